@@ -0,0 +1,35 @@
+"""Add HNSW cosine index on entity_embeddings.embedding.
+
+Lets ``VectorSearchService`` push ranking into PostgreSQL
+(``ORDER BY embedding <=> :q LIMIT k``) without a sequential scan.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # halfvec_cosine_ops matches the <=> operator used by vector search;
+    # m / ef_construction are the pgvector defaults, stated explicitly
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_entity_embeddings_embedding_hnsw "
+        "ON entity_embeddings USING hnsw (embedding halfvec_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_entity_embeddings_embedding_hnsw")
@@ -0,0 +1,70 @@
+"""Store entity embeddings as float16 BLOBs on non-PostgreSQL backends.
+
+``EntityEmbeddingModel.embedding`` now uses ``HalfVectorType``:
+pgvector ``halfvec`` on PostgreSQL (unchanged, so this migration is a
+no-op there) and a little-endian float16 BLOB elsewhere. On SQLite the
+column is redeclared as ``BLOB`` and existing JSON text vectors are
+re-encoded in place.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+
+import numpy as np
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Rows converted per UPDATE batch
+_BATCH_SIZE = 1000
+
+
+def _convert(to_blob: bool) -> None:
+    """Re-encode every stored vector as BLOB (upgrade) or JSON text (downgrade)."""
+    bind = op.get_bind()
+    source_type = "text" if to_blob else "blob"
+    rows = bind.execute(
+        sa.text("SELECT embedding_id, embedding FROM entity_embeddings WHERE typeof(embedding) = :kind"),
+        {"kind": source_type},
+    ).all()
+    for start in range(0, len(rows), _BATCH_SIZE):
+        updates = []
+        for embedding_id, value in rows[start : start + _BATCH_SIZE]:
+            if to_blob:
+                encoded: object = np.asarray(json.loads(value), dtype="<f2").tobytes()
+            else:
+                encoded = json.dumps(np.frombuffer(value, dtype="<f2").astype(float).tolist())
+            updates.append({"id": embedding_id, "value": encoded})
+        bind.execute(
+            sa.text("UPDATE entity_embeddings SET embedding = :value WHERE embedding_id = :id"),
+            updates,
+        )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        return
+    # Convert values first: the table rebuild CASTs the column, and SQLite
+    # keeps BLOB values as-is but would turn JSON text into raw bytes
+    _convert(to_blob=True)
+    with op.batch_alter_table("entity_embeddings") as batch:
+        batch.alter_column("embedding", type_=sa.LargeBinary(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        return
+    _convert(to_blob=False)
+    with op.batch_alter_table("entity_embeddings") as batch:
+        batch.alter_column("embedding", type_=sa.Text(), existing_nullable=False)
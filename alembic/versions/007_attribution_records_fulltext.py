@@ -0,0 +1,95 @@
+"""Full-text index on attribution_records.
+
+PostgreSQL: adds ``search_vector``, a ``STORED`` generated ``tsvector``
+over work title, artist name, credited entity names, credit roles (with
+``role_detail``) and provenance agents, weighted A/A/B/C/D, plus a GIN
+index. ``TextSearchService`` queries it with ``websearch_to_tsquery``
+and orders by ``ts_rank``.
+
+SQLite: creates the ``attribution_records_fts`` FTS5 table with the
+same document and backfills it from existing rows. The application
+keeps it in sync afterwards.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _weighted(expression: str, weight: str) -> str:
+    """Return ``setweight(to_tsvector('simple', ...), weight)`` SQL."""
+    return f"setweight(to_tsvector('simple'::regconfig, coalesce({expression}, '')), '{weight}')"
+
+
+# Every function used is IMMUTABLE, as generated columns require
+_SEARCH_VECTOR = " || ".join(
+    [
+        _weighted("work_title", "A"),
+        _weighted("artist_name", "A"),
+        _weighted("jsonb_path_query_array(credits, '$[*].entity_name')::text", "B"),
+        _weighted("jsonb_path_query_array(credits, '$[*].role')::text", "C"),
+        _weighted("jsonb_path_query_array(credits, '$[*].role_detail')::text", "C"),
+        _weighted("jsonb_path_query_array(provenance_chain, '$[*].agent')::text", "D"),
+    ],
+)
+
+_SQLITE_CREATE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS attribution_records_fts USING fts5("
+    "attribution_id UNINDEXED, work_title, artist_name, credit_names, credit_roles, agents, "
+    "tokenize = 'unicode61 remove_diacritics 2')"
+)
+
+_SQLITE_BACKFILL = """
+INSERT INTO attribution_records_fts
+    (attribution_id, work_title, artist_name, credit_names, credit_roles, agents)
+SELECT
+    r.attribution_id,
+    coalesce(r.work_title, ''),
+    coalesce(r.artist_name, ''),
+    coalesce((SELECT group_concat(coalesce(json_extract(c.value, '$.entity_name'), ''), ' ')
+              FROM json_each(r.credits) AS c), ''),
+    coalesce((SELECT group_concat(coalesce(json_extract(c.value, '$.role'), '') || ' ' ||
+                                  coalesce(json_extract(c.value, '$.role_detail'), ''), ' ')
+              FROM json_each(r.credits) AS c), ''),
+    coalesce((SELECT group_concat(coalesce(json_extract(e.value, '$.agent'), ''), ' ')
+              FROM json_each(r.provenance_chain) AS e), '')
+FROM attribution_records AS r
+"""
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(
+            "ALTER TABLE attribution_records "
+            f"ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ({_SEARCH_VECTOR}) STORED",
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_attribution_records_search_vector "
+            "ON attribution_records USING gin (search_vector)",
+        )
+    elif dialect == "sqlite":
+        op.execute(_SQLITE_CREATE)
+        op.execute("DELETE FROM attribution_records_fts")
+        op.execute(_SQLITE_BACKFILL)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_attribution_records_search_vector")
+        op.execute("ALTER TABLE attribution_records DROP COLUMN IF EXISTS search_vector")
+    elif dialect == "sqlite":
+        op.execute("DROP TABLE IF EXISTS attribution_records_fts")
@@ -0,0 +1,75 @@
+"""Add the attribution_entities junction table.
+
+Denormalizes ``attribution_records.work_entity_id`` (role ``WORK``) and
+every ``credits[*].entity_id``/``role`` into indexed rows, replacing the
+``LIKE '%<uuid>%'`` scan over stringified credits in hybrid search with
+one ``IN`` lookup on ``entity_id``. Existing records are backfilled.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Attribution records read per backfill batch
+_BATCH_SIZE = 1000
+
+_WORK_ROLE = "WORK"
+
+_records = sa.table(
+    "attribution_records",
+    sa.column("attribution_id", sa.Uuid()),
+    sa.column("work_entity_id", sa.Uuid()),
+    sa.column("credits", sa.JSON()),
+)
+
+
+def _entity_rows(attribution_id: uuid.UUID, work_entity_id: uuid.UUID, credits: object) -> list[dict[str, object]]:
+    """Return the junction rows for one attribution record."""
+    if isinstance(credits, str):
+        credits = json.loads(credits)
+    pairs = {(work_entity_id, _WORK_ROLE)}
+    for credit in credits if isinstance(credits, list) else []:
+        if isinstance(credit, dict) and credit.get("entity_id") and credit.get("role"):
+            pairs.add((uuid.UUID(str(credit["entity_id"])), str(credit["role"])))
+    return [{"attribution_id": attribution_id, "entity_id": entity_id, "role": role} for entity_id, role in pairs]
+
+
+def upgrade() -> None:
+    table = op.create_table(
+        "attribution_entities",
+        sa.Column(
+            "attribution_id",
+            sa.Uuid(),
+            sa.ForeignKey("attribution_records.attribution_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("entity_id", sa.Uuid(), primary_key=True),
+        sa.Column("role", sa.String(50), primary_key=True),
+    )
+    op.create_index("ix_attribution_entities_entity_id", "attribution_entities", ["entity_id"])
+
+    result = op.get_bind().execution_options(yield_per=_BATCH_SIZE).execute(sa.select(_records))
+    for batch in result.partitions():
+        rows = [row for record in batch for row in _entity_rows(*record)]
+        if rows:
+            op.bulk_insert(table, rows)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_attribution_entities_entity_id", table_name="attribution_entities")
+    op.drop_table("attribution_entities")
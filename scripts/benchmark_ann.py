@@ -0,0 +1,230 @@
+"""ANN benchmark: recall@k and query latency of the IVF-flat index.
+
+Builds an ``IVFFlatIndex`` over synthetic clustered embeddings (standing
+in for ``entity_embeddings``) and compares it with exact brute-force
+search. For each catalogue size the report records:
+
+- index build (training) time,
+- exact search latency per query,
+- for each ``n_probe``: approximate latency per query, speed-up over
+  exact search, and recall@k against the exact top-k.
+
+Vectors are drawn around random cluster centres so that, like real name
+embeddings, neighbourhoods are meaningful; queries are perturbed copies
+of catalogue vectors.
+
+Usage
+-----
+::
+
+    uv run python scripts/benchmark_ann.py
+    uv run python scripts/benchmark_ann.py --sizes 10000,100000 --n-probe 1,4,16 --output ann.json
+    uv run python scripts/benchmark_ann.py --dim 768 --k 20
+
+See Also
+--------
+src/music_attribution/search/ann_index.py : Index implementation.
+src/music_attribution/search/vector_search.py : Exact and ANN-backed search.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from music_attribution.search.ann_index import ANNConfig, IVFFlatIndex, recall_at_k
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_SIZES = (10_000, 100_000)
+
+_DEFAULT_N_PROBE = (1, 4, 8, 16, 32)
+
+# all-MiniLM-L6-v2 embedding dimension
+_DEFAULT_DIM = 384
+
+# Queries timed per configuration
+_QUERIES = 200
+
+# Within-cluster noise relative to the centre spread (higher = harder recall)
+_CLUSTER_SPREAD = 1.5
+
+
+def generate_vectors(size: int, dim: int, *, seed: int = 42) -> np.ndarray:
+    """Generate clustered synthetic embeddings.
+
+    Parameters
+    ----------
+    size : int
+        Number of vectors.
+    dim : int
+        Vector dimension.
+    seed : int, optional
+        Random seed.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(size, dim)`` float32 matrix.
+    """
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(max(size // 50, 1), dim))
+    labels = rng.integers(0, len(centres), size)
+    return (centres[labels] + _CLUSTER_SPREAD * rng.normal(size=(size, dim))).astype(np.float32)
+
+
+def _mean_latency(search: Any, queries: np.ndarray) -> float:
+    """Return mean seconds per query for ``search``."""
+    t0 = time.perf_counter()
+    for query in queries:
+        search(query)
+    return (time.perf_counter() - t0) / max(len(queries), 1)
+
+
+def benchmark_size(size: int, dim: int, n_probes: list[int], *, k: int = 10, seed: int = 42) -> dict[str, Any]:
+    """Benchmark one catalogue size.
+
+    Parameters
+    ----------
+    size : int
+        Number of indexed vectors.
+    dim : int
+        Vector dimension.
+    n_probes : list[int]
+        ``n_probe`` values to evaluate.
+    k : int, optional
+        Result depth for recall@k.
+    seed : int, optional
+        Random seed.
+
+    Returns
+    -------
+    dict[str, Any]
+        Build time, exact latency and per-``n_probe`` recall and latency.
+    """
+    vectors = generate_vectors(size, dim, seed=seed)
+    rng = np.random.default_rng(seed + 1)
+    queries = vectors[rng.integers(0, size, _QUERIES)] + 0.1 * rng.normal(size=(_QUERIES, dim)).astype(np.float32)
+
+    index = IVFFlatIndex(ANNConfig(seed=seed))
+    index.add_many([f"e{i}" for i in range(size)], vectors, auto_train=False)
+    t0 = time.perf_counter()
+    index.train()
+    build_s = time.perf_counter() - t0
+
+    exact_s = _mean_latency(lambda q: index.search_exact(q, k), queries)
+    probes: list[dict[str, Any]] = []
+    for n_probe in n_probes:
+        approx_s = _mean_latency(lambda q, n=n_probe: index.search(q, k, n_probe=n), queries)
+        recall = recall_at_k(index, queries, k, n_probe=n_probe)
+        probes.append(
+            {
+                "n_probe": n_probe,
+                "query_ms": round(approx_s * 1000, 3),
+                "speedup": round(exact_s / approx_s, 2) if approx_s else 0.0,
+                f"recall_at_{k}": round(recall, 4),
+            },
+        )
+        logger.info(
+            "n=%d n_probe=%d query=%.3fms (exact %.3fms) recall@%d=%.3f",
+            size,
+            n_probe,
+            approx_s * 1000,
+            exact_s * 1000,
+            k,
+            recall,
+        )
+
+    return {
+        "vectors": size,
+        "dim": dim,
+        "n_lists": index.n_lists,
+        "build_s": round(build_s, 3),
+        "exact_query_ms": round(exact_s * 1000, 3),
+        "probes": probes,
+    }
+
+
+def run_benchmarks(
+    sizes: list[int],
+    dim: int,
+    n_probes: list[int],
+    *,
+    k: int = 10,
+    output_path: Path | None = None,
+) -> dict[str, Any]:
+    """Run the ANN benchmark for every requested catalogue size.
+
+    Parameters
+    ----------
+    sizes : list[int]
+        Catalogue sizes to benchmark.
+    dim : int
+        Vector dimension.
+    n_probes : list[int]
+        ``n_probe`` values to evaluate.
+    k : int, optional
+        Result depth for recall@k.
+    output_path : Path | None, optional
+        If given, the JSON report is written here.
+
+    Returns
+    -------
+    dict[str, Any]
+        Full benchmark report.
+    """
+    report = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "k": k,
+        "results": [benchmark_size(size, dim, n_probes, k=k) for size in sizes],
+    }
+    if output_path is not None:
+        output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        logger.info("Wrote report to %s", output_path)
+    return report
+
+
+def main() -> None:
+    """CLI entry point for the ANN benchmark."""
+    parser = argparse.ArgumentParser(description="IVF-flat ANN benchmark (recall@k and query latency)")
+    parser.add_argument(
+        "--sizes",
+        type=str,
+        default=",".join(str(s) for s in _DEFAULT_SIZES),
+        help="Comma-separated catalogue sizes (default: 10000,100000)",
+    )
+    parser.add_argument(
+        "--n-probe",
+        type=str,
+        default=",".join(str(n) for n in _DEFAULT_N_PROBE),
+        help="Comma-separated n_probe values (default: 1,4,8,16,32)",
+    )
+    parser.add_argument("--dim", type=int, default=_DEFAULT_DIM)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Path to write JSON results file",
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    run_benchmarks(
+        [int(s) for s in args.sizes.split(",")],
+        args.dim,
+        [int(n) for n in args.n_probe.split(",")],
+        k=args.k,
+        output_path=Path(args.output) if args.output else None,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""Blocking benchmark: candidate pairs and wall time for string-similarity resolution.
+
+Compares the exhaustive pairwise comparison used by Stage 2 of the
+resolution cascade against ``CandidateBlocker`` candidate generation on
+synthetic catalogues of identifier-less artist names. For each catalogue
+size the report records:
+
+- number of candidate pairs (blocked vs. exhaustive),
+- wall time for blocking and for scoring the blocked pairs,
+- estimated wall time for exhaustive scoring (extrapolated from a sample),
+- recall of the blocked pairs against the synthetic ground truth.
+
+Synthetic names are generated from a fixed seed: each base name is
+duplicated with music-domain perturbations (typos, ``"X, The"`` reordering,
+``feat.`` credits, accents, token swaps) so the true duplicate pairs are
+known.
+
+Usage
+-----
+::
+
+    uv run python scripts/benchmark_blocking.py
+    uv run python scripts/benchmark_blocking.py --sizes 1000,10000 --output blocking.json
+    uv run python scripts/benchmark_blocking.py --lsh-bands 24 --lsh-rows 2
+
+See Also
+--------
+src/music_attribution/resolution/blocking.py : Blocking implementation.
+src/music_attribution/resolution/orchestrator.py : Stage 2 consumer.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import time
+from datetime import UTC, datetime
+from itertools import combinations
+from pathlib import Path
+from typing import Any
+
+from music_attribution.resolution.blocking import BlockingConfig, CandidateBlocker
+from music_attribution.resolution.string_similarity import StringSimilarityMatcher
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+_SYLLABLES = (
+    "ka", "lo", "mi", "ren", "tas", "vo", "ny", "zed", "qu", "ph", "bri", "sol",
+    "dar", "el", "fin", "gor", "hal", "is", "jun", "mor", "nel", "ost", "pra", "ul",
+    "ash", "bel", "cor", "dem", "eth", "fra", "gil", "hun", "ix", "jar", "kel", "lum",
+    "mas", "nor", "oph", "pel", "rho", "sen", "tor", "urb", "val", "wen", "xan", "yor",
+)  # fmt: skip
+
+_ACCENTS = {"a": "á", "e": "é", "o": "ö", "u": "ü", "i": "í"}
+
+# Number of pairs sampled to extrapolate exhaustive scoring cost
+_SCORE_SAMPLE = 20_000
+
+
+def _perturb(name: str, rng: random.Random) -> str:
+    """Apply one music-domain perturbation to a name."""
+    choice = rng.randrange(5)
+    if choice == 0 and len(name) > 3:
+        pos = rng.randrange(len(name))
+        return name[:pos] + rng.choice("abcdefghijklmnopqrstuvwxyz") + name[pos + 1 :]
+    if choice == 1:
+        return f"{name}, The" if not name.startswith("The ") else f"{name[4:]}, The"
+    if choice == 2:
+        return f"{name} feat. {rng.choice(_SYLLABLES).title()}"
+    if choice == 3:
+        return "".join(_ACCENTS.get(c, c) if rng.random() < 0.3 else c for c in name)
+    tokens = name.split()
+    return " ".join(reversed(tokens)) if len(tokens) > 1 else name.upper()
+
+
+def generate_names(size: int, *, seed: int = 42, duplicate_rate: float = 0.3) -> tuple[list[str], list[int]]:
+    """Generate synthetic artist names with known duplicate clusters.
+
+    Parameters
+    ----------
+    size : int
+        Number of names to generate.
+    seed : int, optional
+        Random seed for reproducibility.
+    duplicate_rate : float, optional
+        Fraction of names that are perturbed copies of an earlier name.
+
+    Returns
+    -------
+    tuple[list[str], list[int]]
+        Names and their ground-truth cluster IDs (same ID = same entity).
+    """
+    rng = random.Random(seed)
+    names: list[str] = []
+    clusters: list[int] = []
+    bases: list[str] = []
+    for _ in range(size):
+        if bases and rng.random() < duplicate_rate:
+            cluster = rng.randrange(len(bases))
+            names.append(_perturb(bases[cluster], rng))
+        else:
+            token_count = rng.choice((1, 2, 2, 3))
+            base = " ".join(
+                "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 3))).title() for _ in range(token_count)
+            )
+            if rng.random() < 0.1:
+                base = f"The {base}"
+            cluster = len(bases)
+            bases.append(base)
+            names.append(base)
+        clusters.append(cluster)
+    return names, clusters
+
+
+def _true_pairs(clusters: list[int]) -> set[tuple[int, int]]:
+    """Enumerate the ground-truth duplicate pairs."""
+    members: dict[int, list[int]] = {}
+    for idx, cluster in enumerate(clusters):
+        members.setdefault(cluster, []).append(idx)
+    return {pair for group in members.values() for pair in combinations(group, 2)}
+
+
+def _matching_pairs(
+    matcher: StringSimilarityMatcher,
+    names: list[str],
+    pairs: list[tuple[int, int]],
+) -> set[tuple[int, int]]:
+    """Score pairs in one batch and keep those at or above the threshold."""
+    scores = matcher.score_pairs([names[i] for i, _ in pairs], [names[j] for _, j in pairs])
+    return {pair for pair, score in zip(pairs, scores, strict=True) if score >= matcher._threshold}
+
+
+def benchmark_size(size: int, config: BlockingConfig, *, seed: int = 42) -> dict[str, Any]:
+    """Benchmark blocking against exhaustive comparison for one catalogue size.
+
+    Parameters
+    ----------
+    size : int
+        Number of synthetic names.
+    config : BlockingConfig
+        Blocking configuration under test.
+    seed : int, optional
+        Random seed for name generation and pair sampling.
+
+    Returns
+    -------
+    dict[str, Any]
+        Pair counts, timings (seconds), and recall metrics.
+    """
+    names, clusters = generate_names(size, seed=seed)
+    matcher = StringSimilarityMatcher()
+    blocker = CandidateBlocker(config)
+
+    t0 = time.perf_counter()
+    pairs = blocker.candidate_pairs(names)
+    block_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    matched = _matching_pairs(matcher, names, pairs)
+    score_s = time.perf_counter() - t0
+
+    exhaustive_pairs = size * (size - 1) // 2
+    rng = random.Random(seed)
+    sample = [tuple(sorted(rng.sample(range(size), 2))) for _ in range(min(_SCORE_SAMPLE, exhaustive_pairs))]
+    t0 = time.perf_counter()
+    matcher.score_pairs([names[i] for i, _ in sample], [names[j] for _, j in sample])
+    per_pair_s = (time.perf_counter() - t0) / max(len(sample), 1)
+
+    truth = _true_pairs(clusters)
+    candidate_set = set(pairs)
+    true_matches = _matching_pairs(matcher, names, sorted(truth))
+
+    result = {
+        "records": size,
+        "exhaustive_pairs": exhaustive_pairs,
+        "candidate_pairs": len(pairs),
+        "reduction_ratio": round(1 - len(pairs) / exhaustive_pairs, 6) if exhaustive_pairs else 0.0,
+        "block_s": round(block_s, 4),
+        "score_blocked_s": round(score_s, 4),
+        "score_exhaustive_s_estimated": round(per_pair_s * exhaustive_pairs, 2),
+        "matched_pairs": len(matched),
+        "pair_recall": round(len(truth & candidate_set) / len(truth), 4) if truth else 1.0,
+        "match_recall": round(len(true_matches & candidate_set) / len(true_matches), 4) if true_matches else 1.0,
+    }
+    logger.info(
+        "n=%d pairs=%d (%.4f%% of exhaustive) block=%.2fs score=%.2fs recall=%.3f",
+        size,
+        len(pairs),
+        100 * len(pairs) / max(exhaustive_pairs, 1),
+        block_s,
+        score_s,
+        result["match_recall"],
+    )
+    return result
+
+
+def run_benchmarks(
+    sizes: list[int],
+    config: BlockingConfig,
+    *,
+    output_path: Path | None = None,
+) -> dict[str, Any]:
+    """Run the blocking benchmark for every requested catalogue size.
+
+    Parameters
+    ----------
+    sizes : list[int]
+        Catalogue sizes to benchmark.
+    config : BlockingConfig
+        Blocking configuration under test.
+    output_path : Path | None, optional
+        If given, the JSON report is written here.
+
+    Returns
+    -------
+    dict[str, Any]
+        Full benchmark report.
+    """
+    report = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": config.__dict__,
+        "results": [benchmark_size(size, config) for size in sizes],
+    }
+    if output_path is not None:
+        output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        logger.info("Wrote report to %s", output_path)
+    return report
+
+
+def main() -> None:
+    """CLI entry point for the blocking benchmark."""
+    parser = argparse.ArgumentParser(
+        description="String-similarity blocking benchmark (pair counts and wall time)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=str,
+        default=",".join(str(s) for s in _DEFAULT_SIZES),
+        help="Comma-separated catalogue sizes (default: 1000,10000,100000)",
+    )
+    parser.add_argument("--prefix-length", type=int, default=BlockingConfig.prefix_length)
+    parser.add_argument("--lsh-bands", type=int, default=BlockingConfig.lsh_bands)
+    parser.add_argument("--lsh-rows", type=int, default=BlockingConfig.lsh_rows)
+    parser.add_argument("--max-block-size", type=int, default=BlockingConfig.max_block_size)
+    parser.add_argument("--no-phonetic", action="store_true", help="Disable the Metaphone key")
+    parser.add_argument("--no-sorted-tokens", action="store_true", help="Disable the sorted-token key")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Path to write JSON results file",
+    )
+
+    args = parser.parse_args()
+    config = BlockingConfig(
+        prefix_length=args.prefix_length,
+        sorted_tokens=not args.no_sorted_tokens,
+        phonetic=not args.no_phonetic,
+        lsh_bands=args.lsh_bands,
+        lsh_rows=args.lsh_rows,
+        max_block_size=args.max_block_size,
+        exhaustive_below=0,
+    )
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    run_benchmarks(
+        [int(s) for s in args.sizes.split(",")],
+        config,
+        output_path=Path(args.output) if args.output else None,
+    )
+
+
+if __name__ == "__main__":
+    main()
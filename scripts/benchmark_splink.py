@@ -0,0 +1,324 @@
+"""Splink fallback benchmark: vectorized vs. legacy predict and cluster.
+
+Compares ``SplinkMatcher._fallback_predict`` and ``SplinkMatcher.cluster``
+against the previous row-wise implementations (nested ``iloc`` loop and
+``iterrows()`` union-find, reproduced below) on synthetic record frames.
+For each frame size the report records:
+
+- number of predicted pairs and clusters,
+- wall time for the vectorized predict and cluster,
+- wall time for the legacy cluster on the same predictions,
+- estimated wall time for the legacy predict (O(n²); measured on a small
+  frame and extrapolated quadratically),
+- whether both implementations agree on the small frame.
+
+Records reuse the synthetic artist names of ``benchmark_blocking.py``;
+each ground-truth entity carries an ISRC on ~60% of its records.
+
+Usage
+-----
+::
+
+    uv run python scripts/benchmark_splink.py
+    uv run python scripts/benchmark_splink.py --sizes 10000 --legacy-size 500 --output splink.json
+
+See Also
+--------
+src/music_attribution/resolution/splink_linkage.py : Implementation.
+scripts/benchmark_blocking.py : Name generator.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from benchmark_blocking import generate_names
+
+from music_attribution.resolution.splink_linkage import SplinkMatcher
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_SIZES = (10_000, 100_000)
+_COMPARISON_COLUMNS = ["canonical_name", "isrc"]
+
+
+def generate_records(size: int, *, seed: int = 42, isrc_rate: float = 0.6) -> pd.DataFrame:
+    """Generate a record frame with duplicate names and shared ISRCs.
+
+    Parameters
+    ----------
+    size : int
+        Number of records.
+    seed : int, optional
+        Random seed for reproducibility.
+    isrc_rate : float, optional
+        Probability that a record carries its entity's ISRC.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns ``unique_id``, ``canonical_name``, ``isrc``.
+    """
+    names, clusters = generate_names(size, seed=seed)
+    rng = random.Random(seed)
+    isrcs = [f"GBXXX{cluster:07d}" if rng.random() < isrc_rate else None for cluster in clusters]
+    return pd.DataFrame({"unique_id": range(size), "canonical_name": names, "isrc": isrcs})
+
+
+def _legacy_fallback_predict(columns: list[str], records: pd.DataFrame) -> pd.DataFrame:
+    """Row-wise fallback predict, as implemented before vectorization."""
+    pairs = []
+    n = len(records)
+    for i in range(n):
+        for j in range(i + 1, n):
+            matches = 0
+            for col in columns:
+                val_i = records.iloc[i].get(col)
+                val_j = records.iloc[j].get(col)
+                if val_i is not None and val_j is not None and val_i == val_j:
+                    matches += 1
+            pairs.append(
+                {
+                    "unique_id_l": records.iloc[i]["unique_id"],
+                    "unique_id_r": records.iloc[j]["unique_id"],
+                    "match_probability": matches / len(columns) if columns else 0.0,
+                }
+            )
+    return pd.DataFrame(pairs)
+
+
+def _legacy_cluster(predictions: pd.DataFrame, threshold: float) -> list[list[int]]:
+    """``iterrows()`` union-find clustering, as implemented before vectorization."""
+    parent: dict[int, int] = {}
+
+    def find(x: int) -> int:
+        if x not in parent:
+            parent[x] = x
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    all_ids: set[int] = set()
+    for _, row in predictions[predictions["match_probability"] >= threshold].iterrows():
+        lid, rid = int(row["unique_id_l"]), int(row["unique_id_r"])
+        all_ids.update((lid, rid))
+        pl, pr = find(lid), find(rid)
+        if pl != pr:
+            parent[pl] = pr
+    for _, row in predictions.iterrows():
+        all_ids.update((int(row["unique_id_l"]), int(row["unique_id_r"])))
+
+    groups: dict[int, list[int]] = defaultdict(list)
+    for uid in all_ids:
+        groups[find(uid)].append(uid)
+    return list(groups.values())
+
+
+def _canonical(clusters: list[list[int]]) -> list[list[int]]:
+    """Order-independent form of a clustering."""
+    return sorted(sorted(c) for c in clusters)
+
+
+def check_parity(size: int, *, threshold: float, seed: int = 42) -> tuple[bool, float]:
+    """Compare vectorized and legacy results on a small frame.
+
+    Parameters
+    ----------
+    size : int
+        Frame size (the legacy predict is O(n²) ``iloc`` calls).
+    threshold : float
+        Clustering threshold.
+    seed : int, optional
+        Random seed for record generation.
+
+    Returns
+    -------
+    tuple[bool, float]
+        Whether predictions and clusters agree, and the legacy predict
+        wall time in seconds.
+    """
+    records = generate_records(size, seed=seed)
+    matcher = SplinkMatcher()
+    matcher.configure_model(_COMPARISON_COLUMNS)
+
+    t0 = time.perf_counter()
+    legacy = _legacy_fallback_predict(_COMPARISON_COLUMNS, records)
+    legacy_s = time.perf_counter() - t0
+
+    vectorized = matcher._fallback_predict(records)
+    # The vectorized path omits pairs agreeing on no column
+    legacy_matched = legacy[legacy["match_probability"] > 0].reset_index(drop=True)
+    same_pairs = legacy_matched[["unique_id_l", "unique_id_r"]].equals(
+        vectorized[["unique_id_l", "unique_id_r"]].astype(legacy_matched["unique_id_l"].dtype)
+    ) and np.allclose(legacy_matched["match_probability"], vectorized["match_probability"])
+    same_clusters = _canonical(_legacy_cluster(legacy, threshold)) == _canonical(
+        matcher.cluster(vectorized, threshold, unique_ids=records["unique_id"])
+    )
+    return same_pairs and same_clusters, legacy_s
+
+
+def benchmark_size(
+    size: int,
+    *,
+    threshold: float,
+    legacy_size: int,
+    legacy_predict_s: float,
+    seed: int = 42,
+) -> dict[str, Any]:
+    """Benchmark vectorized predict/cluster for one frame size.
+
+    Parameters
+    ----------
+    size : int
+        Number of synthetic records.
+    threshold : float
+        Clustering threshold.
+    legacy_size : int
+        Frame size the legacy predict was timed on.
+    legacy_predict_s : float
+        Legacy predict wall time at ``legacy_size``.
+    seed : int, optional
+        Random seed for record generation.
+
+    Returns
+    -------
+    dict[str, Any]
+        Pair/cluster counts and timings (seconds).
+    """
+    records = generate_records(size, seed=seed)
+    matcher = SplinkMatcher()
+    matcher.configure_model(_COMPARISON_COLUMNS)
+
+    t0 = time.perf_counter()
+    predictions = matcher._fallback_predict(records)
+    predict_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    clusters = matcher.cluster(predictions, threshold)
+    cluster_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    legacy_clusters = _legacy_cluster(predictions, threshold)
+    legacy_cluster_s = time.perf_counter() - t0
+
+    legacy_pairs = legacy_size * (legacy_size - 1) / 2
+    scale = size * (size - 1) / 2 / legacy_pairs if legacy_pairs else 0.0
+    result = {
+        "records": size,
+        "predicted_pairs": len(predictions),
+        "clusters": len(clusters),
+        "clusters_agree": _canonical(clusters) == _canonical(legacy_clusters),
+        "predict_s": round(predict_s, 4),
+        "cluster_s": round(cluster_s, 4),
+        "legacy_cluster_s": round(legacy_cluster_s, 4),
+        "legacy_predict_s_estimated": round(legacy_predict_s * scale, 1),
+    }
+    logger.info(
+        "n=%d pairs=%d predict=%.3fs (legacy est. %.0fs) cluster=%.3fs (legacy %.2fs)",
+        size,
+        len(predictions),
+        predict_s,
+        result["legacy_predict_s_estimated"],
+        cluster_s,
+        legacy_cluster_s,
+    )
+    return result
+
+
+def run_benchmarks(
+    sizes: list[int],
+    *,
+    threshold: float = 0.85,
+    legacy_size: int = 300,
+    output_path: Path | None = None,
+) -> dict[str, Any]:
+    """Run the Splink fallback benchmark for every requested frame size.
+
+    Parameters
+    ----------
+    sizes : list[int]
+        Frame sizes to benchmark.
+    threshold : float, optional
+        Clustering threshold.
+    legacy_size : int, optional
+        Frame size for the legacy predict timing and parity check.
+    output_path : Path | None, optional
+        If given, the JSON report is written here.
+
+    Returns
+    -------
+    dict[str, Any]
+        Full benchmark report.
+    """
+    parity, legacy_predict_s = check_parity(legacy_size, threshold=threshold)
+    logger.info("Parity at n=%d: %s (legacy predict %.2fs)", legacy_size, parity, legacy_predict_s)
+    report = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "threshold": threshold,
+        "legacy_size": legacy_size,
+        "legacy_predict_s": round(legacy_predict_s, 4),
+        "parity": parity,
+        "results": [
+            benchmark_size(
+                size,
+                threshold=threshold,
+                legacy_size=legacy_size,
+                legacy_predict_s=legacy_predict_s,
+            )
+            for size in sizes
+        ],
+    }
+    if output_path is not None:
+        output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        logger.info("Wrote report to %s", output_path)
+    return report
+
+
+def main() -> None:
+    """CLI entry point for the Splink fallback benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Vectorized vs. legacy SplinkMatcher fallback predict/cluster benchmark",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=str,
+        default=",".join(str(s) for s in _DEFAULT_SIZES),
+        help="Comma-separated frame sizes (default: 10000,100000)",
+    )
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument(
+        "--legacy-size",
+        type=int,
+        default=300,
+        help="Frame size for timing the O(n²) legacy predict (extrapolated to --sizes)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Path to write JSON results file",
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    run_benchmarks(
+        [int(s) for s in args.sizes.split(",")],
+        threshold=args.threshold,
+        legacy_size=args.legacy_size,
+        output_path=Path(args.output) if args.output else None,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,9 @@ Notes
 -----
 CORS origins are read from ``Settings.cors_origins`` (comma-separated).
 The database engine is stored on ``app.state`` so that route-level
-dependencies can access it without global singletons.
+dependencies can access it without global singletons. The search result
+cache (``Settings.search_cache_backend``) is installed process-wide,
+since repositories invalidate it on every catalogue write.
 """
 
 from __future__ import annotations
@@ -33,22 +35,25 @@ from music_attribution.api.routes.permissions import router as permissions_route
 from music_attribution.chat.agui_endpoint import router as copilotkit_router
 from music_attribution.config import Settings
 from music_attribution.db.engine import async_session_factory, create_async_engine_factory
+from music_attribution.search.result_cache import create_search_result_cache, set_search_result_cache
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
-    """Manage the async database engine lifecycle.
+    """Manage the async database engine and search cache lifecycle.
 
     Creates the SQLAlchemy async engine and session factory on startup,
-    attaches them to ``app.state``, and disposes the engine on shutdown.
+    attaches them to ``app.state``, installs the search result cache,
+    and disposes the engine and closes the cache on shutdown.
 
     Parameters
     ----------
     app : FastAPI
         The FastAPI application instance whose ``state`` will be populated
-        with ``async_engine``, ``async_session_factory``, and ``settings``.
+        with ``async_engine``, ``async_session_factory``,
+        ``search_result_cache`` and ``settings``.
 
     Yields
     ------
@@ -64,11 +69,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     app.state.async_session_factory = factory
     app.state.settings = settings
 
+    search_result_cache = create_search_result_cache(settings)
+    app.state.search_result_cache = search_result_cache
+    set_search_result_cache(search_result_cache)
+
     db_host = settings.database_url.split("@")[-1] if "@" in settings.database_url else "unknown"
     logger.info("Database engine created: %s", db_host)
 
     yield
 
+    set_search_result_cache(None)
+    if search_result_cache is not None:
+        await search_result_cache.close()
     await engine.dispose()
     logger.info("Database engine disposed")
 
@@ -213,7 +213,7 @@ async def search_attributions(
     """
     from music_attribution.search.hybrid_search import HybridSearchService
 
-    service = HybridSearchService()
+    service = HybridSearchService(session_factory=request.app.state.async_session_factory)
     async with get_session(request) as session:
         results = await service.search(q, limit=limit, session=session)
         return [
@@ -37,10 +37,11 @@ import logging
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from music_attribution.db.models import AttributionRecordModel
+from music_attribution.db.fts import sync_attribution_fts
+from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel
 from music_attribution.db.utils import ensure_utc, parse_jsonb
 from music_attribution.schemas.attribution import (
     AttributionRecord,
@@ -48,9 +49,13 @@ from music_attribution.schemas.attribution import (
     UpdateEventDetails,
 )
 from music_attribution.schemas.enums import ProvenanceEventTypeEnum
+from music_attribution.search.result_cache import mark_catalogue_changed
 
 logger = logging.getLogger(__name__)
 
+# attribution_entities.role for the record's own work entity
+WORK_ENTITY_ROLE = "WORK"
+
 
 class AttributionRecordRepository:
     """In-memory repository for AttributionRecord persistence.
@@ -264,6 +269,38 @@ def _model_to_record(model: AttributionRecordModel) -> AttributionRecord:
     )
 
 
+def _attribution_entity_rows(record: AttributionRecord) -> list[dict[str, object]]:
+    """Build the ``attribution_entities`` rows for a record.
+
+    One row for the work entity (role ``WORK_ENTITY_ROLE``) and one per
+    distinct ``(entity_id, role)`` among the credits.
+
+    Parameters
+    ----------
+    record : AttributionRecord
+        The attribution record.
+
+    Returns
+    -------
+    list[dict[str, object]]
+        Insert parameter dicts for ``AttributionEntityModel``.
+    """
+    pairs = {(record.work_entity_id, WORK_ENTITY_ROLE)}
+    pairs.update((credit.entity_id, credit.role.value) for credit in record.credits)
+    return [
+        {"attribution_id": record.attribution_id, "entity_id": entity_id, "role": role}
+        for entity_id, role in sorted(pairs, key=lambda pair: (str(pair[0]), pair[1]))
+    ]
+
+
+async def _sync_attribution_entities(record: AttributionRecord, session: AsyncSession) -> None:
+    """Replace the ``attribution_entities`` rows of ``record``."""
+    await session.execute(
+        delete(AttributionEntityModel).where(AttributionEntityModel.attribution_id == record.attribution_id),
+    )
+    await session.execute(insert(AttributionEntityModel), _attribution_entity_rows(record))
+
+
 class AsyncAttributionRepository:
     """Async PostgreSQL repository for AttributionRecord persistence.
 
@@ -274,6 +311,13 @@ class AsyncAttributionRepository:
     Provides the same logical operations as ``AttributionRecordRepository``
     but backed by PostgreSQL with ACID guarantees and JSONB storage for
     nested Pydantic models.
+
+    ``store()`` and ``update()`` also refresh the record's rows in the
+    ``attribution_entities`` junction table and, on SQLite, in the
+    ``attribution_records_fts`` full-text table (PostgreSQL maintains
+    its generated ``search_vector`` column itself), and flag the session
+    so that its commit invalidates the search result cache
+    (``mark_catalogue_changed``).
     """
 
     async def store(self, record: AttributionRecord, session: AsyncSession) -> uuid.UUID:
@@ -294,6 +338,9 @@ class AsyncAttributionRepository:
         model = _record_to_model(record)
         session.add(model)
         await session.flush()
+        await _sync_attribution_entities(record, session)
+        await sync_attribution_fts(session, model)
+        mark_catalogue_changed(session)
         return record.attribution_id
 
     async def update(self, record: AttributionRecord, session: AsyncSession) -> uuid.UUID:
@@ -359,6 +406,9 @@ class AsyncAttributionRepository:
         existing.credits = [c.model_dump(mode="json") for c in updated.credits]  # type: ignore[assignment]
 
         await session.flush()
+        await _sync_attribution_entities(updated, session)
+        await sync_attribution_fts(session, existing)
+        mark_catalogue_changed(session)
         return updated.attribution_id
 
     async def find_by_id(
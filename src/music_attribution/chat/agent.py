@@ -368,7 +368,7 @@ def create_attribution_agent() -> Agent[AgentDeps, str]:
 
         from music_attribution.search.hybrid_search import HybridSearchService
 
-        svc = HybridSearchService()
+        svc = HybridSearchService(session_factory=ctx.deps.session_factory)
         async with ctx.deps.session_factory() as session:
             hits = await svc.search(query, session=session, limit=10)
         for hit in hits:
@@ -1,6 +1,7 @@
 """Database management CLI commands.
 
-Provides async functions for seed, reset, and status operations.
+Provides async functions for seed, reset, status, embedding backfill and
+ANN index build operations.
 Can be run directly via `python -m music_attribution.cli.db <command>`.
 """
 
@@ -13,7 +14,16 @@ import sys
 from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from music_attribution.db.models import AttributionRecordModel
+from music_attribution.db.fts import clear_attribution_fts
+from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel
+from music_attribution.resolution.embedding_service import BackfillReport, EmbeddingService
+from music_attribution.search.ann_index import IVFFlatIndex
+from music_attribution.search.result_cache import (
+    create_search_result_cache,
+    mark_catalogue_changed,
+    set_search_result_cache,
+    wait_for_catalogue_invalidation,
+)
 from music_attribution.seed.imogen_heap import seed_imogen_heap
 
 logger = logging.getLogger(__name__)
@@ -28,6 +38,7 @@ async def run_seed(factory: async_sessionmaker[AsyncSession]) -> None:
     async with factory() as session:
         await seed_imogen_heap(session)
         await session.commit()
+    await wait_for_catalogue_invalidation()
     logger.info("Seed complete: Imogen Heap attribution data loaded")
 
 
@@ -38,8 +49,12 @@ async def run_reset(factory: async_sessionmaker[AsyncSession]) -> None:
         factory: Async session factory bound to the target database.
     """
     async with factory() as session:
+        await session.execute(delete(AttributionEntityModel))
         await session.execute(delete(AttributionRecordModel))
+        await clear_attribution_fts(session)
+        mark_catalogue_changed(session)
         await session.commit()
+    await wait_for_catalogue_invalidation()
     logger.info("Reset complete: all attribution records deleted")
 
 
@@ -59,6 +74,49 @@ async def run_status(factory: async_sessionmaker[AsyncSession]) -> dict[str, int
     return counts
 
 
+async def run_embed(
+    factory: async_sessionmaker[AsyncSession],
+    *,
+    checkpoint_path: str | None = None,
+) -> BackfillReport:
+    """Backfill embeddings for resolved entities that have none.
+
+    Args:
+        factory: Async session factory bound to the target database.
+        checkpoint_path: JSON checkpoint file; an existing one is resumed.
+
+    Returns:
+        Cumulative backfill counters and this run's throughput.
+    """
+    async with factory() as session:
+        report = await EmbeddingService().backfill_embeddings(session=session, checkpoint_path=checkpoint_path)
+    await wait_for_catalogue_invalidation()
+    logger.info(
+        "Embedding backfill complete: %d embedded in %.1fs (%.1f entities/sec)",
+        report.embedded,
+        report.seconds,
+        report.entities_per_second,
+    )
+    return report
+
+
+async def run_ann_build(factory: async_sessionmaker[AsyncSession], *, index_path: str) -> IVFFlatIndex:
+    """Build the local ANN index from stored embeddings and save it.
+
+    Args:
+        factory: Async session factory bound to the target database.
+        index_path: Destination `.npz` file.
+
+    Returns:
+        The trained index.
+    """
+    async with factory() as session:
+        index = await IVFFlatIndex.from_database(session)
+    index.save(index_path)
+    logger.info("ANN index saved to %s: %d vectors in %d lists", index_path, len(index), index.n_lists)
+    return index
+
+
 def _main() -> None:
     """Entry point for CLI usage."""
     from music_attribution.config import Settings
@@ -69,9 +127,12 @@ def _main() -> None:
     settings = Settings()  # type: ignore[call-arg]
     engine = create_async_engine_factory(settings.database_url)
     factory = async_session_factory(engine)
+    # Only a shared cache can be invalidated from this process
+    if settings.search_cache_backend.lower() == "valkey":
+        set_search_result_cache(create_search_result_cache(settings))
 
     if len(sys.argv) < 2:
-        print("Usage: python -m music_attribution.cli.db <seed|reset|status>")  # noqa: T201
+        print("Usage: python -m music_attribution.cli.db <seed|reset|status|embed [checkpoint]|ann <path>>")  # noqa: T201
         sys.exit(1)
 
     command = sys.argv[1]
@@ -84,6 +145,14 @@ def _main() -> None:
         counts = asyncio.run(run_status(factory))
         for table, count in counts.items():
             print(f"  {table}: {count}")  # noqa: T201
+    elif command == "embed":
+        checkpoint = sys.argv[2] if len(sys.argv) > 2 else None
+        asyncio.run(run_embed(factory, checkpoint_path=checkpoint))
+    elif command == "ann":
+        if len(sys.argv) < 3:
+            print("Usage: python -m music_attribution.cli.db ann <path>")  # noqa: T201
+            sys.exit(1)
+        asyncio.run(run_ann_build(factory, index_path=sys.argv[2]))
     else:
         print(f"Unknown command: {command}")  # noqa: T201
         sys.exit(1)
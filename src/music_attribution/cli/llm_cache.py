@@ -0,0 +1,115 @@
+"""LLM disambiguation cache CLI commands.
+
+Provides async functions for warm-up, purge, and stats operations on the
+durable LLM decision cache. Can be run directly via
+`python -m music_attribution.cli.llm_cache <command> <sqlite-path>`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import time
+
+from music_attribution.resolution.llm_cache import LLMCacheStore, SQLiteLLMCacheStore
+
+logger = logging.getLogger(__name__)
+
+# Decisions copied by `warm` when no limit is given
+_DEFAULT_WARM_LIMIT = 10_000
+
+# Default entry lifetime for `purge` (7 days)
+_DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+async def run_warm(
+    source: LLMCacheStore,
+    target: LLMCacheStore,
+    *,
+    limit: int = _DEFAULT_WARM_LIMIT,
+    max_age: float = _DEFAULT_TTL_SECONDS,
+) -> int:
+    """Copy the most recent decisions from one store into another.
+
+    Used to preload the shared Valkey tier from a SQLite decision log
+    (e.g. after a Valkey restart) so new workers start with warm hits.
+
+    Args:
+        source: Store to read recent decisions from.
+        target: Store to write them into.
+        limit: Maximum number of decisions to copy.
+        max_age: Only copy decisions younger than this many seconds.
+
+    Returns:
+        Number of decisions copied.
+    """
+    entries = await source.recent(limit, time.time() - max_age)
+    for entry in reversed(entries):
+        await target.put(entry)
+    logger.info("Warm-up complete: %d LLM decisions copied", len(entries))
+    return len(entries)
+
+
+async def run_purge(store: LLMCacheStore, *, ttl_seconds: float = _DEFAULT_TTL_SECONDS) -> int:
+    """Delete decisions older than the TTL.
+
+    Args:
+        store: Store to purge.
+        ttl_seconds: Entry lifetime in seconds.
+
+    Returns:
+        Number of decisions deleted.
+    """
+    deleted = await store.purge(time.time() - ttl_seconds)
+    logger.info("Purge complete: %d expired LLM decisions deleted", deleted)
+    return deleted
+
+
+async def run_stats(store: LLMCacheStore) -> dict[str, float]:
+    """Return entry count and age range of a store.
+
+    Args:
+        store: Store to inspect.
+
+    Returns:
+        Dictionary with `entries`, and `newest_age_seconds` when non-empty.
+    """
+    stats: dict[str, float] = {"entries": await store.count()}
+    newest = await store.recent(1)
+    if newest:
+        stats["newest_age_seconds"] = round(time.time() - newest[0].stored_at, 1)
+    return stats
+
+
+def _main() -> None:
+    """Entry point for CLI usage."""
+    logging.basicConfig(level=logging.INFO)
+
+    if len(sys.argv) < 3:
+        print("Usage: python -m music_attribution.cli.llm_cache <warm|purge|stats> <sqlite-path>")  # noqa: T201
+        sys.exit(1)
+
+    command, path = sys.argv[1], sys.argv[2]
+    store = SQLiteLLMCacheStore(path)
+
+    if command == "warm":
+        from music_attribution.config import Settings
+        from music_attribution.resolution.llm_cache import ValkeyLLMCacheStore
+
+        settings = Settings()  # type: ignore[call-arg]
+        target = ValkeyLLMCacheStore(settings.valkey_url)
+        asyncio.run(run_warm(store, target))
+    elif command == "purge":
+        asyncio.run(run_purge(store))
+    elif command == "stats":
+        stats = asyncio.run(run_stats(store))
+        for name, value in stats.items():
+            print(f"  {name}: {value}")  # noqa: T201
+    else:
+        print(f"Unknown command: {command}")  # noqa: T201
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    _main()
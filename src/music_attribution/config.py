@@ -15,6 +15,13 @@ DATABASE_URL : str
     (e.g. ``postgresql+psycopg://…@localhost/db``).  # pragma: allowlist secret
 VALKEY_URL : str
     Valkey/Redis connection URL (default ``redis://localhost:6379``).
+SEARCH_CACHE_BACKEND : str
+    Search result cache: ``none`` (default), ``valkey`` or ``memory``.
+    The pipeline and CLI write from their own processes, so only
+    ``valkey`` sees their writes; ``memory`` is per process and is only
+    safe when the API process is the sole writer.
+SEARCH_CACHE_TTL_SECONDS : float
+    Lifetime of a cached search result set (default ``300``).
 API_HOST : str
     API server bind address (default ``0.0.0.0``).
 API_PORT : int
@@ -60,6 +67,15 @@ class Settings(BaseSettings):
         (e.g. ``postgresql+psycopg://…@localhost/db``).
     valkey_url : str
         Valkey/Redis connection URL for caching and pub/sub.
+    search_cache_backend : str
+        Hybrid search result cache backend: ``"none"`` (default, no
+        caching), ``"valkey"`` (shared via ``valkey_url``, invalidated by
+        every writer that configures it; needs the ``valkey`` extra) or
+        ``"memory"`` (per process; only for an API process that is the
+        sole writer, since other processes' writes are only seen once
+        entries expire).
+    search_cache_ttl_seconds : float
+        Lifetime of a cached search result set in seconds.
     api_host : str
         Network interface to bind the API server to.
     api_port : int
@@ -96,6 +112,8 @@ class Settings(BaseSettings):
     # Database
     database_url: str = Field(description="PostgreSQL async connection string")
     valkey_url: str = Field(default="redis://localhost:6379", description="Valkey/Redis connection URL")
+    search_cache_backend: str = Field(default="none", description="Search result cache: none, valkey or memory")
+    search_cache_ttl_seconds: float = Field(default=300.0, description="Search result cache entry lifetime (s)")
 
     # API
     api_host: str = Field(default="0.0.0.0", description="API server host")
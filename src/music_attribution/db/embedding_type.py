@@ -0,0 +1,208 @@
+"""Embedding column type with NumPy decoding on every backend.
+
+``entity_embeddings.embedding`` used to come back as Python objects:
+pgvector's ``HALFVEC`` result processor expands each row into a list of
+Python floats, and SQLite (tests, offline deployments) stored the vector
+as a JSON string that had to be ``json.loads``-ed per row. For scans
+over many rows that decoding cost more than the similarity math.
+
+``HalfVectorType`` keeps pgvector ``halfvec`` on PostgreSQL and uses a
+compact binary encoding elsewhere:
+
+- **PostgreSQL** -- column type ``HALFVEC(dim)``; results decode
+  straight into ``float16`` arrays (``HalfVector.to_numpy()`` when the
+  driver already produced a ``HalfVector``, otherwise a C-level parse of
+  the text form with ``np.fromstring``).
+- **SQLite** -- ``BLOB`` of little-endian ``float16`` values (2 bytes
+  per dimension, no header).
+
+``decode_embedding`` accepts every stored form (including legacy JSON
+text rows written before migration 006), and ``stack_embeddings``
+copies many rows into one ``float32`` matrix without creating Python
+floats.
+
+Functions
+---------
+encode_embedding
+    Encode a vector as the SQLite BLOB format.
+decode_embedding
+    Decode any stored embedding form into a ``float16`` array.
+stack_embeddings
+    Stack stored embeddings into one ``float32`` matrix.
+
+Classes
+-------
+HalfVectorType
+    SQLAlchemy column type for embeddings.
+
+See Also
+--------
+music_attribution.db.models.EntityEmbeddingModel : Uses the type.
+music_attribution.search.vector_search : Scans decoded matrices.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from pgvector import HalfVector
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import Dialect, LargeBinary
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+# Storage dtype of the SQLite BLOB encoding (little-endian half precision)
+_BLOB_DTYPE = np.dtype("<f2")
+
+
+def encode_embedding(value: object) -> bytes:
+    """Encode a vector as little-endian ``float16`` bytes.
+
+    Parameters
+    ----------
+    value : object
+        Any form accepted by ``decode_embedding``.
+
+    Returns
+    -------
+    bytes
+        ``2 * dim`` bytes.
+    """
+    return decode_embedding(value).astype(_BLOB_DTYPE, copy=False).tobytes()
+
+
+def decode_embedding(raw: object) -> np.ndarray:
+    """Decode a stored embedding into a 1-D ``float16`` array.
+
+    Handles, in order of preference:
+
+    - ``numpy.ndarray`` -- returned as ``float16`` (no copy if already).
+    - ``bytes`` / ``memoryview`` -- SQLite BLOB; viewed in place.
+    - ``HalfVector`` -- pgvector object; viewed via ``to_numpy()``.
+    - ``str`` -- pgvector text (``"[0.1,0.2]"``) or legacy JSON text;
+      parsed in C by ``np.fromstring``.
+    - ``list`` / ``tuple`` -- in-memory fixtures.
+
+    Parameters
+    ----------
+    raw : object
+        Raw embedding value.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(dim,)`` ``float16`` array (read-only when it views a buffer).
+
+    Raises
+    ------
+    TypeError
+        If the value does not match any known storage format.
+    """
+    if isinstance(raw, np.ndarray):
+        return raw.astype(np.float16, copy=False).reshape(-1)
+    if isinstance(raw, bytes | bytearray | memoryview):
+        return np.frombuffer(raw, dtype=_BLOB_DTYPE).astype(np.float16, copy=False)
+    if isinstance(raw, HalfVector):
+        return raw.to_numpy()
+    if isinstance(raw, str):
+        text = raw.strip()
+        if text.startswith("[") and text.endswith("]"):
+            text = text[1:-1]
+        if not text:
+            return np.zeros(0, dtype=np.float16)
+        return np.fromstring(text, dtype=np.float32, sep=",").astype(np.float16)
+    if isinstance(raw, list | tuple):
+        return np.asarray(raw, dtype=np.float16)
+    msg = f"Unexpected embedding type: {type(raw)}"
+    raise TypeError(msg)
+
+
+def stack_embeddings(raws: Sequence[object], dim: int | None = None) -> np.ndarray:
+    """Decode stored embeddings into one ``(n, dim)`` ``float32`` matrix.
+
+    Each row is decoded (usually a buffer view) and written directly into
+    a preallocated matrix.
+
+    Parameters
+    ----------
+    raws : Sequence[object]
+        Raw embedding values.
+    dim : int | None, optional
+        Expected dimension; inferred from the first row when ``None``.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``float32`` matrix, one row per input.
+
+    Raises
+    ------
+    ValueError
+        If the rows have different dimensions.
+    """
+    if not raws:
+        return np.zeros((0, dim or 0), dtype=np.float32)
+    first = decode_embedding(raws[0])
+    matrix = np.empty((len(raws), dim or len(first)), dtype=np.float32)
+    for row, raw in enumerate(raws):
+        vector = first if row == 0 else decode_embedding(raw)
+        if len(vector) != matrix.shape[1]:
+            msg = f"Embedding {row} has dimension {len(vector)}, expected {matrix.shape[1]}"
+            raise ValueError(msg)
+        matrix[row] = vector
+    return matrix
+
+
+class _NumpyHALFVEC(HALFVEC):
+    """``HALFVEC`` whose results decode to ``float16`` arrays, not lists."""
+
+    cache_ok = True
+
+    def result_processor(self, dialect: Dialect, coltype: Any) -> Any:  # noqa: ARG002
+        def process(value: Any) -> np.ndarray | None:
+            return None if value is None else decode_embedding(value)
+
+        return process
+
+
+class HalfVectorType(TypeDecorator[np.ndarray]):
+    """Half-precision embedding column: ``halfvec`` on PostgreSQL, BLOB elsewhere.
+
+    Bound values may be lists, arrays, ``HalfVector`` objects or vector
+    text; results are always ``float16`` NumPy arrays. The pgvector
+    distance operators (``cosine_distance`` etc.) are available on the
+    column.
+
+    Parameters
+    ----------
+    dim : int
+        Vector dimension (``HALFVEC(dim)`` on PostgreSQL).
+    """
+
+    impl = HALFVEC
+    cache_ok = True
+
+    def __init__(self, dim: int) -> None:
+        super().__init__(dim)
+        self.dim = dim
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        """Use ``HALFVEC`` on PostgreSQL and ``LargeBinary`` elsewhere."""
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(_NumpyHALFVEC(self.dim))
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        """Pass vectors to pgvector unchanged; encode BLOBs elsewhere."""
+        if value is None or dialect.name == "postgresql":
+            return value
+        return encode_embedding(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> np.ndarray | None:  # noqa: ARG002
+        """Return the stored vector as a ``float16`` array."""
+        return None if value is None else decode_embedding(value)
+
+    def copy(self, **kw: Any) -> HalfVectorType:  # noqa: ARG002
+        """Return a copy with the same dimension."""
+        return HalfVectorType(self.dim)
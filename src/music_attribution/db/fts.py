@@ -0,0 +1,248 @@
+"""Full-text index for attribution records.
+
+``TextSearchService`` used to match ``cast(credits, String) LIKE '%q%'``,
+a sequential scan that serialized JSONB for every row on every query.
+This module defines the indexed document and keeps it queryable on both
+supported backends:
+
+- **PostgreSQL** -- ``attribution_records.search_vector``, a ``STORED``
+  generated ``tsvector`` column with a GIN index (migration 007). The
+  database maintains it; nothing in this module writes it.
+- **SQLite** -- ``attribution_records_fts``, an FTS5 table created
+  alongside ``attribution_records`` (``CREATE_FTS_TABLE``) and kept in
+  sync by ``AsyncAttributionRepository`` via ``sync_attribution_fts``.
+
+The indexed document is the same on both backends, most important
+field first: work title and artist name, credited entity names, credit
+roles (with ``role_detail``) and provenance agents.
+
+Which index a database has is detected once per engine (``fts_backend``)
+and cached; creating or dropping ``attribution_records`` through the
+metadata forgets the cached answer, and so does ``forget_fts_backend``
+after raw DDL. A
+PostgreSQL database migrated to 007 while the process is running is
+picked up on restart.
+
+Classes
+-------
+FTSBackend
+    Full-text index available to an engine.
+
+Functions
+---------
+fts5_supported
+    Whether a SQLite connection was compiled with FTS5.
+fts_document
+    Build the FTS5 column values for one attribution record row.
+fts_backend
+    Detect (once per engine) which full-text index the database has.
+fts_available
+    Whether the session's database has the FTS5 table.
+forget_fts_backend
+    Drop the cached detection result of an engine.
+sync_attribution_fts
+    Replace the FTS5 row of one attribution record.
+clear_attribution_fts
+    Delete every FTS5 row.
+
+See Also
+--------
+music_attribution.search.text_search : Queries the index.
+music_attribution.attribution.persistence : Keeps the FTS5 table in sync.
+"""
+
+from __future__ import annotations
+
+import logging
+import weakref
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import DDL, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from music_attribution.db.utils import parse_jsonb
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Engine
+
+    from music_attribution.db.models import AttributionRecordModel
+
+logger = logging.getLogger(__name__)
+
+# SQLite FTS5 table mirroring attribution_records
+FTS_TABLE = "attribution_records_fts"
+
+# PostgreSQL generated tsvector column (migration 007)
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+# Text search configuration: 'simple' lower-cases without stemming, which
+# suits personal names and multilingual titles
+TS_CONFIG = "simple"
+
+# Indexed FTS5 columns, in bm25() weight order
+FTS_COLUMNS = ("work_title", "artist_name", "credit_names", "credit_roles", "agents")
+
+# bm25() column weights: attribution_id (unindexed), then FTS_COLUMNS
+FTS_WEIGHTS = (0.0, 10.0, 10.0, 5.0, 2.0, 1.0)
+
+CREATE_FTS_TABLE = DDL(
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"attribution_id UNINDEXED, {', '.join(FTS_COLUMNS)}, "
+    "tokenize = 'unicode61 remove_diacritics 2')",
+)
+
+DROP_FTS_TABLE = DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class FTSBackend(StrEnum):
+    """Full-text index available to an engine.
+
+    Attributes
+    ----------
+    TSVECTOR : str
+        PostgreSQL ``search_vector`` column (migration 007).
+    FTS5 : str
+        SQLite ``attribution_records_fts`` table.
+    LIKE : str
+        Neither; text search falls back to LIKE matching.
+    """
+
+    TSVECTOR = "tsvector"
+    FTS5 = "fts5"
+    LIKE = "like"
+
+
+# Detected backend per engine (see ``fts_backend``)
+_BACKENDS: weakref.WeakKeyDictionary[Engine, FTSBackend] = weakref.WeakKeyDictionary()
+
+
+def fts5_supported(ddl: Any, target: Any, bind: Connection | None, *args: Any, **kw: Any) -> bool:  # noqa: ARG001
+    """Return whether ``bind`` is SQLite compiled with FTS5.
+
+    Signature matches ``DDL.execute_if(callable_=...)``.
+    """
+    if bind is None or bind.dialect.name != "sqlite":
+        return False
+    options = bind.exec_driver_sql("PRAGMA compile_options").scalars().all()
+    return "ENABLE_FTS5" in options
+
+
+def fts_document(model: AttributionRecordModel) -> dict[str, str]:
+    """Build the FTS5 column values for one attribution record.
+
+    Parameters
+    ----------
+    model : AttributionRecordModel
+        Attribution record row (``credits`` and ``provenance_chain`` as
+        stored JSON).
+
+    Returns
+    -------
+    dict[str, str]
+        ``attribution_id`` (hex, as stored by ``Uuid`` on SQLite) plus
+        one text value per ``FTS_COLUMNS`` entry.
+    """
+    credits = parse_jsonb(model.credits or [])
+    provenance = parse_jsonb(model.provenance_chain or [])
+    return {
+        "attribution_id": model.attribution_id.hex,
+        "work_title": model.work_title or "",
+        "artist_name": model.artist_name or "",
+        "credit_names": " ".join(str(c.get("entity_name") or "") for c in credits),
+        "credit_roles": " ".join(f"{c.get('role') or ''} {c.get('role_detail') or ''}" for c in credits),
+        "agents": " ".join(str(e.get("agent") or "") for e in provenance),
+    }
+
+
+async def fts_backend(session: AsyncSession) -> FTSBackend:
+    """Return the full-text index of the session's database.
+
+    The catalogue is queried on the first call for an engine and the
+    answer is cached for the engine's lifetime.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Active async database session.
+
+    Returns
+    -------
+    FTSBackend
+        ``TSVECTOR`` on PostgreSQL with the ``search_vector`` column,
+        ``FTS5`` on SQLite with the FTS5 table, ``LIKE`` otherwise.
+    """
+    bind = session.get_bind().engine
+    backend = _BACKENDS.get(bind)
+    if backend is not None:
+        return backend
+
+    if bind.dialect.name == "postgresql":
+        result = await session.execute(
+            text(
+                "SELECT 1 FROM information_schema.columns WHERE table_schema = current_schema() "
+                "AND table_name = 'attribution_records' AND column_name = :name",
+            ),
+            {"name": SEARCH_VECTOR_COLUMN},
+        )
+        backend = FTSBackend.TSVECTOR if result.first() is not None else FTSBackend.LIKE
+        if backend is FTSBackend.LIKE:
+            logger.warning(
+                "attribution_records.%s is missing (migration 007); text search uses LIKE", SEARCH_VECTOR_COLUMN
+            )
+    elif bind.dialect.name == "sqlite":
+        result = await session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE},
+        )
+        backend = FTSBackend.FTS5 if result.first() is not None else FTSBackend.LIKE
+    else:
+        backend = FTSBackend.LIKE
+    _BACKENDS[bind] = backend
+    return backend
+
+
+async def fts_available(session: AsyncSession) -> bool:
+    """Return whether the session's database has the FTS5 table.
+
+    Always ``False`` on PostgreSQL, which uses the generated
+    ``search_vector`` column instead.
+    """
+    return await fts_backend(session) is FTSBackend.FTS5
+
+
+def forget_fts_backend(bind: Engine | Connection) -> None:
+    """Drop the cached ``fts_backend`` answer for ``bind``'s engine.
+
+    Called when ``attribution_records`` is created or dropped; call it
+    after changing the full-text index with raw DDL.
+    """
+    _BACKENDS.pop(bind.engine, None)
+
+
+async def sync_attribution_fts(session: AsyncSession, model: AttributionRecordModel) -> None:
+    """Replace the FTS5 row for ``model`` (no-op without the FTS5 table).
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Active async database session.
+    model : AttributionRecordModel
+        The stored or updated attribution record row.
+    """
+    if not await fts_available(session):
+        return
+    document = fts_document(model)
+    await session.execute(
+        text(f"DELETE FROM {FTS_TABLE} WHERE attribution_id = :attribution_id"),
+        {"attribution_id": document["attribution_id"]},
+    )
+    columns = ", ".join(document)
+    values = ", ".join(f":{name}" for name in document)
+    await session.execute(text(f"INSERT INTO {FTS_TABLE} ({columns}) VALUES ({values})"), document)
+
+
+async def clear_attribution_fts(session: AsyncSession) -> None:
+    """Delete every FTS5 row (no-op without the FTS5 table)."""
+    if await fts_available(session):
+        await session.execute(text(f"DELETE FROM {FTS_TABLE}"))
@@ -45,21 +45,25 @@ from __future__ import annotations
 
 import uuid
 
-from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy import (
     Boolean,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
     Uuid,
+    event,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from music_attribution.db.embedding_type import HalfVectorType
+from music_attribution.db.fts import CREATE_FTS_TABLE, DROP_FTS_TABLE, forget_fts_backend, fts5_supported
+
 
 class Base(DeclarativeBase):
     """Declarative base class for all ORM models.
@@ -208,6 +212,13 @@ class AttributionRecordModel(Base):
         Priority score for the review queue (higher = more urgent).
     version : int
         Optimistic concurrency version counter.
+
+    Notes
+    -----
+    Full-text search uses a generated ``search_vector`` column on
+    PostgreSQL (migration 007, not mapped here) and the
+    ``attribution_records_fts`` FTS5 table on SQLite (see
+    ``music_attribution.db.fts``).
     """
 
     __tablename__ = "attribution_records"
@@ -231,6 +242,49 @@ class AttributionRecordModel(Base):
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
 
+# SQLite full-text index: the FTS5 table is created and dropped with
+# attribution_records. PostgreSQL uses the generated ``search_vector``
+# column from migration 007 instead. Either way the detected text search
+# backend of the engine is re-checked after the table changes.
+event.listen(AttributionRecordModel.__table__, "after_create", CREATE_FTS_TABLE.execute_if(callable_=fts5_supported))
+event.listen(AttributionRecordModel.__table__, "before_drop", DROP_FTS_TABLE.execute_if(dialect="sqlite"))
+event.listen(AttributionRecordModel.__table__, "after_create", lambda _table, bind, **_kw: forget_fts_backend(bind))
+event.listen(AttributionRecordModel.__table__, "after_drop", lambda _table, bind, **_kw: forget_fts_backend(bind))
+
+
+class AttributionEntityModel(Base):
+    """Junction table mapping attribution records to the entities they cite.
+
+    Denormalizes ``attribution_records.work_entity_id`` and every
+    ``credits[*].entity_id`` into indexed rows, so that entity-to-
+    attribution lookups (hybrid search) are one ``IN`` query instead of
+    a ``LIKE`` scan over stringified JSONB. Maintained by
+    ``AsyncAttributionRepository.store()``/``update()`` and backfilled
+    by migration 008.
+
+    Attributes
+    ----------
+    attribution_id : uuid.UUID
+        Foreign key to ``attribution_records.attribution_id``.
+    entity_id : uuid.UUID
+        Cited entity (work or credited contributor).
+    role : str
+        Credit role (``CreditRoleEnum`` value), or ``"WORK"`` for the
+        record's work entity.
+    """
+
+    __tablename__ = "attribution_entities"
+    __table_args__ = (Index("ix_attribution_entities_entity_id", "entity_id"),)
+
+    attribution_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid,
+        ForeignKey("attribution_records.attribution_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    entity_id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
+    role: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+
 class PermissionBundleModel(Base):
     """SQLAlchemy model for PermissionBundle boundary object (BO-5).
 
@@ -395,8 +449,10 @@ class EntityEmbeddingModel(Base):
         Name of the embedding model (e.g. ``"text-embedding-3-small"``).
     model_version : str
         Version string of the embedding model.
-    embedding : HALFVEC(768)
-        768-dimensional half-precision float vector.
+    embedding : HalfVectorType(768)
+        768-dimensional half-precision float vector (pgvector
+        ``HALFVEC`` on PostgreSQL, float16 BLOB on SQLite). Loaded as a
+        ``float16`` NumPy array.
     """
 
     __tablename__ = "entity_embeddings"
@@ -406,7 +462,7 @@ class EntityEmbeddingModel(Base):
     entity_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("resolved_entities.entity_id"), nullable=False)
     model_name: Mapped[str] = mapped_column(String(255), nullable=False)
     model_version: Mapped[str] = mapped_column(String(100), nullable=False)
-    embedding = mapped_column(HALFVEC(768), nullable=False)
+    embedding = mapped_column(HalfVectorType(768), nullable=False)
     created_at: Mapped[str] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
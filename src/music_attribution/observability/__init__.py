@@ -11,11 +11,15 @@ metrics
     drift events, and center-bias detections. Includes a
     ``create_metrics`` factory for test isolation and a ``get_metrics``
     singleton for production use.
+search_metrics
+    Per-modality latency histograms and timeout-drop counters for
+    hybrid search.
 
 See Also
 --------
 music_attribution.quality.drift_detector : Produces ``drift_detected`` events.
 music_attribution.chat.agent : Produces ``agent_latency`` observations.
+music_attribution.search.hybrid_search : Produces search modality metrics.
 """
 
 from __future__ import annotations
@@ -0,0 +1,146 @@
+"""Prometheus metrics for the hybrid search subsystem.
+
+Captures per-modality latency for ``HybridSearchService``, counts
+modalities dropped from Reciprocal Rank Fusion for missing their
+latency budget, and tracks the search result cache hit ratio.
+
+The module follows the same frozen-dataclass + singleton pattern as
+:mod:`~music_attribution.observability.metrics`.
+
+Usage
+-----
+>>> from music_attribution.observability.search_metrics import get_search_metrics
+>>> sm = get_search_metrics()
+>>> sm.modality_latency_seconds.labels(modality="text", outcome="ok").observe(0.012)
+
+Metric Instruments
+------------------
+search_modality_latency_seconds : Histogram
+    Latency of one search modality (seconds), labelled by modality
+    (``text``, ``vector``, ``graph``) and outcome (``ok``, ``timeout``,
+    ``error``, ``cancelled``).
+search_modality_dropped_total : Counter
+    Modalities dropped from fusion after exceeding their timeout,
+    labelled by modality.
+search_result_cache_requests_total : Counter
+    Result cache lookups, labelled by result (``hit``, ``miss``).
+search_result_cache_hit_ratio : Gauge
+    Share of result cache lookups served from the cache since process
+    start.
+
+See Also
+--------
+music_attribution.observability.metrics : Application-level metrics.
+music_attribution.search.hybrid_search : Emits these metrics.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Modality buckets -- indexed lookups are milliseconds, query embedding on
+# CPU can take a second or more
+_MODALITY_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass(frozen=True)
+class SearchMetrics:
+    """Container for all hybrid search Prometheus metrics.
+
+    Using a frozen dataclass rather than module-level globals allows
+    isolated registries in tests (preventing collector name conflicts)
+    and makes the set of metrics explicit and type-safe.
+
+    Attributes
+    ----------
+    modality_latency_seconds : Histogram
+        Per-modality latency in seconds. Labels: ``modality``,
+        ``outcome``.
+    modality_dropped_total : Counter
+        Modalities dropped after a timeout. Labels: ``modality``.
+    result_cache_requests_total : Counter
+        Result cache lookups. Labels: ``result``.
+    result_cache_hit_ratio : Gauge
+        Cumulative result cache hit ratio in [0, 1].
+    """
+
+    modality_latency_seconds: Histogram
+    modality_dropped_total: Counter
+    result_cache_requests_total: Counter
+    result_cache_hit_ratio: Gauge
+
+
+def create_search_metrics(registry: CollectorRegistry | None = None) -> SearchMetrics:
+    """Create a fresh set of hybrid search Prometheus metrics.
+
+    Parameters
+    ----------
+    registry : CollectorRegistry | None, optional
+        Prometheus collector registry to register metrics with.
+        If ``None``, a new isolated registry is created (useful for
+        testing).
+
+    Returns
+    -------
+    SearchMetrics
+        Frozen dataclass containing all search metric instruments.
+    """
+    if registry is None:
+        registry = CollectorRegistry()
+
+    return SearchMetrics(
+        modality_latency_seconds=Histogram(
+            "search_modality_latency_seconds",
+            "Hybrid search modality latency in seconds",
+            labelnames=["modality", "outcome"],
+            buckets=_MODALITY_LATENCY_BUCKETS,
+            registry=registry,
+        ),
+        modality_dropped_total=Counter(
+            "search_modality_dropped_total",
+            "Hybrid search modalities dropped from fusion after a timeout",
+            labelnames=["modality"],
+            registry=registry,
+        ),
+        result_cache_requests_total=Counter(
+            "search_result_cache_requests_total",
+            "Hybrid search result cache lookups",
+            labelnames=["result"],
+            registry=registry,
+        ),
+        result_cache_hit_ratio=Gauge(
+            "search_result_cache_hit_ratio",
+            "Share of hybrid search result cache lookups served from the cache",
+            registry=registry,
+        ),
+    )
+
+
+# --- Module-level singletons for convenience imports ---
+
+_default_search_metrics: SearchMetrics | None = None
+
+
+def get_search_metrics() -> SearchMetrics:
+    """Get or create the default search metrics singleton.
+
+    Uses module-level caching to ensure metrics are registered exactly
+    once with the default Prometheus ``REGISTRY``.
+
+    Returns
+    -------
+    SearchMetrics
+        Singleton ``SearchMetrics`` instance using the default
+        Prometheus registry.
+    """
+    global _default_search_metrics  # noqa: PLW0603
+    if _default_search_metrics is None:
+        from prometheus_client import REGISTRY
+
+        _default_search_metrics = create_search_metrics(REGISTRY)
+    return _default_search_metrics
@@ -0,0 +1,184 @@
+"""Budgets, gating and counters for the expensive resolution stages.
+
+After identifier and string grouping, ``ResolutionOrchestrator.resolve``
+can refine groups with embedding similarity (Stage 3), graph evidence
+(Stage 5) and LLM disambiguation (Stage 6). These stages cost orders of
+magnitude more per group than the cheap ones, so they are gated:
+
+- **Ambiguity band** -- a stage only sees groups whose current combined
+  confidence lies in ``[ambiguity_low, ambiguity_high]``. Groups the
+  cheaper stages already decided (confidently same, or too weak to
+  rescue) never reach it.
+- **Budgets** -- each stage has a ``StageBudget`` per ``resolve()`` call
+  (maximum pairs scored, wall-clock seconds, external calls). Once a
+  budget is spent the remaining groups skip the stage.
+
+``StageStats`` counters record, per stage, how many items entered, how
+many it settled (moved out of the ambiguity band or grouped), how many
+it skipped for budget, and the pairs, calls and seconds it spent. The
+ratio of settled to entered items shows how much work each stage saves
+the stages after it.
+
+See Also
+--------
+music_attribution.resolution.orchestrator : Runs the cascade.
+music_attribution.resolution.llm_disambiguation : Stage 6 gating.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+# Cascade stage names, in execution order
+STAGES = ("identifier", "string", "embedding", "graph", "llm")
+
+
+@dataclass(frozen=True)
+class StageBudget:
+    """Per-``resolve()`` resource limits for one cascade stage.
+
+    ``None`` means unlimited.
+
+    Attributes
+    ----------
+    max_pairs : int | None
+        Maximum record pairs scored by the stage.
+    max_seconds : float | None
+        Maximum wall-clock seconds spent in the stage. Checked between
+        batches, so one batch may overrun it; the LLM stage also cancels
+        requests still running when it expires.
+    max_calls : int | None
+        Maximum external calls (model batches, LLM requests).
+    """
+
+    max_pairs: int | None = None
+    max_seconds: float | None = None
+    max_calls: int | None = None
+
+
+@dataclass(frozen=True)
+class CascadeConfig:
+    """Ambiguity band and budgets for the expensive cascade stages.
+
+    Attributes
+    ----------
+    ambiguity_low : float
+        Lower bound of the confidence band that triggers refinement.
+    ambiguity_high : float
+        Upper bound of the band; more confident groups are left as is.
+    embedding_batch_size : int
+        Groups whose names are embedded in one ``embed_batch`` call.
+    embedding : StageBudget
+        Stage 3 budget.
+    graph : StageBudget
+        Stage 5 budget.
+    llm : StageBudget
+        Stage 6 budget (``max_calls`` caps LLM requests).
+    """
+
+    ambiguity_low: float = 0.4
+    ambiguity_high: float = 0.9
+    embedding_batch_size: int = 256
+    embedding: StageBudget = field(default_factory=lambda: StageBudget(max_pairs=50_000))
+    graph: StageBudget = field(default_factory=lambda: StageBudget(max_pairs=200_000))
+    llm: StageBudget = field(default_factory=lambda: StageBudget(max_calls=20))
+
+    def is_ambiguous(self, confidence: float) -> bool:
+        """Return whether ``confidence`` lies in the ambiguity band."""
+        return self.ambiguity_low <= confidence <= self.ambiguity_high
+
+
+@dataclass
+class StageStats:
+    """Cumulative work counters for one cascade stage.
+
+    Attributes
+    ----------
+    items_in : int
+        Records (Stages 1-2) or groups (Stages 3-6) that entered the stage.
+    items_settled : int
+        Items the stage decided: records grouped (Stages 1-2) or groups
+        moved out of the ambiguity band (Stages 3-6).
+    skipped_budget : int
+        Groups that skipped the stage because its budget was spent.
+    pairs : int
+        Record pairs scored.
+    calls : int
+        External calls made (model batches, LLM requests).
+    seconds : float
+        Wall-clock time spent in the stage.
+    """
+
+    items_in: int = 0
+    items_settled: int = 0
+    skipped_budget: int = 0
+    pairs: int = 0
+    calls: int = 0
+    seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of entering items the stage settled (0.0 when idle)."""
+        return self.items_settled / self.items_in if self.items_in else 0.0
+
+
+class BudgetTracker:
+    """Track one stage's spending against its ``StageBudget``.
+
+    Parameters
+    ----------
+    budget : StageBudget
+        Limits for the current ``resolve()`` call.
+    stats : StageStats
+        Counters updated as work is recorded.
+
+    Attributes
+    ----------
+    _budget : StageBudget
+        Active limits.
+    _stats : StageStats
+        Cumulative counters (shared across calls).
+    _pairs : int
+        Pairs spent in the current call.
+    _calls : int
+        Calls spent in the current call.
+    _seconds : float
+        Seconds spent in the current call.
+    """
+
+    def __init__(self, budget: StageBudget, stats: StageStats) -> None:
+        self._budget = budget
+        self._stats = stats
+        self._pairs = 0
+        self._calls = 0
+        self._seconds = 0.0
+
+    def allows(self, pairs: int = 0, calls: int = 0) -> bool:
+        """Return whether spending ``pairs`` and ``calls`` more stays in budget."""
+        budget = self._budget
+        if budget.max_pairs is not None and self._pairs + pairs > budget.max_pairs:
+            return False
+        if budget.max_calls is not None and self._calls + calls > budget.max_calls:
+            return False
+        return budget.max_seconds is None or self._seconds < budget.max_seconds
+
+    def remaining_calls(self) -> int | None:
+        """Return the calls left in the budget (``None`` if unlimited)."""
+        if self._budget.max_calls is None:
+            return None
+        return max(self._budget.max_calls - self._calls, 0)
+
+    def remaining_seconds(self) -> float | None:
+        """Return the seconds left in the budget (``None`` if unlimited)."""
+        if self._budget.max_seconds is None:
+            return None
+        return max(self._budget.max_seconds - self._seconds, 0.0)
+
+    def record(self, *, pairs: int = 0, calls: int = 0, seconds: float = 0.0) -> None:
+        """Record work done by the stage."""
+        self._pairs += pairs
+        self._calls += calls
+        self._seconds += seconds
+        self._stats.pairs += pairs
+        self._stats.calls += calls
+        self._stats.seconds += seconds
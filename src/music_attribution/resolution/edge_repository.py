@@ -33,6 +33,7 @@ from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from music_attribution.db.models import EdgeModel
+from music_attribution.search.result_cache import mark_catalogue_changed
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +83,8 @@ class AsyncEdgeRepository:
         """Add a directed edge between two entities.
 
         Creates a new edge record in the database. The caller is
-        responsible for committing the transaction.
+        responsible for committing the transaction; the commit
+        invalidates the search result cache.
 
         Parameters
         ----------
@@ -114,6 +116,7 @@ class AsyncEdgeRepository:
         )
         session.add(edge)
         await session.flush()
+        mark_catalogue_changed(session)
         return edge.edge_id
 
     async def get_edges(
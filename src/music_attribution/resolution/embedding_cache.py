@@ -0,0 +1,263 @@
+"""Content-addressed, memory-mapped embedding cache.
+
+Embedding the same text twice with the same model gives the same vector,
+yet every pipeline re-run re-encodes the whole catalogue. ``EmbeddingCache``
+stores each vector under ``sha256(text)`` inside a namespace for one
+``(model_name, model_version)`` pair, so only new or changed texts reach
+the transformer.
+
+On-disk layout (one directory per namespace)::
+
+    <directory>/<model_name>@<model_version>/
+        meta.json     model name, version and vector dimension
+        vectors.f16   row-major float16 matrix (rows x dim)
+        keys.bin      32-byte SHA-256 digest per row, in row order
+
+Both data files are append-only. The vectors are read through a
+``numpy.memmap``, so opening a large cache costs only reading the digest
+index. Rows are appended vectors-first, and on open both files are
+truncated to the rows present in each, so an interrupted write never
+leaves a key pointing at a partial vector.
+
+Storing float16 halves the footprint and matches the pgvector
+``halfvec`` column; cached vectors are returned as float32.
+
+A cache instance is safe to share between components in one process
+(resolution, search and voice drift); ``EmbeddingCache.shared()`` returns
+one instance per namespace. Use a single writing process per directory.
+
+See Also
+--------
+music_attribution.resolution.embedding_match : ``EmbeddingMatcher(cache=...)``.
+music_attribution.resolution.embedding_service : ``EmbeddingService(cache=...)``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any, ClassVar
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# SHA-256 digest size in bytes
+_KEY_BYTES = 32
+
+# Characters allowed in namespace directory names
+_UNSAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def text_digest(text: str) -> bytes:
+    """Return the SHA-256 digest used as the cache key of ``text``."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Append-only float16 embedding store keyed by text hash.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Root cache directory; the namespace subdirectory is created.
+    model_name : str
+        Embedding model name.
+    model_version : str
+        Model version; a new version starts an empty namespace.
+
+    Attributes
+    ----------
+    model_name : str
+        Embedding model name.
+    model_version : str
+        Model version.
+    path : Path
+        Namespace directory.
+    _dim : int | None
+        Vector dimension (``None`` until the first vector is stored).
+    _rows : dict[bytes, int]
+        Digest to row index.
+    _file_rows : int
+        Rows in the data files (can exceed ``len(_rows)`` when a file
+        written by an older version holds duplicate keys).
+    _matrix : numpy.memmap | None
+        Read-only mapping of ``vectors.f16`` (remapped after appends).
+    _lock : threading.Lock
+        Serializes appends and remaps.
+    hits : int
+        Texts served from the cache.
+    misses : int
+        Texts that had to be encoded.
+
+    Examples
+    --------
+    >>> cache = EmbeddingCache.shared(".cache/embeddings", "all-MiniLM-L6-v2", "1.0.0")
+    >>> vectors = cache.encode(texts, model.encode)  # encodes only unseen texts
+    """
+
+    _shared: ClassVar[dict[tuple[str, str, str], EmbeddingCache]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, directory: str | Path, model_name: str, model_version: str) -> None:
+        self.model_name = model_name
+        self.model_version = model_version
+        namespace = _UNSAFE_PATH_CHARS.sub("_", f"{model_name}@{model_version}")
+        self.path = Path(directory) / namespace
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._dim: int | None = None
+        self._rows: dict[bytes, int] = {}
+        self._file_rows = 0
+        self._matrix: np.memmap | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @classmethod
+    def shared(cls, directory: str | Path, model_name: str, model_version: str) -> EmbeddingCache:
+        """Return the process-wide instance for a directory and model namespace."""
+        key = (str(Path(directory).resolve()), model_name, model_version)
+        with cls._shared_lock:
+            cache = cls._shared.get(key)
+            if cache is None:
+                cache = cls._shared[key] = cls(directory, model_name, model_version)
+            return cache
+
+    @property
+    def dim(self) -> int | None:
+        """Vector dimension, or ``None`` while the cache is empty."""
+        return self._dim
+
+    def __len__(self) -> int:
+        """Return the number of cached vectors."""
+        return len(self._rows)
+
+    def __contains__(self, text: object) -> bool:
+        """Return whether ``text`` has a cached vector."""
+        return isinstance(text, str) and text_digest(text) in self._rows
+
+    def get(self, text: str) -> np.ndarray | None:
+        """Return the cached vector for ``text`` (float32), or ``None``."""
+        row = self._rows.get(text_digest(text))
+        if row is None:
+            return None
+        return np.asarray(self._mapped()[row], dtype=np.float32)
+
+    def encode(self, texts: Sequence[str], compute: Callable[[list[str]], Any]) -> np.ndarray:
+        """Return embeddings for ``texts``, computing only uncached ones.
+
+        Parameters
+        ----------
+        texts : Sequence[str]
+            Texts to embed (duplicates are computed once).
+        compute : Callable[[list[str]], Any]
+            Encoder for the missing texts, returning one vector per text
+            (e.g. ``model.encode``). Not called when every text is cached.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(len(texts), dim)`` float32 matrix in input order. Vectors
+            pass through float16 storage, so fresh and cached results
+            are identical.
+
+        Raises
+        ------
+        ValueError
+            If ``compute`` returns the wrong number of vectors or a
+            dimension that differs from the cached ones.
+        """
+        digests = [text_digest(text) for text in texts]
+        missing: dict[bytes, str] = {}
+        for digest, text in zip(digests, texts, strict=True):
+            if digest not in self._rows:
+                missing.setdefault(digest, text)
+        self.hits += len(texts) - sum(1 for d in digests if d in missing)
+        self.misses += len(missing)
+
+        if missing:
+            vectors = np.asarray(compute(list(missing.values())), dtype=np.float32)
+            if vectors.ndim == 1:
+                vectors = vectors.reshape(1, -1)
+            if len(vectors) != len(missing):
+                msg = f"Encoder returned {len(vectors)} vectors for {len(missing)} texts"
+                raise ValueError(msg)
+            self._append(list(missing), vectors)
+
+        if not digests:
+            return np.zeros((0, self._dim or 0), dtype=np.float32)
+        rows = np.fromiter((self._rows[d] for d in digests), dtype=np.int64, count=len(digests))
+        return np.asarray(self._mapped()[rows], dtype=np.float32)
+
+    def _load(self) -> None:
+        """Read metadata and the digest index; drop any torn trailing row."""
+        meta_path = self.path / "meta.json"
+        if not meta_path.exists():
+            return
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        self._dim = int(meta["dim"])
+        keys_path, vectors_path = self.path / "keys.bin", self.path / "vectors.f16"
+        row_bytes = self._dim * 2
+        keys_size = keys_path.stat().st_size if keys_path.exists() else 0
+        vectors_size = vectors_path.stat().st_size if vectors_path.exists() else 0
+        rows = min(keys_size // _KEY_BYTES, vectors_size // row_bytes)
+        if keys_size != rows * _KEY_BYTES or vectors_size != rows * row_bytes:
+            logger.warning("Truncating embedding cache %s to %d complete rows", self.path, rows)
+            for file_path, size in ((keys_path, rows * _KEY_BYTES), (vectors_path, rows * row_bytes)):
+                with file_path.open("ab") as handle:
+                    handle.truncate(size)
+        keys = keys_path.read_bytes() if rows else b""
+        self._rows = {}
+        for i in range(rows):
+            # A duplicated key keeps its first row; later copies are dead rows
+            self._rows.setdefault(keys[i * _KEY_BYTES : (i + 1) * _KEY_BYTES], i)
+        self._file_rows = rows
+
+    def _append(self, digests: list[bytes], vectors: np.ndarray) -> None:
+        """Append rows (vectors first, then keys) and index them.
+
+        Digests indexed by another thread since the caller's lookup are
+        skipped, so concurrent misses on one text append it once.
+        """
+        with self._lock:
+            fresh = [i for i, digest in enumerate(digests) if digest not in self._rows]
+            if not fresh:
+                return
+            digests = [digests[i] for i in fresh]
+            vectors = vectors[fresh]
+            if self._dim is None:
+                self._dim = int(vectors.shape[1])
+                meta = {"model_name": self.model_name, "model_version": self.model_version, "dim": self._dim}
+                (self.path / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+            elif vectors.shape[1] != self._dim:
+                msg = f"Vector dimension {vectors.shape[1]} does not match cached dimension {self._dim}"
+                raise ValueError(msg)
+            with (self.path / "vectors.f16").open("ab") as handle:
+                handle.write(np.ascontiguousarray(vectors, dtype=np.float16).tobytes())
+            with (self.path / "keys.bin").open("ab") as handle:
+                handle.write(b"".join(digests))
+            start = self._file_rows
+            for offset, digest in enumerate(digests):
+                self._rows[digest] = start + offset
+            self._file_rows += len(digests)
+            self._matrix = None
+
+    def _mapped(self) -> np.memmap:
+        """Return a mapping covering every indexed row (remapping if stale)."""
+        matrix = self._matrix
+        if matrix is None or len(matrix) < self._file_rows:
+            with self._lock:
+                matrix = np.memmap(
+                    self.path / "vectors.f16",
+                    dtype=np.float16,
+                    mode="r",
+                    shape=(self._file_rows, self._dim or 0),
+                )
+                self._matrix = matrix
+        return matrix
@@ -23,6 +23,8 @@ See Also
 --------
 music_attribution.resolution.string_similarity : Stage 2 (runs before this).
 music_attribution.resolution.embedding_service : Persistence layer for pgvector.
+music_attribution.resolution.embedding_cache : Content-addressed vector cache.
+music_attribution.resolution.vector_index : In-memory matrix index.
 music_attribution.resolution.splink_linkage : Stage 4 (probabilistic linkage).
 """
 
@@ -30,7 +32,15 @@ from __future__ import annotations
 
 import logging
 import math
-from typing import Any
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from music_attribution.resolution.vector_index import VectorIndex
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from music_attribution.resolution.embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +60,10 @@ class EmbeddingMatcher:
     model_name : str, optional
         Sentence-transformer model to use. Default is ``"all-MiniLM-L6-v2"``,
         a lightweight model with good quality-speed tradeoff.
+    cache : EmbeddingCache | None, optional
+        Content-addressed vector cache for this model. When set, only
+        texts without a cached vector are encoded, and the model is not
+        loaded until the first miss.
 
     Attributes
     ----------
@@ -57,18 +71,25 @@ class EmbeddingMatcher:
         Name of the sentence-transformer model.
     _model : Any
         Lazy-loaded ``SentenceTransformer`` instance.
-    _embeddings : dict[str, list[float]]
-        In-memory embedding store (entity_id -> vector).
+    _index : VectorIndex
+        In-memory embedding store: contiguous normalized float32 matrix
+        with an entity_id <-> row mapping.
+    _cache : EmbeddingCache | None
+        Vector cache, if configured.
 
     See Also
     --------
     music_attribution.resolution.embedding_service : Production persistence via pgvector.
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache: EmbeddingCache | None = None) -> None:
+        if cache is not None and cache.model_name != model_name:
+            msg = f"Embedding cache is for model {cache.model_name!r}, not {model_name!r}"
+            raise ValueError(msg)
         self._model_name = model_name
         self._model: Any = None
-        self._embeddings: dict[str, list[float]] = {}
+        self._index = VectorIndex()
+        self._cache = cache
 
     def _get_model(self) -> Any:
         """Lazy-load the sentence-transformer model.
@@ -111,8 +132,7 @@ class EmbeddingMatcher:
             Embedding vector. Dimensionality depends on the model
             (384 for ``all-MiniLM-L6-v2``).
         """
-        model = self._get_model()
-        result = model.encode([text])
+        result = self.encode([text])
         return [float(v) for v in result[0]]
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
@@ -131,10 +151,28 @@ class EmbeddingMatcher:
         list[list[float]]
             List of embedding vectors, one per input text.
         """
-        model = self._get_model()
-        results = model.encode(texts)
+        results = self.encode(texts)
         return [[float(v) for v in row] for row in results]
 
+    def encode(self, texts: list[str], **encode_kwargs: Any) -> np.ndarray | Any:
+        """Encode ``texts`` with the model, through the cache if configured.
+
+        Parameters
+        ----------
+        texts : list[str]
+            Texts to embed.
+        **encode_kwargs : Any
+            Extra arguments for the model's ``encode`` (e.g. ``batch_size``).
+
+        Returns
+        -------
+        numpy.ndarray
+            One embedding row per text.
+        """
+        if self._cache is None:
+            return self._get_model().encode(texts, **encode_kwargs)
+        return self._cache.encode(texts, lambda missing: self._get_model().encode(missing, **encode_kwargs))
+
     async def store_embedding(self, entity_id: str, embedding: list[float]) -> None:
         """Store an embedding in the in-memory index for later similarity search.
 
@@ -146,20 +184,49 @@ class EmbeddingMatcher:
         entity_id : str
             Unique identifier for the entity.
         embedding : list[float]
-            Embedding vector to store.
+            Embedding vector to store. Replaces any existing vector for
+            ``entity_id``.
         """
-        self._embeddings[entity_id] = embedding
+        self._index.add(entity_id, embedding)
+
+    async def store_embeddings(self, entity_ids: Sequence[str], embeddings: Sequence[Sequence[float]]) -> None:
+        """Store many embeddings in the in-memory index in one call.
+
+        Parameters
+        ----------
+        entity_ids : Sequence[str]
+            Entity identifiers.
+        embeddings : Sequence[Sequence[float]]
+            One embedding per identifier.
+        """
+        self._index.add_many(entity_ids, embeddings)
+
+    async def remove_embedding(self, entity_id: str) -> bool:
+        """Remove an entity from the in-memory index.
+
+        Parameters
+        ----------
+        entity_id : str
+            Entity identifier.
+
+        Returns
+        -------
+        bool
+            ``True`` if the entity was indexed.
+        """
+        return self._index.remove(entity_id)
 
     async def find_similar(
         self,
         query_embedding: list[float],
         top_k: int = 5,
     ) -> list[tuple[str, float]]:
-        """Find the most similar stored embeddings via brute-force cosine search.
+        """Find the most similar stored embeddings via exact cosine search.
 
-        Performs exhaustive comparison against all stored embeddings. For
-        production-scale deployments, use pgvector's approximate nearest
-        neighbor index instead.
+        Scores every stored embedding with one matrix-vector product over
+        the pre-normalized index and selects the top-k with
+        ``argpartition``. For production-scale deployments, use pgvector's
+        approximate nearest neighbor index instead.
 
         Parameters
         ----------
@@ -174,13 +241,33 @@ class EmbeddingMatcher:
             Top-k results as ``(entity_id, cosine_similarity)`` tuples,
             sorted by similarity descending.
         """
-        scored: list[tuple[str, float]] = []
-        for entity_id, stored_embedding in self._embeddings.items():
-            score = self.cosine_similarity(query_embedding, stored_embedding)
-            scored.append((entity_id, score))
+        return self._index.search(query_embedding, top_k)
+
+    async def find_similar_many(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        top_k: int = 5,
+    ) -> list[list[tuple[str, float]]]:
+        """Find the most similar stored embeddings for many queries at once.
+
+        Scores the whole query block with one matrix-matrix product
+        (chunked to bound memory), which is much faster than calling
+        ``find_similar`` per query in resolution workloads.
 
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[:top_k]
+        Parameters
+        ----------
+        query_embeddings : Sequence[Sequence[float]]
+            Query embedding vectors.
+        top_k : int, optional
+            Number of results per query. Default is 5.
+
+        Returns
+        -------
+        list[list[tuple[str, float]]]
+            Per query, ``(entity_id, cosine_similarity)`` tuples sorted by
+            similarity descending.
+        """
+        return self._index.search_many(query_embeddings, top_k)
 
     @staticmethod
     def cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
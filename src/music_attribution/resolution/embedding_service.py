@@ -9,8 +9,17 @@ This service bridges the gap between the in-memory ``EmbeddingMatcher``
 handles:
 
 - Embedding generation from formatted entity text.
+- Optional content-addressed caching (``EmbeddingCache``) so unchanged
+  entity text is never re-encoded across pipeline runs.
 - Idempotent storage (skips if embedding already exists for entity + model).
 - Entity text formatting for consistent embedding input.
+- Bulk backfill (``backfill_embeddings``): pages through
+  ``resolved_entities`` by primary key, skips entities that already have
+  an embedding, encodes each page with the model's batched ``encode``,
+  and writes it with one multi-row ``INSERT ... ON CONFLICT DO NOTHING``.
+  A JSON checkpoint after every committed page makes the job resumable.
+- Optional incremental maintenance of a local ANN index
+  (``IVFFlatIndex``) as embeddings are stored.
 
 Notes
 -----
@@ -26,15 +35,29 @@ music_attribution.db.models.EntityEmbeddingModel : SQLAlchemy ORM model.
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import time
 import uuid
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import exists, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from music_attribution.db.models import EntityEmbeddingModel
+from music_attribution.db.models import EntityEmbeddingModel, ResolvedEntityModel
+from music_attribution.db.utils import parse_jsonb
+from music_attribution.resolution.embedding_cache import EmbeddingCache
 from music_attribution.resolution.embedding_match import EmbeddingMatcher
+from music_attribution.search.result_cache import mark_catalogue_changed
+
+if TYPE_CHECKING:
+    from music_attribution.search.ann_index import IVFFlatIndex
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +65,63 @@ MODEL_NAME = "all-MiniLM-L6-v2"
 MODEL_VERSION = "1.0.0"
 
 
+@dataclass
+class BackfillReport:
+    """Progress and throughput of an embedding backfill.
+
+    Counters include work done by earlier runs when resuming from a
+    checkpoint; ``seconds`` covers the current run only.
+
+    Attributes
+    ----------
+    last_entity_id : str | None
+        Highest ``entity_id`` committed so far (keyset cursor).
+    entities_seen : int
+        Entities without an embedding that were read and encoded.
+    embedded : int
+        Embedding rows inserted.
+    skipped_existing : int
+        Rows dropped by ``ON CONFLICT DO NOTHING`` (written concurrently).
+    pages : int
+        Pages committed.
+    seconds : float
+        Wall-clock time of the current run.
+    entities_this_run : int
+        Entities encoded by the current run.
+    """
+
+    last_entity_id: str | None = None
+    entities_seen: int = 0
+    embedded: int = 0
+    skipped_existing: int = 0
+    pages: int = 0
+    seconds: float = 0.0
+    entities_this_run: int = 0
+
+    @property
+    def entities_per_second(self) -> float:
+        """Throughput of the current run (0.0 before any work)."""
+        return self.entities_this_run / self.seconds if self.seconds > 0 else 0.0
+
+    def save(self, path: Path) -> None:
+        """Atomically write the checkpoint JSON to ``path``."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> BackfillReport:
+        """Read a checkpoint, starting fresh if ``path`` does not exist.
+
+        Per-run fields (``seconds``, ``entities_this_run``) are reset.
+        """
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(**{**data, "seconds": 0.0, "entities_this_run": 0})
+
+
 class EmbeddingService:
     """Service for generating and persisting entity embeddings.
 
@@ -54,6 +134,12 @@ class EmbeddingService:
     model_name : str, optional
         Sentence-transformer model name. Default is ``MODEL_NAME``
         (``"all-MiniLM-L6-v2"``).
+    cache : EmbeddingCache | None, optional
+        Vector cache namespaced by ``(model_name, MODEL_VERSION)``; see
+        ``cached()``. ``None`` encodes every text.
+    ann_index : IVFFlatIndex | None, optional
+        Local ANN index updated with every newly stored embedding. The
+        caller persists it (``IVFFlatIndex.save``).
 
     Attributes
     ----------
@@ -61,11 +147,37 @@ class EmbeddingService:
         Underlying matcher used for model loading and encoding.
     _model_name : str
         Model name for database record tracking.
+    _ann_index : IVFFlatIndex | None
+        Optional ANN index kept in step with stored embeddings.
     """
 
-    def __init__(self, model_name: str = MODEL_NAME) -> None:
-        self._matcher = EmbeddingMatcher(model_name=model_name)
+    def __init__(
+        self,
+        model_name: str = MODEL_NAME,
+        cache: EmbeddingCache | None = None,
+        ann_index: IVFFlatIndex | None = None,
+    ) -> None:
+        self._matcher = EmbeddingMatcher(model_name=model_name, cache=cache)
         self._model_name = model_name
+        self._ann_index = ann_index
+
+    @classmethod
+    def cached(cls, cache_dir: str | Path, model_name: str = MODEL_NAME) -> EmbeddingService:
+        """Create a service using the shared on-disk cache for this model version.
+
+        Parameters
+        ----------
+        cache_dir : str | Path
+            Root directory of the embedding cache.
+        model_name : str, optional
+            Sentence-transformer model name.
+
+        Returns
+        -------
+        EmbeddingService
+            Service whose encodes go through ``EmbeddingCache.shared``.
+        """
+        return cls(model_name, cache=EmbeddingCache.shared(cache_dir, model_name, MODEL_VERSION))
 
     def generate_embedding(self, text: str) -> list[float]:
         """Generate a dense embedding vector for text.
@@ -86,10 +198,34 @@ class EmbeddingService:
         ImportError
             If ``sentence-transformers`` is not installed.
         """
-        model = self._matcher._get_model()  # noqa: SLF001
-        result = model.encode([text])
+        result = self._matcher.encode([text])
         return [float(v) for v in result[0]]
 
+    def generate_embeddings(self, texts: list[str], *, batch_size: int = 64) -> list[list[float]]:
+        """Generate embeddings for many texts with one batched ``encode`` call.
+
+        Parameters
+        ----------
+        texts : list[str]
+            Input texts (typically formatted via ``format_entity_text``).
+        batch_size : int, optional
+            Texts per forward pass inside the model. Default 64.
+
+        Returns
+        -------
+        list[list[float]]
+            One embedding per text, in input order.
+
+        Raises
+        ------
+        ImportError
+            If ``sentence-transformers`` is not installed.
+        """
+        if not texts:
+            return []
+        result = self._matcher.encode(texts, batch_size=batch_size)
+        return [[float(v) for v in row] for row in result]
+
     @staticmethod
     def format_entity_text(
         canonical_name: str,
@@ -143,7 +279,8 @@ class EmbeddingService:
             Dense embedding vector to store.
         session : AsyncSession
             Active async database session. The caller is responsible
-            for committing the transaction.
+            for committing the transaction; a commit that wrote an
+            embedding invalidates the search result cache.
         """
         # Check if embedding already exists for this entity + model
         stmt = select(EntityEmbeddingModel).where(
@@ -163,3 +300,163 @@ class EmbeddingService:
             created_at=datetime.now(UTC),
         )
         session.add(model)
+        mark_catalogue_changed(session)
+        if self._ann_index is not None:
+            self._ann_index.add(str(entity_id), embedding)
+
+    async def store_embeddings(
+        self,
+        rows: list[tuple[uuid.UUID, list[float]]],
+        *,
+        session: AsyncSession,
+    ) -> int:
+        """Insert many embeddings in one statement, skipping existing ones.
+
+        Uses a multi-row ``INSERT ... ON CONFLICT (entity_id, model_name)
+        DO NOTHING`` (PostgreSQL, or SQLite in tests) instead of a
+        SELECT-then-INSERT per entity. With an ``ann_index``, the insert
+        returns the IDs it wrote and only those rows are indexed.
+
+        Parameters
+        ----------
+        rows : list[tuple[uuid.UUID, list[float]]]
+            ``(entity_id, embedding)`` pairs.
+        session : AsyncSession
+            Active async database session. The caller is responsible
+            for committing the transaction; a commit that wrote an
+            embedding invalidates the search result cache.
+
+        Returns
+        -------
+        int
+            Number of rows inserted.
+        """
+        if not rows:
+            return 0
+        created_at = datetime.now(UTC)
+        values = [
+            {
+                "embedding_id": uuid.uuid4(),
+                "entity_id": entity_id,
+                "model_name": self._model_name,
+                "model_version": MODEL_VERSION,
+                "embedding": embedding,
+                "created_at": created_at,
+            }
+            for entity_id, embedding in rows
+        ]
+        insert = sqlite_insert if session.get_bind().dialect.name == "sqlite" else pg_insert
+        stmt = insert(EntityEmbeddingModel).values(values)
+        stmt = stmt.on_conflict_do_nothing(index_elements=["entity_id", "model_name"])
+        if self._ann_index is None:
+            result: Any = await session.execute(stmt)
+            if result.rowcount:
+                mark_catalogue_changed(session)
+            return int(result.rowcount)
+
+        # RETURNING yields only the rows the insert wrote, not conflicts
+        written = set((await session.execute(stmt.returning(EntityEmbeddingModel.entity_id))).scalars())
+        if written:
+            mark_catalogue_changed(session)
+        new_rows = [(str(entity_id), embedding) for entity_id, embedding in rows if entity_id in written]
+        if new_rows:
+            self._ann_index.add_many([entity_id for entity_id, _ in new_rows], [vector for _, vector in new_rows])
+        return len(written)
+
+    async def backfill_embeddings(
+        self,
+        *,
+        session: AsyncSession,
+        page_size: int = 1000,
+        batch_size: int = 64,
+        checkpoint_path: str | Path | None = None,
+        max_pages: int | None = None,
+    ) -> BackfillReport:
+        """Embed every resolved entity that has no embedding for this model.
+
+        Streams ``resolved_entities`` in ``entity_id`` order (keyset
+        pagination, so each page is an index range scan), encodes each page
+        through the model's batched ``encode`` and inserts it with
+        ``store_embeddings``. Each page is committed before the checkpoint
+        is advanced, so an interrupted job resumes after the last
+        committed page and never loses or duplicates work.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Session dedicated to the job; committed after every page.
+        page_size : int, optional
+            Entities read and written per page. Default 1000.
+        batch_size : int, optional
+            Texts per model forward pass. Default 64.
+        checkpoint_path : str | Path | None, optional
+            JSON checkpoint file. If it exists the job resumes from it.
+        max_pages : int | None, optional
+            Stop after this many pages in this run (``None`` runs to the end).
+
+        Returns
+        -------
+        BackfillReport
+            Cumulative counters and this run's throughput.
+        """
+        path = Path(checkpoint_path) if checkpoint_path is not None else None
+        report = BackfillReport.load(path) if path is not None else BackfillReport()
+        started = time.perf_counter()
+        pages_this_run = 0
+
+        while max_pages is None or pages_this_run < max_pages:
+            stmt = (
+                select(
+                    ResolvedEntityModel.entity_id,
+                    ResolvedEntityModel.entity_type,
+                    ResolvedEntityModel.canonical_name,
+                    ResolvedEntityModel.alternative_names,
+                )
+                .where(
+                    ~exists().where(
+                        EntityEmbeddingModel.entity_id == ResolvedEntityModel.entity_id,
+                        EntityEmbeddingModel.model_name == self._model_name,
+                    ),
+                )
+                .order_by(ResolvedEntityModel.entity_id)
+                .limit(page_size)
+            )
+            if report.last_entity_id is not None:
+                stmt = stmt.where(ResolvedEntityModel.entity_id > uuid.UUID(report.last_entity_id))
+            page = (await session.execute(stmt)).all()
+            if not page:
+                break
+
+            texts = [
+                self.format_entity_text(
+                    name,
+                    entity_type,
+                    parse_jsonb(alternative_names) if alternative_names else None,  # type: ignore[arg-type]
+                )
+                for _, entity_type, name, alternative_names in page
+            ]
+            embeddings = self.generate_embeddings(texts, batch_size=batch_size)
+            inserted = await self.store_embeddings(
+                [(row[0], embedding) for row, embedding in zip(page, embeddings, strict=True)],
+                session=session,
+            )
+            await session.commit()
+
+            report.last_entity_id = str(page[-1][0])
+            report.entities_seen += len(page)
+            report.entities_this_run += len(page)
+            report.embedded += inserted
+            report.skipped_existing += len(page) - inserted
+            report.pages += 1
+            report.seconds = time.perf_counter() - started
+            pages_this_run += 1
+            if path is not None:
+                report.save(path)
+            logger.info(
+                "Embedding backfill: %d entities (%.1f entities/sec)",
+                report.entities_seen,
+                report.entities_per_second,
+            )
+
+        report.seconds = time.perf_counter() - started
+        return report
@@ -0,0 +1,263 @@
+"""Compressed (CSR) adjacency index for batched graph-evidence scoring.
+
+``GraphResolver`` keeps its relationship graph as a dict of Python sets,
+which is convenient for incremental edits but slow to query: every
+``score_graph_evidence`` call rebuilds two neighbor sets, and candidate
+search walks neighbors-of-neighbors one element at a time.
+``AdjacencyIndex`` is an immutable snapshot of the same graph in
+compressed sparse row form:
+
+- entity IDs are interned to dense integer positions;
+- ``indptr[i]:indptr[i + 1]`` slices ``indices`` to the sorted, de-duplicated
+  neighbors of node ``i`` (relationship types are collapsed, matching the
+  set semantics of the resolver).
+
+Pair scoring gathers the neighbor rows of thousands of pairs at once and
+counts intersections with a single sort, and the top-k candidate query
+counts two-hop paths with ``np.unique`` over the reached nodes only. Hub nodes (e.g. compilation
+labels or "Various Artists" releases linked to thousands of entities) are
+skipped during the two-hop walk when their degree exceeds ``max_degree``,
+since they connect almost everything and carry little evidence.
+
+See Also
+--------
+music_attribution.resolution.graph_resolution : Builds and queries the index.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+
+import numpy as np
+
+# Pairs scored per vectorized pass in ``score_pairs`` (bounds peak memory)
+_PAIR_CHUNK = 8_192
+
+
+class AdjacencyIndex:
+    """CSR snapshot of an undirected graph with interned string IDs.
+
+    Parameters
+    ----------
+    ids : Sequence[str]
+        Node IDs; position ``i`` is node ``i``.
+    indptr : numpy.ndarray
+        Row offsets (int64, length ``len(ids) + 1``).
+    indices : numpy.ndarray
+        Concatenated neighbor positions (int64), sorted within each row.
+
+    Attributes
+    ----------
+    _ids : list[str]
+        Node ID per position.
+    _positions : dict[str, int]
+        Node ID to position.
+    _indptr : numpy.ndarray
+        Row offsets.
+    _indices : numpy.ndarray
+        Neighbor positions.
+    _degree : numpy.ndarray
+        Neighbor count per node (int64), with a trailing 0 so that
+        position ``-1`` (unknown node) has degree 0.
+
+    Examples
+    --------
+    >>> index = AdjacencyIndex.from_adjacency({"a": {"x", "y"}, "b": {"x", "y"}, "x": {"a", "b"}, "y": {"a", "b"}})
+    >>> index.score_pairs(["a"], ["b"]).tolist()
+    [1.0]
+    """
+
+    def __init__(self, ids: Sequence[str], indptr: np.ndarray, indices: np.ndarray) -> None:
+        self._ids = list(ids)
+        self._positions = {node_id: pos for pos, node_id in enumerate(self._ids)}
+        self._indptr = indptr
+        self._indices = indices
+        self._degree = np.append(np.diff(indptr), 0)
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Mapping[str, Iterable[str]]) -> AdjacencyIndex:
+        """Build the index from a node-to-neighbors mapping.
+
+        Parameters
+        ----------
+        adjacency : Mapping[str, Iterable[str]]
+            Neighbor IDs per node. Neighbors that are not keys are added
+            as nodes; duplicates are removed.
+
+        Returns
+        -------
+        AdjacencyIndex
+            CSR index over every node mentioned in ``adjacency``.
+        """
+        positions: dict[str, int] = {node_id: pos for pos, node_id in enumerate(adjacency)}
+        sources: list[int] = []
+        targets: list[int] = []
+        for node_id, neighbors in adjacency.items():
+            source = positions[node_id]
+            for neighbor in neighbors:
+                sources.append(source)
+                targets.append(positions.setdefault(neighbor, len(positions)))
+
+        size = len(positions)
+        # De-duplicate and sort rows in one pass via combined keys
+        keys = np.unique(np.asarray(sources, dtype=np.int64) * size + np.asarray(targets, dtype=np.int64))
+        rows, indices = np.divmod(keys, max(size, 1))
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=size), out=indptr[1:])
+        return cls(list(positions), indptr, indices)
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self._ids)
+
+    def __contains__(self, node_id: object) -> bool:
+        """Return whether ``node_id`` is a node of the index."""
+        return node_id in self._positions
+
+    def degree(self, node_id: str) -> int:
+        """Return the number of distinct neighbors of ``node_id`` (0 if absent)."""
+        pos = self._positions.get(node_id)
+        return 0 if pos is None else int(self._degree[pos])
+
+    def neighbors(self, node_id: str) -> list[str]:
+        """Return the neighbor IDs of ``node_id`` (empty if absent)."""
+        pos = self._positions.get(node_id)
+        if pos is None:
+            return []
+        return [self._ids[i] for i in self._indices[self._indptr[pos] : self._indptr[pos + 1]]]
+
+    def shared_counts(self, left: Sequence[str], right: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Count shared and total neighbors for many pairs at once.
+
+        Parameters
+        ----------
+        left : Sequence[str]
+            First node of each pair.
+        right : Sequence[str]
+            Second node of each pair; same length as ``left``.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            ``|N(a) & N(b)|`` and ``|N(a) | N(b)|`` per pair (int64). Unknown
+            nodes have no neighbors.
+
+        Raises
+        ------
+        ValueError
+            If ``left`` and ``right`` differ in length.
+        """
+        if len(left) != len(right):
+            msg = f"shared_counts requires equal-length sequences, got {len(left)} and {len(right)}"
+            raise ValueError(msg)
+        left_pos = self._lookup(left)
+        right_pos = self._lookup(right)
+        shared = np.zeros(len(left_pos), dtype=np.int64)
+        for start in range(0, len(left_pos), _PAIR_CHUNK):
+            stop = start + _PAIR_CHUNK
+            shared[start:stop] = self._intersections(left_pos[start:stop], right_pos[start:stop])
+        union = self._row_degree(left_pos) + self._row_degree(right_pos) - shared
+        return shared, union
+
+    def score_pairs(self, left: Sequence[str], right: Sequence[str]) -> np.ndarray:
+        """Graph-evidence score for many pairs (see ``GraphResolver.score_graph_evidence``).
+
+        The score averages the Jaccard coefficient of the neighbor sets
+        with a shared-count boost ``min(shared / 3, 1)``.
+
+        Parameters
+        ----------
+        left : Sequence[str]
+            First node of each pair.
+        right : Sequence[str]
+            Second node of each pair.
+
+        Returns
+        -------
+        numpy.ndarray
+            Scores in ``[0, 1]`` (float64); 0.0 for pairs sharing no neighbor.
+        """
+        shared, union = self.shared_counts(left, right)
+        jaccard = np.divide(shared, union, out=np.zeros(len(shared)), where=union > 0)
+        boost = np.minimum(shared / 3.0, 1.0)
+        return np.where(shared > 0, np.minimum((jaccard + boost) / 2.0, 1.0), 0.0)
+
+    def top_k(
+        self,
+        node_id: str,
+        *,
+        k: int | None = None,
+        min_shared: int = 2,
+        max_degree: int | None = None,
+    ) -> list[tuple[str, int]]:
+        """Find the nodes sharing the most neighbors with ``node_id``.
+
+        Parameters
+        ----------
+        node_id : str
+            Query node.
+        k : int | None, optional
+            Maximum number of candidates (``None`` returns all).
+        min_shared : int, optional
+            Minimum shared-neighbor count. Default 2.
+        max_degree : int | None, optional
+            Skip intermediate neighbors with more than this many neighbors
+            of their own (hub pruning). ``None`` disables pruning.
+
+        Returns
+        -------
+        list[tuple[str, int]]
+            ``(candidate_id, shared_count)`` by count descending, ties in
+            node insertion order. The query node is never included.
+        """
+        pos = self._positions.get(node_id)
+        if pos is None:
+            return []
+        via = self._indices[self._indptr[pos] : self._indptr[pos + 1]]
+        if max_degree is not None:
+            via = via[self._degree[via] <= max_degree]
+        _, reached = self._gather(via)
+        reached_nodes, counts = np.unique(reached, return_counts=True)
+        keep = (counts >= max(min_shared, 1)) & (reached_nodes != pos)
+        reached_nodes, counts = reached_nodes[keep], counts[keep]
+
+        # Stable sort on -count keeps insertion order among ties
+        order = np.argsort(-counts, kind="stable")
+        if k is not None:
+            order = order[:k]
+        return [(self._ids[node], int(counts[i])) for node, i in zip(reached_nodes[order], order, strict=True)]
+
+    def _lookup(self, node_ids: Sequence[str]) -> np.ndarray:
+        """Map IDs to positions; unknown IDs become ``-1``."""
+        return np.fromiter((self._positions.get(n, -1) for n in node_ids), dtype=np.int64, count=len(node_ids))
+
+    def _row_degree(self, positions: np.ndarray) -> np.ndarray:
+        """Degree per position (0 for ``-1``)."""
+        degrees: np.ndarray = self._degree[positions]
+        return degrees
+
+    def _gather(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Concatenate the neighbor rows of ``rows`` (``-1`` rows are empty).
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            Index into ``rows`` owning each neighbor, and the neighbors.
+        """
+        lengths = self._row_degree(rows)
+        owner = np.repeat(np.arange(len(rows)), lengths)
+        # Offset of each gathered element within its row
+        within = np.arange(len(owner)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return owner, self._indices[self._indptr[rows[owner]] + within]
+
+    def _intersections(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """Shared-neighbor count per pair via one sort of tagged neighbors."""
+        size = max(len(self._ids), 1)
+        left_owner, left_neighbors = self._gather(left)
+        right_owner, right_neighbors = self._gather(right)
+        # Rows are de-duplicated, so a repeated (pair, neighbor) key means shared
+        keys = np.sort(
+            np.concatenate((left_owner * size + left_neighbors, right_owner * size + right_neighbors)),
+        )
+        repeated = keys[1:][keys[1:] == keys[:-1]]
+        return np.bincount(repeated // size, minlength=len(left))
@@ -32,6 +32,9 @@ import logging
 from collections import defaultdict
 from datetime import UTC, datetime
 
+import numpy as np
+
+from music_attribution.resolution.union_find import DisjointSet
 from music_attribution.schemas.enums import (
     AssuranceLevelEnum,
     ConflictSeverityEnum,
@@ -115,8 +118,8 @@ class IdentifierMatcher:
         """Group records that share any identifier using union-find.
 
         Builds an inverted index from ``field:value`` keys to record indices,
-        then uses union-find with path compression to merge all records
-        sharing any identifier into the same group.
+        then merges all records sharing any identifier into the same group
+        with a bulk ``DisjointSet.union_pairs`` call.
 
         Parameters
         ----------
@@ -139,32 +142,17 @@ class IdentifierMatcher:
                     key = f"{field}:{value}"
                     id_to_indices[key].add(i)
 
-        # Union-find to group records
-        parent = list(range(len(records)))
-
-        def find(x: int) -> int:
-            while parent[x] != x:
-                parent[x] = parent[parent[x]]
-                x = parent[x]
-            return x
-
-        def union(x: int, y: int) -> None:
-            px, py = find(x), find(y)
-            if px != py:
-                parent[px] = py
-
-        # Union records that share any identifier
+        # Union records that share any identifier (star edges to one holder)
+        left: list[int] = []
+        right: list[int] = []
         for indices in id_to_indices.values():
-            idx_list = list(indices)
-            for j in range(1, len(idx_list)):
-                union(idx_list[0], idx_list[j])
-
-        # Collect groups
-        group_map: dict[int, list[int]] = defaultdict(list)
-        for i in range(len(records)):
-            group_map[find(i)].append(i)
+            idx_list = sorted(indices)
+            left.extend([idx_list[0]] * (len(idx_list) - 1))
+            right.extend(idx_list[1:])
+        forest = DisjointSet(len(records))
+        forest.union_pairs(np.asarray(left, dtype=np.int64), np.asarray(right, dtype=np.int64))
 
-        return [[records[i] for i in group] for group in group_map.values()]
+        return [[records[i] for i in group] for group in forest.groups()]
 
     def _build_entity(self, records: list[NormalizedRecord]) -> ResolvedEntity:
         """Build a ResolvedEntity from a group of identifier-matched records.
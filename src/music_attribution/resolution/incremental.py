@@ -0,0 +1,219 @@
+"""Entity state and deltas for incremental resolution.
+
+``ResolutionOrchestrator.resolve`` rebuilds every entity from the records it
+is given. ``ResolutionOrchestrator.resolve_incremental`` instead takes only
+new or changed records plus a ``ResolutionState`` -- the current entities,
+their member records, and lookup indexes -- and re-resolves just the
+clusters those records touch. The outcome is reported as a
+``ResolutionDelta`` so callers can persist only what changed.
+
+The state keeps three indexes in sync with the entities it holds:
+
+- **record owner** -- ``(source, source_id)`` to entity, so a changed
+  record replaces its previous version instead of being added twice;
+- **identifier index** -- ``"isrc:<value>"``-style keys (the same keys
+  Stage 1 uses) to entity;
+- **name index** -- a ``NameIndex`` over canonical and alternative names
+  for fuzzy attachment of identifier-less records.
+
+See Also
+--------
+music_attribution.resolution.orchestrator : Runs the incremental cascade.
+music_attribution.resolution.name_index : Cross-batch fuzzy name lookup.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from music_attribution.resolution.name_index import NameIndex
+from music_attribution.schemas.normalized import NormalizedRecord
+from music_attribution.schemas.resolved import ResolvedEntity
+
+# Identifier fields used for exact-match attachment (mirrors Stage 1)
+_IDENTIFIER_FIELDS = ("isrc", "iswc", "isni", "mbid", "acoustid")
+
+
+def _identifier_keys(record: NormalizedRecord) -> list[str]:
+    """Return the ``"<field>:<value>"`` identifier keys of a record.
+
+    Parameters
+    ----------
+    record : NormalizedRecord
+        Record to inspect.
+
+    Returns
+    -------
+    list[str]
+        One key per populated identifier field.
+    """
+    keys = []
+    for field in _IDENTIFIER_FIELDS:
+        val = getattr(record.identifiers, field, None)
+        if val:
+            keys.append(f"{field}:{val}")
+    return keys
+
+
+def _record_key(record: NormalizedRecord) -> tuple[str, str]:
+    """Return the stable ``(source, source_id)`` identity of a record."""
+    return (str(record.source), record.source_id)
+
+
+class ResolutionDelta(NamedTuple):
+    """Changes produced by one incremental resolution run.
+
+    Attributes
+    ----------
+    created : list[ResolvedEntity]
+        Entities formed only from new records.
+    updated : list[ResolvedEntity]
+        Existing entities that gained or changed records. Their
+        ``entity_id`` is preserved.
+    merged : list[ResolvedEntity]
+        Entities formed by merging two or more existing entities. The
+        surviving ``entity_id`` is kept and ``merged_from`` lists the
+        retired IDs.
+    retired : list[uuid.UUID]
+        Entity IDs absorbed by a merge; callers should delete them.
+    """
+
+    created: list[ResolvedEntity]
+    updated: list[ResolvedEntity]
+    merged: list[ResolvedEntity]
+    retired: list[uuid.UUID]
+
+
+class ResolutionState:
+    """Current resolved entities with their member records and indexes.
+
+    Parameters
+    ----------
+    name_index : NameIndex | None, optional
+        Name index to maintain. Defaults to an empty ``NameIndex``.
+
+    Attributes
+    ----------
+    _entities : dict[uuid.UUID, ResolvedEntity]
+        Current entities by ID.
+    _members : dict[uuid.UUID, list[NormalizedRecord]]
+        Member records of each entity.
+    _record_owner : dict[tuple[str, str], uuid.UUID]
+        ``(source, source_id)`` to owning entity.
+    _identifier_owner : dict[str, uuid.UUID]
+        Identifier key to owning entity.
+    _name_index : NameIndex
+        Fuzzy index over entity names.
+    """
+
+    def __init__(self, name_index: NameIndex | None = None) -> None:
+        self._entities: dict[uuid.UUID, ResolvedEntity] = {}
+        self._members: dict[uuid.UUID, list[NormalizedRecord]] = {}
+        self._record_owner: dict[tuple[str, str], uuid.UUID] = {}
+        self._identifier_owner: dict[str, uuid.UUID] = {}
+        self._name_index = name_index if name_index is not None else NameIndex()
+
+    @classmethod
+    def from_entities(
+        cls,
+        entities: Iterable[tuple[ResolvedEntity, list[NormalizedRecord]]],
+        name_index: NameIndex | None = None,
+    ) -> ResolutionState:
+        """Build a state from entities and their member records.
+
+        Parameters
+        ----------
+        entities : Iterable[tuple[ResolvedEntity, list[NormalizedRecord]]]
+            Each entity paired with the records it was resolved from.
+        name_index : NameIndex | None, optional
+            Name index to maintain (re-populated from ``entities``).
+
+        Returns
+        -------
+        ResolutionState
+            Populated state.
+        """
+        state = cls(name_index)
+        for entity, records in entities:
+            state.put(entity, records)
+        return state
+
+    def __len__(self) -> int:
+        """Return the number of entities."""
+        return len(self._entities)
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Return whether an entity is held."""
+        return entity_id in self._entities
+
+    @property
+    def name_index(self) -> NameIndex:
+        """Name index kept in sync with the held entities."""
+        return self._name_index
+
+    def entities(self) -> list[ResolvedEntity]:
+        """Return all current entities."""
+        return list(self._entities.values())
+
+    def get(self, entity_id: uuid.UUID) -> ResolvedEntity | None:
+        """Return an entity by ID, or ``None``."""
+        return self._entities.get(entity_id)
+
+    def members(self, entity_id: uuid.UUID) -> list[NormalizedRecord]:
+        """Return the member records of an entity (empty if unknown)."""
+        return list(self._members.get(entity_id, []))
+
+    def owner_of(self, record: NormalizedRecord) -> uuid.UUID | None:
+        """Return the entity currently holding this record's source identity."""
+        return self._record_owner.get(_record_key(record))
+
+    def owner_of_identifier(self, key: str) -> uuid.UUID | None:
+        """Return the entity holding an identifier key, or ``None``."""
+        return self._identifier_owner.get(key)
+
+    def put(self, entity: ResolvedEntity, records: list[NormalizedRecord]) -> None:
+        """Insert or replace an entity and its member records.
+
+        Parameters
+        ----------
+        entity : ResolvedEntity
+            Entity to store (keyed by ``entity.entity_id``).
+        records : list[NormalizedRecord]
+            Records the entity was resolved from.
+        """
+        self.remove(entity.entity_id)
+        entity_id = entity.entity_id
+        self._entities[entity_id] = entity
+        self._members[entity_id] = list(records)
+        for record in records:
+            self._record_owner[_record_key(record)] = entity_id
+            for key in _identifier_keys(record):
+                self._identifier_owner[key] = entity_id
+        self._name_index.add_entity(entity)
+
+    def remove(self, entity_id: uuid.UUID) -> bool:
+        """Remove an entity and its index entries.
+
+        Parameters
+        ----------
+        entity_id : uuid.UUID
+            Entity to remove.
+
+        Returns
+        -------
+        bool
+            ``True`` if the entity was held.
+        """
+        if self._entities.pop(entity_id, None) is None:
+            return False
+        for record in self._members.pop(entity_id, []):
+            rkey = _record_key(record)
+            if self._record_owner.get(rkey) == entity_id:
+                del self._record_owner[rkey]
+            for key in _identifier_keys(record):
+                if self._identifier_owner.get(key) == entity_id:
+                    del self._identifier_owner[key]
+        self._name_index.remove(entity_id)
+        return True
@@ -0,0 +1,524 @@
+"""Tiered, persistent cache for LLM disambiguation decisions.
+
+``LLMDisambiguator`` keys each request by a SHA-256 of the candidate set
+and context (``_cache_key``). A decision for a given key is worth reusing
+across restarts, pipeline runs and API workers, so ``TieredLLMCache``
+layers two stores:
+
+- **Memory tier** -- a bounded, per-process LRU (``OrderedDict``) serving
+  repeat requests without I/O.
+- **Durable tier** (optional) -- an ``LLMCacheStore`` shared between
+  processes: ``SQLiteLLMCacheStore`` (a local file, WAL mode) or
+  ``ValkeyLLMCacheStore`` (the deployment's ``valkey_url``).
+
+Entries carry the wall-clock time they were stored and expire after
+``ttl_seconds`` in both tiers. Both tiers evict their oldest entries
+beyond ``max_entries``. ``CacheStats`` counts memory hits, durable
+hits, misses, expirations and evictions. ``warm_up()`` preloads the
+most recent durable decisions into memory at process start.
+
+Payloads are opaque JSON strings, so this module does not depend on the
+result model.
+
+See Also
+--------
+music_attribution.resolution.llm_disambiguation : Uses the cache.
+music_attribution.cli.llm_cache : Warm-up, purge and stats commands.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, NamedTuple, Protocol
+
+try:
+    import valkey.asyncio as valkey_asyncio
+
+    VALKEY_AVAILABLE = True
+except ImportError:
+    VALKEY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Default lifetime of a cached decision (7 days)
+_DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+class CacheEntry(NamedTuple):
+    """One cached decision.
+
+    Attributes
+    ----------
+    key : str
+        ``LLMDisambiguator._cache_key`` digest.
+    payload : str
+        Serialized decision (JSON).
+    stored_at : float
+        Unix time the decision was cached.
+    """
+
+    key: str
+    payload: str
+    stored_at: float
+
+
+@dataclass
+class CacheStats:
+    """Cumulative hit/miss counters for a ``TieredLLMCache``.
+
+    Attributes
+    ----------
+    memory_hits : int
+        Lookups served by the in-process LRU.
+    store_hits : int
+        Lookups served by the durable store (then promoted to memory).
+    misses : int
+        Lookups found in neither tier (including expired entries).
+    expired : int
+        Entries found but discarded because they outlived the TTL.
+    writes : int
+        Decisions written through to the cache.
+    evictions : int
+        Entries dropped from the memory tier by the size bound.
+    """
+
+    memory_hits: int = 0
+    store_hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served by either tier (0.0 before any lookup)."""
+        hits = self.memory_hits + self.store_hits
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+
+class LLMCacheStore(Protocol):
+    """Durable, shareable tier behind the in-process LRU."""
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for ``key``, or ``None``."""
+        ...
+
+    async def put(self, entry: CacheEntry) -> None:
+        """Insert or replace ``entry``."""
+        ...
+
+    async def recent(self, limit: int, since: float = 0.0) -> list[CacheEntry]:
+        """Return up to ``limit`` entries stored after ``since``, newest first."""
+        ...
+
+    async def purge(self, before: float) -> int:
+        """Delete entries stored before ``before``; return how many."""
+        ...
+
+    async def count(self) -> int:
+        """Return the number of stored entries."""
+        ...
+
+    async def close(self) -> None:
+        """Release connections."""
+        ...
+
+
+class SQLiteLLMCacheStore:
+    """``LLMCacheStore`` in a local SQLite file.
+
+    The database runs in WAL mode so several processes on one host can
+    read and write it concurrently. Statements run on a worker thread
+    (``asyncio.to_thread``) so a busy or slow disk never blocks the event
+    loop; a lock serializes this instance's use of its connection.
+
+    Parameters
+    ----------
+    path : str | Path
+        Database file (created if missing). ``":memory:"`` for tests.
+    max_entries : int, optional
+        Oldest entries beyond this count are deleted on insert.
+        Default 100,000.
+
+    Attributes
+    ----------
+    _conn : sqlite3.Connection
+        Open connection.
+    _lock : threading.Lock
+        Serializes statements on ``_conn``.
+    _max_entries : int
+        Size bound.
+
+    Notes
+    -----
+    The size bound is enforced in SQL against the rows actually in the
+    file, so it holds when several processes share the database.
+    """
+
+    def __init__(self, path: str | Path, *, max_entries: int = 100_000) -> None:
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, payload TEXT NOT NULL, stored_at REAL NOT NULL)",
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_stored_at ON llm_cache (stored_at)")
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for ``key``, or ``None``."""
+        row = await asyncio.to_thread(
+            self._fetchone,
+            "SELECT key, payload, stored_at FROM llm_cache WHERE key = ?",
+            (key,),
+        )
+        return CacheEntry(*row) if row is not None else None
+
+    async def put(self, entry: CacheEntry) -> None:
+        """Insert or replace ``entry`` and enforce ``max_entries``."""
+        await asyncio.to_thread(self._put, entry)
+
+    async def recent(self, limit: int, since: float = 0.0) -> list[CacheEntry]:
+        """Return up to ``limit`` entries stored after ``since``, newest first."""
+        rows = await asyncio.to_thread(self._fetchall, since, limit)
+        return [CacheEntry(*row) for row in rows]
+
+    async def purge(self, before: float) -> int:
+        """Delete entries stored before ``before``; return how many."""
+        return await asyncio.to_thread(self._delete_before, before)
+
+    async def count(self) -> int:
+        """Return the number of stored entries."""
+        row = await asyncio.to_thread(self._fetchone, "SELECT COUNT(*) FROM llm_cache", ())
+        return int(row[0]) if row is not None else 0
+
+    async def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _fetchone(self, sql: str, params: tuple[Any, ...]) -> tuple[Any, ...] | None:
+        """Run a single-row query."""
+        with self._lock:
+            row: tuple[Any, ...] | None = self._conn.execute(sql, params).fetchone()
+            return row
+
+    def _fetchall(self, since: float, limit: int) -> list[tuple[Any, ...]]:
+        """Select up to ``limit`` rows stored after ``since``, newest first."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT key, payload, stored_at FROM llm_cache WHERE stored_at >= ? ORDER BY stored_at DESC LIMIT ?",
+                (since, limit),
+            ).fetchall()
+
+    def _put(self, entry: CacheEntry) -> None:
+        """Upsert ``entry`` and trim the table in one write transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                inserted = self._conn.execute(
+                    "INSERT OR IGNORE INTO llm_cache (key, payload, stored_at) VALUES (?, ?, ?)",
+                    entry,
+                ).rowcount
+                if inserted:
+                    # Everything past the newest max_entries rows is evicted
+                    self._conn.execute(
+                        "DELETE FROM llm_cache WHERE key IN "
+                        "(SELECT key FROM llm_cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                        (self._max_entries,),
+                    )
+                else:
+                    self._conn.execute(
+                        "UPDATE llm_cache SET payload = ?, stored_at = ? WHERE key = ?",
+                        (entry.payload, entry.stored_at, entry.key),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _delete_before(self, before: float) -> int:
+        """Delete rows stored before ``before``; return how many."""
+        with self._lock:
+            return int(self._conn.execute("DELETE FROM llm_cache WHERE stored_at < ?", (before,)).rowcount)
+
+
+class ValkeyLLMCacheStore:
+    """``LLMCacheStore`` in Valkey (or Redis), shared by all workers.
+
+    Each decision is a string key with a server-side expiry equal to the
+    TTL, holding ``"<stored_at>\\n<payload>"``. A sorted set scored by
+    ``stored_at`` indexes keys for ``recent()``, ``purge()`` and the size
+    bound; index members older than the TTL are dropped on insert, before
+    the bound is checked.
+
+    Parameters
+    ----------
+    url : str
+        Connection URL (``Settings.valkey_url``). Ignored when ``client``
+        is given.
+    ttl_seconds : float, optional
+        Server-side expiry for each entry.
+    max_entries : int, optional
+        Oldest entries beyond this count are deleted on insert.
+    prefix : str, optional
+        Key namespace. Default ``"llm-cache:"``.
+    client : Any, optional
+        Pre-built async client (``valkey.asyncio.Valkey`` compatible).
+
+    Attributes
+    ----------
+    _client : Any
+        Async client.
+    _ttl : int
+        Expiry in whole seconds.
+    _max_entries : int
+        Size bound.
+    _prefix : str
+        Key namespace.
+    _index : str
+        Sorted-set key indexing entries by ``stored_at``.
+
+    Raises
+    ------
+    ImportError
+        If no ``client`` is given and the ``valkey`` package is not
+        installed.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        max_entries: int = 1_000_000,
+        prefix: str = "llm-cache:",
+        client: Any = None,
+    ) -> None:
+        if client is None:
+            if not VALKEY_AVAILABLE:
+                msg = "ValkeyLLMCacheStore requires the 'valkey' package"
+                raise ImportError(msg)
+            client = valkey_asyncio.from_url(url, decode_responses=True)
+        self._client = client
+        self._ttl = max(int(ttl_seconds), 1)
+        self._max_entries = max_entries
+        self._prefix = prefix
+        self._index = f"{prefix}index"
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for ``key``, or ``None``."""
+        value = await self._client.get(self._prefix + key)
+        if value is None:
+            return None
+        stored_at, _, payload = value.partition("\n")
+        return CacheEntry(key, payload, float(stored_at))
+
+    async def put(self, entry: CacheEntry) -> None:
+        """Insert or replace ``entry`` and enforce ``max_entries``."""
+        await self._client.set(self._prefix + entry.key, f"{entry.stored_at!r}\n{entry.payload}", ex=self._ttl)
+        await self._client.zadd(self._index, {entry.key: entry.stored_at})
+        # Entries whose string key the server has already expired would
+        # otherwise still count towards the bound
+        await self._client.zremrangebyscore(self._index, "-inf", f"({entry.stored_at - self._ttl!r}")
+        overflow = await self._client.zcard(self._index) - self._max_entries
+        if overflow > 0:
+            oldest = await self._client.zrange(self._index, 0, overflow - 1)
+            await self._remove(oldest)
+
+    async def recent(self, limit: int, since: float = 0.0) -> list[CacheEntry]:
+        """Return up to ``limit`` live entries stored after ``since``, newest first."""
+        keys = await self._client.zrevrangebyscore(self._index, "+inf", since, start=0, num=limit)
+        entries = []
+        for key in keys:
+            entry = await self.get(key)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    async def purge(self, before: float) -> int:
+        """Delete entries stored before ``before``; return how many."""
+        stale = await self._client.zrangebyscore(self._index, "-inf", f"({before!r}")
+        await self._remove(stale)
+        return len(stale)
+
+    async def count(self) -> int:
+        """Return the number of indexed entries."""
+        return int(await self._client.zcard(self._index))
+
+    async def close(self) -> None:
+        """Close the client connection pool."""
+        await self._client.aclose()
+
+    async def _remove(self, keys: list[str]) -> None:
+        """Delete ``keys`` and their index entries."""
+        if keys:
+            await self._client.delete(*(self._prefix + key for key in keys))
+            await self._client.zrem(self._index, *keys)
+
+
+class TieredLLMCache:
+    """In-process LRU in front of an optional durable ``LLMCacheStore``.
+
+    Lookups check memory first, then the store; store hits are promoted
+    into memory. Writes go to both tiers. Entries older than
+    ``ttl_seconds`` are treated as misses and dropped.
+
+    Parameters
+    ----------
+    store : LLMCacheStore | None, optional
+        Durable tier. ``None`` keeps the cache process-local.
+    max_memory_entries : int, optional
+        LRU capacity. Default 4096.
+    ttl_seconds : float, optional
+        Entry lifetime. Default 7 days.
+    clock : Callable[[], float], optional
+        Wall-clock source (``time.time``); injectable for tests.
+
+    Attributes
+    ----------
+    _store : LLMCacheStore | None
+        Durable tier.
+    _memory : OrderedDict[str, CacheEntry]
+        LRU tier, least recently used first.
+    _max_memory_entries : int
+        LRU capacity.
+    _ttl : float
+        Entry lifetime in seconds.
+    _clock : Callable[[], float]
+        Time source.
+    _stats : CacheStats
+        Hit/miss counters.
+
+    Examples
+    --------
+    >>> cache = TieredLLMCache(SQLiteLLMCacheStore("llm-cache.sqlite"))
+    >>> await cache.warm_up(limit=1000)
+    >>> disambiguator = LLMDisambiguator(cache=cache)
+    """
+
+    def __init__(
+        self,
+        store: LLMCacheStore | None = None,
+        *,
+        max_memory_entries: int = 4096,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._store = store
+        self._memory: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._max_memory_entries = max_memory_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Cumulative hit/miss counters."""
+        return self._stats
+
+    def __len__(self) -> int:
+        """Return the number of entries in the memory tier."""
+        return len(self._memory)
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached payload for ``key``, or ``None`` on a miss.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        str | None
+            Serialized decision, or ``None`` if absent or expired.
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            if self._is_fresh(entry):
+                self._memory.move_to_end(key)
+                self._stats.memory_hits += 1
+                return entry.payload
+            del self._memory[key]
+            self._stats.expired += 1
+
+        if self._store is not None:
+            stored = await self._store.get(key)
+            if stored is not None:
+                if self._is_fresh(stored):
+                    self._remember(stored)
+                    self._stats.store_hits += 1
+                    return stored.payload
+                self._stats.expired += 1
+
+        self._stats.misses += 1
+        return None
+
+    async def put(self, key: str, payload: str) -> None:
+        """Cache ``payload`` under ``key`` in both tiers."""
+        entry = CacheEntry(key, payload, self._clock())
+        self._remember(entry)
+        if self._store is not None:
+            await self._store.put(entry)
+        self._stats.writes += 1
+
+    async def warm_up(self, *, limit: int | None = None, max_age: float | None = None) -> int:
+        """Preload the most recent durable entries into memory.
+
+        Parameters
+        ----------
+        limit : int | None, optional
+            Maximum entries to load. Defaults to the memory capacity.
+        max_age : float | None, optional
+            Only load entries younger than this many seconds. Defaults
+            to the TTL.
+
+        Returns
+        -------
+        int
+            Number of entries loaded (0 without a durable store).
+        """
+        if self._store is None:
+            return 0
+        limit = min(limit or self._max_memory_entries, self._max_memory_entries)
+        since = self._clock() - min(max_age if max_age is not None else self._ttl, self._ttl)
+        entries = await self._store.recent(limit, since)
+        # Insert oldest first so the newest end up most recently used
+        for entry in reversed(entries):
+            self._remember(entry)
+        logger.info("Warmed LLM cache with %d entries", len(entries))
+        return len(entries)
+
+    async def purge_expired(self) -> int:
+        """Drop expired entries from both tiers; return the durable count removed."""
+        cutoff = self._clock() - self._ttl
+        for key in [k for k, e in self._memory.items() if e.stored_at < cutoff]:
+            del self._memory[key]
+        return await self._store.purge(cutoff) if self._store is not None else 0
+
+    async def close(self) -> None:
+        """Close the durable store."""
+        if self._store is not None:
+            await self._store.close()
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        """Return whether ``entry`` is within the TTL."""
+        return self._clock() - entry.stored_at <= self._ttl
+
+    def _remember(self, entry: CacheEntry) -> None:
+        """Insert ``entry`` as most recently used, evicting beyond capacity."""
+        self._memory[entry.key] = entry
+        self._memory.move_to_end(entry.key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats.evictions += 1
@@ -11,9 +11,21 @@ Key design decisions:
 - **Cost gating**: LLM invocation is guarded by ``should_invoke()``, which
   checks that the best existing signal falls in the ambiguity range.
 - **Deterministic caching**: A SHA-256 cache key prevents duplicate LLM
-  calls for the same candidate set and context.
+  calls for the same candidate set and context. Decisions live in a
+  ``TieredLLMCache`` (bounded LRU, optionally backed by SQLite or Valkey
+  so they survive restarts and are shared between workers).
+- **Batching**: With a ``SchedulerConfig``, concurrent cache misses are
+  coalesced by key and packed into batch calls (``_call_llm_batch``)
+  under a concurrency limit. A batch is one numbered prompt answered by
+  one structured ``BatchDisambiguationResult`` (``_call_llm_structured``);
+  without a structured endpoint it falls back to one ``_call_llm`` per
+  request.
 - **Structured output**: The LLM returns a ``DisambiguationResult`` with
   chosen index, confidence, and reasoning (not free text).
+- **Two questions**: ``disambiguate()`` picks the best of several
+  candidates; ``check_same_entity()`` asks whether a group of records
+  describes one entity and can answer "no" (``SameEntityResult``). The
+  resolution cascade uses the latter.
 
 Notes
 -----
@@ -26,15 +38,22 @@ See Also
 --------
 music_attribution.resolution.graph_resolution : Stage 5 (runs before this).
 music_attribution.resolution.orchestrator : Cascade coordinator.
+music_attribution.resolution.llm_cache : Tiered decision cache.
+music_attribution.resolution.llm_scheduler : Coalescing and micro-batching.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
+from collections.abc import Sequence
+from typing import NamedTuple, TypeVar
 
 from pydantic import BaseModel
 
+from music_attribution.resolution.llm_cache import CacheStats, TieredLLMCache
+from music_attribution.resolution.llm_scheduler import DisambiguationScheduler, SchedulerConfig, SchedulerStats
 from music_attribution.schemas.normalized import NormalizedRecord
 from music_attribution.schemas.resolved import ResolutionDetails
 
@@ -65,7 +84,7 @@ class DisambiguationResult(BaseModel):
     alternatives_considered : int
         Number of candidate entities the LLM evaluated.
     cached : bool
-        Whether this result was served from the in-memory cache.
+        Whether this result was served from the decision cache.
     """
 
     chosen_index: int | None  # Index in candidates list, None if uncertain
@@ -75,6 +94,122 @@ class DisambiguationResult(BaseModel):
     cached: bool = False  # Whether result came from cache
 
 
+class SameEntityResult(BaseModel):
+    """Structured output of a same-entity check.
+
+    Attributes
+    ----------
+    is_same : bool | None
+        ``True`` if the records describe one entity, ``False`` if they
+        describe different entities, ``None`` if the LLM is uncertain.
+    confidence : float
+        LLM's self-reported confidence in its verdict, in [0.0, 1.0].
+    reasoning : str
+        Natural-language explanation of the verdict.
+    cached : bool
+        Whether this result was served from the decision cache.
+    """
+
+    is_same: bool | None
+    confidence: float
+    reasoning: str
+    cached: bool = False
+
+    @property
+    def same_entity_confidence(self) -> float | None:
+        """Confidence that the records are one entity (``None`` if undecided).
+
+        A "different" verdict with confidence ``c`` maps to ``1 - c``, so
+        a confident "no" becomes strong evidence against merging.
+        """
+        if self.is_same is None:
+            return None
+        return self.confidence if self.is_same else 1.0 - self.confidence
+
+
+class NumberedDisambiguationResult(DisambiguationResult):
+    """``DisambiguationResult`` tagged with its request number in a batch.
+
+    Attributes
+    ----------
+    request : int
+        1-based number of the request in the batch prompt.
+    """
+
+    request: int
+
+
+class BatchDisambiguationResult(BaseModel):
+    """Structured output of one batched disambiguation call.
+
+    Attributes
+    ----------
+    results : list[NumberedDisambiguationResult]
+        One decision per request, numbered as in the prompt.
+    """
+
+    results: list[NumberedDisambiguationResult]
+
+
+class NumberedSameEntityResult(SameEntityResult):
+    """``SameEntityResult`` tagged with its request number in a batch.
+
+    Attributes
+    ----------
+    request : int
+        1-based number of the request in the batch prompt.
+    """
+
+    request: int
+
+
+class BatchSameEntityResult(BaseModel):
+    """Structured output of one batched same-entity call.
+
+    Attributes
+    ----------
+    results : list[NumberedSameEntityResult]
+        One verdict per request, numbered as in the prompt.
+    """
+
+    results: list[NumberedSameEntityResult]
+
+
+class DisambiguationRequest(NamedTuple):
+    """One candidate set queued for a batched LLM call.
+
+    Attributes
+    ----------
+    candidates : list[NormalizedRecord]
+        Candidate records.
+    context : str
+        Disambiguation context.
+    cache_key : str
+        ``_cache_key(candidates, context)``.
+    """
+
+    candidates: list[NormalizedRecord]
+    context: str
+    cache_key: str
+
+
+# Cache-key namespace separating same-entity verdicts from disambiguations
+_SAME_ENTITY_KEY_PREFIX = "same-entity|"
+
+# Instructions heading a numbered batch prompt, per question
+_DISAMBIGUATE_INSTRUCTIONS = (
+    "For each numbered request, choose the candidate (by index) the context refers to, "
+    "or null if uncertain. Return one result per request, with its number in `request`."
+)
+_SAME_ENTITY_INSTRUCTIONS = (
+    "For each numbered request, decide whether all listed records describe the same real-world "
+    "entity (is_same true or false, or null if uncertain). Return one result per request, "
+    "with its number in `request`."
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+
 class LLMDisambiguator:
     """LLM-assisted entity disambiguation.
 
@@ -82,14 +217,29 @@ class LLMDisambiguator:
     (confidence in the 0.4-0.7 range). Uses SHA-256 content-based
     caching to reduce LLM costs.
 
-    The ``_call_llm`` method is designed to be overridden in subclasses
-    or mocked in tests. In production, it would use a PydanticAI Agent
-    with structured ``DisambiguationResult`` output.
+    Parameters
+    ----------
+    cache : TieredLLMCache | None, optional
+        Decision cache. Defaults to a process-local ``TieredLLMCache``;
+        pass one with a durable store to persist and share decisions.
+    scheduler : SchedulerConfig | None, optional
+        Enables request coalescing and micro-batching of cache misses.
+        ``None`` (default) calls ``_call_llm`` (or
+        ``_call_same_entity_llm``) once per miss.
+
+    The ``_call_llm`` and ``_call_same_entity_llm`` methods are designed
+    to be overridden in subclasses or mocked in tests. In production,
+    they would use a PydanticAI Agent with structured
+    ``DisambiguationResult`` or ``SameEntityResult`` output.
 
     Attributes
     ----------
-    _cache : dict[str, DisambiguationResult]
-        In-memory cache keyed by SHA-256 hash of candidate + context.
+    _cache : TieredLLMCache
+        Decision cache keyed by SHA-256 hash of candidate + context.
+    _scheduler : DisambiguationScheduler | None
+        Batching scheduler for ``disambiguate``, if enabled.
+    _same_entity_scheduler : DisambiguationScheduler | None
+        Batching scheduler for ``check_same_entity``, if enabled.
 
     Notes
     -----
@@ -99,8 +249,35 @@ class LLMDisambiguator:
     are too uncertain for LLM to add value.
     """
 
-    def __init__(self) -> None:
-        self._cache: dict[str, DisambiguationResult] = {}
+    def __init__(self, cache: TieredLLMCache | None = None, scheduler: SchedulerConfig | None = None) -> None:
+        self._cache = cache if cache is not None else TieredLLMCache()
+        self._scheduler: DisambiguationScheduler[DisambiguationRequest, DisambiguationResult] | None = None
+        self._same_entity_scheduler: DisambiguationScheduler[DisambiguationRequest, SameEntityResult] | None = None
+        if scheduler is not None:
+            self._scheduler = DisambiguationScheduler(self._call_and_cache, scheduler)
+            self._same_entity_scheduler = DisambiguationScheduler(self._check_and_cache, scheduler)
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Hit/miss counters of the decision cache."""
+        return self._cache.stats
+
+    @property
+    def scheduler_stats(self) -> SchedulerStats | None:
+        """Coalescing and batching counters of both request kinds (``None`` without a scheduler)."""
+        if self._scheduler is None or self._same_entity_scheduler is None:
+            return None
+        picks, checks = self._scheduler.stats, self._same_entity_scheduler.stats
+        return SchedulerStats(
+            requests=picks.requests + checks.requests,
+            coalesced=picks.coalesced + checks.coalesced,
+            batches=picks.batches + checks.batches,
+            batched_requests=picks.batched_requests + checks.batched_requests,
+        )
+
+    async def warm_up(self, *, limit: int | None = None) -> int:
+        """Preload recent durable decisions into memory (see ``TieredLLMCache.warm_up``)."""
+        return await self._cache.warm_up(limit=limit)
 
     async def disambiguate(
         self,
@@ -110,7 +287,8 @@ class LLMDisambiguator:
         """Disambiguate between candidate entities using LLM.
 
         Checks the content-addressed cache first. On cache miss, calls
-        ``_call_llm()`` and caches the result. On LLM failure, returns
+        ``_call_llm()`` (or, with a scheduler, queues the request for a
+        coalesced batch call) and caches the result. On LLM failure, returns
         a safe fallback with ``chosen_index=None`` and ``confidence=0.0``.
 
         Parameters
@@ -130,20 +308,17 @@ class LLMDisambiguator:
         cache_key = self._cache_key(candidates, context)
 
         # Check cache
-        if cache_key in self._cache:
-            cached = self._cache[cache_key]
-            return DisambiguationResult(
-                chosen_index=cached.chosen_index,
-                confidence=cached.confidence,
-                reasoning=cached.reasoning,
-                alternatives_considered=cached.alternatives_considered,
-                cached=True,
-            )
+        payload = await self._cache.get(cache_key)
+        if payload is not None:
+            return DisambiguationResult.model_validate_json(payload).model_copy(update={"cached": True})
 
         # Call LLM
         try:
+            if self._scheduler is not None:
+                request = DisambiguationRequest(candidates, context, cache_key)
+                return await self._scheduler.submit(cache_key, request)
             result = await self._call_llm(candidates, context)
-            self._cache[cache_key] = result
+            await self._cache.put(cache_key, result.model_dump_json(exclude={"cached"}))
             return result
         except TimeoutError as e:
             logger.warning("LLM disambiguation timed out: %s", e)
@@ -162,6 +337,51 @@ class LLMDisambiguator:
                 alternatives_considered=len(candidates),
             )
 
+    async def check_same_entity(
+        self,
+        candidates: list[NormalizedRecord],
+        context: str = "",
+    ) -> SameEntityResult:
+        """Ask the LLM whether ``candidates`` all describe one entity.
+
+        Unlike ``disambiguate()``, which picks the best candidate, this
+        yes/no question can be answered "different". Cached and
+        scheduled like ``disambiguate()``, under a separate cache-key
+        namespace. On LLM failure, returns an undecided verdict
+        (``is_same=None``, ``confidence=0.0``).
+
+        Parameters
+        ----------
+        candidates : list[NormalizedRecord]
+            Records grouped by earlier cascade stages.
+        context : str, optional
+            Additional context (album, genre, release year, etc.).
+
+        Returns
+        -------
+        SameEntityResult
+            The LLM's verdict, or an undecided fallback on error.
+        """
+        cache_key = self._cache_key(candidates, _SAME_ENTITY_KEY_PREFIX + context)
+
+        payload = await self._cache.get(cache_key)
+        if payload is not None:
+            return SameEntityResult.model_validate_json(payload).model_copy(update={"cached": True})
+
+        try:
+            if self._same_entity_scheduler is not None:
+                request = DisambiguationRequest(candidates, context, cache_key)
+                return await self._same_entity_scheduler.submit(cache_key, request)
+            result = await self._call_same_entity_llm(candidates, context)
+            await self._cache.put(cache_key, result.model_dump_json(exclude={"cached"}))
+            return result
+        except TimeoutError as e:
+            logger.warning("LLM same-entity check timed out: %s", e)
+            return SameEntityResult(is_same=None, confidence=0.0, reasoning=f"LLM timeout: {e}")
+        except Exception as e:  # noqa: BLE001
+            logger.warning("LLM same-entity check failed: %s", e)
+            return SameEntityResult(is_same=None, confidence=0.0, reasoning=f"LLM error: {e}")
+
     async def should_invoke(self, existing_scores: ResolutionDetails) -> bool:
         """Determine if LLM disambiguation is needed based on existing signals.
 
@@ -231,6 +451,197 @@ class LLMDisambiguator:
         # result = await agent.run(prompt)
         raise NotImplementedError("LLM call not configured — mock in tests")
 
+    async def _call_same_entity_llm(
+        self,
+        candidates: list[NormalizedRecord],
+        context: str,
+    ) -> SameEntityResult:
+        """Ask the LLM for a same-entity verdict (abstract / override point).
+
+        Parameters
+        ----------
+        candidates : list[NormalizedRecord]
+            Records to compare.
+        context : str
+            Additional context (album, genre, year, etc.).
+
+        Returns
+        -------
+        SameEntityResult
+            Structured verdict from the LLM.
+
+        Raises
+        ------
+        NotImplementedError
+            Always raised in the base implementation. Subclass or mock
+            this method for actual LLM calls.
+        """
+        # Production implementation would use:
+        # agent = Agent('openai:gpt-4o', result_type=SameEntityResult)
+        raise NotImplementedError("LLM call not configured — mock in tests")
+
+    async def _call_llm_structured(self, prompt: str, result_type: type[M]) -> M:
+        """Send one prompt and parse a structured reply (batch override point).
+
+        Parameters
+        ----------
+        prompt : str
+            Numbered batch prompt (``_batch_prompt``).
+        result_type : type[M]
+            ``BatchDisambiguationResult`` or ``BatchSameEntityResult``.
+
+        Returns
+        -------
+        M
+            The LLM's structured reply.
+
+        Raises
+        ------
+        NotImplementedError
+            In the base implementation; batch calls then fall back to one
+            ``_call_llm`` (or ``_call_same_entity_llm``) per request.
+        """
+        # Production implementation would use:
+        # agent = Agent('openai:gpt-4o', result_type=result_type)
+        # return (await agent.run(prompt)).data
+        raise NotImplementedError("Structured batch call not configured")
+
+    async def _call_same_entity_batch(
+        self,
+        requests: list[DisambiguationRequest],
+    ) -> Sequence[SameEntityResult | BaseException]:
+        """Ask for several same-entity verdicts in one structured call.
+
+        Same packing as ``_call_llm_batch``, with a
+        ``BatchSameEntityResult`` reply. Falls back to one concurrent
+        ``_call_same_entity_llm`` per request.
+
+        Parameters
+        ----------
+        requests : list[DisambiguationRequest]
+            Record groups to check.
+
+        Returns
+        -------
+        Sequence[SameEntityResult | BaseException]
+            One verdict (or the exception that prevented it) per request,
+            in request order.
+        """
+        packed = await self._call_packed(requests, _SAME_ENTITY_INSTRUCTIONS, BatchSameEntityResult, SameEntityResult)
+        if packed is not None:
+            return packed
+        return await asyncio.gather(
+            *(self._call_same_entity_llm(r.candidates, r.context) for r in requests),
+            return_exceptions=True,
+        )
+
+    async def _call_llm_batch(
+        self,
+        requests: list[DisambiguationRequest],
+    ) -> Sequence[DisambiguationResult | BaseException]:
+        """Disambiguate several candidate sets in one structured call.
+
+        Packs the requests into one numbered prompt and asks
+        ``_call_llm_structured`` for a ``BatchDisambiguationResult``.
+        Results are matched to requests by number, so a reordered reply is
+        accepted; a reply with missing, extra or duplicate numbers fails
+        every request, as does a failed call, each with its own exception.
+        A ``chosen_index`` outside a request's candidates fails only that
+        request. Without a structured endpoint (``NotImplementedError``),
+        falls back to one concurrent ``_call_llm`` per request, so
+        subclasses that only override ``_call_llm`` keep working.
+
+        Parameters
+        ----------
+        requests : list[DisambiguationRequest]
+            Candidate sets to disambiguate.
+
+        Returns
+        -------
+        Sequence[DisambiguationResult | BaseException]
+            One decision (or the exception that prevented it) per request,
+            in request order.
+        """
+        packed = await self._call_packed(
+            requests, _DISAMBIGUATE_INSTRUCTIONS, BatchDisambiguationResult, DisambiguationResult
+        )
+        if packed is None:
+            return await asyncio.gather(
+                *(self._call_llm(r.candidates, r.context) for r in requests),
+                return_exceptions=True,
+            )
+        checked: list[DisambiguationResult | BaseException] = []
+        for request, result in zip(requests, packed, strict=True):
+            if (
+                isinstance(result, DisambiguationResult)
+                and result.chosen_index is not None
+                and not 0 <= result.chosen_index < len(request.candidates)
+            ):
+                msg = f"chosen_index {result.chosen_index} out of range for {len(request.candidates)} candidates"
+                checked.append(ValueError(msg))
+            else:
+                checked.append(result)
+        return checked
+
+    async def _call_packed(
+        self,
+        requests: list[DisambiguationRequest],
+        instructions: str,
+        batch_type: type[BatchDisambiguationResult] | type[BatchSameEntityResult],
+        result_type: type[M],
+    ) -> list[M | BaseException] | None:
+        """Send ``requests`` as one numbered prompt; ``None`` if unsupported."""
+        try:
+            batch = await self._call_llm_structured(self._batch_prompt(instructions, requests), batch_type)
+        except NotImplementedError:
+            return None
+        except Exception as e:  # noqa: BLE001
+            logger.warning("LLM batch of %d requests failed: %s", len(requests), e)
+            return [_batch_failure(f"LLM batch call failed: {e}", e) for _ in requests]
+
+        expected = list(range(1, len(requests) + 1))
+        numbers = [item.request for item in batch.results]
+        if sorted(numbers) != expected:
+            msg = f"LLM batch reply numbered {numbers} for requests {expected}"
+            logger.warning(msg)
+            return [_batch_failure(msg) for _ in requests]
+        by_number = {item.request: item for item in batch.results}
+        return [result_type.model_validate(by_number[n].model_dump(exclude={"request"})) for n in expected]
+
+    @staticmethod
+    def _batch_prompt(instructions: str, requests: list[DisambiguationRequest]) -> str:
+        """Render ``requests`` as one numbered prompt under ``instructions``."""
+        lines = [instructions]
+        for number, request in enumerate(requests, start=1):
+            lines.extend(["", f"Request {number}", f"Context: {request.context}", "Candidates:"])
+            lines.extend(
+                f"  {index}. {c.canonical_name} ({c.entity_type}, {c.source}:{c.source_id})"
+                for index, c in enumerate(request.candidates)
+            )
+        return "\n".join(lines)
+
+    async def _call_and_cache(
+        self,
+        requests: list[DisambiguationRequest],
+    ) -> Sequence[DisambiguationResult | BaseException]:
+        """Run one scheduler batch and cache its successful decisions."""
+        results = await self._call_llm_batch(requests)
+        for request, result in zip(requests, results, strict=False):
+            if isinstance(result, DisambiguationResult):
+                await self._cache.put(request.cache_key, result.model_dump_json(exclude={"cached"}))
+        return results
+
+    async def _check_and_cache(
+        self,
+        requests: list[DisambiguationRequest],
+    ) -> Sequence[SameEntityResult | BaseException]:
+        """Run one scheduler batch of same-entity checks and cache the verdicts."""
+        results = await self._call_same_entity_batch(requests)
+        for request, result in zip(requests, results, strict=False):
+            if isinstance(result, SameEntityResult):
+                await self._cache.put(request.cache_key, result.model_dump_json(exclude={"cached"}))
+        return results
+
     @staticmethod
     def _cache_key(candidates: list[NormalizedRecord], context: str) -> str:
         """Generate a deterministic cache key for a disambiguation request.
@@ -254,3 +665,10 @@ class LLMDisambiguator:
         parts = sorted(f"{c.source}:{c.source_id}:{c.canonical_name}" for c in candidates)
         raw = "|".join(parts) + "|" + context
         return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _batch_failure(message: str, cause: BaseException | None = None) -> RuntimeError:
+    """Return a fresh per-request exception for a failed batch call."""
+    error = RuntimeError(message)
+    error.__cause__ = cause
+    return error
@@ -0,0 +1,234 @@
+"""Request coalescing and micro-batching for LLM disambiguation.
+
+When many resolution groups reach ``LLMDisambiguator.disambiguate`` at
+once, issuing one LLM round trip per request wastes latency and tokens
+(each prompt repeats the instructions). ``DisambiguationScheduler`` sits
+between ``disambiguate`` and the model:
+
+- **Coalescing** -- concurrent requests with the same cache key share
+  one future; only the first is sent to the model.
+- **Micro-batching** -- distinct requests are queued and sent together
+  as one batch call once ``max_batch_size`` requests are waiting or
+  ``max_wait_seconds`` has elapsed since the first one arrived.
+- **Concurrency limit** -- at most ``max_concurrency`` batch calls are in
+  flight; further batches wait on a semaphore.
+
+The scheduler is generic over the request and result types and knows
+nothing about the model; the batch function it wraps returns one result
+(or exception) per request, in order.
+
+See Also
+--------
+music_attribution.resolution.llm_disambiguation : Owns the scheduler.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class SchedulerConfig:
+    """Batching and concurrency knobs for ``DisambiguationScheduler``.
+
+    Attributes
+    ----------
+    max_batch_size : int
+        Requests packed into one batch call.
+    max_wait_seconds : float
+        Longest time the first queued request waits for a batch to fill.
+    max_concurrency : int
+        Batch calls allowed in flight at once.
+    """
+
+    max_batch_size: int = 8
+    max_wait_seconds: float = 0.01
+    max_concurrency: int = 4
+
+
+@dataclass
+class SchedulerStats:
+    """Cumulative counters for a ``DisambiguationScheduler``.
+
+    Attributes
+    ----------
+    requests : int
+        Requests submitted.
+    coalesced : int
+        Requests that joined an identical in-flight request.
+    batches : int
+        Batch calls made.
+    batched_requests : int
+        Requests sent in those calls.
+    """
+
+    requests: int = 0
+    coalesced: int = 0
+    batches: int = 0
+    batched_requests: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average requests per batch call (0.0 before any call)."""
+        return self.batched_requests / self.batches if self.batches else 0.0
+
+
+class DisambiguationScheduler(Generic[T, R]):
+    """Coalesce, micro-batch and rate-limit calls to a batch function.
+
+    Parameters
+    ----------
+    call_batch : Callable[[list[T]], Awaitable[Sequence[R | BaseException]]]
+        Sends a batch of requests and returns one result per request,
+        in order. An exception instance in the result list fails only
+        that request; a raised exception fails the whole batch.
+    config : SchedulerConfig | None, optional
+        Batching configuration. Defaults to ``SchedulerConfig()``.
+
+    Attributes
+    ----------
+    _call_batch : Callable
+        Batch function.
+    _config : SchedulerConfig
+        Active configuration.
+    _inflight : dict[str, asyncio.Future]
+        Pending future per request key (queued or being sent).
+    _queue : list[tuple[str, T]]
+        Requests waiting for the next batch.
+    _timer : asyncio.TimerHandle | None
+        Max-wait flush timer for the current queue.
+    _semaphore : asyncio.Semaphore
+        Bounds concurrent batch calls.
+    _tasks : set[asyncio.Task]
+        Running batch tasks (kept referenced until done).
+    _stats : SchedulerStats
+        Counters.
+
+    Examples
+    --------
+    >>> scheduler = DisambiguationScheduler(fake_llm_batch, SchedulerConfig(max_batch_size=4))
+    >>> results = await asyncio.gather(*(scheduler.submit(key, request) for key, request in work))
+    """
+
+    def __init__(
+        self,
+        call_batch: Callable[[list[T]], Awaitable[Sequence[R | BaseException]]],
+        config: SchedulerConfig | None = None,
+    ) -> None:
+        self._call_batch = call_batch
+        self._config = config or SchedulerConfig()
+        self._inflight: dict[str, asyncio.Future[R]] = {}
+        self._queue: list[tuple[str, T]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._semaphore = asyncio.Semaphore(max(self._config.max_concurrency, 1))
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._stats = SchedulerStats()
+
+    @property
+    def stats(self) -> SchedulerStats:
+        """Cumulative coalescing and batching counters."""
+        return self._stats
+
+    async def submit(self, key: str, request: T) -> R:
+        """Schedule ``request`` and wait for its result.
+
+        Parameters
+        ----------
+        key : str
+            Deduplication key; concurrent submissions with an equal key
+            share one result.
+        request : T
+            Request passed to the batch function.
+
+        Returns
+        -------
+        R
+            The request's result.
+
+        Raises
+        ------
+        Exception
+            Whatever the batch function raised (or returned) for this
+            request.
+        """
+        self._stats.requests += 1
+        future = self._inflight.get(key)
+        if future is not None:
+            self._stats.coalesced += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[key] = future
+        self._queue.append((key, request))
+        if len(self._queue) >= self._config.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._config.max_wait_seconds, self._flush)
+        # Shield so one cancelled waiter does not cancel the shared result
+        return await asyncio.shield(future)
+
+    async def drain(self) -> None:
+        """Send queued requests now and wait for all batch calls to finish."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self) -> None:
+        """Start batch tasks for everything queued."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        size = max(self._config.max_batch_size, 1)
+        while self._queue:
+            batch, self._queue = self._queue[:size], self._queue[size:]
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, T]]) -> None:
+        """Send one batch under the semaphore and resolve its futures."""
+        futures = [self._inflight[key] for key, _ in batch]
+        try:
+            async with self._semaphore:
+                self._stats.batches += 1
+                self._stats.batched_requests += len(batch)
+                results = await self._call_batch([request for _, request in batch])
+            if len(results) != len(batch):
+                msg = f"Batch call returned {len(results)} results for {len(batch)} requests"
+                raise ValueError(msg)
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as e:  # noqa: BLE001
+            logger.warning("LLM batch of %d requests failed: %s", len(batch), e)
+            for future in futures:
+                _settle(future, e)
+        else:
+            for future, result in zip(futures, results, strict=True):
+                _settle(future, result)
+        finally:
+            for key, _ in batch:
+                self._inflight.pop(key, None)
+
+
+def _settle(future: asyncio.Future[Any], outcome: object) -> None:
+    """Resolve ``future`` with a result or an exception (if still pending)."""
+    if future.done():
+        return
+    if isinstance(outcome, BaseException):
+        future.set_exception(outcome)
+        # Mark retrieved: waiters may all have been cancelled
+        future.exception()
+    else:
+        future.set_result(outcome)
@@ -0,0 +1,426 @@
+"""Persistent trigram name index for cross-batch fuzzy lookup.
+
+``ResolutionOrchestrator.resolve`` only fuzzy-matches records within the
+batch it is given, so a newly ingested record is never compared against
+entities that already live in ``resolved_entities``. ``NameIndex`` closes
+that gap: it holds every canonical and alternative name of the resolved
+entities in a character-trigram inverted index, answers "which existing
+entities look like this name?" without scanning the catalogue, and is
+updated incrementally as entities are created, changed or removed.
+
+Lookup is two-phase:
+
+1. **Candidate generation** -- the query's trigrams are looked up in the
+   posting lists and the names sharing the most trigrams are kept
+   (bounded by ``max_candidates``). Trigrams carried by more than
+   ``max_posting`` names are skipped as uninformative.
+2. **Verification** -- candidates are scored with
+   ``StringSimilarityMatcher.score_pairs`` (the same Jaro-Winkler +
+   token-sort score as Stage 2) and the best name per entity is kept.
+
+The index is saved to disk as JSON holding the raw names per entity;
+posting lists are rebuilt on load, so a change to name normalization
+never leaves a stale index behind.
+
+See Also
+--------
+music_attribution.resolution.string_similarity : Scores verified candidates.
+music_attribution.resolution.blocking : In-batch equivalent (candidate pairs).
+music_attribution.db.models.ResolvedEntityModel : Source of indexed names.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from music_attribution.db.models import ResolvedEntityModel
+from music_attribution.db.utils import parse_jsonb
+from music_attribution.resolution.string_similarity import StringSimilarityMatcher
+from music_attribution.schemas.resolved import ResolvedEntity
+
+logger = logging.getLogger(__name__)
+
+# On-disk format version (bump on incompatible changes)
+_FORMAT_VERSION = 1
+
+
+class NameIndexHit(NamedTuple):
+    """A resolved entity whose name matched a lookup.
+
+    Attributes
+    ----------
+    entity_id : uuid.UUID
+        Matched resolved entity.
+    name : str
+        The entity's best-matching name (raw, as indexed).
+    score : float
+        String similarity between the query and ``name`` in [0.0, 1.0].
+    """
+
+    entity_id: uuid.UUID
+    name: str
+    score: float
+
+
+class NameIndex:
+    """Incrementally updatable trigram index over resolved entity names.
+
+    Each indexed name occupies a *slot*; posting lists map a trigram to the
+    slots containing it. Removing or re-adding an entity tombstones its
+    old slots, which are dropped from postings on the next ``compact()``
+    (called automatically once tombstones outnumber live slots).
+    ``save()`` only writes live slots.
+
+    Parameters
+    ----------
+    matcher : StringSimilarityMatcher | None, optional
+        Scorer for verification and default threshold source. Defaults to
+        ``StringSimilarityMatcher()``.
+    ngram_size : int, optional
+        Character n-gram size. Default 3.
+    max_candidates : int, optional
+        Maximum slots verified per lookup. Default 200.
+    max_posting : int, optional
+        Trigrams with more postings than this are ignored during
+        candidate generation (unless every query trigram is that common).
+        Default 2,000.
+
+    Attributes
+    ----------
+    _names : list[str]
+        Raw name per slot.
+    _normalized : list[str]
+        Normalized name per slot.
+    _slot_entity : list[uuid.UUID | None]
+        Owning entity per slot; ``None`` marks a tombstone.
+    _slot_type : list[str | None]
+        Entity type per slot (for type-restricted lookups).
+    _entity_slots : dict[uuid.UUID, list[int]]
+        Live slots of each entity.
+    _postings : dict[str, list[int]]
+        Trigram to slot positions.
+    _posting_cache : dict[str, numpy.ndarray]
+        Array copies of posting lists, invalidated when a list grows.
+
+    Examples
+    --------
+    >>> index = NameIndex()
+    >>> index.add(entity_id, ["The Beatles"], entity_type="ARTIST")
+    >>> index.query("Beatles, The")
+    [NameIndexHit(entity_id=..., name='The Beatles', score=1.0)]
+    """
+
+    def __init__(
+        self,
+        matcher: StringSimilarityMatcher | None = None,
+        *,
+        ngram_size: int = 3,
+        max_candidates: int = 200,
+        max_posting: int = 2_000,
+    ) -> None:
+        self._matcher = matcher or StringSimilarityMatcher()
+        self._ngram_size = ngram_size
+        self._max_candidates = max_candidates
+        self._max_posting = max_posting
+        self._names: list[str] = []
+        self._normalized: list[str] = []
+        self._slot_entity: list[uuid.UUID | None] = []
+        self._slot_type: list[str | None] = []
+        self._entity_slots: dict[uuid.UUID, list[int]] = {}
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        self._posting_cache: dict[str, np.ndarray] = {}
+        self._dead = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed entities."""
+        return len(self._entity_slots)
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Return whether an entity is indexed."""
+        return entity_id in self._entity_slots
+
+    def add(
+        self,
+        entity_id: uuid.UUID,
+        names: Iterable[str],
+        *,
+        entity_type: str | None = None,
+    ) -> None:
+        """Index (or re-index) an entity under the given names.
+
+        Any names previously indexed for ``entity_id`` are replaced.
+
+        Parameters
+        ----------
+        entity_id : uuid.UUID
+            Resolved entity ID.
+        names : Iterable[str]
+            Canonical and alternative names. Blank and duplicate names
+            (after normalization) are skipped.
+        entity_type : str | None, optional
+            Entity type, used by ``query(entity_type=...)``.
+        """
+        self.remove(entity_id)
+        slots: list[int] = []
+        seen: set[str] = set()
+        for name in names:
+            norm = self._matcher.normalize(name)
+            if not norm or norm in seen:
+                continue
+            seen.add(norm)
+            slot = len(self._names)
+            self._names.append(name)
+            self._normalized.append(norm)
+            self._slot_entity.append(entity_id)
+            self._slot_type.append(entity_type)
+            for gram in self._grams(norm):
+                self._postings[gram].append(slot)
+                self._posting_cache.pop(gram, None)
+            slots.append(slot)
+        if slots:
+            self._entity_slots[entity_id] = slots
+
+    def add_entity(self, entity: ResolvedEntity) -> None:
+        """Index a ``ResolvedEntity`` under its canonical and alternative names.
+
+        Parameters
+        ----------
+        entity : ResolvedEntity
+            Entity to index.
+        """
+        self.add(
+            entity.entity_id,
+            [entity.canonical_name, *entity.alternative_names],
+            entity_type=str(entity.entity_type),
+        )
+
+    def remove(self, entity_id: uuid.UUID) -> bool:
+        """Remove an entity from the index.
+
+        Parameters
+        ----------
+        entity_id : uuid.UUID
+            Entity to remove.
+
+        Returns
+        -------
+        bool
+            ``True`` if the entity was indexed.
+        """
+        slots = self._entity_slots.pop(entity_id, None)
+        if slots is None:
+            return False
+        for slot in slots:
+            self._slot_entity[slot] = None
+        self._dead += len(slots)
+        if self._dead > len(self._names) - self._dead:
+            self.compact()
+        return True
+
+    def query(
+        self,
+        name: str,
+        *,
+        k: int = 5,
+        threshold: float | None = None,
+        entity_type: str | None = None,
+        normalized: bool = False,
+        exclude: set[uuid.UUID] | None = None,
+    ) -> list[NameIndexHit]:
+        """Find indexed entities whose names are similar to ``name``.
+
+        Parameters
+        ----------
+        name : str
+            Query name.
+        k : int, optional
+            Maximum number of entities returned. Default 5.
+        threshold : float | None, optional
+            Minimum similarity. Defaults to the matcher's threshold.
+        entity_type : str | None, optional
+            Restrict hits to entities of this type.
+        normalized : bool, optional
+            Set to ``True`` if ``name`` is already normalized.
+        exclude : set[uuid.UUID] | None, optional
+            Entity IDs to leave out of the results.
+
+        Returns
+        -------
+        list[NameIndexHit]
+            Up to ``k`` hits, one per entity, sorted by score descending.
+        """
+        norm = name if normalized else self._matcher.normalize(name)
+        if not norm or not self._entity_slots:
+            return []
+        effective_threshold = threshold if threshold is not None else self._matcher._threshold
+
+        candidates: list[tuple[int, uuid.UUID]] = []
+        for slot in self._candidate_slots(norm):
+            owner = self._slot_entity[slot]
+            if owner is None or (exclude is not None and owner in exclude):
+                continue
+            if entity_type is None or self._slot_type[slot] == entity_type:
+                candidates.append((slot, owner))
+        if not candidates:
+            return []
+
+        scores = self._matcher.score_pairs(
+            [norm] * len(candidates),
+            [self._normalized[slot] for slot, _ in candidates],
+            normalized=True,
+        )
+        best: dict[uuid.UUID, NameIndexHit] = {}
+        for (slot, entity_id), score in zip(candidates, scores.tolist(), strict=True):
+            if score < effective_threshold:
+                continue
+            current = best.get(entity_id)
+            if current is None or score > current.score:
+                best[entity_id] = NameIndexHit(entity_id, self._names[slot], score)
+
+        return sorted(best.values(), key=lambda hit: hit.score, reverse=True)[:k]
+
+    def compact(self) -> None:
+        """Drop tombstoned slots and rebuild the posting lists."""
+        entries = [
+            (entity_id, [self._names[slot] for slot in slots], self._slot_type[slots[0]])
+            for entity_id, slots in self._entity_slots.items()
+        ]
+        self._reset()
+        for entity_id, names, entity_type in entries:
+            self.add(entity_id, names, entity_type=entity_type)
+
+    def save(self, path: Path) -> None:
+        """Write the index to disk as JSON (atomically, via a temp file).
+
+        Parameters
+        ----------
+        path : Path
+            Destination file.
+        """
+        entries = [
+            {
+                "entity_id": str(entity_id),
+                "entity_type": self._slot_type[slots[0]],
+                "names": [self._names[slot] for slot in slots],
+            }
+            for entity_id, slots in self._entity_slots.items()
+        ]
+        payload = {"version": _FORMAT_VERSION, "ngram_size": self._ngram_size, "entities": entries}
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+        logger.info("Saved name index with %d entities to %s", len(entries), path)
+
+    @classmethod
+    def load(cls, path: Path, matcher: StringSimilarityMatcher | None = None) -> NameIndex:
+        """Load an index previously written by ``save()``.
+
+        Parameters
+        ----------
+        path : Path
+            File written by ``save()``.
+        matcher : StringSimilarityMatcher | None, optional
+            Scorer for the loaded index.
+
+        Returns
+        -------
+        NameIndex
+            Index with posting lists rebuilt from the stored names.
+
+        Raises
+        ------
+        ValueError
+            If the file was written with an unsupported format version.
+        """
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != _FORMAT_VERSION:
+            msg = f"Unsupported name index format version: {payload.get('version')}"
+            raise ValueError(msg)
+        index = cls(matcher, ngram_size=payload["ngram_size"])
+        for entry in payload["entities"]:
+            index.add(uuid.UUID(entry["entity_id"]), entry["names"], entity_type=entry["entity_type"])
+        return index
+
+    async def load_from_db(self, *, session: AsyncSession, entity_type: str | None = None) -> int:
+        """Index every row of ``resolved_entities`` (optionally one type).
+
+        Existing index entries for the same entity IDs are replaced, so
+        this also serves as a full refresh.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Active async database session.
+        entity_type : str | None, optional
+            Only index entities of this type.
+
+        Returns
+        -------
+        int
+            Number of entities indexed.
+        """
+        stmt = select(
+            ResolvedEntityModel.entity_id,
+            ResolvedEntityModel.entity_type,
+            ResolvedEntityModel.canonical_name,
+            ResolvedEntityModel.alternative_names,
+        )
+        if entity_type is not None:
+            stmt = stmt.where(ResolvedEntityModel.entity_type == entity_type)
+
+        count = 0
+        result = await session.execute(stmt)
+        for entity_id, row_type, canonical_name, alternative_names in result.all():
+            alternatives = parse_jsonb(alternative_names) if alternative_names else []
+            self.add(entity_id, [canonical_name, *alternatives], entity_type=row_type)
+            count += 1
+        logger.info("Indexed %d resolved entities", count)
+        return count
+
+    def _candidate_slots(self, normalized_name: str) -> list[int]:
+        """Return the slots sharing the most n-grams with a name."""
+        postings = [self._posting_array(g) for g in self._grams(normalized_name) if g in self._postings]
+        if not postings:
+            return []
+        informative = [p for p in postings if len(p) <= self._max_posting] or [min(postings, key=len)]
+        slots, counts = np.unique(np.concatenate(informative), return_counts=True)
+        if len(slots) > self._max_candidates:
+            top = np.argpartition(-counts, self._max_candidates - 1)[: self._max_candidates]
+            slots, counts = slots[top], counts[top]
+        return slots[np.argsort(-counts, kind="stable")].tolist()  # type: ignore[no-any-return]
+
+    def _posting_array(self, gram: str) -> np.ndarray:
+        """Posting list of a gram as a cached int array."""
+        cached = self._posting_cache.get(gram)
+        if cached is None:
+            cached = np.asarray(self._postings[gram], dtype=np.int64)
+            self._posting_cache[gram] = cached
+        return cached
+
+    def _grams(self, normalized_name: str) -> set[str]:
+        """Character n-grams of a space-padded normalized name."""
+        size = self._ngram_size
+        padded = f" {normalized_name} "
+        return {padded[i : i + size] for i in range(max(len(padded) - size + 1, 1))}
+
+    def _reset(self) -> None:
+        """Clear all slots and postings."""
+        self._names = []
+        self._normalized = []
+        self._slot_entity = []
+        self._slot_type = []
+        self._entity_slots = {}
+        self._postings = defaultdict(list)
+        self._posting_cache = {}
+        self._dead = 0
@@ -9,6 +9,12 @@ The orchestrator implements a **cascade** pattern: cheap deterministic methods
 (embedding, Splink, LLM) only fire for records that remain unresolved.
 Signal weights are configurable per deployment.
 
+When an ``EmbeddingMatcher``, ``GraphResolver`` or ``LLMDisambiguator`` is
+supplied, ``resolve()`` refines the groups whose combined confidence is
+still in the ambiguity band with those signals, in that order, under the
+per-stage budgets of a ``CascadeConfig``. ``stage_stats`` exposes per-stage
+timing and hit-rate counters.
+
 Notes
 -----
 This is the top-level entry point for Pipeline 2 (Entity Resolution) in the
@@ -27,14 +33,38 @@ music_attribution.resolution.llm_disambiguation : Stage 6 -- LLM tie-breaking.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import time
 import uuid
 from collections import Counter, defaultdict
 from datetime import UTC, datetime
 
+import numpy as np
+
 from music_attribution.constants import REVIEW_THRESHOLD
+from music_attribution.resolution.blocking import CandidateBlocker
+from music_attribution.resolution.cascade import (
+    STAGES,
+    BudgetTracker,
+    CascadeConfig,
+    StageStats,
+)
+from music_attribution.resolution.embedding_match import EmbeddingMatcher
+from music_attribution.resolution.executor import GroupResolutionExecutor
+from music_attribution.resolution.graph_resolution import GraphResolver
 from music_attribution.resolution.identifier_match import IdentifierMatcher
+from music_attribution.resolution.incremental import (
+    ResolutionDelta,
+    ResolutionState,
+    _identifier_keys,
+    _record_key,
+)
+from music_attribution.resolution.llm_disambiguation import LLMDisambiguator
+from music_attribution.resolution.name_index import NameIndex, NameIndexHit
 from music_attribution.resolution.string_similarity import StringSimilarityMatcher
+from music_attribution.resolution.union_find import DisjointSet
 from music_attribution.schemas.enums import (
     AssuranceLevelEnum,
     ConflictSeverityEnum,
@@ -78,6 +108,24 @@ class ResolutionOrchestrator:
         Per-method weight overrides for score combination. Keys are method
         names (``"identifier"``, ``"splink"``, ``"string"``, ``"embedding"``,
         ``"graph"``, ``"llm"``). Defaults to ``_DEFAULT_WEIGHTS``.
+    blocker : CandidateBlocker | None, optional
+        Candidate-pair generator for the string-similarity stage.
+        Defaults to a ``CandidateBlocker`` with default ``BlockingConfig``.
+    name_index : NameIndex | None, optional
+        Index of already-resolved entity names, used by
+        ``find_existing_matches()`` for cross-batch fuzzy lookup.
+    executor : GroupResolutionExecutor | None, optional
+        Runs Step 4 (group resolution) in chunks on a thread or process
+        pool. Defaults to a serial executor.
+    embedding_matcher : EmbeddingMatcher | None, optional
+        Enables Stage 3: embedding similarity for ambiguous groups.
+    graph_resolver : GraphResolver | None, optional
+        Enables Stage 5: graph evidence for ambiguous groups. Records map
+        to graph nodes via ``graph_node_id()``.
+    llm_disambiguator : LLMDisambiguator | None, optional
+        Enables Stage 6: LLM confirmation for groups still ambiguous.
+    cascade : CascadeConfig | None, optional
+        Ambiguity band and per-stage budgets. Defaults to ``CascadeConfig()``.
 
     Attributes
     ----------
@@ -87,6 +135,22 @@ class ResolutionOrchestrator:
         Stage 1 identifier matcher.
     _string_matcher : StringSimilarityMatcher
         Stage 2 string similarity matcher.
+    _blocker : CandidateBlocker
+        Stage 2 candidate-pair blocker.
+    _name_index : NameIndex | None
+        Cross-batch name index (``None`` when not configured).
+    _executor : GroupResolutionExecutor
+        Step 4 executor.
+    _embedding_matcher : EmbeddingMatcher | None
+        Stage 3 matcher (``None`` disables the stage).
+    _graph_resolver : GraphResolver | None
+        Stage 5 resolver (``None`` disables the stage).
+    _llm : LLMDisambiguator | None
+        Stage 6 disambiguator (``None`` disables the stage).
+    _cascade : CascadeConfig
+        Ambiguity band and budgets.
+    _stage_stats : dict[str, StageStats]
+        Cumulative per-stage counters, keyed by ``cascade.STAGES``.
 
     Examples
     --------
@@ -94,10 +158,56 @@ class ResolutionOrchestrator:
     >>> entities = await orchestrator.resolve(normalized_records)
     """
 
-    def __init__(self, weights: dict[str, float] | None = None) -> None:
+    def __init__(
+        self,
+        weights: dict[str, float] | None = None,
+        blocker: CandidateBlocker | None = None,
+        name_index: NameIndex | None = None,
+        executor: GroupResolutionExecutor | None = None,
+        embedding_matcher: EmbeddingMatcher | None = None,
+        graph_resolver: GraphResolver | None = None,
+        llm_disambiguator: LLMDisambiguator | None = None,
+        cascade: CascadeConfig | None = None,
+    ) -> None:
         self._weights = weights or _DEFAULT_WEIGHTS
         self._id_matcher = IdentifierMatcher()
         self._string_matcher = StringSimilarityMatcher()
+        self._blocker = blocker or CandidateBlocker()
+        self._name_index = name_index
+        self._executor = executor or GroupResolutionExecutor()
+        self._embedding_matcher = embedding_matcher
+        self._graph_resolver = graph_resolver
+        self._llm = llm_disambiguator
+        self._cascade = cascade or CascadeConfig()
+        self._stage_stats: dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+
+    @property
+    def stage_stats(self) -> dict[str, StageStats]:
+        """Cumulative per-stage counters (see ``cascade.StageStats``)."""
+        return self._stage_stats
+
+    def reset_stage_stats(self) -> None:
+        """Zero every stage counter."""
+        self._stage_stats = {stage: StageStats() for stage in STAGES}
+
+    @staticmethod
+    def graph_node_id(record: NormalizedRecord) -> str:
+        """Graph node ID of a record for Stage 5 (``"SOURCE:source_id"``).
+
+        Relationships added to the ``GraphResolver`` must use these IDs.
+
+        Parameters
+        ----------
+        record : NormalizedRecord
+            Source record.
+
+        Returns
+        -------
+        str
+            Node ID.
+        """
+        source, source_id = _record_key(record)
+        return f"{source}:{source_id}"
 
     async def resolve(self, records: list[NormalizedRecord]) -> list[ResolvedEntity]:
         """Resolve a list of NormalizedRecords into ResolvedEntities.
@@ -109,6 +219,9 @@ class ResolutionOrchestrator:
         3. Remaining singletons form their own groups.
         4. Each group is resolved into a ``ResolvedEntity`` with confidence
            scores and assurance levels.
+        5. Multi-record groups whose confidence falls in the ambiguity band
+           are refined with embedding, graph and LLM evidence (each stage
+           only when configured, within its budget).
 
         Parameters
         ----------
@@ -131,36 +244,201 @@ class ResolutionOrchestrator:
         if not records:
             return []
 
+        # Normalize every name exactly once; all later stages reuse these
+        normalized = [self._string_matcher.normalize(r.canonical_name) for r in records]
+
         # Step 1: Group by shared identifiers
+        started = time.perf_counter()
         groups = self._group_by_identifiers(records)
 
-        # Step 2: For ungrouped records, try string similarity
         grouped_indices: set[int] = set()
         for group in groups:
             grouped_indices.update(group)
+        self._record_grouping("identifier", len(records), len(grouped_indices), started)
 
+        # Step 2: For ungrouped records, try string similarity
         ungrouped = [i for i in range(len(records)) if i not in grouped_indices]
         if ungrouped:
-            string_groups = self._group_by_string_similarity(records, ungrouped)
+            started = time.perf_counter()
+            string_groups = self._group_by_string_similarity(ungrouped, normalized)
             groups.extend(string_groups)
             for g in string_groups:
                 grouped_indices.update(g)
+            self._record_grouping("string", len(ungrouped), sum(len(g) for g in string_groups), started)
 
         # Step 3: Singleton groups for remaining ungrouped
         for i in range(len(records)):
             if i not in grouped_indices:
                 groups.append([i])
 
-        # Step 4: Resolve each group into a ResolvedEntity
-        entities = []
-        for group in groups:
-            group_records = [records[i] for i in group]
-            entity = await self.resolve_group(group_records)
-            entities.append(entity)
-
+        # Step 4: Resolve each group into a ResolvedEntity (chunked, in order)
+        work = [([records[i] for i in group], [normalized[i] for i in group]) for group in groups]
+        if self._executor.backend == "process":
+            # Workers rebuild a lightweight orchestrator instead of pickling self
+            chunk_fn = functools.partial(_resolve_group_chunk, self._weights)
+            entities = await self._executor.map_chunks(chunk_fn, work)
+        else:
+            entities = await self._executor.map_chunks(self._build_entities, work)
+
+        # Step 5: Refine ambiguous groups with the expensive signals
+        if self._embedding_matcher is not None or self._graph_resolver is not None or self._llm is not None:
+            entities = await self._refine_ambiguous([recs for recs, _ in work], entities)
         return entities
 
-    async def resolve_group(self, records: list[NormalizedRecord]) -> ResolvedEntity:
+    async def resolve_incremental(
+        self,
+        records: list[NormalizedRecord],
+        state: ResolutionState,
+    ) -> ResolutionDelta:
+        """Merge new or changed records into an existing entity state.
+
+        Instead of re-resolving the full catalogue, each record is attached
+        to the clusters it touches and only those clusters are re-resolved:
+
+        1. A record whose ``(source, source_id)`` is already held replaces
+           its previous version in the owning entity.
+        2. Records sharing an identifier with an existing entity (or with
+           each other) are linked, as in Stage 1.
+        3. Records without an identifier link are grouped by in-batch
+           string similarity (Stage 2) and attached to the best
+           same-type hit in the state's ``NameIndex``.
+        4. Every connected cluster is re-resolved with ``resolve_group``.
+           Clusters without an existing entity are *created*; clusters
+           with one are *updated* (ID preserved); clusters spanning
+           several existing entities are *merged* into the entity with
+           the most records, and the others are *retired*.
+
+        ``state`` is updated in place to reflect the delta.
+
+        Parameters
+        ----------
+        records : list[NormalizedRecord]
+            New or changed records. For duplicate ``(source, source_id)``
+            pairs the last occurrence wins.
+        state : ResolutionState
+            Current entities, member records and indexes.
+
+        Returns
+        -------
+        ResolutionDelta
+            Created, updated and merged entities plus retired IDs.
+        """
+        latest = {_record_key(r): r for r in records}
+        records = list(latest.values())
+        if not records:
+            return ResolutionDelta(created=[], updated=[], merged=[], retired=[])
+
+        normalized = [self._string_matcher.normalize(r.canonical_name) for r in records]
+
+        # Nodes 0..n-1 are records; existing entities get nodes n, n+1, ...
+        n = len(records)
+        entity_nodes: dict[uuid.UUID, int] = {}
+        edges: list[tuple[int, int]] = []
+
+        def entity_node(entity_id: uuid.UUID) -> int:
+            return entity_nodes.setdefault(entity_id, n + len(entity_nodes))
+
+        # Steps 1-2: known source records and identifier links
+        linked: set[int] = set()
+        first_with_key: dict[str, int] = {}
+        for i, record in enumerate(records):
+            owner = state.owner_of(record)
+            if owner is not None:
+                edges.append((i, entity_node(owner)))
+                linked.add(i)
+            for key in _identifier_keys(record):
+                owner = state.owner_of_identifier(key)
+                if owner is not None:
+                    edges.append((i, entity_node(owner)))
+                    linked.add(i)
+                if key in first_with_key:
+                    edges.append((first_with_key[key], i))
+                    linked.update((i, first_with_key[key]))
+                else:
+                    first_with_key[key] = i
+
+        # Step 3: names for records without an identifier link
+        unlinked = [i for i in range(n) if i not in linked]
+        if unlinked:
+            for group in self._group_by_string_similarity(unlinked, normalized):
+                edges.extend((group[0], idx) for idx in group[1:])
+            for i in unlinked:
+                hits = state.name_index.query(
+                    normalized[i],
+                    k=1,
+                    threshold=self._string_matcher._threshold,
+                    entity_type=str(records[i].entity_type),
+                    normalized=True,
+                )
+                if hits:
+                    edges.append((i, entity_node(hits[0].entity_id)))
+
+        forest = DisjointSet(n + len(entity_nodes))
+        edge_array = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        forest.union_pairs(edge_array[:, 0], edge_array[:, 1])
+        labels = forest.component_labels().tolist()
+
+        # Step 4: collect clusters (in record order) and re-resolve them
+        clusters: dict[int, tuple[list[int], list[uuid.UUID]]] = {}
+        for i in range(n):
+            clusters.setdefault(labels[i], ([], []))[0].append(i)
+        for entity_id, node in entity_nodes.items():
+            clusters[labels[node]][1].append(entity_id)
+
+        delta = ResolutionDelta(created=[], updated=[], merged=[], retired=[])
+        for indices, entity_ids in clusters.values():
+            new_records = [records[i] for i in indices]
+            if not entity_ids:
+                entity = await self.resolve_group(
+                    new_records,
+                    normalized_names=[normalized[i] for i in indices],
+                )
+                state.put(entity, new_records)
+                delta.created.append(entity)
+                continue
+
+            new_keys = {_record_key(r) for r in new_records}
+            members = [
+                m for eid in entity_ids for m in state.members(eid) if _record_key(m) not in new_keys
+            ] + new_records
+            ranked = sorted(entity_ids, key=lambda eid: (-len(state.members(eid)), str(eid)))
+            survivor, absorbed = ranked[0], ranked[1:]
+
+            merged_from: list[uuid.UUID] = []
+            for eid in ranked:
+                previous = state.get(eid)
+                if previous is not None and previous.merged_from:
+                    merged_from.extend(previous.merged_from)
+            merged_from.extend(absorbed)
+
+            entity = await self.resolve_group(members)
+            entity = entity.model_copy(
+                update={"entity_id": survivor, "merged_from": merged_from or None},
+            )
+            for eid in absorbed:
+                state.remove(eid)
+            state.put(entity, members)
+            if absorbed:
+                delta.merged.append(entity)
+                delta.retired.extend(absorbed)
+            else:
+                delta.updated.append(entity)
+
+        logger.info(
+            "Incremental resolution: %d created, %d updated, %d merged, %d retired",
+            len(delta.created),
+            len(delta.updated),
+            len(delta.merged),
+            len(delta.retired),
+        )
+        return delta
+
+    async def resolve_group(
+        self,
+        records: list[NormalizedRecord],
+        *,
+        normalized_names: list[str] | None = None,
+    ) -> ResolvedEntity:
         """Resolve a pre-clustered group of records into a single entity.
 
         Merges identifiers, picks the canonical name, detects cross-source
@@ -172,6 +450,9 @@ class ResolutionOrchestrator:
         records : list[NormalizedRecord]
             Pre-clustered records believed to represent the same entity.
             Must contain at least one record.
+        normalized_names : list[str] | None, optional
+            Pre-normalized canonical names aligned with ``records``. When
+            omitted, names are normalized here.
 
         Returns
         -------
@@ -184,8 +465,23 @@ class ResolutionOrchestrator:
         Records with confidence below ``_REVIEW_THRESHOLD`` (0.5) are
         automatically flagged for human review in the attribution pipeline.
         """
+        return self._build_entity(records, normalized_names)
+
+    def _build_entities(
+        self,
+        chunk: list[tuple[list[NormalizedRecord], list[str]]],
+    ) -> list[ResolvedEntity]:
+        """Resolve a chunk of ``(records, normalized_names)`` groups."""
+        return [self._build_entity(records, names) for records, names in chunk]
+
+    def _build_entity(
+        self,
+        records: list[NormalizedRecord],
+        normalized_names: list[str] | None = None,
+    ) -> ResolvedEntity:
+        """Synchronous body of ``resolve_group`` (safe to run in a worker)."""
         # Determine resolution method and compute details
-        details = self._compute_resolution_details(records)
+        details = self._compute_resolution_details(records, normalized_names)
         method = self._determine_method(records, details)
         confidence = self._compute_confidence(details)
         assurance = self._compute_assurance_level(records)
@@ -226,12 +522,280 @@ class ResolutionOrchestrator:
             resolved_at=datetime.now(UTC),
         )
 
+    async def _refine_ambiguous(
+        self,
+        groups: list[list[NormalizedRecord]],
+        entities: list[ResolvedEntity],
+    ) -> list[ResolvedEntity]:
+        """Run Stages 3, 5 and 6 on groups in the ambiguity band.
+
+        Each stage receives only the groups the previous stages left
+        ambiguous, and passes on those it could not settle.
+
+        Parameters
+        ----------
+        groups : list[list[NormalizedRecord]]
+            Records of each group, aligned with ``entities``.
+        entities : list[ResolvedEntity]
+            Entities from Step 4.
+
+        Returns
+        -------
+        list[ResolvedEntity]
+            ``entities`` with refined details, confidence and method.
+        """
+        details = [entity.resolution_details for entity in entities]
+        pending = [
+            i
+            for i, entity in enumerate(entities)
+            if len(groups[i]) > 1 and self._cascade.is_ambiguous(entity.resolution_confidence)
+        ]
+        touched = set(pending)
+        if self._embedding_matcher is not None and pending:
+            pending = await self._embedding_stage(self._embedding_matcher, pending, groups, details)
+        if self._graph_resolver is not None and pending:
+            pending = self._graph_stage(self._graph_resolver, pending, groups, details)
+        if self._llm is not None and pending:
+            pending = await self._llm_stage(self._llm, pending, groups, details)
+
+        return [
+            self._apply_details(entity, groups[i], details[i]) if i in touched else entity
+            for i, entity in enumerate(entities)
+        ]
+
+    async def _embedding_stage(
+        self,
+        matcher: EmbeddingMatcher,
+        pending: list[int],
+        groups: list[list[NormalizedRecord]],
+        details: list[ResolutionDetails],
+    ) -> list[int]:
+        """Stage 3: max pairwise cosine similarity of embedded names."""
+        stats = self._stage_stats["embedding"]
+        tracker = BudgetTracker(self._cascade.embedding, stats)
+        stats.items_in += len(pending)
+        batch_size = max(self._cascade.embedding_batch_size, 1)
+
+        remaining: list[int] = []
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            batch_pairs = sum(_pair_count(len(groups[i])) for i in batch)
+            if not tracker.allows(pairs=batch_pairs, calls=1):
+                stats.skipped_budget += len(pending) - start
+                remaining.extend(pending[start:])
+                break
+
+            started = time.perf_counter()
+            names = [r.canonical_name for i in batch for r in groups[i]]
+            vectors = np.asarray(await matcher.embed_batch(names), dtype=np.float64)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            unit = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+            offset = 0
+            for i in batch:
+                block = unit[offset : offset + len(groups[i])]
+                offset += len(groups[i])
+                best = float((block @ block.T)[np.triu_indices(len(block), k=1)].max())
+                details[i] = details[i].model_copy(update={"embedding_similarity": min(max(best, 0.0), 1.0)})
+            tracker.record(pairs=batch_pairs, calls=1, seconds=time.perf_counter() - started)
+            remaining.extend(self._still_ambiguous(batch, details, stats))
+        return remaining
+
+    def _graph_stage(
+        self,
+        resolver: GraphResolver,
+        pending: list[int],
+        groups: list[list[NormalizedRecord]],
+        details: list[ResolutionDetails],
+    ) -> list[int]:
+        """Stage 5: max graph evidence over each group's record pairs."""
+        stats = self._stage_stats["graph"]
+        tracker = BudgetTracker(self._cascade.graph, stats)
+        stats.items_in += len(pending)
+        index = resolver.build_index()
+
+        remaining: list[int] = []
+        for position, i in enumerate(pending):
+            group_pairs = _pair_count(len(groups[i]))
+            if not tracker.allows(pairs=group_pairs):
+                stats.skipped_budget += len(pending) - position
+                remaining.extend(pending[position:])
+                break
+
+            started = time.perf_counter()
+            nodes = [self.graph_node_id(r) for r in groups[i]]
+            left, right = np.triu_indices(len(nodes), k=1)
+            best = float(index.score_pairs([nodes[a] for a in left], [nodes[b] for b in right]).max())
+            tracker.record(pairs=group_pairs, seconds=time.perf_counter() - started)
+            # No shared neighbors is absence of evidence, not evidence against
+            if best > 0.0:
+                details[i] = details[i].model_copy(update={"graph_path_confidence": best})
+            remaining.extend(self._still_ambiguous([i], details, stats))
+        return remaining
+
+    async def _llm_stage(
+        self,
+        llm: LLMDisambiguator,
+        pending: list[int],
+        groups: list[list[NormalizedRecord]],
+        details: list[ResolutionDetails],
+    ) -> list[int]:
+        """Stage 6: ask the LLM whether each still-ambiguous group is one entity.
+
+        Uses ``LLMDisambiguator.check_same_entity``. A "same" verdict
+        contributes its confidence as ``llm_confidence`` and a "different"
+        verdict contributes one minus its confidence, which pulls the
+        group's confidence down; an undecided answer adds no signal.
+        Groups the disambiguator's own ``should_invoke`` gate rejects are
+        passed on.
+
+        Groups are admitted in batches no larger than the remaining call
+        budget, and each batch is issued concurrently so a disambiguator
+        with a scheduler can coalesce and batch it. Only uncached answers
+        count as calls, so cache hits free budget for the next batch. A
+        batch may run for at most the remaining ``max_seconds``; requests
+        still running then are cancelled, counted as calls and skipped.
+        """
+        stats = self._stage_stats["llm"]
+        tracker = BudgetTracker(self._cascade.llm, stats)
+        stats.items_in += len(pending)
+
+        remaining: list[int] = []
+        position = 0
+        while position < len(pending):
+            if not tracker.allows(calls=1):
+                break
+            calls_left = tracker.remaining_calls()
+            admitted: list[int] = []
+            while position < len(pending) and (calls_left is None or len(admitted) < calls_left):
+                i = pending[position]
+                position += 1
+                if await llm.should_invoke(details[i]):
+                    admitted.append(i)
+                else:
+                    remaining.append(i)
+            if not admitted:
+                break
+
+            started = time.perf_counter()
+            tasks = {
+                asyncio.ensure_future(
+                    llm.check_same_entity(
+                        groups[i],
+                        f"{len(groups[i])} {groups[i][0].entity_type} records sharing an identifier",
+                    ),
+                ): i
+                for i in admitted
+            }
+            done, timed_out = await asyncio.wait(tasks, timeout=tracker.remaining_seconds())
+            for task in timed_out:
+                task.cancel()
+            await asyncio.gather(*timed_out, return_exceptions=True)
+            results = {tasks[task]: task.result() for task in done}
+            calls = sum(not result.cached for result in results.values()) + len(timed_out)
+            tracker.record(calls=calls, seconds=time.perf_counter() - started)
+
+            decided = [i for i in admitted if i in results]
+            for i in decided:
+                verdict = results[i].same_entity_confidence
+                if verdict is not None:
+                    details[i] = details[i].model_copy(update={"llm_confidence": verdict})
+            remaining.extend(self._still_ambiguous(decided, details, stats))
+            skipped = [i for i in admitted if i not in results]
+            stats.skipped_budget += len(skipped)
+            remaining.extend(skipped)
+
+        stats.skipped_budget += len(pending) - position
+        remaining.extend(pending[position:])
+        return remaining
+
+    def _still_ambiguous(
+        self,
+        indices: list[int],
+        details: list[ResolutionDetails],
+        stats: StageStats,
+    ) -> list[int]:
+        """Return the groups still in the band; count the others as settled."""
+        ambiguous = [i for i in indices if self._cascade.is_ambiguous(self._compute_confidence(details[i]))]
+        stats.items_settled += len(indices) - len(ambiguous)
+        return ambiguous
+
+    def _apply_details(
+        self,
+        entity: ResolvedEntity,
+        records: list[NormalizedRecord],
+        details: ResolutionDetails,
+    ) -> ResolvedEntity:
+        """Re-derive confidence, method and review flags from refined details."""
+        confidence = self._compute_confidence(details)
+        needs_review = confidence < _REVIEW_THRESHOLD
+        return entity.model_copy(
+            update={
+                "resolution_details": details,
+                "resolution_confidence": confidence,
+                "resolution_method": self._determine_method(records, details),
+                "needs_review": needs_review,
+                "review_reason": f"Low confidence ({confidence:.2f})" if needs_review else None,
+                "source_records": [
+                    ref.model_copy(update={"agreement_score": confidence}) for ref in entity.source_records
+                ],
+            },
+        )
+
+    def _record_grouping(self, stage: str, items_in: int, items_settled: int, started: float) -> None:
+        """Update Stage 1/2 counters after a grouping pass."""
+        stats = self._stage_stats[stage]
+        stats.items_in += items_in
+        stats.items_settled += items_settled
+        stats.seconds += time.perf_counter() - started
+
+    def find_existing_matches(
+        self,
+        records: list[NormalizedRecord],
+        *,
+        k: int = 5,
+        threshold: float | None = None,
+    ) -> list[list[NameIndexHit]]:
+        """Look up already-resolved entities whose names match each record.
+
+        Queries the configured ``NameIndex`` with each record's canonical
+        name, restricted to the record's entity type. This finds
+        cross-batch candidates without re-resolving the stored catalogue.
+
+        Parameters
+        ----------
+        records : list[NormalizedRecord]
+            Newly ingested records.
+        k : int, optional
+            Maximum hits per record. Default 5.
+        threshold : float | None, optional
+            Minimum similarity. Defaults to the Stage 2 threshold.
+
+        Returns
+        -------
+        list[list[NameIndexHit]]
+            Hits aligned with ``records`` (best first). All lists are empty
+            when no name index is configured.
+        """
+        if self._name_index is None:
+            return [[] for _ in records]
+        effective_threshold = threshold if threshold is not None else self._string_matcher._threshold
+        return [
+            self._name_index.query(
+                self._string_matcher.normalize(r.canonical_name),
+                k=k,
+                threshold=effective_threshold,
+                entity_type=str(r.entity_type),
+                normalized=True,
+            )
+            for r in records
+        ]
+
     def _group_by_identifiers(self, records: list[NormalizedRecord]) -> list[list[int]]:
         """Group records by shared identifiers using union-find.
 
         Builds an inverted index from identifier values to record indices,
-        then uses union-find with path compression to merge records that
-        share any identifier (ISRC, ISWC, ISNI, MBID, AcoustID).
+        then merges records that share any identifier (ISRC, ISWC, ISNI,
+        MBID, AcoustID) in one bulk ``DisjointSet.union_pairs`` call.
 
         Parameters
         ----------
@@ -244,114 +808,82 @@ class ResolutionOrchestrator:
             Groups of record indices. Only groups with 2+ records are
             returned (singletons are handled separately by the caller).
         """
-        parent: dict[int, int] = {}
-
-        def find(x: int) -> int:
-            if x not in parent:
-                parent[x] = x
-            while parent[x] != x:
-                parent[x] = parent[parent[x]]
-                x = parent[x]
-            return x
-
-        def union(x: int, y: int) -> None:
-            px, py = find(x), find(y)
-            if px != py:
-                parent[px] = py
-
         # Build identifier index
         id_index: dict[str, list[int]] = defaultdict(list)
         for i, record in enumerate(records):
-            ids = record.identifiers
-            for field in ("isrc", "iswc", "isni", "mbid", "acoustid"):
-                val = getattr(ids, field, None)
-                if val:
-                    id_index[f"{field}:{val}"].append(i)
+            for key in _identifier_keys(record):
+                id_index[key].append(i)
 
-        # Union records sharing identifiers
+        # Union records sharing identifiers (star edges to the first holder)
+        left: list[int] = []
+        right: list[int] = []
         for indices in id_index.values():
-            for j in range(1, len(indices)):
-                union(indices[0], indices[j])
+            left.extend([indices[0]] * (len(indices) - 1))
+            right.extend(indices[1:])
+        forest = DisjointSet(len(records))
+        forest.union_pairs(np.asarray(left, dtype=np.int64), np.asarray(right, dtype=np.int64))
 
-        # Collect groups (only groups with 2+ records indicate matches)
-        groups_map: dict[int, list[int]] = defaultdict(list)
-        grouped: set[int] = set()
-        for key_indices in id_index.values():
-            if len(key_indices) > 1:
-                for idx in key_indices:
-                    grouped.add(idx)
-
-        for idx in grouped:
-            groups_map[find(idx)].append(idx)
-
-        # Deduplicate within groups
-        return [sorted(set(v)) for v in groups_map.values()]
+        # Only groups with 2+ records indicate matches
+        return forest.groups(min_size=2)
 
     def _group_by_string_similarity(
         self,
-        records: list[NormalizedRecord],
         indices: list[int],
+        normalized: list[str],
     ) -> list[list[int]]:
         """Group ungrouped records by canonical name string similarity.
 
-        Performs pairwise Jaro-Winkler + token-sort comparison on records
-        that were not matched by identifier. Uses union-find to transitively
-        merge records that exceed the similarity threshold.
+        Candidate pairs come from the ``CandidateBlocker`` (prefix,
+        sorted-token, phonetic and n-gram LSH keys), so only plausible
+        pairs are scored with Jaro-Winkler + token-sort comparison.
+        Uses union-find to transitively merge records that exceed the
+        similarity threshold.
 
         Parameters
         ----------
-        records : list[NormalizedRecord]
-            Full record list (indexed by position).
         indices : list[int]
             Indices of records not yet grouped by identifier matching.
+        normalized : list[str]
+            Normalized canonical names of the full record list (indexed
+            by position).
 
         Returns
         -------
         list[list[int]]
             Groups of record indices with 2+ members.
         """
-        parent: dict[int, int] = {}
-
-        def find(x: int) -> int:
-            if x not in parent:
-                parent[x] = x
-            while parent[x] != x:
-                parent[x] = parent[parent[x]]
-                x = parent[x]
-            return x
-
-        def union(x: int, y: int) -> None:
-            px, py = find(x), find(y)
-            if px != py:
-                parent[px] = py
-
-        for i_idx in range(len(indices)):
-            for j_idx in range(i_idx + 1, len(indices)):
-                i, j = indices[i_idx], indices[j_idx]
-                score = self._string_matcher.score(
-                    records[i].canonical_name,
-                    records[j].canonical_name,
-                )
-                if score >= self._string_matcher._threshold:
-                    union(i, j)
-
-        groups_map: dict[int, list[int]] = defaultdict(list)
-        for idx in indices:
-            if idx in parent:
-                groups_map[find(idx)].append(idx)
+        names = [normalized[i] for i in indices]
+        pairs = np.asarray(self._blocker.candidate_pairs(names, normalized=True), dtype=np.int64).reshape(-1, 2)
+        self._stage_stats["string"].pairs += len(pairs)
+        scores = self._string_matcher.score_pairs(
+            [names[i_idx] for i_idx in pairs[:, 0]],
+            [names[j_idx] for j_idx in pairs[:, 1]],
+            normalized=True,
+        )
+        matched = pairs[scores >= self._string_matcher._threshold]
 
-        return [sorted(set(v)) for v in groups_map.values() if len(v) > 1]
+        # Union-find runs over local positions, mapped back to record indices
+        forest = DisjointSet(len(indices))
+        forest.union_pairs(matched[:, 0], matched[:, 1])
+        return [[indices[pos] for pos in group] for group in forest.groups(min_size=2)]
 
-    def _compute_resolution_details(self, records: list[NormalizedRecord]) -> ResolutionDetails:
+    def _compute_resolution_details(
+        self,
+        records: list[NormalizedRecord],
+        normalized_names: list[str] | None = None,
+    ) -> ResolutionDetails:
         """Compute per-method resolution details for a record group.
 
         Checks which identifiers are shared across the group and computes
-        pairwise string similarity (maximum across all pairs).
+        pairwise string similarity (maximum across all pairs, scored in
+        one ``score_matrix`` batch).
 
         Parameters
         ----------
         records : list[NormalizedRecord]
             Records in the current resolution group.
+        normalized_names : list[str] | None, optional
+            Pre-normalized canonical names aligned with ``records``.
 
         Returns
         -------
@@ -372,15 +904,9 @@ class ResolutionOrchestrator:
         # String similarity (pairwise max)
         string_sim: float | None = None
         if len(records) > 1:
-            max_sim = 0.0
-            for i in range(len(records)):
-                for j in range(i + 1, len(records)):
-                    score = self._string_matcher.score(
-                        records[i].canonical_name,
-                        records[j].canonical_name,
-                    )
-                    max_sim = max(max_sim, score)
-            string_sim = max_sim
+            names = normalized_names or [self._string_matcher.normalize(r.canonical_name) for r in records]
+            matrix = self._string_matcher.score_matrix(names, names, normalized=True)
+            string_sim = float(matrix[np.triu_indices(len(names), k=1)].max())
 
         return ResolutionDetails(
             string_similarity=string_sim,
@@ -396,7 +922,7 @@ class ResolutionOrchestrator:
 
         Selects the highest-confidence method that contributed to the
         resolution, following the cascade priority order: exact ID >
-        fuzzy string > embedding > singleton fallback.
+        fuzzy string > embedding > graph > LLM > singleton fallback.
 
         Parameters
         ----------
@@ -416,6 +942,10 @@ class ResolutionOrchestrator:
             return ResolutionMethodEnum.FUZZY_STRING
         if details.embedding_similarity and details.embedding_similarity >= 0.7:
             return ResolutionMethodEnum.EMBEDDING
+        if details.graph_path_confidence and details.graph_path_confidence >= 0.7:
+            return ResolutionMethodEnum.GRAPH
+        if details.llm_confidence and details.llm_confidence >= 0.7:
+            return ResolutionMethodEnum.LLM
         if len(records) == 1:
             return ResolutionMethodEnum.EXACT_ID
         return ResolutionMethodEnum.FUZZY_STRING
@@ -572,3 +1102,42 @@ class ResolutionOrchestrator:
                     merged[field] = val
 
         return IdentifierBundle(**merged)  # type: ignore[arg-type]
+
+
+def _pair_count(size: int) -> int:
+    """Number of unordered record pairs in a group of ``size``."""
+    return size * (size - 1) // 2
+
+
+# Per-process orchestrators for the process backend, keyed by weights
+_WORKER_ORCHESTRATORS: dict[tuple[tuple[str, float], ...], ResolutionOrchestrator] = {}
+
+
+def _resolve_group_chunk(
+    weights: dict[str, float],
+    chunk: list[tuple[list[NormalizedRecord], list[str]]],
+) -> list[ResolvedEntity]:
+    """Resolve a chunk of groups in a worker process.
+
+    Module-level (hence picklable) entry point for the process backend.
+    Each worker builds one orchestrator per weight set and reuses it for
+    every chunk it receives.
+
+    Parameters
+    ----------
+    weights : dict[str, float]
+        Signal weights of the submitting orchestrator.
+    chunk : list[tuple[list[NormalizedRecord], list[str]]]
+        Groups as ``(records, normalized_names)`` pairs.
+
+    Returns
+    -------
+    list[ResolvedEntity]
+        One entity per group, in chunk order.
+    """
+    key = tuple(sorted(weights.items()))
+    orchestrator = _WORKER_ORCHESTRATORS.get(key)
+    if orchestrator is None:
+        orchestrator = ResolutionOrchestrator(weights=weights)
+        _WORKER_ORCHESTRATORS[key] = orchestrator
+    return orchestrator._build_entities(chunk)
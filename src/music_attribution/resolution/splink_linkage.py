@@ -13,6 +13,23 @@ u-probabilities for non-matches) are estimated from the data using EM.
 
 When Splink is not available (e.g., in lightweight test environments), the
 matcher falls back to a simple exact-match heuristic on comparison columns.
+The fallback mirrors Splink's blocking: candidate pairs come from a
+self-join on each comparison column (records sharing a value), and the
+agreement fraction is computed with columnar equality masks over the
+factorized columns rather than per-cell lookups.
+
+Trained parameters can be persisted with ``save_model()`` as JSON together
+with a content hash and a column profile of the training data.
+``fit_or_load()`` reloads them at start-up and only re-runs EM when the
+new data's profile drifts past a threshold; a loaded model predicts on
+new batches by warm-starting a linker from the stored settings.
+
+For dedupe jobs whose pair table outgrows memory, ``predict_batches()``
+pushes the match-probability threshold into the DuckDB query and streams
+the surviving pairs as Arrow record batches (converted to NumPy
+``PairBatch`` chunks), and ``cluster_batches()`` folds each chunk into a
+``DisjointSet`` as it arrives, so only one chunk of pairs is held in
+Python at a time.
 
 Notes
 -----
@@ -33,14 +50,49 @@ music_attribution.resolution.graph_resolution : Stage 5 (runs after this).
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
 import logging
-from collections import defaultdict
-from typing import Any
+import os
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, NamedTuple
 
+import numpy as np
 import pandas as pd
 
+from music_attribution.resolution.union_find import DisjointSet
+
 logger = logging.getLogger(__name__)
 
+_MODEL_FORMAT_VERSION = 1
+
+# Maximum profile drift (see ``profile_drift``) tolerated before re-training
+_DEFAULT_DRIFT_THRESHOLD = 0.1
+
+# Pairs per streamed chunk in ``predict_batches``
+_DEFAULT_BATCH_SIZE = 65_536
+
+
+class PairBatch(NamedTuple):
+    """One streamed chunk of predicted record pairs.
+
+    Attributes
+    ----------
+    unique_id_l : numpy.ndarray
+        Left record IDs.
+    unique_id_r : numpy.ndarray
+        Right record IDs.
+    match_probability : numpy.ndarray
+        Match probability per pair (float64).
+    """
+
+    unique_id_l: np.ndarray
+    unique_id_r: np.ndarray
+    match_probability: np.ndarray
+
 
 class SplinkMatcher:
     """Probabilistic record linkage using the Splink library.
@@ -54,6 +106,9 @@ class SplinkMatcher:
     3. ``predict()`` -- compute match probabilities for all candidate pairs.
     4. ``cluster()`` -- group records by match probability threshold.
 
+    Steps 2-3 can be replaced by ``fit_or_load()``, which reuses parameters
+    saved by ``save_model()`` unless the training data has drifted.
+
     Attributes
     ----------
     _model_configured : bool
@@ -62,12 +117,22 @@ class SplinkMatcher:
         Column names used for record comparison.
     _linker : Any
         The Splink ``Linker`` instance (``None`` until parameters are estimated).
+    _settings : dict[str, Any] | None
+        Trained Splink settings (m/u probabilities included), ``None``
+        until estimated or loaded, or when Splink is unavailable.
+    _training_hash : str | None
+        ``training_data_hash()`` of the data the parameters came from.
+    _training_profile : dict[str, Any] | None
+        ``data_profile()`` of the training data, used for drift checks.
     """
 
     def __init__(self) -> None:
         self._model_configured = False
         self._comparison_columns: list[str] = []
         self._linker: Any = None
+        self._settings: dict[str, Any] | None = None
+        self._training_hash: str | None = None
+        self._training_profile: dict[str, Any] | None = None
 
     def configure_model(self, comparison_columns: list[str]) -> None:
         """Configure the Splink model with comparison columns.
@@ -113,6 +178,8 @@ class SplinkMatcher:
             msg = "Model not configured. Call configure_model() first."
             raise RuntimeError(msg)
 
+        self._record_training_data(records)
+        self._settings = None
         try:
             import splink.comparison_library as cl
             from splink import DuckDBAPI, Linker, SettingsCreator, block_on
@@ -148,12 +215,13 @@ class SplinkMatcher:
                     "EM estimation failed for all %d columns — predictions may use unestimated parameters",
                     em_failures,
                 )
+            self._settings = self._linker.misc.save_model_to_json()
 
         except ImportError:
             logger.warning("Splink not available, using fallback parameter estimation")
             self._linker = None
 
-    def predict(self, records: pd.DataFrame) -> pd.DataFrame:
+    def predict(self, records: pd.DataFrame, *, warm_start: bool = False) -> pd.DataFrame:
         """Predict match probabilities for all candidate record pairs.
 
         If the Splink linker is available, uses the trained model to
@@ -163,7 +231,12 @@ class SplinkMatcher:
         Parameters
         ----------
         records : pd.DataFrame
-            DataFrame with comparison columns (used only in fallback mode).
+            DataFrame with comparison columns. Used in fallback mode, and
+            as the batch to link in warm-start mode.
+        warm_start : bool, optional
+            Link ``records`` (a new batch) with the trained settings
+            instead of the training data, without re-estimating. Implied
+            when the parameters were loaded with ``load_model()``.
 
         Returns
         -------
@@ -171,9 +244,10 @@ class SplinkMatcher:
             DataFrame with columns ``unique_id_l``, ``unique_id_r``,
             and ``match_probability`` (float in [0, 1]).
         """
-        if self._linker is not None:
+        linker = self._prediction_linker(records, warm_start=warm_start)
+        if linker is not None:
             try:
-                predictions = self._linker.inference.predict()
+                predictions = linker.inference.predict()
                 df: pd.DataFrame = predictions.as_pandas_dataframe()
                 return df[["unique_id_l", "unique_id_r", "match_probability"]]  # type: ignore[no-any-return]
             except Exception as e:
@@ -182,15 +256,266 @@ class SplinkMatcher:
         # Fallback: simple exact match on comparison columns
         return self._fallback_predict(records)
 
+    def predict_batches(
+        self,
+        records: pd.DataFrame,
+        *,
+        threshold: float = 0.85,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        warm_start: bool = False,
+    ) -> Iterator[PairBatch]:
+        """Stream the pairs at or above ``threshold`` in bounded chunks.
+
+        With a Splink linker, the threshold is passed to Splink's predict
+        SQL (so sub-threshold pairs never reach the result table) and the
+        result is read from DuckDB as Arrow record batches of at most
+        ``batch_size`` rows. Without Splink, or without ``pyarrow``, the
+        materialized ``predict()`` output is filtered and sliced instead.
+
+        Parameters
+        ----------
+        records : pd.DataFrame
+            Records to link (see ``predict()``).
+        threshold : float, optional
+            Minimum match probability. Default 0.85.
+        batch_size : int, optional
+            Maximum pairs per chunk. Default 65,536.
+        warm_start : bool, optional
+            Link ``records`` with the trained settings (see ``predict()``).
+
+        Yields
+        ------
+        PairBatch
+            Chunks of ``(unique_id_l, unique_id_r, match_probability)``.
+        """
+        linker = self._prediction_linker(records, warm_start=warm_start)
+        if linker is None:
+            frame = self._fallback_predict(records)
+        else:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                logger.warning("pyarrow not available, streaming from materialized predictions")
+                frame = self.predict(records, warm_start=warm_start)
+            else:
+                try:
+                    predictions = linker.inference.predict(threshold_match_probability=threshold)
+                    relation = predictions.as_duckdbpyrelation().project("unique_id_l, unique_id_r, match_probability")
+                    reader = relation.fetch_record_batch(batch_size)
+                except Exception as e:
+                    logger.warning("Splink streaming prediction failed: %s, using fallback", e)
+                    frame = self._fallback_predict(records)
+                else:
+                    for batch in reader:
+                        yield PairBatch(
+                            batch.column(0).to_numpy(),
+                            batch.column(1).to_numpy(),
+                            batch.column(2).to_numpy().astype(np.float64),
+                        )
+                    return
+
+        above = frame[frame["match_probability"] >= threshold]
+        for start in range(0, len(above), max(batch_size, 1)):
+            chunk = above.iloc[start : start + batch_size]
+            yield PairBatch(
+                chunk["unique_id_l"].to_numpy(),
+                chunk["unique_id_r"].to_numpy(),
+                chunk["match_probability"].to_numpy(dtype=np.float64),
+            )
+
+    def cluster_batches(self, batches: Iterable[PairBatch], unique_ids: Any) -> list[list[Any]]:
+        """Cluster streamed pair chunks incrementally.
+
+        Every chunk is unioned into one ``DisjointSet`` over ``unique_ids``
+        as it arrives, so memory stays at one chunk plus two arrays per
+        record regardless of the total number of pairs. Chunks are taken
+        as already filtered (see ``predict_batches()``).
+
+        Parameters
+        ----------
+        batches : Iterable[PairBatch]
+            Pair chunks, e.g. from ``predict_batches()``.
+        unique_ids : array-like
+            All record IDs; records without pairs become singletons.
+
+        Returns
+        -------
+        list[list[Any]]
+            Clusters of ``unique_id`` values, ordered by smallest ID.
+
+        Raises
+        ------
+        ValueError
+            If a chunk references an ID not in ``unique_ids``.
+        """
+        ids = np.unique(np.asarray(unique_ids))
+        forest = DisjointSet(len(ids))
+        for batch in batches:
+            left = _dense_positions(ids, batch.unique_id_l)
+            right = _dense_positions(ids, batch.unique_id_r)
+            forest.union_pairs(left, right)
+        return [ids[group].tolist() for group in forest.groups()]
+
+    def predict_clusters(
+        self,
+        records: pd.DataFrame,
+        *,
+        threshold: float = 0.85,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        warm_start: bool = False,
+    ) -> list[list[Any]]:
+        """Stream predictions straight into incremental clustering.
+
+        Equivalent to ``cluster(predict(records), threshold)`` with every
+        record present, without materializing the pair table.
+
+        Parameters
+        ----------
+        records : pd.DataFrame
+            Records to link (``unique_id`` plus comparison columns).
+        threshold : float, optional
+            Minimum match probability. Default 0.85.
+        batch_size : int, optional
+            Maximum pairs per streamed chunk.
+        warm_start : bool, optional
+            Link ``records`` with the trained settings (see ``predict()``).
+
+        Returns
+        -------
+        list[list[Any]]
+            Clusters of ``unique_id`` values, singletons included.
+        """
+        batches = self.predict_batches(records, threshold=threshold, batch_size=batch_size, warm_start=warm_start)
+        return self.cluster_batches(batches, records["unique_id"].to_numpy())
+
+    def save_model(self, path: Path) -> None:
+        """Write the trained parameters to disk as JSON (atomically).
+
+        The file holds the Splink settings (``None`` in fallback mode), the
+        comparison columns, and the hash and profile of the training data.
+
+        Parameters
+        ----------
+        path : Path
+            Destination file.
+
+        Raises
+        ------
+        RuntimeError
+            If no parameters have been estimated or loaded.
+        """
+        if self._training_hash is None or self._training_profile is None:
+            msg = "No trained parameters. Call estimate_parameters() first."
+            raise RuntimeError(msg)
+        payload = {
+            "version": _MODEL_FORMAT_VERSION,
+            "saved_at": datetime.now(UTC).isoformat(),
+            "comparison_columns": self._comparison_columns,
+            "training_hash": self._training_hash,
+            "training_profile": self._training_profile,
+            "settings": self._settings,
+        }
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+        logger.info("Saved Splink model (%s) to %s", self._training_hash[:12], path)
+
+    def load_model(self, path: Path) -> None:
+        """Load parameters written by ``save_model()`` (no re-training).
+
+        Configures the comparison columns from the file. Subsequent
+        ``predict()`` calls warm-start a linker on the batch they receive.
+
+        Parameters
+        ----------
+        path : Path
+            File written by ``save_model()``.
+
+        Raises
+        ------
+        ValueError
+            If the file was written with an unsupported format version.
+        """
+        payload = _read_model(path)
+        self.configure_model(payload["comparison_columns"])
+        self._linker = None
+        self._settings = payload["settings"]
+        self._training_hash = payload["training_hash"]
+        self._training_profile = payload["training_profile"]
+
+    def fit_or_load(
+        self,
+        records: pd.DataFrame,
+        path: Path,
+        *,
+        drift_threshold: float = _DEFAULT_DRIFT_THRESHOLD,
+    ) -> bool:
+        """Reuse saved parameters unless the data has drifted; else re-train.
+
+        The saved model is reused when its comparison columns match the
+        configured ones and either the training-data hash is unchanged or
+        ``profile_drift()`` against ``records`` is within
+        ``drift_threshold``. Otherwise parameters are re-estimated on
+        ``records`` and saved to ``path``.
+
+        Parameters
+        ----------
+        records : pd.DataFrame
+            Current data (``unique_id`` plus comparison columns).
+        path : Path
+            Model file (created or replaced on re-training).
+        drift_threshold : float, optional
+            Maximum tolerated profile drift. Default 0.1.
+
+        Returns
+        -------
+        bool
+            ``True`` if parameters were re-estimated, ``False`` if loaded.
+
+        Raises
+        ------
+        RuntimeError
+            If ``configure_model()`` has not been called first.
+        """
+        if not self._model_configured:
+            msg = "Model not configured. Call configure_model() first."
+            raise RuntimeError(msg)
+
+        if path.exists():
+            payload = _read_model(path)
+            if payload["comparison_columns"] == self._comparison_columns:
+                if payload["training_hash"] == training_data_hash(records, self._comparison_columns):
+                    logger.info("Splink training data unchanged, loading %s", path)
+                    self.load_model(path)
+                    return False
+                drift = profile_drift(
+                    payload["training_profile"],
+                    data_profile(records, self._comparison_columns),
+                )
+                if drift <= drift_threshold:
+                    logger.info("Splink data drift %.3f <= %.3f, loading %s", drift, drift_threshold, path)
+                    self.load_model(path)
+                    return False
+                logger.info("Splink data drift %.3f > %.3f, re-training", drift, drift_threshold)
+            else:
+                logger.info("Splink comparison columns changed, re-training")
+
+        self.estimate_parameters(records)
+        self.save_model(path)
+        return True
+
     def cluster(
         self,
         predictions: pd.DataFrame,
         threshold: float = 0.85,
+        *,
+        unique_ids: Any = None,
     ) -> list[list[int]]:
         """Cluster records into entity groups based on match predictions.
 
-        Uses union-find with path compression to transitively merge
-        records connected by match probabilities above the threshold.
+        Transitively merges records connected by match probabilities
+        above the threshold with a bulk ``DisjointSet.union_pairs`` call;
+        no per-row Python iteration is involved.
 
         Parameters
         ----------
@@ -200,6 +525,10 @@ class SplinkMatcher:
         threshold : float, optional
             Minimum match probability to consider a pair as linked.
             Default is 0.85.
+        unique_ids : array-like of int, optional
+            All record IDs. Records absent from ``predictions`` (e.g. not
+            blocked with any other record) are returned as singleton
+            clusters. By default only IDs seen in ``predictions`` appear.
 
         Returns
         -------
@@ -207,52 +536,49 @@ class SplinkMatcher:
             Clusters of ``unique_id`` values. Each cluster represents
             records believed to be the same entity.
         """
-        # Filter predictions above threshold
-        above = predictions[predictions["match_probability"] >= threshold]
-
-        # Union-find clustering
-        parent: dict[int, int] = {}
-
-        def find(x: int) -> int:
-            if x not in parent:
-                parent[x] = x
-            while parent[x] != x:
-                parent[x] = parent[parent[x]]
-                x = parent[x]
-            return x
-
-        def union(x: int, y: int) -> None:
-            px, py = find(x), find(y)
-            if px != py:
-                parent[px] = py
-
-        # Collect all IDs
-        all_ids: set[int] = set()
-        for _, row in above.iterrows():
-            lid = int(row["unique_id_l"])
-            rid = int(row["unique_id_r"])
-            all_ids.add(lid)
-            all_ids.add(rid)
-            union(lid, rid)
-
-        # Also add unpaired IDs from predictions
-        for _, row in predictions.iterrows():
-            all_ids.add(int(row["unique_id_l"]))
-            all_ids.add(int(row["unique_id_r"]))
-
-        # Group by root
-        groups: dict[int, list[int]] = defaultdict(list)
-        for uid in all_ids:
-            groups[find(uid)].append(uid)
-
-        return list(groups.values())
+        left_ids = predictions["unique_id_l"].to_numpy(dtype=np.int64)
+        right_ids = predictions["unique_id_r"].to_numpy(dtype=np.int64)
+
+        # Map every ID seen in the predictions to a dense position
+        extra_ids = np.empty(0, dtype=np.int64) if unique_ids is None else np.asarray(unique_ids, dtype=np.int64)
+        all_ids, positions = np.unique(np.concatenate((left_ids, right_ids, extra_ids)), return_inverse=True)
+        left_pos, right_pos = positions[: len(left_ids)], positions[len(left_ids) : 2 * len(left_ids)]
+
+        # Union only the pairs above threshold
+        above = predictions["match_probability"].to_numpy(dtype=np.float64) >= threshold
+        forest = DisjointSet(len(all_ids))
+        forest.union_pairs(left_pos[above], right_pos[above])
+
+        return [all_ids[group].tolist() for group in forest.groups()]
+
+    def _record_training_data(self, records: pd.DataFrame) -> None:
+        """Remember the hash and profile of the data being trained on."""
+        self._training_hash = training_data_hash(records, self._comparison_columns)
+        self._training_profile = data_profile(records, self._comparison_columns)
+
+    def _prediction_linker(self, records: pd.DataFrame, *, warm_start: bool) -> Any:
+        """Return the linker to predict with (warm-started when required)."""
+        if self._settings is not None and (warm_start or self._linker is None):
+            return self._warm_start_linker(records)
+        return self._linker
+
+    def _warm_start_linker(self, records: pd.DataFrame) -> Any:
+        """Build a linker over ``records`` from the trained settings."""
+        try:
+            from splink import DuckDBAPI, Linker
+        except ImportError:
+            return None
+        # Copy so the linker cannot mutate the stored settings
+        return Linker(records, copy.deepcopy(self._settings), db_api=DuckDBAPI())  # type: ignore[arg-type]
 
     def _fallback_predict(self, records: pd.DataFrame) -> pd.DataFrame:
         """Fallback prediction using exact matching on comparison columns.
 
-        Used when Splink is not available or fails. Computes match
-        probability as the fraction of comparison columns with exact
-        agreement between each record pair.
+        Used when Splink is not available or fails. Candidate pairs are
+        the union of per-column blocks (records sharing a non-null value,
+        like Splink's ``block_on(col)`` rules); each pair's match
+        probability is the fraction of comparison columns with exact
+        agreement. Pairs agreeing on no column are not emitted.
 
         Parameters
         ----------
@@ -263,25 +589,164 @@ class SplinkMatcher:
         -------
         pd.DataFrame
             DataFrame with columns ``unique_id_l``, ``unique_id_r``,
-            ``match_probability``.
+            ``match_probability``, ordered by record position of the left
+            then right record. Missing values never agree.
         """
-        pairs = []
         n = len(records)
-        for i in range(n):
-            for j in range(i + 1, n):
-                matches = 0
-                total = len(self._comparison_columns)
-                for col in self._comparison_columns:
-                    val_i = records.iloc[i].get(col)
-                    val_j = records.iloc[j].get(col)
-                    if val_i is not None and val_j is not None and val_i == val_j:
-                        matches += 1
-                prob = matches / total if total > 0 else 0.0
-                pairs.append(
-                    {
-                        "unique_id_l": records.iloc[i]["unique_id"],
-                        "unique_id_r": records.iloc[j]["unique_id"],
-                        "match_probability": prob,
-                    }
-                )
-        return pd.DataFrame(pairs)
+        total = len(self._comparison_columns)
+        # Factorize each column once; nulls get code -1 and never agree
+        codes = [
+            pd.factorize(records[col], use_na_sentinel=True)[0] for col in self._comparison_columns if col in records
+        ]
+
+        # Self-join on each comparison column, deduplicated as l * n + r keys
+        block_keys = [left * n + right for left, right in map(_block_pairs, codes)]
+        keys = np.unique(np.concatenate(block_keys)) if block_keys else np.empty(0, dtype=np.int64)
+        left, right = np.divmod(keys, max(n, 1))
+
+        matches = np.zeros(len(keys), dtype=np.int64)
+        for column_codes in codes:
+            code_l = column_codes[left]
+            matches += (code_l == column_codes[right]) & (code_l >= 0)
+
+        unique_ids = records["unique_id"].to_numpy()
+        return pd.DataFrame(
+            {
+                "unique_id_l": unique_ids[left],
+                "unique_id_r": unique_ids[right],
+                "match_probability": matches / total if total > 0 else np.zeros(len(keys)),
+            }
+        )
+
+
+def training_data_hash(records: pd.DataFrame, comparison_columns: list[str]) -> str:
+    """Content hash of the comparison columns, independent of row order.
+
+    Parameters
+    ----------
+    records : pd.DataFrame
+        Training data.
+    comparison_columns : list[str]
+        Columns the model compares (absent columns are ignored).
+
+    Returns
+    -------
+    str
+        Hex SHA-256 over the column names and the sorted row hashes.
+    """
+    columns = [col for col in comparison_columns if col in records]
+    row_hashes = np.sort(pd.util.hash_pandas_object(records[columns], index=False).to_numpy())
+    digest = hashlib.sha256(json.dumps(comparison_columns).encode())
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+def data_profile(records: pd.DataFrame, comparison_columns: list[str]) -> dict[str, Any]:
+    """Summarize the distribution of each comparison column.
+
+    Per column: ``null_rate`` (share of missing values), ``distinct_ratio``
+    (distinct non-null values per non-null row) and ``top_share`` (share of
+    non-null rows holding the most frequent value). These drive Splink's
+    u-probabilities and term-frequency adjustments.
+
+    Parameters
+    ----------
+    records : pd.DataFrame
+        Data to profile.
+    comparison_columns : list[str]
+        Columns to profile; absent columns count as entirely null.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``{"rows": int, "columns": {col: {stat: float}}}``.
+    """
+    rows = len(records)
+    columns: dict[str, dict[str, float]] = {}
+    for col in comparison_columns:
+        values = records[col].dropna() if col in records else pd.Series(dtype=object)
+        counts = values.value_counts()
+        columns[col] = {
+            "null_rate": 1.0 - len(values) / rows if rows else 1.0,
+            "distinct_ratio": len(counts) / len(values) if len(values) else 0.0,
+            "top_share": float(counts.iloc[0]) / len(values) if len(values) else 0.0,
+        }
+    return {"rows": rows, "columns": columns}
+
+
+def profile_drift(saved: dict[str, Any], current: dict[str, Any]) -> float:
+    """Largest absolute change of any profile statistic.
+
+    Parameters
+    ----------
+    saved : dict[str, Any]
+        ``data_profile()`` of the training data.
+    current : dict[str, Any]
+        ``data_profile()`` of the new data.
+
+    Returns
+    -------
+    float
+        Maximum absolute difference across columns and statistics
+        (``1.0`` if the profiled columns differ).
+    """
+    if saved["columns"].keys() != current["columns"].keys():
+        return 1.0
+    return max(
+        (
+            abs(saved_stats[stat] - current["columns"][col][stat])
+            for col, saved_stats in saved["columns"].items()
+            for stat in saved_stats
+        ),
+        default=0.0,
+    )
+
+
+def _dense_positions(ids: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Map ``values`` to their positions in the sorted ``ids`` array."""
+    positions = np.searchsorted(ids, values)
+    known = positions < len(ids)
+    if not known.all() or not np.array_equal(ids[positions], values):
+        msg = "Pair batch references unique_id values missing from unique_ids"
+        raise ValueError(msg)
+    return positions
+
+
+def _read_model(path: Path) -> dict[str, Any]:
+    """Read and version-check a model file written by ``save_model()``."""
+    payload: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    if payload.get("version") != _MODEL_FORMAT_VERSION:
+        msg = f"Unsupported Splink model format version: {payload.get('version')}"
+        raise ValueError(msg)
+    return payload
+
+
+def _block_pairs(codes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Enumerate all ``(i, j)`` position pairs (``i < j``) sharing a code.
+
+    Vectorized self-join: positions are sorted by code and each element
+    is paired with the elements after it in its block, so the output is
+    built with ``np.repeat`` instead of a Python loop per block.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        Factorized column values; ``-1`` (null) is never paired.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        Left and right positions (int64), ``left < right``.
+    """
+    valid = np.flatnonzero(codes >= 0)
+    order = valid[np.argsort(codes[valid], kind="stable")]
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]]) if len(order) else order
+    sizes = np.diff(np.r_[starts, len(order)])
+
+    # Element at rank r in a block of size s pairs with the s - 1 - r after it
+    block_end = np.repeat(starts + sizes, sizes)
+    partners = block_end - np.arange(len(order)) - 1
+    first = np.repeat(np.arange(len(order)), partners)
+    offsets = np.arange(len(first)) - np.repeat(np.cumsum(partners) - partners, partners) + 1
+    return order[first].astype(np.int64), order[first + offsets].astype(np.int64)
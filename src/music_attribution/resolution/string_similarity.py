@@ -14,6 +14,12 @@ The two similarity algorithms are complementary:
 - **Jaro-Winkler** excels at short strings and character-level typos.
 - **Token-sort ratio** handles word reordering (``"John Elton"`` matches ``"Elton John"``).
 
+Batch scoring (``score_matrix``, ``score_pairs``, ``top_k``) runs both
+algorithms through ``rapidfuzz``'s native ``cdist`` / ``cpdist`` kernels,
+which produce the same scores as the pairwise ``jellyfish`` + ``thefuzz``
+path but without a Python-level loop, optionally spread across worker
+threads.
+
 Notes
 -----
 This module implements the fuzzy string matching layer described in
@@ -28,11 +34,17 @@ music_attribution.resolution.embedding_match : Stage 3 (semantic similarity).
 
 from __future__ import annotations
 
+import functools
 import re
 import unicodedata
 
 import jellyfish
+import numpy as np
+from rapidfuzz import fuzz as rf_fuzz
+from rapidfuzz import process
+from rapidfuzz.distance import JaroWinkler
 from thefuzz import fuzz
+from thefuzz.utils import full_process
 
 # Common music abbreviation expansions
 _ABBREVIATIONS: dict[str, str] = {
@@ -49,7 +61,26 @@ _ABBREVIATIONS: dict[str, str] = {
     "orch.": "orchestra",
 }
 
+# All abbreviations compiled into one alternation, tried in dict order so that
+# "feat." is attempted before "feat" at the same position. No expansion
+# contains another abbreviation, so one pass equals sequential substitution.
+_ABBREVIATION_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(abbrev) for abbrev in _ABBREVIATIONS) + r")\b",
+    flags=re.IGNORECASE,
+)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Upper bound on memoized normalized names (LRU eviction beyond this)
+_NORMALIZE_CACHE_SIZE = 65_536
+
 
+def _expand_abbreviation(match: re.Match[str]) -> str:
+    """Map a matched abbreviation to its expansion (``re.sub`` callback)."""
+    return _ABBREVIATIONS[match.group(0).lower()]
+
+
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def _normalize_name(name: str) -> str:
     """Normalize a music entity name for comparison.
 
@@ -62,6 +93,10 @@ def _normalize_name(name: str) -> str:
     4. Abbreviation expansion (``"feat."`` -> ``"featuring"``).
     5. Whitespace normalization.
 
+    Results are memoized in a bounded LRU (``_NORMALIZE_CACHE_SIZE``
+    entries), so repeated comparisons of the same name only pay for
+    normalization once.
+
     Parameters
     ----------
     name : str
@@ -92,17 +127,11 @@ def _normalize_name(name: str) -> str:
     if normalized.endswith(", the"):
         normalized = "the " + normalized[:-5]
 
-    # Expand abbreviations
-    for abbrev, expansion in _ABBREVIATIONS.items():
-        normalized = re.sub(
-            r"\b" + re.escape(abbrev) + r"\b",
-            expansion,
-            normalized,
-            flags=re.IGNORECASE,
-        )
+    # Expand abbreviations (single pass over the precompiled alternation)
+    normalized = _ABBREVIATION_PATTERN.sub(_expand_abbreviation, normalized)
 
     # Normalize whitespace
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+    normalized = _WHITESPACE_PATTERN.sub(" ", normalized).strip()
     return normalized
 
 
@@ -119,21 +148,47 @@ class StringSimilarityMatcher:
         Minimum similarity score (0.0-1.0) to consider a match.
         Default is 0.85, which balances precision and recall for
         typical music entity names.
+    workers : int, optional
+        Worker threads for the batch scoring methods. ``1`` scores on
+        the calling thread; ``-1`` uses every available core. Default 1.
 
     Attributes
     ----------
     _threshold : float
         Active similarity threshold.
+    _workers : int
+        Default worker count for batch scoring.
 
     See Also
     --------
     music_attribution.resolution.orchestrator.ResolutionOrchestrator : Uses this as Stage 2.
     """
 
-    def __init__(self, threshold: float = 0.85) -> None:
+    def __init__(self, threshold: float = 0.85, workers: int = 1) -> None:
         self._threshold = threshold
+        self._workers = workers
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Normalize an entity name once for repeated comparisons.
+
+        Callers that compare the same names many times (e.g. the
+        orchestrator's pairwise loops) normalize each name up front and
+        pass ``normalized=True`` to ``score()`` / ``find_candidates()``.
+
+        Parameters
+        ----------
+        name : str
+            Raw entity name.
+
+        Returns
+        -------
+        str
+            Normalized name (see ``_normalize_name``).
+        """
+        return _normalize_name(name)
 
-    def score(self, name_a: str, name_b: str) -> float:
+    def score(self, name_a: str, name_b: str, *, normalized: bool = False) -> float:
         """Compute similarity score between two entity names.
 
         Both names are normalized (accent stripping, abbreviation expansion,
@@ -146,6 +201,9 @@ class StringSimilarityMatcher:
             First entity name (raw, unnormalized).
         name_b : str
             Second entity name (raw, unnormalized).
+        normalized : bool, optional
+            Set to ``True`` when both names were already passed through
+            ``normalize()``; skips normalization entirely.
 
         Returns
         -------
@@ -153,8 +211,8 @@ class StringSimilarityMatcher:
             Similarity score in range [0.0, 1.0]. Returns 1.0 for
             exact matches after normalization.
         """
-        norm_a = _normalize_name(name_a)
-        norm_b = _normalize_name(name_b)
+        norm_a = name_a if normalized else _normalize_name(name_a)
+        norm_b = name_b if normalized else _normalize_name(name_b)
 
         if norm_a == norm_b:
             return 1.0
@@ -173,6 +231,8 @@ class StringSimilarityMatcher:
         name: str,
         corpus: list[str],
         threshold: float | None = None,
+        *,
+        normalized: bool = False,
     ) -> list[tuple[str, float]]:
         """Find candidate matches from a corpus above the similarity threshold.
 
@@ -188,6 +248,9 @@ class StringSimilarityMatcher:
         threshold : float | None, optional
             Override the instance threshold for this query. If ``None``,
             uses the threshold set at construction time.
+        normalized : bool, optional
+            Set to ``True`` when ``name`` and every ``corpus`` entry are
+            already normalized.
 
         Returns
         -------
@@ -196,12 +259,175 @@ class StringSimilarityMatcher:
             score descending. Empty list if no matches exceed threshold.
         """
         effective_threshold = threshold if threshold is not None else self._threshold
-        candidates = []
-
-        for candidate in corpus:
-            s = self.score(name, candidate)
-            if s >= effective_threshold:
-                candidates.append((candidate, s))
-
+        scores = self.score_matrix([name], corpus, normalized=normalized)[0]
+        candidates = [(corpus[i], float(scores[i])) for i in np.flatnonzero(scores >= effective_threshold)]
         candidates.sort(key=lambda x: x[1], reverse=True)
         return candidates
+
+    def score_matrix(
+        self,
+        queries: list[str],
+        corpus: list[str],
+        *,
+        normalized: bool = False,
+        workers: int | None = None,
+    ) -> np.ndarray:
+        """Score every query against every corpus name in one batch.
+
+        Equivalent to calling ``score(q, c)`` for each pair, but both
+        similarity algorithms run in ``rapidfuzz.process.cdist``.
+
+        Parameters
+        ----------
+        queries : list[str]
+            Query names (rows of the result).
+        corpus : list[str]
+            Corpus names (columns of the result).
+        normalized : bool, optional
+            Set to ``True`` when all names are already normalized.
+        workers : int | None, optional
+            Override the instance worker count for this call.
+
+        Returns
+        -------
+        numpy.ndarray
+            Float64 array of shape ``(len(queries), len(corpus))`` with
+            scores in [0.0, 1.0].
+        """
+        norm_q = queries if normalized else [_normalize_name(q) for q in queries]
+        norm_c = corpus if normalized else [_normalize_name(c) for c in corpus]
+        if not norm_q or not norm_c:
+            return np.zeros((len(norm_q), len(norm_c)), dtype=np.float64)
+
+        n_workers = self._workers if workers is None else workers
+        jw_scores = process.cdist(
+            norm_q,
+            norm_c,
+            scorer=JaroWinkler.normalized_similarity,
+            dtype=np.float64,
+            workers=n_workers,
+        )
+        token_scores = process.cdist(
+            [_token_sort_form(q) for q in norm_q],
+            [_token_sort_form(c) for c in norm_c],
+            scorer=rf_fuzz.token_sort_ratio,
+            dtype=np.float64,
+            workers=n_workers,
+        )
+        scores = np.maximum(jw_scores, np.round(token_scores) / 100.0)
+        scores[np.asarray(norm_q)[:, None] == np.asarray(norm_c)[None, :]] = 1.0
+        return scores  # type: ignore[no-any-return]
+
+    def score_pairs(
+        self,
+        left: list[str],
+        right: list[str],
+        *,
+        normalized: bool = False,
+        workers: int | None = None,
+    ) -> np.ndarray:
+        """Score aligned name pairs ``(left[i], right[i])`` in one batch.
+
+        Used for blocked candidate pairs, where only specific pairs (not
+        the full cross product) need scoring.
+
+        Parameters
+        ----------
+        left : list[str]
+            First name of each pair.
+        right : list[str]
+            Second name of each pair; must have the same length as ``left``.
+        normalized : bool, optional
+            Set to ``True`` when all names are already normalized.
+        workers : int | None, optional
+            Override the instance worker count for this call.
+
+        Returns
+        -------
+        numpy.ndarray
+            Float64 array of shape ``(len(left),)`` with scores in [0.0, 1.0].
+
+        Raises
+        ------
+        ValueError
+            If ``left`` and ``right`` differ in length.
+        """
+        if len(left) != len(right):
+            msg = f"score_pairs requires equal-length inputs, got {len(left)} and {len(right)}"
+            raise ValueError(msg)
+        if not left:
+            return np.zeros(0, dtype=np.float64)
+
+        norm_l = left if normalized else [_normalize_name(n) for n in left]
+        norm_r = right if normalized else [_normalize_name(n) for n in right]
+        n_workers = self._workers if workers is None else workers
+        jw_scores = process.cpdist(
+            norm_l,
+            norm_r,
+            scorer=JaroWinkler.normalized_similarity,
+            dtype=np.float64,
+            workers=n_workers,
+        )
+        token_scores = process.cpdist(
+            [_token_sort_form(n) for n in norm_l],
+            [_token_sort_form(n) for n in norm_r],
+            scorer=rf_fuzz.token_sort_ratio,
+            dtype=np.float64,
+            workers=n_workers,
+        )
+        scores = np.maximum(jw_scores, np.round(token_scores) / 100.0)
+        scores[np.asarray(norm_l) == np.asarray(norm_r)] = 1.0
+        return scores  # type: ignore[no-any-return]
+
+    def top_k(
+        self,
+        query: str,
+        corpus: list[str],
+        k: int,
+        *,
+        threshold: float = 0.0,
+        normalized: bool = False,
+        workers: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the ``k`` best-scoring corpus entries for a query.
+
+        Parameters
+        ----------
+        query : str
+            Name to search for.
+        corpus : list[str]
+            Candidate names to rank.
+        k : int
+            Maximum number of results.
+        threshold : float, optional
+            Drop results scoring below this value. Default 0.0 (keep all).
+        normalized : bool, optional
+            Set to ``True`` when all names are already normalized.
+        workers : int | None, optional
+            Override the instance worker count for this call.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            ``(indices, scores)``: corpus positions and their scores,
+            sorted by score descending (ties by corpus position).
+        """
+        scores = self.score_matrix([query], corpus, normalized=normalized, workers=workers)[0]
+        if k <= 0 or scores.size == 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.float64)
+
+        top = np.argpartition(-scores, k - 1)[:k] if k < scores.size else np.arange(scores.size)
+        top = top[np.lexsort((top, -scores[top]))]
+        top = top[scores[top] >= threshold]
+        return top, scores[top]
+
+
+@functools.lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _token_sort_form(normalized_name: str) -> str:
+    """Preprocess a name the way ``thefuzz.fuzz.token_sort_ratio`` does.
+
+    ``thefuzz`` strips non-ASCII characters and applies rapidfuzz's
+    ``default_process`` before scoring; batch scoring must do the same so
+    its results match ``score()`` exactly.
+    """
+    return str(full_process(normalized_name, force_ascii=True))
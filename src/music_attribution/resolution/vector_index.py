@@ -0,0 +1,345 @@
+"""Contiguous in-memory matrix index for exact cosine top-k search.
+
+``EmbeddingMatcher`` used to keep embeddings in a ``dict[str, list[float]]``
+and score a query with a Python loop over every entry. ``VectorIndex``
+keeps them in one contiguous NumPy matrix instead:
+
+- rows are L2-normalized on insert, so cosine similarity is a plain dot
+  product and a query is one matrix-vector product;
+- an ``id -> row`` dict and a ``row -> id`` list map entity IDs to rows;
+- capacity doubles when full (amortized O(1) append);
+- deletions set a tombstone flag; tombstoned rows are excluded from
+  results and reclaimed by ``compact()``, which runs automatically once
+  more than half the rows are dead;
+- top-k selection uses ``np.argpartition`` (O(n)) and sorts only the k
+  winners.
+
+``search_many`` scores a block of queries with one matrix-matrix product,
+chunked so the score block stays bounded in memory.
+
+The index is also the row store of ``search.ann_index.IVFFlatIndex``,
+which keeps its inverted lists as row numbers: ``add_many`` returns the
+rows it wrote, ``top_k_rows`` scores a subset of rows, and the
+``on_compact`` callback reports how rows were renumbered.
+
+See Also
+--------
+music_attribution.resolution.embedding_match : Uses the index.
+music_attribution.search.ann_index : Approximate index built on this one.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import cast
+
+import numpy as np
+
+# Initial row capacity of an empty index
+_INITIAL_CAPACITY = 1024
+
+# Upper bound on query x row scores materialized at once in ``search_many``
+_SCORE_BLOCK = 1 << 24
+
+
+class VectorIndex:
+    """Exact cosine-similarity index over a contiguous normalized matrix.
+
+    Parameters
+    ----------
+    dim : int | None, optional
+        Vector dimension. ``None`` infers it from the first insert.
+    dtype : numpy.dtype | type, optional
+        Storage dtype, ``np.float32`` (default) or ``np.float16`` (half
+        the memory; scores are still computed in float32).
+    on_compact : Callable[[numpy.ndarray], None] | None, optional
+        Called after ``compact()`` with the old row of each surviving
+        row (in new row order), so owners of per-row data can renumber it.
+
+    Attributes
+    ----------
+    _dim : int | None
+        Vector dimension.
+    _dtype : numpy.dtype
+        Storage dtype.
+    _matrix : numpy.ndarray
+        ``(capacity, dim)`` normalized rows; rows ``>= _size`` are unused.
+    _alive : numpy.ndarray
+        Per-row liveness flag (``False`` = tombstone or unused).
+    _ids : list[str | None]
+        Entity ID per used row (``None`` for tombstones).
+    _rows : dict[str, int]
+        Entity ID to row for live entries.
+    _size : int
+        Rows used (live plus tombstoned).
+    _on_compact : Callable[[numpy.ndarray], None] | None
+        Compaction callback.
+
+    Examples
+    --------
+    >>> index = VectorIndex()
+    >>> index.add("a", [1.0, 0.0])
+    >>> index.search([1.0, 0.1], k=1)
+    [('a', 0.995...)]
+    """
+
+    def __init__(
+        self,
+        dim: int | None = None,
+        dtype: np.dtype | type = np.float32,
+        *,
+        on_compact: Callable[[np.ndarray], None] | None = None,
+    ) -> None:
+        self._dim = dim
+        self._dtype = np.dtype(dtype)
+        self._matrix = np.zeros((0, dim or 0), dtype=self._dtype)
+        self._alive = np.zeros(0, dtype=bool)
+        self._ids: list[str | None] = []
+        self._rows: dict[str, int] = {}
+        self._size = 0
+        self._on_compact = on_compact
+
+    @property
+    def dim(self) -> int | None:
+        """Vector dimension (``None`` while empty and unconfigured)."""
+        return self._dim
+
+    @property
+    def capacity(self) -> int:
+        """Allocated rows (used rows are ``0 .. size - 1``)."""
+        return len(self._matrix)
+
+    @property
+    def size(self) -> int:
+        """Rows used, live plus tombstoned."""
+        return self._size
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """View of the used rows, tombstones included, indexed by row."""
+        return self._matrix[: self._size]
+
+    def __len__(self) -> int:
+        """Return the number of live entries."""
+        return len(self._rows)
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Return whether ``entity_id`` has a live entry."""
+        return entity_id in self._rows
+
+    def row(self, entity_id: str) -> int | None:
+        """Return the row of ``entity_id``, or ``None`` if absent."""
+        return self._rows.get(entity_id)
+
+    def live_rows(self) -> np.ndarray:
+        """Return the indices of live rows in ascending order."""
+        return np.flatnonzero(self._alive[: self._size])
+
+    def ids(self) -> list[str]:
+        """Return live entity IDs in row order."""
+        return [entity_id for entity_id in self._ids if entity_id is not None]
+
+    def vectors(self) -> np.ndarray:
+        """Return the live normalized rows (float32) in ``ids()`` order."""
+        return np.asarray(self._matrix[: self._size][self._alive[: self._size]], dtype=np.float32)
+
+    def add(self, entity_id: str, vector: Sequence[float] | np.ndarray) -> None:
+        """Insert or replace the vector for ``entity_id``."""
+        self.add_many([entity_id], np.asarray(vector, dtype=np.float32).reshape(1, -1))
+
+    def add_many(
+        self,
+        entity_ids: Sequence[str],
+        vectors: Sequence[Sequence[float]] | np.ndarray,
+        *,
+        normalized: bool = False,
+    ) -> np.ndarray:
+        """Insert or replace many vectors at once.
+
+        Parameters
+        ----------
+        entity_ids : Sequence[str]
+            Entity IDs; existing IDs are overwritten in place.
+        vectors : Sequence[Sequence[float]] | numpy.ndarray
+            One vector per ID.
+        normalized : bool, optional
+            The vectors are already unit length (e.g. rows read back from
+            ``vectors()``) and are stored as given. Default ``False``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Row written for each ID, in input order.
+
+        Raises
+        ------
+        ValueError
+            If the counts differ or a vector has the wrong dimension.
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or len(matrix) != len(entity_ids):
+            msg = f"add_many requires one vector per ID, got {len(entity_ids)} IDs and shape {matrix.shape}"
+            raise ValueError(msg)
+        if self._dim is None:
+            self._dim = int(matrix.shape[1])
+            self._matrix = np.zeros((0, self._dim), dtype=self._dtype)
+        if matrix.shape[1] != self._dim:
+            msg = f"Vector dimension {matrix.shape[1]} does not match index dimension {self._dim}"
+            raise ValueError(msg)
+
+        rows = matrix if normalized else normalize_rows(matrix)
+        written = np.empty(len(entity_ids), dtype=np.int64)
+        for position, (entity_id, row_vector) in enumerate(zip(entity_ids, rows, strict=True)):
+            row = self._rows.get(entity_id)
+            if row is None:
+                row = self._append_row()
+                self._rows[entity_id] = row
+                self._ids.append(entity_id)
+                self._alive[row] = True
+            self._matrix[row] = row_vector
+            written[position] = row
+        return written
+
+    def remove(self, entity_id: str) -> bool:
+        """Tombstone ``entity_id``; return whether it was present."""
+        row = self._rows.pop(entity_id, None)
+        if row is None:
+            return False
+        self._alive[row] = False
+        self._ids[row] = None
+        if self._size - len(self._rows) > max(len(self._rows), _INITIAL_CAPACITY // 2):
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """Drop tombstoned rows and renumber the live ones."""
+        kept = self.live_rows()
+        self._matrix = np.ascontiguousarray(self._matrix[kept])
+        live_ids = self.ids()
+        self._ids = list(live_ids)
+        self._rows = {entity_id: row for row, entity_id in enumerate(live_ids)}
+        self._size = len(live_ids)
+        self._alive = np.ones(self._size, dtype=bool)
+        if self._on_compact is not None:
+            self._on_compact(kept)
+
+    def search(self, query: Sequence[float] | np.ndarray, k: int = 5) -> list[tuple[str, float]]:
+        """Return the ``k`` most similar live entries to ``query``.
+
+        Parameters
+        ----------
+        query : Sequence[float] | numpy.ndarray
+            Query vector (any norm; zero vectors score 0.0 everywhere).
+        k : int, optional
+            Number of results. Default 5.
+
+        Returns
+        -------
+        list[tuple[str, float]]
+            ``(entity_id, cosine_similarity)`` sorted by similarity descending.
+        """
+        return self.search_many(np.asarray(query, dtype=np.float32).reshape(1, -1), k)[0]
+
+    def search_many(self, queries: Sequence[Sequence[float]] | np.ndarray, k: int = 5) -> list[list[tuple[str, float]]]:
+        """Top-``k`` search for a block of queries.
+
+        Parameters
+        ----------
+        queries : Sequence[Sequence[float]] | numpy.ndarray
+            ``(m, dim)`` query vectors.
+        k : int, optional
+            Results per query. Default 5.
+
+        Returns
+        -------
+        list[list[tuple[str, float]]]
+            One ranked result list per query.
+        """
+        matrix = np.asarray(queries, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        k = min(k, len(self._rows))
+        if k <= 0 or len(matrix) == 0:
+            return [[] for _ in range(len(matrix))]
+        if matrix.shape[1] != self._dim:
+            msg = f"Query dimension {matrix.shape[1]} does not match index dimension {self._dim}"
+            raise ValueError(msg)
+
+        normalized = normalize_rows(matrix)
+        rows = self._matrix[: self._size].astype(np.float32, copy=False)
+        dead = ~self._alive[: self._size]
+        step = max(1, _SCORE_BLOCK // max(self._size, 1))
+        results: list[list[tuple[str, float]]] = []
+        for start in range(0, len(normalized), step):
+            scores = normalized[start : start + step] @ rows.T
+            scores[:, dead] = -np.inf
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            # k never exceeds the live count, so every selected row is live
+            results.extend(
+                [(cast(str, self._ids[row]), score) for row, score in zip(row_ids, row_scores, strict=True)]
+                for row_ids, row_scores in zip(top.tolist(), top_scores.tolist(), strict=True)
+            )
+        return results
+
+    def top_k_rows(self, vector: np.ndarray, rows: np.ndarray, k: int) -> list[tuple[str, float]]:
+        """Score a subset of rows against one query and return the best ``k``.
+
+        Parameters
+        ----------
+        vector : numpy.ndarray
+            L2-normalized float32 query of the index dimension.
+        rows : numpy.ndarray
+            Candidate rows; tombstoned rows are skipped.
+        k : int
+            Number of results.
+
+        Returns
+        -------
+        list[tuple[str, float]]
+            ``(entity_id, cosine_similarity)`` sorted by similarity descending.
+        """
+        rows = rows[self._alive[rows]]
+        k = min(k, len(rows))
+        if k <= 0:
+            return []
+        scores = self._matrix[rows].astype(np.float32, copy=False) @ vector
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(cast(str, self._ids[int(rows[i])]), float(scores[i])) for i in top]
+
+    def _append_row(self) -> int:
+        """Reserve the next row, doubling capacity when full."""
+        if self._size == len(self._matrix):
+            capacity = max(_INITIAL_CAPACITY, 2 * len(self._matrix))
+            grown = np.zeros((capacity, self._dim or 0), dtype=self._dtype)
+            grown[: self._size] = self._matrix[: self._size]
+            alive = np.zeros(capacity, dtype=bool)
+            alive[: self._size] = self._alive[: self._size]
+            self._matrix, self._alive = grown, alive
+        row = self._size
+        self._size += 1
+        return row
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize the rows of ``matrix``; zero rows stay zero.
+
+    Shared by ``VectorIndex`` and ``search.ann_index.IVFFlatIndex``.
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        2-D float array, one vector per row.
+
+    Returns
+    -------
+    numpy.ndarray
+        New array of unit-length rows.
+    """
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    normalized: np.ndarray = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+    return normalized
@@ -5,14 +5,27 @@ Provides three search modalities and a hybrid fusion service:
 Submodules
 ----------
 text_search
-    LIKE-based text search across attribution record JSONB fields.
-    Upgradeable to PostgreSQL ``tsvector`` + GIN indexes for production.
+    Full-text search across attribution records: generated ``tsvector``
+    column + GIN index on PostgreSQL (migration 007), FTS5 table on
+    SQLite, LIKE scan as a last-resort fallback.
 vector_search
     Cosine similarity search across entity embeddings (pgvector).
-    Supports HNSW index-accelerated queries on PostgreSQL.
+    On PostgreSQL, ranking is pushed into SQL (``ORDER BY embedding <=>
+    :q LIMIT k``, HNSW index from migration 005); SQLite falls back to a
+    vectorized NumPy scan over float16 BLOBs (migration 006).
+ann_index
+    Local IVF-flat approximate nearest-neighbour index (NumPy, persisted
+    to ``.npz``) for SQLite and offline deployments, with recall@k
+    measurement against exact search.
+query_embedding
+    Async query encoder with an in-memory LRU and in-flight dedupe,
+    shared by hybrid search, chat and voice tools.
 hybrid_search
     Reciprocal Rank Fusion (RRF) combining text, vector, and graph
     context modalities into a single ranked result set.
+result_cache
+    Hybrid search result cache keyed by query, limit and catalogue
+    generation (in-process or Valkey), invalidated on catalogue writes.
 
 See Also
 --------
@@ -0,0 +1,547 @@
+"""Approximate nearest-neighbour (IVF-flat) index over entity embeddings.
+
+``VectorSearchService.find_similar`` and ``HybridSearchService`` rank
+candidates by scanning every row of ``entity_embeddings``. On PostgreSQL
+pgvector can do that ranking with an HNSW index; on SQLite (offline and
+single-node deployments) there is no index, so every query is O(n).
+
+``IVFFlatIndex`` is a local, NumPy-only inverted-file index:
+
+- **Training** -- spherical k-means partitions the (L2-normalized)
+  vectors into ``n_lists`` clusters (``sqrt(n)`` by default).
+- **Search** -- the query is compared with the centroids and only the
+  ``n_probe`` closest lists are scanned exactly. Raising ``n_probe``
+  trades speed for recall; ``n_probe == n_lists`` is exact search.
+- **Incremental updates** -- ``add``/``remove`` assign new vectors to
+  their nearest centroid and tombstone deleted ones, so the index can
+  follow ``EmbeddingService.store_embedding(s)``. The index retrains
+  itself when the catalogue outgrows its centroids by
+  ``retrain_growth``. Until ``min_train_size`` vectors are present the
+  index is untrained and searches exactly.
+- **Persistence** -- ``save``/``load`` write one ``.npz`` file
+  atomically (vectors, IDs, list assignments, centroids, config).
+
+Rows, IDs, tombstones and compaction live in a
+``resolution.vector_index.VectorIndex``; this module only adds the
+centroids and the inverted lists of row numbers on top of it.
+
+``recall_at_k`` measures approximate results against exact search;
+``scripts/benchmark_ann.py`` reports recall and latency per ``n_probe``.
+
+Classes
+-------
+ANNConfig
+    Training and search parameters.
+IVFFlatIndex
+    The index.
+
+See Also
+--------
+music_attribution.search.vector_search : ``VectorSearchService(ann_index=...)``.
+music_attribution.search.hybrid_search : ``HybridSearchService(ann_index=...)``.
+music_attribution.resolution.vector_index : Exact in-memory index used by resolution.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import uuid
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from music_attribution.db.embedding_type import stack_embeddings
+from music_attribution.db.models import EntityEmbeddingModel
+from music_attribution.resolution.embedding_service import MODEL_NAME
+from music_attribution.resolution.vector_index import VectorIndex, normalize_rows
+
+logger = logging.getLogger(__name__)
+
+# Rows scored against the centroids per block during assignment
+_ASSIGN_BLOCK = 65_536
+
+# On-disk format version written by ``save``
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ANNConfig:
+    """Training and search parameters for ``IVFFlatIndex``.
+
+    Attributes
+    ----------
+    n_lists : int | None
+        Number of inverted lists (k-means clusters). ``None`` uses
+        ``sqrt(n)`` at training time.
+    n_probe : int
+        Lists scanned per query.
+    train_iterations : int
+        K-means iterations.
+    train_sample : int
+        Maximum vectors sampled to train the centroids.
+    min_train_size : int
+        Vectors required before the index trains itself; smaller
+        indexes search exactly.
+    retrain_growth : float
+        Retrain once the index holds this many times the vectors it was
+        trained on.
+    seed : int
+        Random seed for sampling and centroid initialisation.
+    """
+
+    n_lists: int | None = None
+    n_probe: int = 8
+    train_iterations: int = 10
+    train_sample: int = 50_000
+    min_train_size: int = 1024
+    retrain_growth: float = 4.0
+    seed: int = 0
+
+
+class IVFFlatIndex:
+    """Inverted-file index with exact scoring inside the probed lists.
+
+    Parameters
+    ----------
+    config : ANNConfig | None, optional
+        Index configuration. Defaults to ``ANNConfig()``.
+    model_name : str | None, optional
+        Embedding model the vectors come from; checked by ``load``.
+
+    Attributes
+    ----------
+    config : ANNConfig
+        Active configuration.
+    model_name : str | None
+        Embedding model name.
+    _store : VectorIndex
+        Normalized float32 rows and the entity ID of each row.
+    _assign : numpy.ndarray
+        Inverted list of each store row (``-1`` while unassigned).
+    _centroids : numpy.ndarray | None
+        ``(n_lists, dim)`` normalized centroids, ``None`` while untrained.
+    _lists : list[list[int]]
+        Rows per inverted list.
+    _list_arrays : dict[int, numpy.ndarray]
+        Cached array form of ``_lists`` entries (dropped on change).
+    _trained_size : int
+        Live vectors at the last training.
+
+    Examples
+    --------
+    >>> index = IVFFlatIndex(ANNConfig(n_probe=4))
+    >>> index.add_many(entity_ids, vectors)  # trains once min_train_size is reached
+    >>> index.search(query_vector, k=10)
+    [('0b4c...', 0.93), ...]
+    """
+
+    def __init__(self, config: ANNConfig | None = None, *, model_name: str | None = None) -> None:
+        self.config = config or ANNConfig()
+        self.model_name = model_name
+        self._store = VectorIndex(on_compact=self._renumber)
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._centroids: np.ndarray | None = None
+        self._lists: list[list[int]] = []
+        self._list_arrays: dict[int, np.ndarray] = {}
+        self._trained_size = 0
+
+    @property
+    def dim(self) -> int | None:
+        """Vector dimension (``None`` while empty)."""
+        return self._store.dim
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether centroids exist (otherwise searches are exact)."""
+        return self._centroids is not None
+
+    @property
+    def n_lists(self) -> int:
+        """Number of inverted lists (0 while untrained)."""
+        return 0 if self._centroids is None else len(self._centroids)
+
+    def __len__(self) -> int:
+        """Return the number of live vectors."""
+        return len(self._store)
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Return whether ``entity_id`` has a live vector."""
+        return entity_id in self._store
+
+    def vector(self, entity_id: str) -> np.ndarray | None:
+        """Return the stored (normalized) vector of ``entity_id``, or ``None``."""
+        row = self._store.row(entity_id)
+        return None if row is None else self._store.matrix[row].copy()
+
+    def add(self, entity_id: str, vector: Sequence[float] | np.ndarray) -> None:
+        """Insert or replace one vector."""
+        self.add_many([entity_id], np.asarray(vector, dtype=np.float32).reshape(1, -1))
+
+    def add_many(
+        self,
+        entity_ids: Sequence[str],
+        vectors: Sequence[Sequence[float]] | np.ndarray,
+        *,
+        auto_train: bool = True,
+    ) -> None:
+        """Insert or replace vectors, assigning them to their nearest list.
+
+        Trains the index once ``min_train_size`` vectors are present and
+        retrains it when it grows past ``retrain_growth`` times the
+        trained size.
+
+        Parameters
+        ----------
+        entity_ids : Sequence[str]
+            Entity IDs; existing IDs are overwritten.
+        vectors : Sequence[Sequence[float]] | numpy.ndarray
+            One vector per ID.
+        auto_train : bool, optional
+            Train or retrain when the size thresholds are crossed.
+            Default ``True``; bulk loaders pass ``False`` and call
+            ``train()`` once at the end.
+
+        Raises
+        ------
+        ValueError
+            If the counts differ or a vector has the wrong dimension.
+        """
+        rows = self._store.add_many(entity_ids, vectors)
+        if len(rows) == 0:
+            return
+        if len(self._assign) < self._store.capacity:
+            assign = np.full(self._store.capacity, -1, dtype=np.int32)
+            assign[: len(self._assign)] = self._assign
+            self._assign = assign
+        if self._centroids is not None:
+            lists = _argmax_blocks(self._store.matrix[rows], self._centroids)
+            for row, list_id in zip(rows.tolist(), lists.tolist(), strict=True):
+                self._detach(row)
+                self._attach(row, list_id)
+
+        if not auto_train:
+            return
+        if self._centroids is None:
+            if len(self) >= self.config.min_train_size:
+                self.train()
+        elif len(self) > self.config.retrain_growth * max(self._trained_size, 1):
+            self.train()
+
+    def remove(self, entity_id: str) -> bool:
+        """Tombstone ``entity_id``; return whether it was present."""
+        row = self._store.row(entity_id)
+        if row is None:
+            return False
+        self._detach(row)
+        return self._store.remove(entity_id)
+
+    def train(self, n_lists: int | None = None) -> None:
+        """Fit centroids with spherical k-means and rebuild the lists.
+
+        Parameters
+        ----------
+        n_lists : int | None, optional
+            Number of lists; defaults to ``config.n_lists`` or ``sqrt(n)``.
+        """
+        live = self._store.live_rows()
+        if len(live) == 0:
+            return
+        vectors = self._store.matrix
+        rng = np.random.default_rng(self.config.seed)
+        requested = n_lists or self.config.n_lists or round(np.sqrt(len(live)))
+        n_lists = int(min(max(requested, 1), len(live)))
+        sample_rows = live
+        if len(live) > self.config.train_sample:
+            sample_rows = np.sort(rng.choice(live, self.config.train_sample, replace=False))
+        sample = vectors[sample_rows]
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(self.config.train_iterations):
+            labels = _argmax_blocks(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=n_lists)
+            empty = counts == 0
+            if empty.any():
+                # Re-seed empty clusters from random sample points
+                sums[empty] = sample[rng.choice(len(sample), int(empty.sum()), replace=False)]
+            centroids = normalize_rows(sums)
+
+        self._centroids = centroids
+        self._assign = np.full(self._store.capacity, -1, dtype=np.int32)
+        self._assign[live] = _argmax_blocks(vectors[live], centroids)
+        self._rebuild_lists()
+        self._trained_size = len(live)
+        logger.info("Trained IVF index: %d vectors in %d lists", len(live), n_lists)
+
+    def search(
+        self,
+        query: Sequence[float] | np.ndarray,
+        k: int = 10,
+        *,
+        n_probe: int | None = None,
+    ) -> list[tuple[str, float]]:
+        """Return approximately the ``k`` most similar vectors to ``query``.
+
+        Parameters
+        ----------
+        query : Sequence[float] | numpy.ndarray
+            Query vector (any norm).
+        k : int, optional
+            Number of results. Default 10.
+        n_probe : int | None, optional
+            Lists to scan; defaults to ``config.n_probe``. Ignored (exact
+            search) while the index is untrained.
+
+        Returns
+        -------
+        list[tuple[str, float]]
+            ``(entity_id, cosine_similarity)`` sorted by similarity descending.
+        """
+        vector = self._prepare_query(query)
+        if vector is None or k <= 0:
+            return []
+        if self._centroids is None:
+            return self._store.search(vector, k)
+        probes = min(n_probe or self.config.n_probe, len(self._centroids))
+        centroid_scores = self._centroids @ vector
+        nearest = np.argpartition(-centroid_scores, probes - 1)[:probes]
+        rows = [self._list_array(int(list_id)) for list_id in nearest]
+        candidates = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        return self._store.top_k_rows(vector, candidates, k)
+
+    def search_exact(self, query: Sequence[float] | np.ndarray, k: int = 10) -> list[tuple[str, float]]:
+        """Return the exact ``k`` nearest vectors (brute-force scan)."""
+        vector = self._prepare_query(query)
+        if vector is None or k <= 0:
+            return []
+        return self._store.search(vector, k)
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to one ``.npz`` file (atomic replace).
+
+        Parameters
+        ----------
+        path : str | Path
+            Destination file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        live = self._store.live_rows()
+        meta = {
+            "format_version": _FORMAT_VERSION,
+            "model_name": self.model_name,
+            "config": asdict(self.config),
+            "trained_size": self._trained_size,
+            "dim": self._store.dim,
+        }
+        arrays: dict[str, Any] = {
+            "meta": np.array(json.dumps(meta)),
+            "ids": np.array(self._store.ids(), dtype=str),
+            "vectors": self._store.vectors(),
+            "assign": self._assign[live] if self._centroids is not None else np.zeros(0, dtype=np.int32),
+            "centroids": self._centroids if self._centroids is not None else np.zeros((0, 0), dtype=np.float32),
+        }
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as handle:
+            np.savez(handle, **arrays)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path, *, model_name: str | None = None) -> IVFFlatIndex:
+        """Read an index written by ``save``.
+
+        Parameters
+        ----------
+        path : str | Path
+            Index file.
+        model_name : str | None, optional
+            Expected embedding model; a different stored model raises.
+
+        Returns
+        -------
+        IVFFlatIndex
+            The restored index (same lists, no retraining).
+
+        Raises
+        ------
+        ValueError
+            If the file format or embedding model does not match.
+        """
+        with np.load(Path(path), allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("format_version") != _FORMAT_VERSION:
+                msg = f"Unsupported ANN index format {meta.get('format_version')!r} in {path}"
+                raise ValueError(msg)
+            if model_name is not None and meta["model_name"] not in (None, model_name):
+                msg = f"ANN index {path} was built for model {meta['model_name']!r}, not {model_name!r}"
+                raise ValueError(msg)
+            index = cls(ANNConfig(**meta["config"]), model_name=meta["model_name"])
+            ids = [str(entity_id) for entity_id in data["ids"]]
+            vectors = np.asarray(data["vectors"], dtype=np.float32)
+            centroids = np.asarray(data["centroids"], dtype=np.float32)
+            assign = np.asarray(data["assign"], dtype=np.int32)
+
+        if meta["dim"] is not None:
+            index._store.add_many(ids, vectors.reshape(len(ids), int(meta["dim"])), normalized=True)
+            index._assign = np.full(index._store.capacity, -1, dtype=np.int32)
+        if len(centroids):
+            index._centroids = centroids
+            index._assign[: len(ids)] = assign
+            index._rebuild_lists()
+        index._trained_size = int(meta["trained_size"])
+        return index
+
+    @classmethod
+    async def from_database(
+        cls,
+        session: AsyncSession,
+        *,
+        model_name: str = MODEL_NAME,
+        config: ANNConfig | None = None,
+        page_size: int = 10_000,
+    ) -> IVFFlatIndex:
+        """Build an index from ``entity_embeddings`` rows of one model.
+
+        Reads the table in ``entity_id`` order with keyset pagination,
+        then trains once on the full set.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            Active async database session.
+        model_name : str, optional
+            Embedding model to index. Default ``MODEL_NAME``.
+        config : ANNConfig | None, optional
+            Index configuration.
+        page_size : int, optional
+            Rows fetched per query. Default 10 000.
+
+        Returns
+        -------
+        IVFFlatIndex
+            Trained index (untrained if fewer than ``min_train_size`` rows).
+        """
+        index = cls(config, model_name=model_name)
+        last_id: uuid.UUID | None = None
+        while True:
+            stmt = (
+                select(EntityEmbeddingModel.entity_id, EntityEmbeddingModel.embedding)
+                .where(EntityEmbeddingModel.model_name == model_name)
+                .order_by(EntityEmbeddingModel.entity_id)
+                .limit(page_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(EntityEmbeddingModel.entity_id > last_id)
+            page = (await session.execute(stmt)).all()
+            if not page:
+                break
+            index.add_many(
+                [str(entity_id) for entity_id, _ in page],
+                stack_embeddings([raw for _, raw in page]),
+                auto_train=False,
+            )
+            last_id = page[-1][0]
+
+        if len(index) >= index.config.min_train_size:
+            index.train()
+        logger.info("Built ANN index from %d %s embeddings", len(index), model_name)
+        return index
+
+    def _prepare_query(self, query: Sequence[float] | np.ndarray) -> np.ndarray | None:
+        """Normalize ``query``; ``None`` when the index is empty."""
+        if not len(self._store):
+            return None
+        vector = np.asarray(query, dtype=np.float32).reshape(1, -1)
+        if vector.shape[1] != self._store.dim:
+            msg = f"Query dimension {vector.shape[1]} does not match index dimension {self._store.dim}"
+            raise ValueError(msg)
+        normalized: np.ndarray = normalize_rows(vector)[0]
+        return normalized
+
+    def _attach(self, row: int, list_id: int) -> None:
+        """Put ``row`` in inverted list ``list_id``."""
+        self._assign[row] = list_id
+        self._lists[list_id].append(row)
+        self._list_arrays.pop(list_id, None)
+
+    def _detach(self, row: int) -> None:
+        """Remove ``row`` from its inverted list."""
+        list_id = int(self._assign[row])
+        if list_id >= 0:
+            self._lists[list_id].remove(row)
+            self._list_arrays.pop(list_id, None)
+            self._assign[row] = -1
+
+    def _list_array(self, list_id: int) -> np.ndarray:
+        """Return inverted list ``list_id`` as an array (cached)."""
+        array = self._list_arrays.get(list_id)
+        if array is None:
+            array = self._list_arrays[list_id] = np.asarray(self._lists[list_id], dtype=np.int64)
+        return array
+
+    def _rebuild_lists(self) -> None:
+        """Regroup rows into inverted lists from ``_assign``."""
+        n_lists = 0 if self._centroids is None else len(self._centroids)
+        self._lists = [[] for _ in range(n_lists)]
+        for row in self._store.live_rows():
+            list_id = int(self._assign[row])
+            if list_id >= 0:
+                self._lists[list_id].append(int(row))
+        self._list_arrays = {}
+
+    def _renumber(self, kept: np.ndarray) -> None:
+        """Follow a store compaction: row ``i`` was row ``kept[i]``."""
+        self._assign = self._assign[kept]
+        self._rebuild_lists()
+
+
+def recall_at_k(
+    index: IVFFlatIndex,
+    queries: Sequence[Sequence[float]] | np.ndarray,
+    k: int = 10,
+    *,
+    n_probe: int | None = None,
+) -> float:
+    """Mean fraction of the exact top-``k`` found by the approximate search.
+
+    Parameters
+    ----------
+    index : IVFFlatIndex
+        Index to evaluate.
+    queries : Sequence[Sequence[float]] | numpy.ndarray
+        Query vectors.
+    k : int, optional
+        Result depth. Default 10.
+    n_probe : int | None, optional
+        Lists scanned by the approximate search.
+
+    Returns
+    -------
+    float
+        Recall@k in [0, 1] (1.0 when there are no queries).
+    """
+    recalls: list[float] = []
+    for query in np.asarray(queries, dtype=np.float32):
+        exact = {entity_id for entity_id, _ in index.search_exact(query, k)}
+        if not exact:
+            continue
+        found = {entity_id for entity_id, _ in index.search(query, k, n_probe=n_probe)}
+        recalls.append(len(exact & found) / len(exact))
+    return float(np.mean(recalls)) if recalls else 1.0
+
+
+def _argmax_blocks(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Return the most similar centroid per row, scoring in bounded blocks."""
+    labels = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), _ASSIGN_BLOCK):
+        block = vectors[start : start + _ASSIGN_BLOCK] @ centroids.T
+        labels[start : start + _ASSIGN_BLOCK] = np.argmax(block, axis=1)
+    return labels
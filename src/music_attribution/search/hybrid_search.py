@@ -2,10 +2,11 @@
 
 Combines three search modalities into a single ranked result set:
 
-1. **Text search** -- LIKE queries on JSONB credits and provenance
-   fields (via ``TextSearchService``).
+1. **Text search** -- full-text index over titles, credited names,
+   roles and provenance agents (via ``TextSearchService``).
 2. **Vector similarity** -- cosine distance on entity embeddings
-   (via ``EmbeddingMatcher``), mapped back to attribution records.
+   (query embedded by ``QueryEmbeddingService``, ranked by
+   ``VectorSearchService``), mapped back to attribution records.
 3. **Graph context** -- 1-hop edge neighbours of vector-matched
    entities, providing relational context expansion.
 
@@ -17,10 +18,21 @@ where ``k = 60`` (standard value from Cormack et al., 2009). This
 produces a robust combined ranking that is insensitive to score
 scale differences between modalities.
 
+Given a session factory, text retrieval and the semantic branch
+(vector, then graph) run concurrently on separate pooled sessions. Each
+modality has a latency budget (``ModalityTimeouts``); one that misses
+it is dropped from the fusion instead of stalling the request.
+
+With a ``SearchResultCache`` (the process-wide one by default), fused
+results are memoized per query, limit and catalogue generation. Result
+sets missing a dropped modality are not cached.
+
 Classes
 -------
 HybridSearchResult
     Named tuple pairing an ``AttributionRecord`` with its RRF score.
+ModalityTimeouts
+    Per-modality latency budgets.
 HybridSearchService
     Orchestrates the three modalities and performs RRF fusion.
 
@@ -28,26 +40,43 @@ See Also
 --------
 music_attribution.search.text_search : Text modality.
 music_attribution.search.vector_search : Vector modality.
+music_attribution.search.query_embedding : Cached query embeddings.
+music_attribution.search.result_cache : Result cache and invalidation.
 music_attribution.db.models.EdgeModel : Graph edges for context.
+music_attribution.observability.search_metrics : Modality latency metrics.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import uuid
-from typing import NamedTuple
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from music_attribution.db.models import AttributionRecordModel, EdgeModel, EntityEmbeddingModel
+from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel, EdgeModel
+from music_attribution.observability.search_metrics import SearchMetrics, get_search_metrics
+from music_attribution.resolution.embedding_cache import EmbeddingCache
 from music_attribution.resolution.embedding_match import EmbeddingMatcher
 from music_attribution.schemas.attribution import AttributionRecord
+from music_attribution.search.query_embedding import QueryEmbeddingService, get_query_embedding_service
+from music_attribution.search.result_cache import SearchResultCache, get_search_result_cache
 from music_attribution.search.text_search import TextSearchService
-from music_attribution.search.vector_search import _cosine_similarity, _parse_embedding
+from music_attribution.search.vector_search import VectorSearchService
+
+if TYPE_CHECKING:
+    from music_attribution.search.ann_index import IVFFlatIndex
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # RRF constant (standard value from the original RRF paper)
 RRF_K = 60
 
@@ -69,6 +98,30 @@ class HybridSearchResult(NamedTuple):
     rrf_score: float
 
 
+@dataclass(frozen=True)
+class ModalityTimeouts:
+    """Per-modality latency budgets for concurrent hybrid search.
+
+    A modality that exceeds its budget is cancelled and dropped from
+    the RRF fusion; the other modalities still contribute. ``None``
+    disables the budget for that modality.
+
+    Attributes
+    ----------
+    text : float | None
+        Seconds allowed for full-text retrieval. Default 2.0.
+    vector : float | None
+        Seconds allowed for query embedding plus vector retrieval.
+        Default 5.0 (covers CPU embedding of a short query).
+    graph : float | None
+        Seconds allowed for 1-hop graph expansion. Default 2.0.
+    """
+
+    text: float | None = 2.0
+    vector: float | None = 5.0
+    graph: float | None = 2.0
+
+
 class HybridSearchService:
     """Hybrid search combining text, vector, and graph modalities via RRF.
 
@@ -77,20 +130,81 @@ class HybridSearchService:
     ranked list of attribution record IDs; the RRF algorithm combines
     these into a single ranking without requiring score normalisation.
 
-    The service is stateless -- each ``search()`` call runs all three
-    modalities independently and fuses the results.
+    With a ``session_factory``, text retrieval and the semantic branch
+    (query embedding, vector retrieval, then graph expansion) run
+    concurrently, each on its own pooled session and each bounded by
+    ``timeouts``. Without one, the modalities run one after another on
+    the caller's session and no budgets apply. Per-modality latency is
+    recorded in ``search_modality_latency_seconds`` either way.
+
+    Parameters
+    ----------
+    embedding_cache : EmbeddingCache | None, optional
+        Persistent vector cache for the query embedding model. Ignored
+        when ``query_embeddings`` is given.
+    ann_index : IVFFlatIndex | None, optional
+        Local approximate nearest-neighbour index over the entity
+        embeddings; replaces the full-table vector scan.
+    session_factory : async_sessionmaker[AsyncSession] | None, optional
+        Pool-backed session factory enabling concurrent modalities.
+    timeouts : ModalityTimeouts | None, optional
+        Per-modality latency budgets (concurrent mode only).
+    metrics : SearchMetrics | None, optional
+        Metric instruments; defaults to the process-wide singleton.
+    query_embeddings : QueryEmbeddingService | None, optional
+        Query encoder with an LRU of recent queries. Defaults to the
+        process-wide service, or to a new one over ``embedding_cache``
+        when that is given.
+    result_cache : SearchResultCache | None, optional
+        Result cache. Defaults to the process-wide cache
+        (``set_search_result_cache``), if one is installed.
+    use_result_cache : bool, optional
+        Whether to cache results at all. ``False`` bypasses the cache
+        even when a process-wide one is installed. Default ``True``.
 
     Attributes
     ----------
     _text_search : TextSearchService
-        LIKE-based text search on JSONB fields.
-    _matcher : EmbeddingMatcher
-        Embedding model for query vectorisation.
+        Full-text search on attribution records.
+    _query_embeddings : QueryEmbeddingService
+        Cached, deduplicating query encoder.
+    _vector_search : VectorSearchService
+        Backend-aware vector ranking for the vector modality.
+    _session_factory : async_sessionmaker[AsyncSession] | None
+        Session factory for concurrent modalities.
+    _timeouts : ModalityTimeouts
+        Per-modality latency budgets.
+    _metrics : SearchMetrics
+        Latency histogram and drop counter.
+    _result_cache : SearchResultCache | None
+        Fused result cache, if configured.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        embedding_cache: EmbeddingCache | None = None,
+        ann_index: IVFFlatIndex | None = None,
+        *,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        timeouts: ModalityTimeouts | None = None,
+        metrics: SearchMetrics | None = None,
+        query_embeddings: QueryEmbeddingService | None = None,
+        result_cache: SearchResultCache | None = None,
+        use_result_cache: bool = True,
+    ) -> None:
         self._text_search = TextSearchService()
-        self._matcher = EmbeddingMatcher()
+        if query_embeddings is None:
+            query_embeddings = (
+                get_query_embedding_service()
+                if embedding_cache is None
+                else QueryEmbeddingService(EmbeddingMatcher(cache=embedding_cache))
+            )
+        self._query_embeddings = query_embeddings
+        self._vector_search = VectorSearchService(ann_index=ann_index)
+        self._session_factory = session_factory
+        self._timeouts = timeouts or ModalityTimeouts()
+        self._metrics = metrics or get_search_metrics()
+        self._result_cache = (result_cache or get_search_result_cache()) if use_result_cache else None
 
     async def search(
         self,
@@ -103,13 +217,18 @@ class HybridSearchService:
 
         Execution order:
 
-        1. Text search (LIKE on credits and provenance JSONB).
+        0. Result cache lookup; a hit returns immediately.
+        1. Text search (full-text index on attribution records), and,
+           concurrently when a session factory is configured:
         2. Vector search (embed query, cosine similarity on entity
-           embeddings, map entity IDs to attribution IDs).
+           embeddings, map entity IDs to attribution IDs via
+           ``attribution_entities``), followed by
         3. Graph context (1-hop neighbours of vector-matched entities,
            mapped to attribution IDs).
-        4. RRF fusion across all modalities.
-        5. Fetch full ``AttributionRecord`` objects for top results.
+        4. RRF fusion across the modalities that finished within their
+           budget.
+        5. Fetch full ``AttributionRecord`` objects for top results, and
+           cache them if every modality contributed.
 
         Parameters
         ----------
@@ -118,7 +237,8 @@ class HybridSearchService:
         limit : int, optional
             Maximum number of results to return. Default is 50.
         session : AsyncSession
-            Active async database session for all queries.
+            Active async database session. Used for every modality in
+            sequential mode, and for record hydration in both modes.
 
         Returns
         -------
@@ -127,43 +247,53 @@ class HybridSearchService:
             Each result pairs an ``AttributionRecord`` with its
             fused score.
         """
+        if self._result_cache is None:
+            results, _ = await self._fused_search(query, limit=limit, session=session)
+            return results
+
+        # Read the generation first: a write during the search invalidates this entry
+        generation, cached = await self._result_cache.get(query, limit)
+        if cached is not None:
+            return [HybridSearchResult(record=record, rrf_score=score) for record, score in cached]
+        results, complete = await self._fused_search(query, limit=limit, session=session)
+        if complete:
+            await self._result_cache.put(query, limit, generation, results)
+        return results
+
+    async def _fused_search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        session: AsyncSession,
+    ) -> tuple[list[HybridSearchResult], bool]:
+        """Run the modalities and fuse them (steps 1-5 of ``search``).
+
+        Returns
+        -------
+        tuple[list[HybridSearchResult], bool]
+            Ranked results, and whether every modality finished within
+            its budget.
+        """
+        if self._session_factory is None:
+            text_results = await self._text_modality(query, limit=limit, session=session)
+            vector_ids, graph_ids = await self._semantic_modalities(query, limit=limit, session=session)
+        else:
+            try:
+                async with asyncio.TaskGroup() as group:
+                    text_task = group.create_task(self._text_modality(query, limit=limit, session=session))
+                    semantic_task = group.create_task(self._semantic_modalities(query, limit=limit, session=session))
+            except ExceptionGroup as errors:
+                # Surface the failing modality's own exception
+                raise errors.exceptions[0] from errors
+            text_results = text_task.result()
+            vector_ids, graph_ids = semantic_task.result()
+
         # Collect per-attribution_id rank from each modality
         # rank is 1-based position in that modality's result list
-        text_ranks: dict[uuid.UUID, int] = {}
-        vector_ranks: dict[uuid.UUID, int] = {}
-        graph_ranks: dict[uuid.UUID, int] = {}
-
-        # --- Modality 1: Text search ---
-        text_results = await self._text_search.search(
-            query,
-            limit=limit * 2,
-            session=session,
-        )
-        for rank, record in enumerate(text_results, start=1):
-            text_ranks[record.attribution_id] = rank
-
-        # --- Modality 2: Vector similarity search ---
-        vector_entity_ids = await self._vector_search_by_query(query, limit=limit, session=session)
-        # Map entity_ids to attribution_ids
-        vector_attribution_ids = await self._entities_to_attributions(
-            [eid for eid, _ in vector_entity_ids],
-            session=session,
-        )
-        for rank, attr_id in enumerate(vector_attribution_ids, start=1):
-            if attr_id not in vector_ranks:
-                vector_ranks[attr_id] = rank
-
-        # --- Modality 3: Graph context ---
-        # Find graph neighbors of entities from vector search
-        matched_entity_ids = {eid for eid, _ in vector_entity_ids}
-        neighbor_entity_ids = await self._graph_neighbors(matched_entity_ids, session=session)
-        neighbor_attribution_ids = await self._entities_to_attributions(
-            list(neighbor_entity_ids),
-            session=session,
-        )
-        for rank, attr_id in enumerate(neighbor_attribution_ids, start=1):
-            if attr_id not in graph_ranks:
-                graph_ranks[attr_id] = rank
+        text_ranks = _ranks(record.attribution_id for record in text_results or [])
+        vector_ranks = _ranks(vector_ids or [])
+        graph_ranks = _ranks(graph_ids or [])
 
         # --- RRF Fusion ---
         all_attribution_ids = set(text_ranks) | set(vector_ranks) | set(graph_ranks)
@@ -183,7 +313,7 @@ class HybridSearchService:
 
         # Fetch full attribution records for top results
         record_map: dict[uuid.UUID, AttributionRecord] = {}
-        for record in text_results:
+        for record in text_results or []:
             record_map[record.attribution_id] = record
 
         # Fetch any records not already in text_results
@@ -198,11 +328,120 @@ class HybridSearchService:
             for model in result.scalars().all():
                 record_map[model.attribution_id] = _model_to_record(model)
 
-        return [
+        results = [
             HybridSearchResult(record=record_map[attr_id], rrf_score=score)
             for attr_id, score in top_ids
             if attr_id in record_map
         ]
+        return results, None not in (text_results, vector_ids, graph_ids)
+
+    @asynccontextmanager
+    async def _modality_session(self, session: AsyncSession) -> AsyncIterator[AsyncSession]:
+        """Yield a fresh pooled session in concurrent mode, else ``session``."""
+        if self._session_factory is None:
+            yield session
+        else:
+            async with self._session_factory() as modality_session:
+                yield modality_session
+
+    async def _timed(self, modality: str, awaitable: Awaitable[T]) -> T | None:
+        """Await one modality under its budget and record its latency.
+
+        Parameters
+        ----------
+        modality : str
+            ``"text"``, ``"vector"`` or ``"graph"``.
+        awaitable : Awaitable[T]
+            The modality's work.
+
+        Returns
+        -------
+        T | None
+            The modality result, or ``None`` if it exceeded its budget
+            (it is then dropped from fusion).
+        """
+        timeout = getattr(self._timeouts, modality) if self._session_factory is not None else None
+        outcome = "ok"
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except TimeoutError:
+            outcome = "timeout"
+            self._metrics.modality_dropped_total.labels(modality=modality).inc()
+            logger.warning(
+                "Hybrid search %s modality exceeded its %.3fs budget; dropped from fusion", modality, timeout
+            )
+            return None
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            self._metrics.modality_latency_seconds.labels(modality=modality, outcome=outcome).observe(
+                time.perf_counter() - start,
+            )
+
+    async def _text_modality(
+        self,
+        query: str,
+        *,
+        limit: int,
+        session: AsyncSession,
+    ) -> list[AttributionRecord] | None:
+        """Run full-text retrieval (``None`` if it missed its budget)."""
+        async with self._modality_session(session) as modality_session:
+            return await self._timed(
+                "text",
+                self._text_search.search(query, limit=limit * 2, session=modality_session),
+            )
+
+    async def _semantic_modalities(
+        self,
+        query: str,
+        *,
+        limit: int,
+        session: AsyncSession,
+    ) -> tuple[list[uuid.UUID] | None, list[uuid.UUID] | None]:
+        """Run vector retrieval, then graph expansion of its entities.
+
+        Returns
+        -------
+        tuple[list[uuid.UUID] | None, list[uuid.UUID] | None]
+            Vector and graph attribution IDs; ``None`` for a modality
+            that missed its budget (graph is skipped when vector is).
+        """
+        async with self._modality_session(session) as modality_session:
+            vector = await self._timed("vector", self._vector_modality(query, limit=limit, session=modality_session))
+            if vector is None:
+                return None, None
+            matched_entity_ids, vector_attribution_ids = vector
+            graph_attribution_ids = await self._timed(
+                "graph",
+                self._graph_modality(matched_entity_ids, session=modality_session),
+            )
+            return vector_attribution_ids, graph_attribution_ids
+
+    async def _vector_modality(
+        self,
+        query: str,
+        *,
+        limit: int,
+        session: AsyncSession,
+    ) -> tuple[set[uuid.UUID], list[uuid.UUID]]:
+        """Return the vector-matched entity IDs and their attribution IDs."""
+        vector_entity_ids = await self._vector_search_by_query(query, limit=limit, session=session)
+        attribution_ids = await self._entities_to_attributions(
+            [eid for eid, _ in vector_entity_ids],
+            session=session,
+        )
+        return {eid for eid, _ in vector_entity_ids}, attribution_ids
+
+    async def _graph_modality(self, entity_ids: set[uuid.UUID], *, session: AsyncSession) -> list[uuid.UUID]:
+        """Return attribution IDs of the 1-hop graph neighbours of ``entity_ids``."""
+        neighbor_entity_ids = await self._graph_neighbors(entity_ids, session=session)
+        return await self._entities_to_attributions(list(neighbor_entity_ids), session=session)
 
     async def _vector_search_by_query(
         self,
@@ -213,9 +452,12 @@ class HybridSearchService:
     ) -> list[tuple[uuid.UUID, float]]:
         """Embed the query text and find similar entity embeddings.
 
-        Uses the ``EmbeddingMatcher`` to vectorise the query, then
-        computes cosine similarity against all entity embeddings in
-        the database. Similarity scores are clamped to [0.0, 1.0].
+        Uses the ``QueryEmbeddingService`` to vectorise the query (LRU
+        hit, joined in-flight encode, or an encode in an executor), then ranks
+        entity embeddings with ``VectorSearchService.search_by_vector``
+        (pgvector ``<=>`` on PostgreSQL, the ANN index when configured,
+        otherwise a NumPy scan). Similarity scores are clamped to
+        [0.0, 1.0].
 
         Parameters
         ----------
@@ -232,22 +474,8 @@ class HybridSearchService:
             List of ``(entity_id, similarity)`` sorted by similarity
             descending, truncated to ``limit``.
         """
-        query_embedding = await self._matcher.embed(query)
-
-        # Fetch all entity embeddings
-        stmt = select(EntityEmbeddingModel.entity_id, EntityEmbeddingModel.embedding)
-        result = await session.execute(stmt)
-        candidates = result.all()
-
-        scored: list[tuple[uuid.UUID, float]] = []
-        for entity_id, raw_embedding in candidates:
-            candidate_embedding = _parse_embedding(raw_embedding)
-            similarity = _cosine_similarity(query_embedding, candidate_embedding)
-            similarity = max(0.0, min(1.0, similarity))
-            scored.append((entity_id, similarity))
-
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[:limit]
+        query_embedding = await self._query_embeddings.embed(query)
+        return await self._vector_search.search_by_vector(query_embedding, limit=limit, session=session)
 
     async def _entities_to_attributions(
         self,
@@ -263,9 +491,9 @@ class HybridSearchService:
         2. Inside the ``credits`` JSONB array (as ``entity_id`` in
            individual credit entries).
 
-        For cross-database compatibility, the credits check uses
-        ``LIKE`` on the stringified JSONB rather than PostgreSQL-specific
-        JSONB operators.
+        Both are denormalized into the ``attribution_entities`` junction
+        table, so the mapping is one indexed ``IN`` lookup on
+        ``entity_id``.
 
         Parameters
         ----------
@@ -283,19 +511,12 @@ class HybridSearchService:
         if not entity_ids:
             return []
 
-        from sqlalchemy import ColumnElement, String, cast, or_
-
-        conditions: list[ColumnElement[bool]] = []
-        for eid in entity_ids:
-            eid_str = str(eid)
-            conditions.append(
-                cast(AttributionRecordModel.credits, String).like(f"%{eid_str}%"),
-            )
-            conditions.append(AttributionRecordModel.work_entity_id == eid)
-
+        matching = select(AttributionEntityModel.attribution_id).where(
+            AttributionEntityModel.entity_id.in_(entity_ids),
+        )
         stmt = (
             select(AttributionRecordModel.attribution_id)
-            .where(or_(*conditions))
+            .where(AttributionRecordModel.attribution_id.in_(matching))
             .order_by(AttributionRecordModel.confidence_score.desc())
         )
         result = await session.execute(stmt)
@@ -344,3 +565,11 @@ class HybridSearchService:
 
         # Exclude the original entities
         return neighbors - entity_ids
+
+
+def _ranks(attribution_ids: Iterable[uuid.UUID]) -> dict[uuid.UUID, int]:
+    """Map each attribution ID to its first 1-based rank."""
+    ranks: dict[uuid.UUID, int] = {}
+    for rank, attr_id in enumerate(attribution_ids, start=1):
+        ranks.setdefault(attr_id, rank)
+    return ranks
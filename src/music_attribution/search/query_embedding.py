@@ -0,0 +1,207 @@
+"""Async query-embedding service with an in-memory LRU.
+
+Hybrid search, the chat agent and the voice tools embed short free-text
+queries, often the same few over and over. Encoding is a synchronous
+transformer forward pass, so ``QueryEmbeddingService``:
+
+- runs ``EmbeddingMatcher.encode`` in an executor, off the event loop;
+- keeps a bounded LRU of query vectors keyed by the normalized query
+  text (Unicode NFKC, case-folded, whitespace collapsed), which is also
+  the text that is encoded, so equivalent queries share one vector;
+- coalesces concurrent requests for the same query onto one in-flight
+  encode.
+
+Query vectors are held in process memory only; entity embeddings
+belong in the persistent ``EmbeddingCache``, which the matcher may
+also use.
+
+Functions
+---------
+normalize_query
+    Normalize a query into its cache key.
+get_query_embedding_service
+    Process-wide service for the default embedding model.
+
+Classes
+-------
+QueryEmbeddingService
+    Bounded, deduplicating async query encoder.
+
+See Also
+--------
+music_attribution.resolution.embedding_match : Model loading and encoding.
+music_attribution.search.hybrid_search : Embeds queries through this service.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import unicodedata
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from music_attribution.resolution.embedding_match import EmbeddingMatcher
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+logger = logging.getLogger(__name__)
+
+# Default number of query vectors kept (384 float32 values each, ~1.5 KB)
+DEFAULT_MAXSIZE = 1024
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Return the cache key of ``query``.
+
+    Applies Unicode NFKC, case folding and whitespace collapsing. The
+    default model lower-cases its input, so folding does not change the
+    embedding.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", query).casefold()).strip()
+
+
+class QueryEmbeddingService:
+    """Embed search queries off the event loop, with an LRU and dedupe.
+
+    Parameters
+    ----------
+    matcher : EmbeddingMatcher | None, optional
+        Encoder for the query model. Default is a new
+        ``EmbeddingMatcher()`` (model loaded on the first miss).
+    maxsize : int, optional
+        Maximum number of cached query vectors. Default
+        ``DEFAULT_MAXSIZE``.
+    executor : Executor | None, optional
+        Executor for the forward pass; ``None`` uses the event loop's
+        default thread pool.
+
+    Attributes
+    ----------
+    _matcher : EmbeddingMatcher
+        Encoder for the query model.
+    _maxsize : int
+        LRU capacity.
+    _executor : Executor | None
+        Executor running ``EmbeddingMatcher.encode``.
+    _vectors : OrderedDict[str, numpy.ndarray]
+        Normalized query to vector, least recently used first.
+    _inflight : dict[str, asyncio.Task[numpy.ndarray]]
+        Encodes in progress, by normalized query.
+    hits : int
+        Queries served from the LRU.
+    misses : int
+        Queries that started an encode.
+    coalesced : int
+        Queries that joined an in-flight encode.
+
+    Notes
+    -----
+    The LRU and the in-flight table are only touched from the event
+    loop, so no lock is needed; use one instance per event loop.
+    Returned arrays are shared and read-only.
+    """
+
+    def __init__(
+        self,
+        matcher: EmbeddingMatcher | None = None,
+        *,
+        maxsize: int = DEFAULT_MAXSIZE,
+        executor: Executor | None = None,
+    ) -> None:
+        if maxsize < 1:
+            msg = f"maxsize must be positive, got {maxsize}"
+            raise ValueError(msg)
+        self._matcher = matcher or EmbeddingMatcher()
+        self._maxsize = maxsize
+        self._executor = executor
+        self._vectors: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[np.ndarray]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached query vectors."""
+        return len(self._vectors)
+
+    async def embed(self, query: str) -> np.ndarray:
+        """Return the embedding of ``query``.
+
+        Parameters
+        ----------
+        query : str
+            Free-text search query.
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only float32 query vector.
+
+        Notes
+        -----
+        Cancelling a caller does not cancel the shared encode; other
+        waiters still receive the vector and it is still cached. A
+        failed encode is not cached and is raised to every waiter.
+        """
+        key = normalize_query(query)
+        vector = self._vectors.get(key)
+        if vector is not None:
+            self._vectors.move_to_end(key)
+            self.hits += 1
+            return vector
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._encode(key))
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    async def _encode(self, key: str) -> np.ndarray:
+        """Encode ``key`` in the executor and store it in the LRU."""
+        loop = asyncio.get_running_loop()
+        try:
+            encoded = await loop.run_in_executor(self._executor, self._matcher.encode, [key])
+            vector = np.array(encoded[0], dtype=np.float32)
+            vector.setflags(write=False)
+            self._vectors[key] = vector
+            if len(self._vectors) > self._maxsize:
+                self._vectors.popitem(last=False)
+            return vector
+        finally:
+            del self._inflight[key]
+
+    def clear(self) -> None:
+        """Drop every cached query vector (in-flight encodes still finish)."""
+        self._vectors.clear()
+
+
+# --- Module-level singleton shared by search, chat and voice ---
+
+_default_service: QueryEmbeddingService | None = None
+
+
+def get_query_embedding_service() -> QueryEmbeddingService:
+    """Get or create the process-wide query embedding service.
+
+    ``HybridSearchService`` instances are created per request, so the
+    LRU and the loaded model live here instead.
+
+    Returns
+    -------
+    QueryEmbeddingService
+        Singleton service for the default embedding model.
+    """
+    global _default_service  # noqa: PLW0603
+    if _default_service is None:
+        _default_service = QueryEmbeddingService()
+    return _default_service
@@ -0,0 +1,519 @@
+"""Hybrid search result cache with write-through invalidation.
+
+``GET /api/v1/attributions/search`` runs the full hybrid pipeline (text
+retrieval, query embedding, vector and graph modalities, RRF fusion and
+record fetch) for every request, although the catalogue only changes
+when attribution records, graph edges or entity embeddings are written. ``SearchResultCache``
+memoizes ``HybridSearchService.search`` results under
+``(normalized query, limit, catalogue generation)``.
+
+The catalogue generation is a counter held by the cache backend.
+``AsyncAttributionRepository.store``/``update`` and
+``AsyncEdgeRepository.add_edge`` and the ``EmbeddingService`` store
+methods call ``mark_catalogue_changed()`` on their session; when that session commits, an ``after_commit`` hook
+bumps the generation, which moves every later lookup to a fresh key
+space. A rolled-back write bumps nothing. Bumping only after the commit
+means a search that reads the new generation also sees the committed
+rows, and a search that started earlier stores its results under the
+superseded generation, where they are never read. Lookups in the same
+process wait for scheduled bumps first, so a search right after a
+commit never reads the old generation.
+
+Two backends are provided:
+
+- ``InProcessSearchCacheBackend`` -- a bounded LRU in process memory.
+  Invalidation only reaches searches in the same process: writes from
+  pipeline or CLI processes are not seen until entries expire. Use it
+  only for a single API process whose own requests do all the writing.
+- ``ValkeySearchCacheBackend`` -- shared by all API workers and by
+  pipeline processes (``Settings.valkey_url``); the generation is an
+  ``INCR`` counter and entries expire server-side. Use it whenever
+  another process writes to the catalogue.
+
+Caching is off by default (``search_cache_backend="none"``): the
+pipeline is the main writer and runs in its own process, so a default
+per-process cache would be invalidated by nothing but its TTL.
+
+Entries also expire after ``ttl_seconds`` in both backends, which bounds
+staleness from writes the cache cannot see. Backend errors are logged
+and treated as misses, so an unavailable Valkey degrades to uncached
+search.
+
+Functions
+---------
+create_search_result_cache
+    Build the cache selected by ``Settings.search_cache_backend``.
+set_search_result_cache
+    Install (or remove) the process-wide cache.
+get_search_result_cache
+    Return the process-wide cache, if any.
+mark_catalogue_changed
+    Flag a session so its commit invalidates the process-wide cache.
+bump_catalogue_generation
+    Invalidate the process-wide cache immediately.
+wait_for_catalogue_invalidation
+    Wait for invalidations scheduled by committed sessions.
+
+Classes
+-------
+SearchCacheBackend
+    Protocol for generation counter and payload storage.
+InProcessSearchCacheBackend
+    In-memory LRU backend.
+ValkeySearchCacheBackend
+    Valkey (or Redis) backend.
+SearchResultCache
+    Keying, serialization and hit-ratio accounting.
+
+See Also
+--------
+music_attribution.search.hybrid_search : Reads and fills the cache.
+music_attribution.resolution.llm_cache : Same tiering for LLM decisions.
+music_attribution.observability.search_metrics : Hit-ratio metrics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, Protocol
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from music_attribution.observability.search_metrics import SearchMetrics, get_search_metrics
+from music_attribution.schemas.attribution import AttributionRecord
+from music_attribution.search.query_embedding import normalize_query
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from music_attribution.config import Settings
+
+try:
+    import valkey.asyncio as valkey_asyncio
+
+    VALKEY_AVAILABLE = True
+except ImportError:
+    VALKEY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Default lifetime of a cached result set (5 minutes)
+_DEFAULT_TTL_SECONDS = 300.0
+
+# Backends selectable through Settings.search_cache_backend
+SEARCH_CACHE_BACKENDS = ("memory", "valkey", "none")
+
+# Session.info flag set by catalogue writes, consumed on commit/rollback
+_CHANGED_FLAG = "catalogue_changed"
+
+
+class SearchCacheBackend(Protocol):
+    """Generation counter plus payload storage for ``SearchResultCache``."""
+
+    async def generation(self) -> int:
+        """Return the current catalogue generation."""
+        ...
+
+    async def bump_generation(self) -> int:
+        """Advance the catalogue generation and return the new value."""
+        ...
+
+    async def get(self, key: str) -> str | None:
+        """Return the payload stored under ``key``, or ``None``."""
+        ...
+
+    async def put(self, key: str, payload: str) -> None:
+        """Store ``payload`` under ``key``."""
+        ...
+
+    async def close(self) -> None:
+        """Release connections."""
+        ...
+
+
+class InProcessSearchCacheBackend:
+    """``SearchCacheBackend`` in process memory.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        LRU capacity. Default 1024.
+    ttl_seconds : float, optional
+        Entry lifetime. Default 300.
+    clock : Callable[[], float], optional
+        Time source (``time.monotonic``); injectable for tests.
+
+    Attributes
+    ----------
+    _generation : int
+        Catalogue generation.
+    _entries : OrderedDict[str, tuple[float, str]]
+        Key to ``(stored_at, payload)``, least recently used first.
+    _max_entries : int
+        LRU capacity.
+    _ttl : float
+        Entry lifetime in seconds.
+    _clock : Callable[[], float]
+        Time source.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._generation = 0
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return len(self._entries)
+
+    async def generation(self) -> int:
+        """Return the current catalogue generation."""
+        return self._generation
+
+    async def bump_generation(self) -> int:
+        """Advance the generation and drop every entry (all now unreachable)."""
+        self._generation += 1
+        self._entries.clear()
+        return self._generation
+
+    async def get(self, key: str) -> str | None:
+        """Return the live payload for ``key``, or ``None``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, payload = entry
+        if self._clock() - stored_at > self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    async def put(self, key: str, payload: str) -> None:
+        """Store ``payload`` as most recently used, evicting beyond capacity."""
+        self._entries[key] = (self._clock(), payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+class ValkeySearchCacheBackend:
+    """``SearchCacheBackend`` in Valkey (or Redis), shared by all workers.
+
+    The generation is an integer key advanced with ``INCR``. Result sets
+    are string keys with a server-side expiry of ``ttl_seconds``; keys of
+    superseded generations are never read again and simply expire.
+
+    Parameters
+    ----------
+    url : str
+        Connection URL (``Settings.valkey_url``). Ignored when ``client``
+        is given.
+    ttl_seconds : float, optional
+        Server-side expiry for each result set. Default 300.
+    prefix : str, optional
+        Key namespace. Default ``"search-cache:"``.
+    client : Any, optional
+        Pre-built async client (``valkey.asyncio.Valkey`` compatible).
+
+    Attributes
+    ----------
+    _client : Any
+        Async client.
+    _ttl : int
+        Expiry in whole seconds.
+    _prefix : str
+        Key namespace.
+    _generation_key : str
+        Key holding the catalogue generation.
+
+    Raises
+    ------
+    ImportError
+        If no ``client`` is given and the ``valkey`` package is not
+        installed.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        prefix: str = "search-cache:",
+        client: Any = None,
+    ) -> None:
+        if client is None:
+            if not VALKEY_AVAILABLE:
+                msg = "ValkeySearchCacheBackend requires the 'valkey' package"
+                raise ImportError(msg)
+            client = valkey_asyncio.from_url(url, decode_responses=True)
+        self._client = client
+        self._ttl = max(int(ttl_seconds), 1)
+        self._prefix = prefix
+        self._generation_key = f"{prefix}generation"
+
+    async def generation(self) -> int:
+        """Return the current catalogue generation (0 if never bumped)."""
+        value = await self._client.get(self._generation_key)
+        return int(value) if value is not None else 0
+
+    async def bump_generation(self) -> int:
+        """Atomically advance the generation and return the new value."""
+        return int(await self._client.incr(self._generation_key))
+
+    async def get(self, key: str) -> str | None:
+        """Return the payload stored under ``key``, or ``None``."""
+        value: str | None = await self._client.get(self._prefix + key)
+        return value
+
+    async def put(self, key: str, payload: str) -> None:
+        """Store ``payload`` under ``key`` with the configured expiry."""
+        await self._client.set(self._prefix + key, payload, ex=self._ttl)
+
+    async def close(self) -> None:
+        """Close the client connection pool."""
+        await self._client.aclose()
+
+
+class SearchResultCache:
+    """Hybrid search results keyed by query, limit and catalogue generation.
+
+    Parameters
+    ----------
+    backend : SearchCacheBackend
+        Generation counter and payload storage.
+    metrics : SearchMetrics | None, optional
+        Metric instruments; defaults to the process-wide singleton.
+
+    Attributes
+    ----------
+    _backend : SearchCacheBackend
+        Generation counter and payload storage.
+    _metrics : SearchMetrics
+        Lookup counter and hit-ratio gauge.
+    _pending : set[asyncio.Task[None]]
+        Generation bumps scheduled by committed sessions.
+    hits : int
+        Lookups served from the cache.
+    misses : int
+        Lookups that had to run the search.
+
+    Examples
+    --------
+    >>> cache = SearchResultCache(InProcessSearchCacheBackend())
+    >>> set_search_result_cache(cache)  # used by every HybridSearchService
+    """
+
+    def __init__(self, backend: SearchCacheBackend, *, metrics: SearchMetrics | None = None) -> None:
+        self._backend = backend
+        self._metrics = metrics or get_search_metrics()
+        self._pending: set[asyncio.Task[None]] = set()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache (0.0 before any lookup)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    async def get(self, query: str, limit: int) -> tuple[int | None, list[tuple[AttributionRecord, float]] | None]:
+        """Look up the results of ``search(query, limit=limit)``.
+
+        Parameters
+        ----------
+        query : str
+            Search query (normalized with ``normalize_query``).
+        limit : int
+            Result limit.
+
+        Returns
+        -------
+        tuple[int | None, list[tuple[AttributionRecord, float]] | None]
+            The current generation, to pass to ``put`` after a miss, and
+            the cached ``(record, rrf_score)`` pairs, or ``None`` on a
+            miss. The generation is ``None`` when the backend failed;
+            ``put`` then stores nothing.
+        """
+        await self.wait_for_pending()
+        try:
+            generation = await self._backend.generation()
+            payload = await self._backend.get(_cache_key(query, limit, generation))
+        except Exception:
+            logger.warning("Search result cache lookup failed", exc_info=True)
+            return None, None
+
+        if payload is None:
+            self._record(hit=False)
+            return generation, None
+        self._record(hit=True)
+        return generation, [(AttributionRecord.model_validate(record), score) for record, score in json.loads(payload)]
+
+    async def put(
+        self,
+        query: str,
+        limit: int,
+        generation: int | None,
+        results: Sequence[tuple[AttributionRecord, float]],
+    ) -> None:
+        """Store the results of a search that missed at ``generation``."""
+        if generation is None:
+            return
+        payload = json.dumps([[record.model_dump(mode="json"), score] for record, score in results])
+        try:
+            await self._backend.put(_cache_key(query, limit, generation), payload)
+        except Exception:
+            logger.warning("Search result cache write failed", exc_info=True)
+
+    async def bump_generation(self) -> None:
+        """Invalidate every cached result set."""
+        try:
+            await self._backend.bump_generation()
+        except Exception:
+            logger.warning("Search result cache invalidation failed", exc_info=True)
+
+    def schedule_bump(self) -> None:
+        """Bump the generation from synchronous code on the event loop thread.
+
+        Used by the ``after_commit`` hook. Outside a running event loop
+        (synchronous sessions) there is nothing to schedule on, and the
+        bump is skipped with a warning.
+        """
+        try:
+            task = asyncio.get_running_loop().create_task(self.bump_generation())
+        except RuntimeError:
+            logger.warning("No running event loop; search result cache not invalidated after commit")
+            return
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def wait_for_pending(self) -> None:
+        """Wait for every scheduled generation bump to finish."""
+        if self._pending:
+            await asyncio.gather(*self._pending)
+
+    async def close(self) -> None:
+        """Finish scheduled bumps and close the backend."""
+        await self.wait_for_pending()
+        await self._backend.close()
+
+    def _record(self, *, hit: bool) -> None:
+        """Count one lookup and refresh the hit-ratio gauge."""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self._metrics.result_cache_requests_total.labels(result="hit" if hit else "miss").inc()
+        self._metrics.result_cache_hit_ratio.set(self.hit_ratio)
+
+
+def _cache_key(query: str, limit: int, generation: int) -> str:
+    """Return the backend key for one ``(query, limit, generation)``."""
+    digest = hashlib.sha256(json.dumps([normalize_query(query), limit]).encode("utf-8")).hexdigest()
+    return f"{generation}:{digest}"
+
+
+def create_search_result_cache(settings: Settings) -> SearchResultCache | None:
+    """Build the cache selected by ``settings.search_cache_backend``.
+
+    Parameters
+    ----------
+    settings : Settings
+        Application settings (``search_cache_backend``,
+        ``search_cache_ttl_seconds``, ``valkey_url``).
+
+    Returns
+    -------
+    SearchResultCache | None
+        ``None`` when caching is disabled (``"none"``).
+
+    Raises
+    ------
+    ValueError
+        If the backend name is not one of ``SEARCH_CACHE_BACKENDS``.
+    """
+    name = settings.search_cache_backend.lower()
+    ttl = settings.search_cache_ttl_seconds
+    backend: SearchCacheBackend
+    if name == "memory":
+        backend = InProcessSearchCacheBackend(ttl_seconds=ttl)
+    elif name == "valkey":
+        backend = ValkeySearchCacheBackend(settings.valkey_url, ttl_seconds=ttl)
+    elif name == "none":
+        return None
+    else:
+        msg = f"Unknown search cache backend {settings.search_cache_backend!r}; expected one of {SEARCH_CACHE_BACKENDS}"
+        raise ValueError(msg)
+    return SearchResultCache(backend)
+
+
+# --- Process-wide cache used by HybridSearchService and the repositories ---
+
+_default_cache: SearchResultCache | None = None
+
+
+def set_search_result_cache(cache: SearchResultCache | None) -> None:
+    """Install ``cache`` as the process-wide result cache (``None`` disables it).
+
+    Called from the API lifespan and the database CLI.
+    """
+    global _default_cache  # noqa: PLW0603
+    _default_cache = cache
+
+
+def get_search_result_cache() -> SearchResultCache | None:
+    """Return the process-wide result cache, or ``None`` if not configured."""
+    return _default_cache
+
+
+def mark_catalogue_changed(session: AsyncSession) -> None:
+    """Invalidate the process-wide result cache when ``session`` commits.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Session holding an uncommitted catalogue write.
+    """
+    session.info[_CHANGED_FLAG] = True
+
+
+async def bump_catalogue_generation() -> None:
+    """Invalidate the process-wide result cache now (no-op if not configured)."""
+    if _default_cache is not None:
+        await _default_cache.bump_generation()
+
+
+async def wait_for_catalogue_invalidation() -> None:
+    """Wait for bumps scheduled by committed sessions (call before exiting)."""
+    if _default_cache is not None:
+        await _default_cache.wait_for_pending()
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    """Schedule a generation bump once a catalogue write has committed."""
+    if session.info.pop(_CHANGED_FLAG, False) and _default_cache is not None:
+        _default_cache.schedule_bump()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    """Forget catalogue writes that were rolled back."""
+    session.info.pop(_CHANGED_FLAG, None)
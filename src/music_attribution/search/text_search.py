@@ -1,21 +1,42 @@
 """Text search service for attribution records.
 
-Provides LIKE-based text search across attribution record JSONB fields
-(credits and provenance_chain). This is the simplest search modality
-in the hybrid search stack, designed for cross-database compatibility.
-
-On PostgreSQL, this could be upgraded to use ``tsvector`` + GIN indexes
-for significantly better performance on large datasets. The current
-LIKE-based approach works identically on both PostgreSQL and SQLite,
-ensuring consistent behaviour between production and unit tests.
+Ranks attribution records against a text query using the full-text
+index from ``music_attribution.db.fts``. The backend is chosen per
+session:
+
+- **PostgreSQL** -- ``search_vector @@ websearch_to_tsquery(...)`` on the
+  generated ``tsvector`` column (GIN index, migration 007), ordered by
+  ``ts_rank``.
+- **SQLite with FTS5** -- ``attribution_records_fts MATCH ...`` ordered
+  by ``bm25()``.
+- **LIKE fallback** -- substring match over the stringified ``credits``
+  and ``provenance_chain`` columns, for SQLite databases without the
+  FTS5 table and PostgreSQL databases not yet at migration 007 (a
+  sequential scan; kept for compatibility only).
+
+The indexed document covers work title, artist name, credited entity
+names, credit roles (with ``role_detail``) and provenance agents. Query
+terms are ANDed; ties in relevance are broken by confidence score.
+
+Functions
+---------
+_tsvector_statement
+    Build the PostgreSQL ``tsvector`` query.
+_fts5_match
+    Turn a free-text query into a safe FTS5 MATCH expression.
+_fts5_statement
+    Build the SQLite FTS5 query.
+_like_statement
+    Build the LIKE fallback query.
 
 Classes
 -------
 TextSearchService
-    Async search service with paginated LIKE queries.
+    Async search service with paginated full-text queries.
 
 See Also
 --------
+music_attribution.db.fts : Index definition and FTS5 synchronization.
 music_attribution.search.hybrid_search : Uses this as modality 1.
 music_attribution.search.vector_search : Complementary vector modality.
 """
@@ -23,32 +44,125 @@ music_attribution.search.vector_search : Complementary vector modality.
 from __future__ import annotations
 
 import logging
+import re
+from typing import Any
 
-from sqlalchemy import cast, select
+from sqlalchemy import ColumnElement, Select, cast, column, func, literal, literal_column, select, table
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.types import String
 
 from music_attribution.attribution.persistence import _model_to_record
+from music_attribution.db.fts import FTS_TABLE, FTS_WEIGHTS, SEARCH_VECTOR_COLUMN, TS_CONFIG, FTSBackend, fts_backend
 from music_attribution.db.models import AttributionRecordModel
 from music_attribution.schemas.attribution import AttributionRecord
 
 logger = logging.getLogger(__name__)
 
+# Word tokens of a free-text query (FTS5 query syntax is never passed through)
+_WORD = re.compile(r"\w+")
+
+
+def _tsvector_statement(query: str, *, limit: int, offset: int) -> Select[Any]:
+    """Build the PostgreSQL query ranked by ``ts_rank``.
+
+    Parameters
+    ----------
+    query : str
+        Free-text query (``websearch_to_tsquery`` syntax: quoted
+        phrases, ``or`` and ``-term`` are honoured).
+    limit : int
+        Maximum number of rows.
+    offset : int
+        Rows to skip.
+
+    Returns
+    -------
+    Select[Any]
+        Statement selecting ``AttributionRecordModel`` rows.
+    """
+    search_vector = literal_column(f"{AttributionRecordModel.__tablename__}.{SEARCH_VECTOR_COLUMN}", TSVECTOR)
+    tsquery = func.websearch_to_tsquery(literal(TS_CONFIG, REGCONFIG), query)
+    return (
+        select(AttributionRecordModel)
+        .where(search_vector.bool_op("@@")(tsquery))
+        .order_by(func.ts_rank(search_vector, tsquery).desc(), AttributionRecordModel.confidence_score.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+def _fts5_match(query: str) -> str | None:
+    """Quote each word of ``query`` as an FTS5 string (implicit AND).
+
+    Returns ``None`` when the query has no word characters.
+    """
+    words = _WORD.findall(query)
+    if not words:
+        return None
+    return " ".join(f'"{word}"' for word in words)
+
+
+def _fts5_statement(match: str, *, limit: int, offset: int) -> Select[Any]:
+    """Build the SQLite FTS5 query ranked by ``bm25()``.
+
+    Parameters
+    ----------
+    match : str
+        FTS5 MATCH expression from ``_fts5_match``.
+    limit : int
+        Maximum number of rows.
+    offset : int
+        Rows to skip.
+
+    Returns
+    -------
+    Select[Any]
+        Statement selecting ``AttributionRecordModel`` rows.
+    """
+    fts = table(FTS_TABLE, column("attribution_id"))
+    fts_ref: ColumnElement[Any] = literal_column(FTS_TABLE)
+    return (
+        select(AttributionRecordModel)
+        .join(fts, fts.c.attribution_id == AttributionRecordModel.attribution_id)
+        .where(fts_ref.bool_op("MATCH")(match))
+        .order_by(func.bm25(fts_ref, *FTS_WEIGHTS), AttributionRecordModel.confidence_score.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+def _like_statement(query: str, *, limit: int, offset: int) -> Select[Any]:
+    """Build the LIKE fallback over stringified JSONB columns."""
+    search_pattern = f"%{query}%"
+    return (
+        select(AttributionRecordModel)
+        .where(
+            cast(AttributionRecordModel.credits, String).like(search_pattern)
+            | cast(AttributionRecordModel.provenance_chain, String).like(search_pattern)
+        )
+        .order_by(AttributionRecordModel.confidence_score.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+
 
 class TextSearchService:
-    """Text search across attribution records using LIKE queries.
+    """Full-text search across attribution records.
 
-    Searches through the stringified JSONB ``credits`` and
-    ``provenance_chain`` columns for substring matches. Results are
-    sorted by confidence score descending with pagination support.
+    Uses the PostgreSQL ``tsvector`` index or the SQLite FTS5 table,
+    whichever the session's database provides, and falls back to LIKE
+    matching when neither exists. Results are ordered by relevance.
 
     This service is stateless and can be instantiated freely.
 
     Notes
     -----
-    The LIKE approach has O(n) performance on the full table. For
-    production datasets, upgrade to PostgreSQL ``tsvector`` columns
-    with GIN indexes and ``ts_rank`` scoring.
+    The PostgreSQL backend requires migration 007 (the generated
+    ``search_vector`` column); without it searches use LIKE. On SQLite,
+    the FTS5 table is created with ``attribution_records`` and kept in
+    sync by ``AsyncAttributionRepository``. The backend is detected
+    once per engine (``db.fts.fts_backend``).
     """
 
     async def search(
@@ -61,9 +175,9 @@ class TextSearchService:
     ) -> list[AttributionRecord]:
         """Search attribution records by text query.
 
-        An empty query returns all records (useful for browsing).
-        Non-empty queries perform case-sensitive LIKE matching on the
-        stringified ``credits`` and ``provenance_chain`` JSONB columns.
+        An empty query returns all records (useful for browsing),
+        sorted by confidence score descending. Non-empty queries match
+        all of their words against the full-text index.
 
         Parameters
         ----------
@@ -81,7 +195,7 @@ class TextSearchService:
         -------
         list[AttributionRecord]
             Matching attribution records (Pydantic BO-3 objects)
-            sorted by confidence score descending.
+            sorted by relevance, then confidence score, descending.
         """
         if not query.strip():
             # Empty query: return all records with pagination
@@ -91,19 +205,15 @@ class TextSearchService:
                 .offset(offset)
                 .limit(limit)
             )
+        elif (backend := await fts_backend(session)) is FTSBackend.TSVECTOR:
+            stmt = _tsvector_statement(query, limit=limit, offset=offset)
+        elif backend is FTSBackend.FTS5:
+            match = _fts5_match(query)
+            if match is None:
+                return []
+            stmt = _fts5_statement(match, limit=limit, offset=offset)
         else:
-            # Search within JSONB credits text (contains role_detail, names, etc.)
-            search_pattern = f"%{query}%"
-            stmt = (
-                select(AttributionRecordModel)
-                .where(
-                    cast(AttributionRecordModel.credits, String).like(search_pattern)
-                    | cast(AttributionRecordModel.provenance_chain, String).like(search_pattern)
-                )
-                .order_by(AttributionRecordModel.confidence_score.desc())
-                .offset(offset)
-                .limit(limit)
-            )
+            stmt = _like_statement(query, limit=limit, offset=offset)
 
         result = await session.execute(stmt)
         models = result.scalars().all()
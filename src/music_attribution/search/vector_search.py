@@ -1,18 +1,26 @@
 """Vector similarity search service for entity embeddings.
 
 Provides cosine similarity search across entity embeddings stored in
-the ``entity_embeddings`` table. On PostgreSQL with pgvector, the
-``<=>`` (cosine distance) operator can be used with HNSW indexes for
-sub-linear search performance. This implementation uses Python-side
-cosine computation for cross-database compatibility with SQLite in
-unit tests.
+the ``entity_embeddings`` table. The ranking backend is chosen per
+session:
+
+- **PostgreSQL + pgvector** -- ranking, threshold and entity-type filter
+  run in SQL (``ORDER BY embedding <=> :q LIMIT k``), served by the HNSW
+  index from migration 005. Only the top ``k`` rows cross the wire.
+- **Local ANN index** -- when an ``IVFFlatIndex`` is configured,
+  candidates come from it (SQLite and offline deployments).
+- **NumPy scan** -- otherwise (SQLite), every embedding is fetched,
+  stacked into one matrix (``stack_embeddings``, no per-element Python
+  floats) and scored with one matrix-vector product.
 
 Functions
 ---------
-_cosine_similarity
-    Compute cosine similarity between two vectors.
+_cosine_scores
+    Cosine similarity of every matrix row to a query vector.
 _parse_embedding
-    Parse embeddings from various database storage formats.
+    Parse an embedding from any storage format into a NumPy array.
+_pgvector_statement
+    Build the pushed-down pgvector ranking query.
 
 Classes
 -------
@@ -22,62 +30,64 @@ VectorSearchService
 See Also
 --------
 music_attribution.search.hybrid_search : Uses this as modality 2.
+music_attribution.search.ann_index : Optional local ANN index.
 music_attribution.db.models.EntityEmbeddingModel : Embedding storage.
 """
 
 from __future__ import annotations
 
-import json
 import logging
-import math
 import uuid
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import Select, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from music_attribution.db.embedding_type import decode_embedding, stack_embeddings
 from music_attribution.db.models import EntityEmbeddingModel, ResolvedEntityModel
 
+if TYPE_CHECKING:
+    from music_attribution.search.ann_index import IVFFlatIndex
+
 logger = logging.getLogger(__name__)
 
+# ANN candidates fetched per requested result when filtering by entity type
+_TYPE_FILTER_OVERSAMPLE = 4
+
+# Largest hnsw.ef_search accepted by pgvector
+_MAX_EF_SEARCH = 1000
 
-def _cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
-    """Compute cosine similarity between two float vectors.
 
-    Uses a pure-Python dot-product implementation for cross-database
-    compatibility (no numpy dependency). For production workloads,
-    pgvector's ``<=>`` operator provides hardware-accelerated distance.
+def _cosine_scores(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every row of ``matrix`` to ``query``.
 
     Parameters
     ----------
-    vec_a : list[float]
-        First vector.
-    vec_b : list[float]
-        Second vector (must have the same length as ``vec_a``).
+    matrix : numpy.ndarray
+        ``(n, dim)`` candidate embeddings.
+    query : numpy.ndarray
+        ``(dim,)`` query embedding.
 
     Returns
     -------
-    float
-        Cosine similarity score. Mathematically in [-1, 1], but
-        callers typically clamp to [0, 1] for search ranking.
+    numpy.ndarray
+        ``(n,)`` similarities in [-1, 1]; rows (or a query) with zero
+        norm score 0.0.
     """
-    dot_product = sum(a * b for a, b in zip(vec_a, vec_b, strict=True))
-    norm_a = math.sqrt(sum(a * a for a in vec_a))
-    norm_b = math.sqrt(sum(b * b for b in vec_b))
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot_product / (norm_a * norm_b)
-
+    norms = np.linalg.norm(matrix, axis=1) * float(np.linalg.norm(query))
+    dots = matrix @ query
+    scores: np.ndarray = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+    return scores
 
-def _parse_embedding(raw: object) -> list[float]:
-    """Parse an embedding vector from database storage format.
 
-    Handles three storage formats depending on the database backend:
+def _parse_embedding(raw: object) -> np.ndarray:
+    """Parse an embedding from any storage format into a ``float32`` array.
 
-    - **PostgreSQL + pgvector**: Returns a ``HalfVector`` object with
-      a ``.to_list()`` method.
-    - **SQLite**: Returns a JSON string that must be deserialised.
-    - **In-memory / test fixtures**: Returns a Python ``list`` or
-      ``tuple`` directly.
+    Delegates to ``decode_embedding``: SQLite BLOBs and pgvector
+    ``HalfVector`` buffers are viewed without per-element Python floats,
+    and text forms are parsed in C.
 
     Parameters
     ----------
@@ -86,37 +96,94 @@ def _parse_embedding(raw: object) -> list[float]:
 
     Returns
     -------
-    list[float]
-        Parsed embedding as a list of Python floats.
+    numpy.ndarray
+        ``(dim,)`` ``float32`` embedding.
 
     Raises
     ------
     TypeError
         If the raw value does not match any known storage format.
     """
-    if isinstance(raw, list | tuple):
-        return [float(v) for v in raw]
-    if isinstance(raw, str):
-        return [float(v) for v in json.loads(raw)]
-    # pgvector HalfVector — convert via .to_list()
-    if hasattr(raw, "to_list"):
-        return [float(v) for v in raw.to_list()]
-    msg = f"Unexpected embedding type: {type(raw)}"
-    raise TypeError(msg)
+    return decode_embedding(raw).astype(np.float32)
+
+
+def _pgvector_statement(
+    query_embedding: Sequence[float] | np.ndarray,
+    *,
+    limit: int,
+    threshold: float = 0.0,
+    entity_type: str | None = None,
+    exclude_entity_id: uuid.UUID | None = None,
+) -> Select[Any]:
+    """Build the pgvector ranking query.
+
+    Cosine distance is ``1 - cosine_similarity``, so the similarity
+    threshold becomes ``distance <= 1 - threshold``. Ordering by the bare
+    ``<=>`` expression lets PostgreSQL use the HNSW index.
+
+    Parameters
+    ----------
+    query_embedding : list[float]
+        Query vector.
+    limit : int
+        Maximum rows returned.
+    threshold : float, optional
+        Minimum cosine similarity; ``0.0`` adds no distance filter.
+    entity_type : str | None, optional
+        Restrict to entities of this type (joins ``resolved_entities``).
+    exclude_entity_id : uuid.UUID | None, optional
+        Entity to leave out (the query entity itself).
+
+    Returns
+    -------
+    Select
+        ``SELECT entity_id, distance ... ORDER BY distance LIMIT limit``.
+    """
+    distance = EntityEmbeddingModel.embedding.cosine_distance(query_embedding)
+    stmt = select(EntityEmbeddingModel.entity_id, distance.label("distance"))
+    if entity_type is not None:
+        stmt = stmt.join(
+            ResolvedEntityModel,
+            EntityEmbeddingModel.entity_id == ResolvedEntityModel.entity_id,
+        ).where(ResolvedEntityModel.entity_type == entity_type)
+    if exclude_entity_id is not None:
+        stmt = stmt.where(EntityEmbeddingModel.entity_id != exclude_entity_id)
+    if threshold > 0.0:
+        stmt = stmt.where(distance <= 1.0 - threshold)
+    return stmt.order_by(distance).limit(limit)
 
 
 class VectorSearchService:
     """Vector similarity search across entity embeddings.
 
-    Fetches embeddings from the ``entity_embeddings`` table and computes
-    cosine similarity in Python. On PostgreSQL with pgvector, the
-    ``<=>`` operator with HNSW indexes provides hardware-accelerated
-    approximate nearest neighbour search. This Python-side implementation
-    ensures cross-database compatibility for unit tests on SQLite.
+    ``search_by_vector`` picks the ranking backend: a configured local
+    ``ann_index`` first, then pgvector push-down when the session is
+    bound to PostgreSQL, then a NumPy scan (SQLite). All backends
+    return the same ``(entity_id, similarity)`` shape with similarity
+    clamped to [0, 1].
 
-    The service is stateless and can be instantiated freely.
+    Parameters
+    ----------
+    ann_index : IVFFlatIndex | None, optional
+        Local approximate nearest-neighbour index over the same
+        embeddings (SQLite and offline deployments).
+    ef_search : int | None, optional
+        ``hnsw.ef_search`` set for pgvector queries (candidate list size
+        of the HNSW scan). Raise it when filtered queries return fewer
+        than ``limit`` rows. ``None`` keeps the server default (40).
+
+    Attributes
+    ----------
+    _ann_index : IVFFlatIndex | None
+        Optional ANN index.
+    _ef_search : int | None
+        HNSW search breadth for pgvector queries.
     """
 
+    def __init__(self, ann_index: IVFFlatIndex | None = None, *, ef_search: int | None = None) -> None:
+        self._ann_index = ann_index
+        self._ef_search = ef_search
+
     async def find_similar(
         self,
         entity_id: uuid.UUID,
@@ -128,10 +195,10 @@ class VectorSearchService:
     ) -> list[tuple[uuid.UUID, float]]:
         """Find entities with similar embeddings to a given entity.
 
-        Fetches the query entity's embedding, then computes cosine
-        similarity against all candidate embeddings in the database.
-        Results are filtered by minimum threshold, optionally filtered
-        by entity type, and sorted by similarity descending.
+        Fetches the query entity's embedding, then ranks the other
+        entities with ``search_by_vector``. Results are filtered by
+        minimum threshold, optionally filtered by entity type, and
+        sorted by similarity descending.
 
         Parameters
         ----------
@@ -167,41 +234,157 @@ class VectorSearchService:
             logger.warning("No embedding found for entity %s", entity_id)
             return []
 
-        query_embedding = _parse_embedding(query_embedding_raw)
+        return await self.search_by_vector(
+            _parse_embedding(query_embedding_raw),
+            limit=limit,
+            threshold=threshold,
+            entity_type=entity_type,
+            exclude_entity_id=entity_id,
+            session=session,
+        )
+
+    async def search_by_vector(
+        self,
+        query_embedding: Sequence[float] | np.ndarray,
+        *,
+        limit: int = 10,
+        threshold: float = 0.0,
+        entity_type: str | None = None,
+        exclude_entity_id: uuid.UUID | None = None,
+        session: AsyncSession,
+    ) -> list[tuple[uuid.UUID, float]]:
+        """Rank entity embeddings by cosine similarity to a query vector.
 
-        # Fetch candidate embeddings (excluding the query entity)
+        Parameters
+        ----------
+        query_embedding : Sequence[float] | numpy.ndarray
+            Query vector.
+        limit : int, optional
+            Maximum number of results. Default is 10.
+        threshold : float, optional
+            Minimum cosine similarity. Default is 0.0.
+        entity_type : str | None, optional
+            Restrict results to this entity type.
+        exclude_entity_id : uuid.UUID | None, optional
+            Entity to leave out of the results.
+        session : AsyncSession
+            Active async database session.
+
+        Returns
+        -------
+        list[tuple[uuid.UUID, float]]
+            ``(entity_id, similarity)`` sorted by similarity descending,
+            similarity clamped to [0.0, 1.0].
+        """
+        if self._ann_index is not None:
+            search = self._search_ann
+        elif session.get_bind().dialect.name == "postgresql":
+            search = self._search_pgvector
+        else:
+            search = self._search_numpy
+        return await search(
+            query_embedding,
+            limit=limit,
+            threshold=threshold,
+            entity_type=entity_type,
+            exclude_entity_id=exclude_entity_id,
+            session=session,
+        )
+
+    async def _search_pgvector(
+        self,
+        query_embedding: Sequence[float] | np.ndarray,
+        *,
+        limit: int,
+        threshold: float,
+        entity_type: str | None,
+        exclude_entity_id: uuid.UUID | None,
+        session: AsyncSession,
+    ) -> list[tuple[uuid.UUID, float]]:
+        """Rank in PostgreSQL with ``<=>``; only the top rows are returned."""
+        if self._ef_search is not None:
+            # SET does not take bind parameters; the value is a clamped int
+            ef_search = max(1, min(int(self._ef_search), _MAX_EF_SEARCH))
+            await session.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
+        stmt = _pgvector_statement(
+            query_embedding,
+            limit=limit,
+            threshold=threshold,
+            entity_type=entity_type,
+            exclude_entity_id=exclude_entity_id,
+        )
+        rows: list[Any] = list((await session.execute(stmt)).all())
+        return [(candidate_id, max(0.0, min(1.0, 1.0 - float(distance)))) for candidate_id, distance in rows]
+
+    async def _search_numpy(
+        self,
+        query_embedding: Sequence[float] | np.ndarray,
+        *,
+        limit: int,
+        threshold: float,
+        entity_type: str | None,
+        exclude_entity_id: uuid.UUID | None,
+        session: AsyncSession,
+    ) -> list[tuple[uuid.UUID, float]]:
+        """Fetch every candidate embedding and score them as one matrix (SQLite)."""
+        candidates_stmt = select(EntityEmbeddingModel.entity_id, EntityEmbeddingModel.embedding)
         if entity_type is not None:
             # Join with resolved_entities to filter by type
-            candidates_stmt = (
-                select(EntityEmbeddingModel.entity_id, EntityEmbeddingModel.embedding)
-                .join(
-                    ResolvedEntityModel,
-                    EntityEmbeddingModel.entity_id == ResolvedEntityModel.entity_id,
-                )
-                .where(
-                    EntityEmbeddingModel.entity_id != entity_id,
-                    ResolvedEntityModel.entity_type == entity_type,
-                )
-            )
-        else:
-            candidates_stmt = select(
-                EntityEmbeddingModel.entity_id,
-                EntityEmbeddingModel.embedding,
-            ).where(EntityEmbeddingModel.entity_id != entity_id)
+            candidates_stmt = candidates_stmt.join(
+                ResolvedEntityModel,
+                EntityEmbeddingModel.entity_id == ResolvedEntityModel.entity_id,
+            ).where(ResolvedEntityModel.entity_type == entity_type)
+        if exclude_entity_id is not None:
+            candidates_stmt = candidates_stmt.where(EntityEmbeddingModel.entity_id != exclude_entity_id)
 
         result = await session.execute(candidates_stmt)
         candidates = result.all()
+        if not candidates:
+            return []
+
+        # One matrix-vector product over all candidates
+        matrix = stack_embeddings([raw for _, raw in candidates])
+        query = np.asarray(query_embedding, dtype=np.float32)
+        scores = np.clip(_cosine_scores(matrix, query), 0.0, 1.0)
+
+        # Sort by similarity descending (stable, so ties keep row order)
+        order = np.argsort(-scores, kind="stable")
+        order = order[scores[order] >= threshold][:limit]
+        return [(candidates[i][0], float(scores[i])) for i in order]
+
+    async def _search_ann(
+        self,
+        query_embedding: Sequence[float] | np.ndarray,
+        *,
+        limit: int,
+        threshold: float,
+        entity_type: str | None,
+        exclude_entity_id: uuid.UUID | None,
+        session: AsyncSession,
+    ) -> list[tuple[uuid.UUID, float]]:
+        """Rank candidates with the ANN index instead of a table scan.
 
-        # Compute similarities
-        scored: list[tuple[uuid.UUID, float]] = []
-        for candidate_id, candidate_embedding_raw in candidates:
-            candidate_embedding = _parse_embedding(candidate_embedding_raw)
-            similarity = _cosine_similarity(query_embedding, candidate_embedding)
-            # Clamp to [0, 1] range for search results
-            similarity = max(0.0, min(1.0, similarity))
-            if similarity >= threshold:
-                scored.append((candidate_id, similarity))
-
-        # Sort by similarity descending
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[:limit]
+        Fetches one extra neighbour when an entity is excluded (the query
+        entity is usually its own nearest neighbour); with
+        ``entity_type``, oversamples and filters the candidates against
+        ``resolved_entities``.
+        """
+        if self._ann_index is None:
+            return []
+        depth = limit + (exclude_entity_id is not None)
+        if entity_type is not None:
+            depth *= _TYPE_FILTER_OVERSAMPLE
+        excluded = str(exclude_entity_id) if exclude_entity_id is not None else None
+        neighbours = [
+            (uuid.UUID(candidate_id), max(0.0, min(1.0, similarity)))
+            for candidate_id, similarity in self._ann_index.search(query_embedding, depth)
+            if candidate_id != excluded
+        ]
+        if entity_type is not None and neighbours:
+            type_stmt = select(ResolvedEntityModel.entity_id).where(
+                ResolvedEntityModel.entity_id.in_([candidate_id for candidate_id, _ in neighbours]),
+                ResolvedEntityModel.entity_type == entity_type,
+            )
+            allowed = set((await session.execute(type_stmt)).scalars().all())
+            neighbours = [(candidate_id, score) for candidate_id, score in neighbours if candidate_id in allowed]
+        return [(candidate_id, score) for candidate_id, score in neighbours if score >= threshold][:limit]
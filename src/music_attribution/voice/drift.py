@@ -26,6 +26,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from music_attribution.resolution.embedding_cache import EmbeddingCache
     from music_attribution.voice.config import VoiceConfig
 
 logger = logging.getLogger(__name__)
@@ -49,9 +50,17 @@ class DriftDetector:
         Configuration with drift thresholds and EWMA alpha.
     reference_text : str
         Persona definition text to embed as reference.
+    embedding_cache : EmbeddingCache | None, optional
+        Shared ``all-MiniLM-L6-v2`` vector cache; repeated responses and
+        the reference text are then encoded only once across sessions.
     """
 
-    def __init__(self, config: VoiceConfig, reference_text: str) -> None:
+    def __init__(
+        self,
+        config: VoiceConfig,
+        reference_text: str,
+        embedding_cache: EmbeddingCache | None = None,
+    ) -> None:
         self._sync_threshold = config.drift_sync_threshold
         self._desync_threshold = config.drift_desync_threshold
         self._alpha = config.drift_ewma_alpha
@@ -60,6 +69,7 @@ class DriftDetector:
         self._raw_scores: list[float] = []
         self._model: Any = None
         self._ref_embedding: Any = None
+        self._embedding_cache = embedding_cache
 
     def score(self, response_text: str) -> float:
         """Compute drift score for a response.
@@ -169,15 +179,10 @@ class DriftDetector:
         ImportError
             If sentence-transformers is not installed.
         """
-        from sentence_transformers import SentenceTransformer
-
-        # Cache the model on the instance (initialized to None in __init__)
-        if self._model is None:
-            self._model = SentenceTransformer("all-MiniLM-L6-v2")
         if self._ref_embedding is None:
-            self._ref_embedding = self._model.encode(self._reference_text)
+            self._ref_embedding = self._encode(self._reference_text)
 
-        resp_embedding = self._model.encode(response_text)
+        resp_embedding = self._encode(response_text)
 
         # Cosine similarity
         import numpy as np
@@ -189,6 +194,28 @@ class DriftDetector:
             return 0.0
         return max(0.0, min(1.0, dot_product / norm_product))
 
+    def _encode(self, text: str) -> Any:
+        """Embed ``text``, through the shared cache when configured.
+
+        Raises
+        ------
+        ImportError
+            If the text is not cached and sentence-transformers is not
+            installed.
+        """
+        if self._embedding_cache is not None:
+            return self._embedding_cache.encode([text], lambda missing: self._get_model().encode(missing))[0]
+        return self._get_model().encode(text)
+
+    def _get_model(self) -> Any:
+        """Lazy-load the sentence-transformer model on first use."""
+        from sentence_transformers import SentenceTransformer
+
+        # Cache the model on the instance (initialized to None in __init__)
+        if self._model is None:
+            self._model = SentenceTransformer("all-MiniLM-L6-v2")
+        return self._model
+
 
 if PIPECAT_AVAILABLE:
 
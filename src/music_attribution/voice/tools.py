@@ -301,7 +301,7 @@ async def _handle_search_attributions(params: Any) -> None:
     try:
         from music_attribution.search.hybrid_search import HybridSearchService
 
-        svc = HybridSearchService()
+        svc = HybridSearchService(session_factory=_session_factory)
         async with _session_factory() as session:
             hits = await svc.search(query, session=session, limit=5)
 
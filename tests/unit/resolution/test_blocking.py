@@ -0,0 +1,81 @@
+"""Tests for candidate-pair blocking."""
+
+from __future__ import annotations
+
+import random
+from itertools import combinations
+
+import pytest
+
+from music_attribution.resolution.blocking import BlockingConfig, CandidateBlocker
+
+
+@pytest.fixture
+def blocker() -> CandidateBlocker:
+    """Create a CandidateBlocker that never falls back to exhaustive pairs."""
+    return CandidateBlocker(BlockingConfig(exhaustive_below=0))
+
+
+class TestCandidateBlocker:
+    """Tests for blocking key generation and candidate pairs."""
+
+    def test_the_suffix_variants_share_block(self, blocker) -> None:
+        """Test that 'The Beatles' and 'Beatles, The' become a candidate pair."""
+        pairs = blocker.candidate_pairs(["The Beatles", "Beatles, The", "Mozart"])
+        assert pairs == [(0, 1)]
+
+    def test_word_reordering_shares_block(self, blocker) -> None:
+        """Test that reordered tokens share the sorted-token key."""
+        pairs = blocker.candidate_pairs(["Elton John", "John Elton"])
+        assert (0, 1) in pairs
+
+    def test_typo_in_first_character_found_by_lsh(self) -> None:
+        """Test that n-gram LSH recovers pairs the prefix key misses."""
+        blocker = CandidateBlocker(BlockingConfig(exhaustive_below=0, sorted_tokens=False, phonetic=False))
+        pairs = blocker.candidate_pairs(["Radiohead Collective", "Zadiohead Collective"])
+        assert (0, 1) in pairs
+
+    def test_unrelated_names_not_paired(self, blocker) -> None:
+        """Test that dissimilar names produce no candidate pairs."""
+        pairs = blocker.candidate_pairs(["Johann Sebastian Bach", "Metallica", "Aphex Twin"])
+        assert pairs == []
+
+    def test_pairs_sorted_and_ordered(self, blocker) -> None:
+        """Test that pairs are sorted with i < j."""
+        names = ["Imogen Heap", "Imogen Heap", "Imogen Heep", "Frou Frou"]
+        pairs = blocker.candidate_pairs(names)
+        assert pairs == sorted(pairs)
+        assert all(i < j for i, j in pairs)
+
+    def test_small_batches_compare_all_pairs(self) -> None:
+        """Test that batches under exhaustive_below return every pair."""
+        blocker = CandidateBlocker(BlockingConfig(exhaustive_below=10))
+        pairs = blocker.candidate_pairs(["A", "B", "C", "D"])
+        assert pairs == list(combinations(range(4), 2))
+
+    def test_oversized_blocks_skipped(self) -> None:
+        """Test that blocks above max_block_size do not emit pairs."""
+        config = BlockingConfig(
+            exhaustive_below=0,
+            max_block_size=2,
+            sorted_tokens=False,
+            phonetic=False,
+            lsh_bands=0,
+        )
+        blocker = CandidateBlocker(config)
+        # All three share the prefix key "abcd" -> block of 3 is skipped
+        assert blocker.candidate_pairs(["abcde", "abcdf", "abcdg"]) == []
+
+    def test_keys_deterministic_across_instances(self) -> None:
+        """Test that MinHash keys are stable for a fixed seed."""
+        assert CandidateBlocker().keys("imogen heap") == CandidateBlocker().keys("imogen heap")
+
+    def test_blocking_reduces_pairs_on_large_batch(self, blocker) -> None:
+        """Test that blocking emits far fewer pairs than exhaustive comparison."""
+        rng = random.Random(0)
+        syllables = ["ka", "lo", "mi", "ren", "tas", "vo", "ny", "zed", "qu", "ph", "bri", "sol"]
+        names = [
+            " ".join("".join(rng.choice(syllables) for _ in range(3)) for _ in range(2)).title() for _ in range(400)
+        ]
+        pairs = blocker.candidate_pairs(names)
+        assert len(pairs) < 400 * 399 / 2 / 4
@@ -0,0 +1,222 @@
+"""Tests for the gated embedding/graph/LLM cascade in the orchestrator."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from music_attribution.resolution.cascade import CascadeConfig, StageBudget
+from music_attribution.resolution.embedding_match import EmbeddingMatcher
+from music_attribution.resolution.graph_resolution import GraphResolver
+from music_attribution.resolution.llm_disambiguation import LLMDisambiguator, SameEntityResult
+from music_attribution.resolution.orchestrator import ResolutionOrchestrator
+from music_attribution.schemas.enums import EntityTypeEnum, ResolutionMethodEnum, SourceEnum
+from music_attribution.schemas.normalized import IdentifierBundle, NormalizedRecord
+
+
+def _make_record(name: str, isrc: str, source: SourceEnum = SourceEnum.MUSICBRAINZ) -> NormalizedRecord:
+    """Create a NormalizedRecord for testing."""
+    return NormalizedRecord(
+        source=source,
+        source_id=str(uuid.uuid4()),
+        entity_type=EntityTypeEnum.ARTIST,
+        canonical_name=name,
+        identifiers=IdentifierBundle(isrc=isrc),
+        fetch_timestamp=datetime.now(UTC),
+        source_confidence=0.9,
+    )
+
+
+def _records() -> list[NormalizedRecord]:
+    """Two ambiguous identifier groups (dissimilar names) and one confident group."""
+    return [
+        _make_record("Cat Stevens", "GB0000000001"),
+        _make_record("Yusuf Islam", "GB0000000001", SourceEnum.DISCOGS),
+        _make_record("Prince", "GB0000000002"),
+        _make_record("The Artist Formerly Known As Prince", "GB0000000002", SourceEnum.DISCOGS),
+        _make_record("Snoop Dogg", "GB0000000003"),
+        _make_record("Snoop Lion", "GB0000000003", SourceEnum.DISCOGS),
+    ]
+
+
+def _embedding_matcher() -> EmbeddingMatcher:
+    """Matcher whose fake model embeds every name to the same vector."""
+    matcher = EmbeddingMatcher()
+    model = MagicMock()
+    model.encode.side_effect = lambda texts: np.ones((len(texts), 4))
+    matcher._model = model
+    return matcher
+
+
+class TestCascadeGating:
+    """Tests for ambiguity-band gating and stage counters."""
+
+    async def test_no_expensive_stages_by_default(self) -> None:
+        """Test that only Stages 1-2 run (and are counted) without components."""
+        orchestrator = ResolutionOrchestrator()
+        entities = await orchestrator.resolve(_records())
+
+        assert all(e.resolution_details.embedding_similarity is None for e in entities)
+        stats = orchestrator.stage_stats
+        assert stats["identifier"].items_in == 6
+        assert stats["identifier"].items_settled == 6
+        assert stats["identifier"].hit_rate == 1.0
+        assert stats["embedding"].items_in == 0
+
+    async def test_embedding_only_for_ambiguous_groups(self) -> None:
+        """Test that confident groups never reach the embedding stage."""
+        matcher = _embedding_matcher()
+        orchestrator = ResolutionOrchestrator(embedding_matcher=matcher)
+        entities = await orchestrator.resolve(_records())
+
+        by_name = {e.canonical_name: e for e in entities}
+        snoop = next(e for name, e in by_name.items() if name.startswith("Snoop"))
+        assert snoop.resolution_details.embedding_similarity is None
+        ambiguous = [e for e in entities if e is not snoop]
+        assert all(e.resolution_details.embedding_similarity == pytest.approx(1.0) for e in ambiguous)
+
+        stats = orchestrator.stage_stats["embedding"]
+        assert stats.items_in == 2
+        assert stats.pairs == 2
+        assert stats.calls == 1
+        assert matcher._model.encode.call_count == 1
+
+    async def test_refined_signal_updates_confidence(self) -> None:
+        """Test that a settling signal raises confidence and counts as a hit."""
+        cascade = CascadeConfig(ambiguity_high=0.8)
+        orchestrator = ResolutionOrchestrator(embedding_matcher=_embedding_matcher(), cascade=cascade)
+        baseline = await ResolutionOrchestrator().resolve(_records())
+        entities = await orchestrator.resolve(_records())
+
+        for before, after in zip(baseline[:2], entities[:2], strict=True):
+            assert after.resolution_confidence > before.resolution_confidence
+            assert all(ref.agreement_score == after.resolution_confidence for ref in after.source_records)
+        assert orchestrator.stage_stats["embedding"].items_settled == 2
+
+    async def test_budget_exhaustion_skips_stage(self) -> None:
+        """Test that a spent pair budget skips the remaining groups."""
+        cascade = CascadeConfig(embedding=StageBudget(max_pairs=0))
+        orchestrator = ResolutionOrchestrator(embedding_matcher=_embedding_matcher(), cascade=cascade)
+        entities = await orchestrator.resolve(_records())
+
+        assert all(e.resolution_details.embedding_similarity is None for e in entities)
+        assert orchestrator.stage_stats["embedding"].skipped_budget == 2
+
+        orchestrator.reset_stage_stats()
+        assert orchestrator.stage_stats["embedding"].skipped_budget == 0
+
+
+class TestGraphAndLLMStages:
+    """Tests for Stage 5 graph evidence and Stage 6 LLM confirmation."""
+
+    async def test_graph_evidence_for_ambiguous_group(self) -> None:
+        """Test that shared graph neighbors add graph_path_confidence."""
+        records = _records()
+        resolver = GraphResolver()
+        for album in ("album-1", "album-2", "album-3"):
+            for record in records[:2]:
+                resolver.add_relationship(ResolutionOrchestrator.graph_node_id(record), album, "PERFORMED_ON")
+
+        orchestrator = ResolutionOrchestrator(graph_resolver=resolver, cascade=CascadeConfig(ambiguity_high=0.8))
+        baseline = await ResolutionOrchestrator().resolve(records)
+        entities = await orchestrator.resolve(records)
+
+        assert entities[0].resolution_details.graph_path_confidence == pytest.approx(1.0)
+        # No shared neighbors: absence of evidence adds no signal
+        assert entities[1].resolution_details.graph_path_confidence is None
+        stats = orchestrator.stage_stats["graph"]
+        assert stats.items_in == 2
+        assert stats.items_settled == 1
+        assert entities[0].resolution_confidence > baseline[0].resolution_confidence
+
+    async def test_llm_budget_caps_calls(self) -> None:
+        """Test that the LLM stage stops at max_calls and records the rest as skipped."""
+        llm = LLMDisambiguator()
+        decision = SameEntityResult(is_same=True, confidence=0.95, reasoning="same")
+        cascade = CascadeConfig(llm=StageBudget(max_calls=1))
+        orchestrator = ResolutionOrchestrator(llm_disambiguator=llm, cascade=cascade)
+
+        with patch.object(llm, "_call_same_entity_llm", new_callable=AsyncMock, return_value=decision) as call:
+            entities = await orchestrator.resolve(_records())
+
+        assert call.await_count == 1
+        assert entities[0].resolution_details.llm_confidence == pytest.approx(0.95)
+        assert entities[1].resolution_details.llm_confidence is None
+        stats = orchestrator.stage_stats["llm"]
+        assert (stats.items_in, stats.calls, stats.skipped_budget) == (2, 1, 1)
+
+    async def test_llm_different_verdict_lowers_confidence(self) -> None:
+        """Test that a confident "different entities" answer counts against the group."""
+        llm = LLMDisambiguator()
+        records = _records()
+        baseline = await ResolutionOrchestrator().resolve(records)
+        different = SameEntityResult(is_same=False, confidence=0.9, reasoning="two people")
+        orchestrator = ResolutionOrchestrator(llm_disambiguator=llm, cascade=CascadeConfig())
+
+        with patch.object(llm, "_call_same_entity_llm", new_callable=AsyncMock, return_value=different):
+            entities = await orchestrator.resolve(records)
+
+        for entity, before in zip(entities[:2], baseline[:2], strict=True):
+            assert entity.resolution_details.llm_confidence == pytest.approx(0.1)
+            assert entity.resolution_confidence < before.resolution_confidence
+            assert entity.resolution_method != ResolutionMethodEnum.LLM
+
+    async def test_llm_cache_hits_do_not_use_call_budget(self) -> None:
+        """Test that cached decisions leave the call budget for uncached groups."""
+        llm = LLMDisambiguator()
+        decision = SameEntityResult(is_same=True, confidence=0.95, reasoning="same")
+        orchestrator = ResolutionOrchestrator(
+            llm_disambiguator=llm, cascade=CascadeConfig(llm=StageBudget(max_calls=1))
+        )
+
+        records = _records()
+
+        with patch.object(llm, "_call_same_entity_llm", new_callable=AsyncMock, return_value=decision) as call:
+            await orchestrator.resolve(records)
+            orchestrator.reset_stage_stats()
+            entities = await orchestrator.resolve(records)
+
+        assert call.await_count == 2
+        assert entities[0].resolution_details.llm_confidence == pytest.approx(0.95)
+        assert entities[1].resolution_details.llm_confidence == pytest.approx(0.95)
+        stats = orchestrator.stage_stats["llm"]
+        assert (stats.calls, stats.skipped_budget) == (1, 0)
+
+    async def test_llm_time_budget_cancels_slow_requests(self) -> None:
+        """Test that max_seconds bounds the concurrent LLM batch."""
+        import asyncio
+        import time
+
+        llm = LLMDisambiguator()
+
+        async def _slow(*_args, **_kwargs):
+            await asyncio.sleep(5)
+
+        orchestrator = ResolutionOrchestrator(
+            llm_disambiguator=llm, cascade=CascadeConfig(llm=StageBudget(max_seconds=0.05))
+        )
+        with patch.object(llm, "_call_same_entity_llm", side_effect=_slow):
+            started = time.perf_counter()
+            entities = await orchestrator.resolve(_records())
+            elapsed = time.perf_counter() - started
+
+        assert elapsed < 1.0
+        assert all(e.resolution_details.llm_confidence is None for e in entities)
+        stats = orchestrator.stage_stats["llm"]
+        assert (stats.items_in, stats.skipped_budget) == (2, 2)
+        assert stats.seconds >= 0.05
+
+    async def test_determine_method_prefers_graph_over_llm(self) -> None:
+        """Test that graph and LLM methods follow embedding in cascade priority."""
+        from music_attribution.schemas.resolved import ResolutionDetails
+
+        orchestrator = ResolutionOrchestrator()
+        records = _records()[:2]
+        details = ResolutionDetails(graph_path_confidence=0.8, llm_confidence=0.9)
+        assert orchestrator._determine_method(records, details) == ResolutionMethodEnum.GRAPH
+        details = ResolutionDetails(llm_confidence=0.9)
+        assert orchestrator._determine_method(records, details) == ResolutionMethodEnum.LLM
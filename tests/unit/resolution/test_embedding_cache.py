@@ -0,0 +1,180 @@
+"""Tests for the content-addressed embedding cache."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from music_attribution.resolution.embedding_cache import EmbeddingCache
+from music_attribution.resolution.embedding_match import EmbeddingMatcher
+from music_attribution.resolution.embedding_service import MODEL_VERSION, EmbeddingService
+
+
+class _CountingEncoder:
+    """Deterministic fake encoder recording which texts it was asked for."""
+
+    def __init__(self, dim: int = 4) -> None:
+        self.dim = dim
+        self.calls: list[list[str]] = []
+
+    def __call__(self, texts, **_):
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        self.calls.append(texts)
+        vectors = np.array([[len(t) + i for i in range(self.dim)] for t in texts], dtype=np.float32)
+        return vectors
+
+
+@pytest.fixture
+def cache(tmp_path) -> EmbeddingCache:
+    """Empty cache in a temporary directory."""
+    return EmbeddingCache(tmp_path, "test-model", "1.0.0")
+
+
+class TestEmbeddingCache:
+    """Tests for lookup, persistence and namespacing."""
+
+    def test_encodes_only_missing_texts(self, cache) -> None:
+        """Test that cached texts are served and duplicates encoded once."""
+        encoder = _CountingEncoder()
+        first = cache.encode(["a", "bb"], encoder)
+        second = cache.encode(["bb", "ccc", "ccc", "a"], encoder)
+
+        assert encoder.calls == [["a", "bb"], ["ccc"]]
+        np.testing.assert_array_equal(second[0], first[1])
+        np.testing.assert_array_equal(second[3], first[0])
+        assert second.dtype == np.float32
+        assert (cache.hits, cache.misses) == (2, 3)
+        assert len(cache) == 3
+
+    def test_persists_across_instances(self, cache, tmp_path) -> None:
+        """Test that a reopened cache serves earlier vectors without encoding."""
+        vectors = cache.encode(["x", "yy"], _CountingEncoder())
+
+        reopened = EmbeddingCache(tmp_path, "test-model", "1.0.0")
+        encoder = _CountingEncoder()
+        np.testing.assert_array_equal(reopened.encode(["yy", "x"], encoder), vectors[::-1])
+        assert encoder.calls == []
+        assert "x" in reopened
+        assert reopened.dim == 4
+
+    def test_vectors_stored_as_float16(self, cache) -> None:
+        """Test that fresh and cached results both reflect float16 storage."""
+        value = np.float32(0.1)
+        fresh = cache.encode(["t"], lambda _: np.full((1, 2), value))
+        assert fresh[0, 0] == np.float32(np.float16(value))
+        assert (cache.path / "vectors.f16").stat().st_size == 2 * 2
+
+    def test_version_namespaces_are_separate(self, cache, tmp_path) -> None:
+        """Test that a new model version starts empty."""
+        cache.encode(["a"], _CountingEncoder())
+        other = EmbeddingCache(tmp_path, "test-model", "2.0.0")
+        assert "a" not in other
+        assert other.get("a") is None
+
+    def test_torn_write_is_truncated(self, cache, tmp_path) -> None:
+        """Test that a partial trailing vector is dropped on reopen."""
+        cache.encode(["a", "b"], _CountingEncoder())
+        with (cache.path / "vectors.f16").open("ab") as handle:
+            handle.write(b"\x00\x01\x02")
+
+        reopened = EmbeddingCache(tmp_path, "test-model", "1.0.0")
+        assert len(reopened) == 2
+        assert (reopened.path / "vectors.f16").stat().st_size == 2 * 4 * 2
+
+    def test_dimension_mismatch_raises(self, cache) -> None:
+        """Test that vectors of another size are rejected."""
+        cache.encode(["a"], _CountingEncoder(dim=4))
+        with pytest.raises(ValueError, match="dimension"):
+            cache.encode(["b"], _CountingEncoder(dim=3))
+
+    def test_concurrent_misses_append_once(self, cache) -> None:
+        """Test that threads missing on the same text keep rows aligned."""
+        import threading
+
+        barrier = threading.Barrier(4)
+        encoder = _CountingEncoder()
+
+        def _slow_encode(texts):
+            barrier.wait(timeout=5)
+            return encoder(texts)
+
+        threads = [threading.Thread(target=cache.encode, args=(["same"], _slow_encode)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        later = cache.encode(["other"], encoder)
+        np.testing.assert_array_equal(later[0], encoder(["other"])[0])
+        assert len(cache) == 2
+        assert (cache.path / "keys.bin").stat().st_size == 2 * 32
+
+    def test_duplicate_keys_on_disk_are_tolerated(self, cache, tmp_path) -> None:
+        """Test that a file with a repeated key (older writers) reopens correctly."""
+        encoder = _CountingEncoder()
+        cache.encode(["a"], encoder)
+        namespace = cache.path
+        keys, vectors = (namespace / "keys.bin").read_bytes(), (namespace / "vectors.f16").read_bytes()
+        (namespace / "keys.bin").write_bytes(keys * 2)
+        (namespace / "vectors.f16").write_bytes(vectors * 2)
+
+        reopened = EmbeddingCache(tmp_path, "test-model", "1.0.0")
+        result = reopened.encode(["a", "bb"], encoder)
+        np.testing.assert_array_equal(result[0], encoder(["a"])[0])
+        np.testing.assert_array_equal(result[1], encoder(["bb"])[0])
+        assert len(EmbeddingCache(tmp_path, "test-model", "1.0.0")) == 2
+
+    def test_shared_returns_one_instance(self, tmp_path) -> None:
+        """Test that shared() reuses the instance per namespace."""
+        first = EmbeddingCache.shared(tmp_path, "m", "1")
+        assert EmbeddingCache.shared(tmp_path, "m", "1") is first
+        assert EmbeddingCache.shared(tmp_path, "m", "2") is not first
+
+
+class TestCachedEncoders:
+    """Tests for the components that route encodes through the cache."""
+
+    async def test_matcher_skips_model_on_hits(self, tmp_path) -> None:
+        """Test that EmbeddingMatcher only loads and calls the model on misses."""
+        cache = EmbeddingCache(tmp_path, "all-MiniLM-L6-v2", "1.0.0")
+        cache.encode(["Bjork"], _CountingEncoder())
+        matcher = EmbeddingMatcher(cache=cache)
+        matcher._get_model = MagicMock()
+
+        vector = await matcher.embed("Bjork")
+        assert len(vector) == 4
+        matcher._get_model.assert_not_called()
+
+    def test_matcher_rejects_other_model_cache(self, tmp_path) -> None:
+        """Test that a cache for a different model is refused."""
+        with pytest.raises(ValueError, match="model"):
+            EmbeddingMatcher(model_name="other", cache=EmbeddingCache(tmp_path, "all-MiniLM-L6-v2", "1"))
+
+    def test_service_rerun_encodes_only_changed_text(self, tmp_path) -> None:
+        """Test that a second run over the catalogue encodes only changed entities."""
+        encoder = _CountingEncoder()
+        service = EmbeddingService(cache=EmbeddingCache(tmp_path, "all-MiniLM-L6-v2", MODEL_VERSION))
+        service._matcher._model = MagicMock(encode=MagicMock(side_effect=encoder))
+        texts = [service.format_entity_text(f"Artist {i}", "ARTIST") for i in range(4)]
+
+        service.generate_embeddings(texts, batch_size=2)
+        texts[2] = service.format_entity_text("Artist 2", "ARTIST", ["Renamed"])
+        service.generate_embeddings(texts, batch_size=2)
+
+        assert [len(call) for call in encoder.calls] == [4, 1]
+        assert encoder.calls[1] == [texts[2]]
+
+    def test_drift_detector_uses_shared_cache(self, tmp_path) -> None:
+        """Test that DriftDetector scores cached texts without loading a model."""
+        from music_attribution.voice.config import VoiceConfig
+        from music_attribution.voice.drift import DriftDetector
+
+        cache = EmbeddingCache(tmp_path, "all-MiniLM-L6-v2", "1.0.0")
+        cache.encode(["persona", "reply"], lambda _: np.array([[1.0, 0.0], [1.0, 0.0]]))
+        detector = DriftDetector(VoiceConfig(), "persona", embedding_cache=cache)
+        detector._get_model = MagicMock()
+
+        assert detector._compute_embedding_similarity("reply") == pytest.approx(1.0)
+        detector._get_model.assert_not_called()
@@ -68,7 +68,8 @@ class TestEmbeddingMatcher:
             "id-2": [0.0, 0.1, 0.9] + [0.0] * 381,  # Low similarity
             "id-3": [0.7, 0.3, 0.0] + [0.0] * 381,  # Medium similarity
         }
-        matcher._embeddings = stored
+        for entity_id, embedding in stored.items():
+            await matcher.store_embedding(entity_id, embedding)
 
         results = await matcher.find_similar(query_embed, top_k=2)
         assert len(results) == 2
@@ -0,0 +1,83 @@
+"""Tests for the chunked group-resolution executor."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from music_attribution.resolution.executor import ExecutorConfig, GroupResolutionExecutor
+from music_attribution.resolution.orchestrator import ResolutionOrchestrator
+from music_attribution.schemas.enums import EntityTypeEnum, SourceEnum
+from music_attribution.schemas.normalized import IdentifierBundle, NormalizedRecord
+
+
+def _square_chunk(chunk: list[int]) -> list[int]:
+    """Module-level (picklable) chunk function."""
+    return [x * x for x in chunk]
+
+
+def _make_record(name: str, isrc: str | None = None) -> NormalizedRecord:
+    """Create a NormalizedRecord for testing."""
+    return NormalizedRecord(
+        source=SourceEnum.MUSICBRAINZ if isrc else SourceEnum.ARTIST_INPUT,
+        source_id=str(uuid.uuid4()),
+        entity_type=EntityTypeEnum.ARTIST,
+        canonical_name=name,
+        identifiers=IdentifierBundle(isrc=isrc) if isrc else IdentifierBundle(),
+        fetch_timestamp=datetime.now(UTC),
+        source_confidence=0.9,
+    )
+
+
+def _records() -> list[NormalizedRecord]:
+    """A small batch mixing identifier, fuzzy and singleton groups."""
+    records = [_make_record("The Beatles", isrc="GBAYE0601690"), _make_record("Beatles", isrc="GBAYE0601690")]
+    records += [_make_record("Imogen Heap"), _make_record("Imogen  Heap"), _make_record("Mozart")]
+    records += [_make_record(f"Artist {i:03d} Zq{i}") for i in range(20)]
+    return records
+
+
+def _summary(entities) -> list[tuple[str, int, str]]:
+    """Order-sensitive, ID-free view of resolved entities."""
+    return [(e.canonical_name, len(e.source_records), e.resolution_method.value) for e in entities]
+
+
+class TestGroupResolutionExecutor:
+    """Tests for chunking and ordering."""
+
+    @pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+    async def test_results_preserve_input_order(self, backend) -> None:
+        """Test that every backend returns chunk results in input order."""
+        config = ExecutorConfig(backend=backend, max_workers=2, chunk_size=7, min_parallel=0)
+        with GroupResolutionExecutor(config) as executor:
+            results = await executor.map_chunks(_square_chunk, list(range(100)))
+        assert results == [x * x for x in range(100)]
+
+    async def test_small_batches_run_inline(self) -> None:
+        """Test that batches below min_parallel never start a pool."""
+        executor = GroupResolutionExecutor(ExecutorConfig(backend="process", min_parallel=10))
+        assert await executor.map_chunks(_square_chunk, [1, 2, 3]) == [1, 4, 9]
+        assert executor._pool is None
+
+    async def test_empty_input(self) -> None:
+        """Test that an empty batch yields no results."""
+        executor = GroupResolutionExecutor(ExecutorConfig(backend="thread", min_parallel=0))
+        assert await executor.map_chunks(_square_chunk, []) == []
+
+
+class TestParallelResolve:
+    """Tests for ResolutionOrchestrator.resolve with a pool executor."""
+
+    @pytest.mark.parametrize("backend", ["thread", "process"])
+    async def test_matches_serial_resolution(self, backend) -> None:
+        """Test that pooled group resolution matches the serial result and order."""
+        records = _records()
+        serial = await ResolutionOrchestrator().resolve(records)
+
+        config = ExecutorConfig(backend=backend, max_workers=2, chunk_size=4, min_parallel=0)
+        with GroupResolutionExecutor(config) as executor:
+            parallel = await ResolutionOrchestrator(executor=executor).resolve(records)
+
+        assert _summary(parallel) == _summary(serial)
@@ -0,0 +1,129 @@
+"""Tests for the CSR adjacency index behind GraphResolver."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from music_attribution.resolution.graph_index import AdjacencyIndex
+from music_attribution.resolution.graph_resolution import GraphResolver
+
+
+def _random_resolver(seed: int) -> tuple[GraphResolver, dict[str, set[str]]]:
+    """Random bipartite-ish graph plus a reference neighbor-set mapping."""
+    rng = random.Random(seed)
+    resolver = GraphResolver()
+    neighbors: dict[str, set[str]] = {}
+    nodes = [f"n{i}" for i in range(rng.randint(2, 40))]
+    for _ in range(rng.randint(0, 120)):
+        a, b = rng.choice(nodes), rng.choice(nodes)
+        resolver.add_relationship(a, b, rng.choice(["PERFORMED_ON", "WROTE"]))
+        neighbors.setdefault(a, set()).add(b)
+        neighbors.setdefault(b, set()).add(a)
+    return resolver, neighbors
+
+
+def _reference_score(neighbors: dict[str, set[str]], a: str, b: str) -> float:
+    """Set-based graph evidence score (the pre-index implementation)."""
+    na, nb = neighbors.get(a, set()), neighbors.get(b, set())
+    shared = na & nb
+    if not shared:
+        return 0.0
+    return min((len(shared) / len(na | nb) + min(len(shared) / 3.0, 1.0)) / 2.0, 1.0)
+
+
+class TestAdjacencyIndex:
+    """Tests for CSR construction, batched scoring and top-k search."""
+
+    def test_rows_are_deduplicated_and_interned(self) -> None:
+        """Test that repeated neighbors collapse and new neighbors become nodes."""
+        index = AdjacencyIndex.from_adjacency({"a": ["x", "y", "x"], "b": ["x"]})
+        assert len(index) == 4
+        assert "y" in index
+        assert index.neighbors("a") == ["x", "y"]
+        assert index.degree("a") == 2
+        assert index.degree("missing") == 0
+
+    @pytest.mark.parametrize("seed", range(8))
+    async def test_batched_scores_match_set_reference(self, seed) -> None:
+        """Test that batched scores equal per-pair set arithmetic."""
+        resolver, neighbors = _random_resolver(seed)
+        nodes = [*neighbors, "unknown"]
+        rng = random.Random(seed)
+        pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(200)]
+
+        scores = await resolver.score_graph_evidence_many(pairs)
+        assert scores == pytest.approx([_reference_score(neighbors, a, b) for a, b in pairs])
+
+    def test_shared_counts_length_mismatch(self) -> None:
+        """Test that misaligned pair sequences are rejected."""
+        with pytest.raises(ValueError, match="equal-length"):
+            AdjacencyIndex.from_adjacency({"a": ["x"]}).shared_counts(["a"], [])
+
+    def test_empty_graph(self) -> None:
+        """Test that an empty index scores unknown pairs as zero."""
+        index = AdjacencyIndex.from_adjacency({})
+        assert index.score_pairs(["a"], ["b"]).tolist() == [0.0]
+        assert index.top_k("a") == []
+
+
+class TestCandidateSearch:
+    """Tests for GraphResolver.find_candidate_matches on the index."""
+
+    @pytest.mark.parametrize("seed", range(8))
+    async def test_counts_match_two_hop_reference(self, seed) -> None:
+        """Test that candidates and order follow the two-hop shared counts."""
+        resolver, neighbors = _random_resolver(seed)
+        for entity_id in neighbors:
+            counts: dict[str, int] = {}
+            for via in neighbors[entity_id]:
+                for other in neighbors[via]:
+                    if other != entity_id:
+                        counts[other] = counts.get(other, 0) + 1
+            candidates = await resolver.find_candidate_matches(entity_id, min_shared=2)
+            assert {c for c, _ in candidates} == {c for c, n in counts.items() if n >= 2}
+            scores = [score for _, score in candidates]
+            assert scores == sorted(scores, reverse=True)
+
+    async def test_neighbor_counts_once_across_relationship_types(self) -> None:
+        """Test that parallel relationship types to one neighbor share one count."""
+        resolver = GraphResolver()
+        resolver.add_relationship("artist-a", "album-x", "PERFORMED_ON")
+        resolver.add_relationship("artist-b", "album-x", "PERFORMED_ON")
+        resolver.add_relationship("artist-b", "album-x", "PRODUCED")
+
+        assert await resolver.find_candidate_matches("artist-a", min_shared=2) == []
+        candidates = await resolver.find_candidate_matches("artist-a", min_shared=1)
+        assert candidates == [("artist-b", pytest.approx((1.0 + 1 / 3) / 2))]
+
+    async def test_hub_pruning_and_top_k(self) -> None:
+        """Test that hub neighbors are skipped and k caps the result."""
+        resolver = GraphResolver(max_hub_degree=10)
+        for album in ("album-1", "album-2"):
+            resolver.add_relationship("artist-a", album, "PERFORMED_ON")
+            resolver.add_relationship("artist-b", album, "PERFORMED_ON")
+        resolver.add_relationship("artist-c", "album-1", "PERFORMED_ON")
+        resolver.add_relationship("artist-c", "album-2", "PERFORMED_ON")
+        resolver.add_relationship("artist-c", "album-3", "PERFORMED_ON")
+        resolver.add_relationship("artist-a", "album-3", "PERFORMED_ON")
+        # A compilation label linked to many artists, including a and d
+        for i in range(20):
+            resolver.add_relationship(f"various-{i}", "label-hub", "RELEASED_ON")
+        resolver.add_relationship("artist-a", "label-hub", "RELEASED_ON")
+        resolver.add_relationship("artist-d", "label-hub", "RELEASED_ON")
+
+        candidates = await resolver.find_candidate_matches("artist-a", min_shared=1)
+        assert [c for c, _ in candidates] == ["artist-c", "artist-b"]
+
+        top = await resolver.find_candidate_matches("artist-a", min_shared=1, k=1)
+        assert [c for c, _ in top] == ["artist-c"]
+
+    async def test_index_rebuilt_after_edit(self) -> None:
+        """Test that new relationships invalidate the cached index."""
+        resolver = GraphResolver()
+        resolver.add_relationship("a", "x", "WROTE")
+        resolver.add_relationship("b", "x", "WROTE")
+        assert await resolver.score_graph_evidence("a", "b") == pytest.approx((1.0 + 1 / 3) / 2)
+        resolver.add_relationship("b", "y", "WROTE")
+        assert await resolver.score_graph_evidence("a", "b") == pytest.approx((0.5 + 1 / 3) / 2)
@@ -0,0 +1,122 @@
+"""Tests for incremental resolution against an existing entity state."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from music_attribution.resolution.incremental import ResolutionState
+from music_attribution.resolution.orchestrator import ResolutionOrchestrator
+from music_attribution.schemas.enums import EntityTypeEnum, SourceEnum
+from music_attribution.schemas.normalized import IdentifierBundle, NormalizedRecord
+
+
+def _make_record(
+    name: str,
+    source: SourceEnum = SourceEnum.ARTIST_INPUT,
+    source_id: str | None = None,
+    isrc: str | None = None,
+) -> NormalizedRecord:
+    """Create a NormalizedRecord for testing."""
+    return NormalizedRecord(
+        source=source,
+        source_id=source_id or str(uuid.uuid4()),
+        entity_type=EntityTypeEnum.ARTIST,
+        canonical_name=name,
+        identifiers=IdentifierBundle(isrc=isrc) if isrc else IdentifierBundle(),
+        fetch_timestamp=datetime.now(UTC),
+        source_confidence=0.9,
+    )
+
+
+@pytest.fixture
+def orchestrator() -> ResolutionOrchestrator:
+    """Create a ResolutionOrchestrator."""
+    return ResolutionOrchestrator()
+
+
+class TestResolveIncremental:
+    """Tests for ResolutionOrchestrator.resolve_incremental."""
+
+    async def test_empty_state_creates_entities(self, orchestrator) -> None:
+        """Test that a first run against an empty state only creates entities."""
+        state = ResolutionState()
+        delta = await orchestrator.resolve_incremental(
+            [_make_record("The Beatles"), _make_record("Beatles, The"), _make_record("Mozart")],
+            state,
+        )
+        assert len(delta.created) == 2
+        assert delta.updated == delta.merged == delta.retired == []
+        assert len(state) == 2
+
+    async def test_identifier_match_updates_existing_entity(self, orchestrator) -> None:
+        """Test that a record sharing an ISRC attaches to the existing entity."""
+        state = ResolutionState()
+        first = await orchestrator.resolve_incremental(
+            [_make_record("Hide and Seek", source=SourceEnum.MUSICBRAINZ, isrc="GBAYE0601690")],
+            state,
+        )
+        entity_id = first.created[0].entity_id
+
+        delta = await orchestrator.resolve_incremental(
+            [_make_record("Hide & Seek", source=SourceEnum.DISCOGS, isrc="GBAYE0601690")],
+            state,
+        )
+        assert delta.created == []
+        assert [e.entity_id for e in delta.updated] == [entity_id]
+        assert len(state.members(entity_id)) == 2
+
+    async def test_name_match_attaches_to_existing_entity(self, orchestrator) -> None:
+        """Test that identifier-less records attach through the name index."""
+        state = ResolutionState()
+        first = await orchestrator.resolve_incremental([_make_record("Imogen Heap")], state)
+
+        delta = await orchestrator.resolve_incremental([_make_record("Imogen  Heap")], state)
+        assert [e.entity_id for e in delta.updated] == [first.created[0].entity_id]
+
+    async def test_changed_record_replaces_previous_version(self, orchestrator) -> None:
+        """Test that re-ingesting a source record does not duplicate it."""
+        state = ResolutionState()
+        first = await orchestrator.resolve_incremental(
+            [_make_record("Imogen Heap", source_id="rec-1")],
+            state,
+        )
+        entity_id = first.created[0].entity_id
+
+        delta = await orchestrator.resolve_incremental(
+            [_make_record("Imogen Jennifer Heap", source_id="rec-1")],
+            state,
+        )
+        assert [e.entity_id for e in delta.updated] == [entity_id]
+        members = state.members(entity_id)
+        assert [m.canonical_name for m in members] == ["Imogen Jennifer Heap"]
+
+    async def test_bridging_record_merges_entities(self, orchestrator) -> None:
+        """Test that a record carrying identifiers of two entities merges them."""
+        state = ResolutionState()
+        first = await orchestrator.resolve_incremental(
+            [
+                _make_record("Frou Frou", source=SourceEnum.MUSICBRAINZ, isrc="GBAAA0000001"),
+                _make_record("Frou Frou", source=SourceEnum.DISCOGS, isrc="GBAAA0000001"),
+                _make_record("Imogen Heap", source=SourceEnum.DISCOGS, isrc="GBBBB0000002"),
+            ],
+            state,
+        )
+        survivor, absorbed = (e.entity_id for e in first.created)
+
+        bridge = _make_record("Frou Frou", source=SourceEnum.ACOUSTID, isrc="GBAAA0000001").model_copy(
+            update={"identifiers": IdentifierBundle(isrc="GBAAA0000001", mbid="mb-1")},
+        )
+        other = _make_record("Imogen Heap", source=SourceEnum.ARTIST_INPUT).model_copy(
+            update={"identifiers": IdentifierBundle(isrc="GBBBB0000002", mbid="mb-1")},
+        )
+        delta = await orchestrator.resolve_incremental([bridge, other], state)
+
+        assert delta.created == delta.updated == []
+        assert [e.entity_id for e in delta.merged] == [survivor]
+        assert delta.retired == [absorbed]
+        assert delta.merged[0].merged_from == [absorbed]
+        assert absorbed not in state
+        assert len(state.members(survivor)) == 5
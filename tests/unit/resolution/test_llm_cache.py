@@ -0,0 +1,282 @@
+"""Tests for the tiered LLM disambiguation cache."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from music_attribution.resolution.llm_cache import (
+    CacheEntry,
+    SQLiteLLMCacheStore,
+    TieredLLMCache,
+    ValkeyLLMCacheStore,
+)
+from music_attribution.resolution.llm_disambiguation import DisambiguationResult, LLMDisambiguator
+from music_attribution.schemas.enums import EntityTypeEnum, SourceEnum
+from music_attribution.schemas.normalized import IdentifierBundle, NormalizedRecord
+
+
+class _Clock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeValkey:
+    """In-memory stand-in for the subset of the async Valkey client used."""
+
+    def __init__(self) -> None:
+        self.strings: dict[str, str] = {}
+        self.expiry: dict[str, int] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.strings[key] = value
+        self.expiry[key] = ex
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.strings.pop(key, None)
+
+    async def zadd(self, name, mapping):
+        self.zsets.setdefault(name, {}).update(mapping)
+
+    async def zcard(self, name):
+        return len(self.zsets.get(name, {}))
+
+    async def zrem(self, name, *members):
+        for member in members:
+            self.zsets.get(name, {}).pop(member, None)
+
+    def _sorted(self, name):
+        return sorted(self.zsets.get(name, {}).items(), key=lambda item: item[1])
+
+    async def zremrangebyscore(self, name, _low, high):
+        bound = float(high.lstrip("("))
+        for member, _ in [item for item in self._sorted(name) if item[1] < bound]:
+            del self.zsets[name][member]
+
+    async def zrange(self, name, start, stop):
+        return [member for member, _ in self._sorted(name)[start : stop + 1]]
+
+    async def zrangebyscore(self, name, _low, high):
+        bound = float(high.lstrip("("))
+        return [member for member, score in self._sorted(name) if score < bound]
+
+    async def zrevrangebyscore(self, name, _high, low, start=0, num=None):
+        members = [member for member, score in reversed(self._sorted(name)) if score >= float(low)]
+        return members[start : start + num]
+
+    async def aclose(self):
+        pass
+
+
+def _make_record(name: str) -> NormalizedRecord:
+    """Create a NormalizedRecord for testing."""
+    return NormalizedRecord(
+        source=SourceEnum.MUSICBRAINZ,
+        source_id=f"id-{name}",
+        entity_type=EntityTypeEnum.ARTIST,
+        canonical_name=name,
+        identifiers=IdentifierBundle(mbid=str(uuid.uuid4())),
+        fetch_timestamp=datetime.now(UTC),
+        source_confidence=0.9,
+    )
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    """Deterministic clock."""
+    return _Clock()
+
+
+@pytest.fixture
+async def sqlite_store(tmp_path):
+    """SQLite store in a temporary file."""
+    store = SQLiteLLMCacheStore(tmp_path / "llm-cache.sqlite", max_entries=3)
+    yield store
+    await store.close()
+
+
+class TestTieredLLMCache:
+    """Tests for LRU, TTL and tier promotion."""
+
+    async def test_memory_lru_eviction(self, clock) -> None:
+        """Test that the least recently used entry is evicted at capacity."""
+        cache = TieredLLMCache(max_memory_entries=2, clock=clock)
+        await cache.put("a", "A")
+        await cache.put("b", "B")
+        assert await cache.get("a") == "A"  # "b" is now least recently used
+        await cache.put("c", "C")
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == "A"
+        assert cache.stats.evictions == 1
+        assert len(cache) == 2
+
+    async def test_ttl_expires_entries(self, clock) -> None:
+        """Test that entries older than the TTL are misses."""
+        cache = TieredLLMCache(ttl_seconds=60, clock=clock)
+        await cache.put("a", "A")
+        clock.now += 61
+
+        assert await cache.get("a") is None
+        assert cache.stats.expired == 1
+        assert cache.stats.misses == 1
+
+    async def test_store_hit_promotes_to_memory(self, clock, sqlite_store) -> None:
+        """Test that a durable hit is served and then cached in memory."""
+        writer = TieredLLMCache(sqlite_store, clock=clock)
+        await writer.put("k", "payload")
+
+        reader = TieredLLMCache(sqlite_store, clock=clock)
+        assert await reader.get("k") == "payload"
+        assert await reader.get("k") == "payload"
+        assert (reader.stats.store_hits, reader.stats.memory_hits) == (1, 1)
+        assert reader.stats.hit_rate == 1.0
+
+    async def test_warm_up_loads_recent_entries(self, clock, sqlite_store) -> None:
+        """Test that warm-up preloads the newest live entries only."""
+        writer = TieredLLMCache(sqlite_store, ttl_seconds=100, clock=clock)
+        await writer.put("old", "O")
+        clock.now += 150
+        await writer.put("new", "N")
+
+        reader = TieredLLMCache(sqlite_store, ttl_seconds=100, clock=clock)
+        assert await reader.warm_up() == 1
+        assert await reader.get("new") == "N"
+        assert reader.stats.memory_hits == 1
+
+    async def test_purge_expired(self, clock, sqlite_store) -> None:
+        """Test that purge removes expired entries from both tiers."""
+        cache = TieredLLMCache(sqlite_store, ttl_seconds=10, clock=clock)
+        await cache.put("a", "A")
+        clock.now += 20
+        await cache.put("b", "B")
+
+        assert await cache.purge_expired() == 1
+        assert len(cache) == 1
+        assert await sqlite_store.count() == 1
+
+
+class TestSQLiteLLMCacheStore:
+    """Tests for the SQLite durable tier."""
+
+    async def test_max_entries_drops_oldest(self, sqlite_store) -> None:
+        """Test that inserts beyond max_entries delete the oldest rows."""
+        for i in range(5):
+            await sqlite_store.put(CacheEntry(f"k{i}", str(i), float(i)))
+
+        assert await sqlite_store.count() == 3
+        assert await sqlite_store.get("k0") is None
+        assert [e.key for e in await sqlite_store.recent(10)] == ["k4", "k3", "k2"]
+
+    async def test_replace_keeps_count(self, sqlite_store) -> None:
+        """Test that rewriting a key updates it in place."""
+        await sqlite_store.put(CacheEntry("k", "old", 1.0))
+        await sqlite_store.put(CacheEntry("k", "new", 2.0))
+
+        assert await sqlite_store.count() == 1
+        assert await sqlite_store.get("k") == CacheEntry("k", "new", 2.0)
+
+    async def test_persists_across_connections(self, tmp_path) -> None:
+        """Test that entries survive reopening the file."""
+        path = tmp_path / "cache.sqlite"
+        store = SQLiteLLMCacheStore(path)
+        await store.put(CacheEntry("k", "v", 1.0))
+        await store.close()
+
+        reopened = SQLiteLLMCacheStore(path)
+        assert await reopened.count() == 1
+        assert (await reopened.get("k")).payload == "v"
+        await reopened.close()
+
+    async def test_max_entries_holds_across_connections(self, tmp_path) -> None:
+        """Test that the size bound counts rows written by other connections."""
+        path = tmp_path / "cache.sqlite"
+        first = SQLiteLLMCacheStore(path, max_entries=3)
+        second = SQLiteLLMCacheStore(path, max_entries=3)
+        for i in range(2):
+            await first.put(CacheEntry(f"a{i}", "v", float(i)))
+        for i in range(2):
+            await second.put(CacheEntry(f"b{i}", "v", float(10 + i)))
+
+        assert await first.count() == 3
+        assert await first.get("a0") is None
+        await first.close()
+        await second.close()
+
+
+class TestValkeyLLMCacheStore:
+    """Tests for the Valkey durable tier against an in-memory client."""
+
+    async def test_round_trip_with_expiry(self) -> None:
+        """Test that entries round-trip and carry the server-side TTL."""
+        client = _FakeValkey()
+        store = ValkeyLLMCacheStore("unused", ttl_seconds=3600, client=client)
+        await store.put(CacheEntry("k", "line1\nline2", 12.5))
+
+        assert await store.get("k") == CacheEntry("k", "line1\nline2", 12.5)
+        assert client.expiry["llm-cache:k"] == 3600
+
+    async def test_max_entries_and_purge(self) -> None:
+        """Test size-bound eviction, recency order and purge."""
+        store = ValkeyLLMCacheStore("unused", max_entries=2, client=_FakeValkey())
+        for i in range(3):
+            await store.put(CacheEntry(f"k{i}", str(i), float(i)))
+
+        assert await store.get("k0") is None
+        assert [e.key for e in await store.recent(10)] == ["k2", "k1"]
+        assert await store.purge(2.0) == 1
+        assert await store.count() == 1
+
+    async def test_expired_index_members_are_dropped_on_insert(self) -> None:
+        """Test that index members past the TTL no longer count towards the size."""
+        client = _FakeValkey()
+        store = ValkeyLLMCacheStore("unused", ttl_seconds=10, max_entries=2, client=client)
+        await store.put(CacheEntry("old", "v", 0.0))
+        await store.put(CacheEntry("k1", "v", 20.0))
+
+        assert await store.count() == 1
+        assert set(client.zsets["llm-cache:index"]) == {"k1"}
+
+
+class TestDisambiguatorCache:
+    """Tests for LLMDisambiguator integration."""
+
+    async def test_decision_shared_through_durable_store(self, sqlite_store) -> None:
+        """Test that a second disambiguator reuses the first one's decision."""
+        candidates = [_make_record("A"), _make_record("B")]
+        decision = DisambiguationResult(chosen_index=1, confidence=0.8, reasoning="r", alternatives_considered=2)
+
+        first = LLMDisambiguator(cache=TieredLLMCache(sqlite_store))
+        with patch.object(first, "_call_llm", new_callable=AsyncMock, return_value=decision):
+            await first.disambiguate(candidates, context="ctx")
+
+        second = LLMDisambiguator(cache=TieredLLMCache(sqlite_store))
+        with patch.object(second, "_call_llm", new_callable=AsyncMock) as call:
+            result = await second.disambiguate(candidates, context="ctx")
+
+        call.assert_not_awaited()
+        assert result.cached
+        assert (result.chosen_index, result.confidence) == (1, 0.8)
+        assert second.cache_stats.store_hits == 1
+
+    async def test_failures_are_not_cached(self) -> None:
+        """Test that fallback results for LLM errors are not stored."""
+        disambiguator = LLMDisambiguator()
+        candidates = [_make_record("A")]
+        with patch.object(disambiguator, "_call_llm", new_callable=AsyncMock, side_effect=TimeoutError("slow")):
+            await disambiguator.disambiguate(candidates, context="ctx")
+
+        assert disambiguator.cache_stats.writes == 0
@@ -11,6 +11,7 @@ import pytest
 from music_attribution.resolution.llm_disambiguation import (
     DisambiguationResult,
     LLMDisambiguator,
+    SameEntityResult,
 )
 from music_attribution.schemas.enums import EntityTypeEnum, SourceEnum
 from music_attribution.schemas.normalized import (
@@ -131,3 +132,42 @@ class TestLLMDisambiguation:
             assert result.chosen_index is None
             assert result.confidence == 0.0
             assert "timeout" in result.reasoning.lower() or "error" in result.reasoning.lower()
+
+
+class TestSameEntityCheck:
+    """Tests for the yes/no same-entity question."""
+
+    async def test_verdict_maps_to_same_entity_confidence(self) -> None:
+        """Test that "same" keeps its confidence, "different" inverts it and undecided has none."""
+        assert SameEntityResult(is_same=True, confidence=0.8, reasoning="").same_entity_confidence == 0.8
+        assert SameEntityResult(is_same=False, confidence=0.8, reasoning="").same_entity_confidence == pytest.approx(
+            0.2
+        )
+        assert SameEntityResult(is_same=None, confidence=0.0, reasoning="").same_entity_confidence is None
+
+    async def test_cached_separately_from_disambiguation(self, disambiguator) -> None:
+        """Test that a same-entity verdict never answers a disambiguation for the same records."""
+        candidates = [_make_record("Cat Stevens"), _make_record("Yusuf Islam")]
+        verdict = SameEntityResult(is_same=False, confidence=0.7, reasoning="different eras")
+        pick = DisambiguationResult(chosen_index=1, confidence=0.6, reasoning="later name", alternatives_considered=2)
+
+        with (
+            patch.object(disambiguator, "_call_same_entity_llm", new_callable=AsyncMock, return_value=verdict) as check,
+            patch.object(disambiguator, "_call_llm", new_callable=AsyncMock, return_value=pick) as call,
+        ):
+            first = await disambiguator.check_same_entity(candidates, "ctx")
+            chosen = await disambiguator.disambiguate(candidates, "ctx")
+            again = await disambiguator.check_same_entity(candidates, "ctx")
+
+        assert (first.is_same, chosen.chosen_index) == (False, 1)
+        assert again.cached
+        assert (check.await_count, call.await_count) == (1, 1)
+
+    async def test_failure_is_undecided(self, disambiguator) -> None:
+        """Test that an LLM error yields no verdict rather than a "different" answer."""
+        with patch.object(disambiguator, "_call_same_entity_llm", side_effect=RuntimeError("boom")):
+            result = await disambiguator.check_same_entity([_make_record("X")])
+
+        assert result.is_same is None
+        assert result.same_entity_confidence is None
+        assert result.reasoning == "LLM error: boom"
@@ -0,0 +1,310 @@
+"""Tests for LLM request coalescing and micro-batching."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from music_attribution.resolution.cascade import CascadeConfig
+from music_attribution.resolution.llm_disambiguation import (
+    BatchSameEntityResult,
+    DisambiguationRequest,
+    DisambiguationResult,
+    LLMDisambiguator,
+    SameEntityResult,
+)
+from music_attribution.resolution.llm_scheduler import DisambiguationScheduler, SchedulerConfig
+from music_attribution.resolution.orchestrator import ResolutionOrchestrator
+from music_attribution.schemas.enums import EntityTypeEnum, SourceEnum
+from music_attribution.schemas.normalized import IdentifierBundle, NormalizedRecord
+
+
+class _FakeBatchLLM:
+    """Local stand-in for a batched LLM endpoint that records its calls."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.batches: list[list[str]] = []
+        self.delay = delay
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def __call__(self, requests: list[str]) -> list[str | BaseException]:
+        self.batches.append(list(requests))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return [ValueError(r) if r.startswith("bad") else r.upper() for r in requests]
+
+
+class _FakeDisambiguator(LLMDisambiguator):
+    """Disambiguator whose batch call packs all requests into one fake response."""
+
+    def __init__(self, config: SchedulerConfig) -> None:
+        super().__init__(scheduler=config)
+        self.batch_sizes: list[int] = []
+
+    async def _call_llm_batch(self, requests: list[DisambiguationRequest]) -> list[DisambiguationResult]:
+        self.batch_sizes.append(len(requests))
+        return [
+            DisambiguationResult(
+                chosen_index=0,
+                confidence=0.9,
+                reasoning=f"batched: {r.context}",
+                alternatives_considered=len(r.candidates),
+            )
+            for r in requests
+        ]
+
+    async def _call_same_entity_batch(self, requests: list[DisambiguationRequest]) -> list[SameEntityResult]:
+        self.batch_sizes.append(len(requests))
+        return [SameEntityResult(is_same=True, confidence=0.9, reasoning=f"batched: {r.context}") for r in requests]
+
+
+class _StructuredBatchLLM(LLMDisambiguator):
+    """Disambiguator backed by a fake structured endpoint that counts round trips.
+
+    Each reply answers the numbered requests in reverse order, with the
+    request's context as the reasoning, so tests can check the matching.
+    """
+
+    def __init__(self, config: SchedulerConfig, *, reply: str = "ok") -> None:
+        super().__init__(scheduler=config)
+        self.prompts: list[str] = []
+        self.reply = reply
+
+    async def _call_llm_structured(self, prompt, result_type):
+        self.prompts.append(prompt)
+        if self.reply == "raise":
+            raise ConnectionError("endpoint down")
+        contexts = [line.removeprefix("Context: ") for line in prompt.splitlines() if line.startswith("Context: ")]
+        numbered = list(enumerate(contexts, start=1))
+        if self.reply == "short":
+            numbered = numbered[:-1]
+        if result_type is BatchSameEntityResult:
+            items = [{"request": n, "is_same": True, "confidence": 0.8, "reasoning": c} for n, c in numbered]
+        else:
+            items = [
+                {"request": n, "chosen_index": 0, "confidence": 0.8, "reasoning": c, "alternatives_considered": 1}
+                for n, c in numbered
+            ]
+        return result_type.model_validate({"results": items[::-1]})
+
+    async def _call_llm(self, *_args, **_kwargs):
+        raise AssertionError("packed batches must not fall back to _call_llm")
+
+
+def _make_record(
+    name: str, isrc: str = "GB0000000009", source: SourceEnum = SourceEnum.MUSICBRAINZ
+) -> NormalizedRecord:
+    """Create a NormalizedRecord for testing."""
+    return NormalizedRecord(
+        source=source,
+        source_id=str(uuid.uuid4()),
+        entity_type=EntityTypeEnum.ARTIST,
+        canonical_name=name,
+        identifiers=IdentifierBundle(isrc=isrc),
+        fetch_timestamp=datetime.now(UTC),
+        source_confidence=0.9,
+    )
+
+
+class TestDisambiguationScheduler:
+    """Tests for coalescing, batching and the concurrency limit."""
+
+    async def test_identical_keys_coalesce(self) -> None:
+        """Test that concurrent requests with one key make one call."""
+        llm = _FakeBatchLLM()
+        scheduler = DisambiguationScheduler(llm)
+        results = await asyncio.gather(*(scheduler.submit("k", "same") for _ in range(5)))
+
+        assert results == ["SAME"] * 5
+        assert llm.batches == [["same"]]
+        assert scheduler.stats.coalesced == 4
+
+    async def test_distinct_requests_packed_into_batches(self) -> None:
+        """Test that queued requests are sent max_batch_size at a time."""
+        llm = _FakeBatchLLM()
+        scheduler = DisambiguationScheduler(llm, SchedulerConfig(max_batch_size=4, max_wait_seconds=1.0))
+        requests = [f"r{i}" for i in range(10)]
+        submitted = [asyncio.ensure_future(scheduler.submit(r, r)) for r in requests]
+        await asyncio.sleep(0)
+        await scheduler.drain()
+
+        assert [len(batch) for batch in llm.batches] == [4, 4, 2]
+        assert [f.result() for f in submitted] == [r.upper() for r in requests]
+        assert scheduler.stats.mean_batch_size == pytest.approx(10 / 3)
+
+    async def test_partial_batch_sent_after_max_wait(self) -> None:
+        """Test that a lone request is flushed by the wait timer."""
+        llm = _FakeBatchLLM()
+        scheduler = DisambiguationScheduler(llm, SchedulerConfig(max_batch_size=8, max_wait_seconds=0.01))
+        result = await asyncio.wait_for(scheduler.submit("k", "solo"), timeout=1.0)
+
+        assert result == "SOLO"
+        assert llm.batches == [["solo"]]
+
+    async def test_semaphore_bounds_concurrent_batches(self) -> None:
+        """Test that no more than max_concurrency batch calls overlap."""
+        llm = _FakeBatchLLM(delay=0.01)
+        config = SchedulerConfig(max_batch_size=1, max_concurrency=2)
+        scheduler = DisambiguationScheduler(llm, config)
+        await asyncio.gather(*(scheduler.submit(f"k{i}", f"r{i}") for i in range(6)))
+
+        assert len(llm.batches) == 6
+        assert llm.peak_in_flight == 2
+
+    async def test_errors_fail_only_their_requests(self) -> None:
+        """Test that a per-item exception fails one request, not the batch."""
+        scheduler = DisambiguationScheduler(_FakeBatchLLM(), SchedulerConfig(max_batch_size=2))
+        good, bad = await asyncio.gather(
+            scheduler.submit("a", "ok"),
+            scheduler.submit("b", "bad"),
+            return_exceptions=True,
+        )
+
+        assert good == "OK"
+        assert isinstance(bad, ValueError)
+
+    async def test_result_count_mismatch_fails_batch(self) -> None:
+        """Test that a batch returning the wrong number of results fails."""
+
+        async def short(requests: list[str]) -> list[str]:
+            return requests[:1]
+
+        scheduler = DisambiguationScheduler(short, SchedulerConfig(max_batch_size=2))
+        outcomes = await asyncio.gather(scheduler.submit("a", "a"), scheduler.submit("b", "b"), return_exceptions=True)
+        assert all(isinstance(o, ValueError) for o in outcomes)
+
+
+class TestScheduledDisambiguator:
+    """Tests for LLMDisambiguator with a scheduler."""
+
+    async def test_concurrent_misses_share_one_call_and_cache(self) -> None:
+        """Test that misses are batched, coalesced and cached."""
+        llm = _FakeDisambiguator(SchedulerConfig(max_batch_size=8))
+        candidates = [[_make_record(f"Artist {i}")] for i in range(3)]
+        work = [*candidates, candidates[0]]
+        results = await asyncio.gather(*(llm.disambiguate(c, "ctx") for c in work))
+
+        assert llm.batch_sizes == [3]
+        assert all(r.confidence == 0.9 for r in results)
+        assert llm.scheduler_stats.coalesced == 1
+        assert llm.cache_stats.writes == 3
+
+        again = await llm.disambiguate(candidates[1], "ctx")
+        assert again.cached
+        assert llm.batch_sizes == [3]
+
+    async def test_default_batch_falls_back_to_call_llm(self) -> None:
+        """Test that the base batch call uses _call_llm and maps errors to fallbacks."""
+
+        class _PerCallLLM(LLMDisambiguator):
+            async def _call_llm(self, candidates, context):
+                if context == "fail":
+                    raise RuntimeError("boom")
+                return DisambiguationResult(
+                    chosen_index=0, confidence=0.6, reasoning="ok", alternatives_considered=len(candidates)
+                )
+
+        llm = _PerCallLLM(scheduler=SchedulerConfig())
+        records = [_make_record("X")]
+        ok, failed = await asyncio.gather(llm.disambiguate(records, "fine"), llm.disambiguate(records, "fail"))
+
+        assert ok.confidence == 0.6
+        assert failed.chosen_index is None
+        assert failed.reasoning == "LLM error: boom"
+
+    async def test_orchestrator_llm_stage_batches_groups(self) -> None:
+        """Test that the cascade's LLM stage sends ambiguous groups in one batch."""
+        llm = _FakeDisambiguator(SchedulerConfig(max_batch_size=8))
+        records = [
+            _make_record("Cat Stevens", "GB0000000001"),
+            _make_record("Yusuf Islam", "GB0000000001", SourceEnum.DISCOGS),
+            _make_record("Prince", "GB0000000002"),
+            _make_record("The Artist Formerly Known As Prince", "GB0000000002", SourceEnum.DISCOGS),
+        ]
+        orchestrator = ResolutionOrchestrator(llm_disambiguator=llm, cascade=CascadeConfig())
+        entities = await orchestrator.resolve(records)
+
+        assert llm.batch_sizes == [2]
+        assert all(e.resolution_details.llm_confidence == pytest.approx(0.9) for e in entities)
+        assert orchestrator.stage_stats["llm"].calls == 2
+
+
+class TestPackedBatchCalls:
+    """Tests for packing a batch into one structured LLM round trip."""
+
+    async def test_batch_is_one_round_trip_matched_by_number(self) -> None:
+        """Test that N misses make one call and each result reaches its request."""
+        llm = _StructuredBatchLLM(SchedulerConfig(max_batch_size=8))
+        contexts = [f"ctx-{i}" for i in range(5)]
+        results = await asyncio.gather(*(llm.disambiguate([_make_record(f"A{i}")], c) for i, c in enumerate(contexts)))
+
+        assert len(llm.prompts) == 1
+        assert [line for line in llm.prompts[0].splitlines() if line.startswith("Request ")] == [
+            f"Request {n}" for n in range(1, 6)
+        ]
+        assert [r.reasoning for r in results] == contexts
+        assert all(type(r) is DisambiguationResult for r in results)
+
+    async def test_misnumbered_reply_fails_each_request(self) -> None:
+        """Test that a reply with a missing result fails every request separately."""
+        llm = _StructuredBatchLLM(SchedulerConfig(), reply="short")
+        requests = [DisambiguationRequest([_make_record(f"A{i}")], f"ctx-{i}", f"k{i}") for i in range(3)]
+        outcomes = await llm._call_llm_batch(requests)
+
+        assert len(llm.prompts) == 1
+        assert all(isinstance(o, RuntimeError) and "numbered" in str(o) for o in outcomes)
+        assert len({id(o) for o in outcomes}) == 3
+
+    async def test_failed_call_gives_fallback_per_request(self) -> None:
+        """Test that a raised batch call becomes one exception per request and is not cached."""
+        llm = _StructuredBatchLLM(SchedulerConfig(max_batch_size=8), reply="raise")
+        records = [[_make_record("A")], [_make_record("B")]]
+        results = await asyncio.gather(*(llm.disambiguate(r, "ctx") for r in records))
+
+        assert len(llm.prompts) == 1
+        assert all(r.chosen_index is None and "endpoint down" in r.reasoning for r in results)
+        assert llm.cache_stats.writes == 0
+
+        outcomes = await llm._call_llm_batch([DisambiguationRequest(r, "ctx", "k") for r in records])
+        assert outcomes[0] is not outcomes[1]
+        assert isinstance(outcomes[0].__cause__, ConnectionError)
+
+    async def test_out_of_range_choice_fails_only_its_request(self) -> None:
+        """Test that a chosen_index beyond the candidates is rejected per request."""
+
+        class _BadIndex(_StructuredBatchLLM):
+            async def _call_llm_structured(self, prompt, result_type):
+                reply = await super()._call_llm_structured(prompt, result_type)
+                reply.results[0].chosen_index = 5
+                return reply
+
+        llm = _BadIndex(SchedulerConfig())
+        requests = [DisambiguationRequest([_make_record(f"A{i}")], f"ctx-{i}", f"k{i}") for i in range(2)]
+        outcomes = await llm._call_llm_batch(requests)
+
+        # The reply is reversed, so its first item answers request 2
+        assert isinstance(outcomes[0], DisambiguationResult)
+        assert isinstance(outcomes[1], ValueError)
+
+    async def test_cascade_groups_share_one_same_entity_round_trip(self) -> None:
+        """Test that the cascade's same-entity checks are packed into one call."""
+        llm = _StructuredBatchLLM(SchedulerConfig(max_batch_size=8))
+        records = [
+            _make_record("Cat Stevens", "GB0000000001"),
+            _make_record("Yusuf Islam", "GB0000000001", SourceEnum.DISCOGS),
+            _make_record("Prince", "GB0000000002"),
+            _make_record("The Artist Formerly Known As Prince", "GB0000000002", SourceEnum.DISCOGS),
+        ]
+        entities = await ResolutionOrchestrator(llm_disambiguator=llm, cascade=CascadeConfig()).resolve(records)
+
+        assert len(llm.prompts) == 1
+        assert llm.prompts[0].startswith("For each numbered request, decide whether")
+        assert all(e.resolution_details.llm_confidence == pytest.approx(0.8) for e in entities)
@@ -0,0 +1,133 @@
+"""Tests for the persistent trigram name index."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from music_attribution.db.models import ResolvedEntityModel
+from music_attribution.resolution.name_index import NameIndex
+
+_BEATLES = uuid.uuid5(uuid.NAMESPACE_DNS, "beatles")
+_HEAP = uuid.uuid5(uuid.NAMESPACE_DNS, "imogen-heap")
+_HIDE = uuid.uuid5(uuid.NAMESPACE_DNS, "hide-and-seek")
+
+
+@pytest.fixture
+def index() -> NameIndex:
+    """Create a NameIndex with three entities."""
+    idx = NameIndex()
+    idx.add(_BEATLES, ["The Beatles", "Fab Four"], entity_type="ARTIST")
+    idx.add(_HEAP, ["Imogen Heap"], entity_type="ARTIST")
+    idx.add(_HIDE, ["Hide and Seek"], entity_type="WORK")
+    return idx
+
+
+@pytest.fixture
+async def async_session():
+    """Create an in-memory SQLite database with two resolved entities."""
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(ResolvedEntityModel.__table__.create)
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        for eid, name, alternatives, etype in [
+            (_HEAP, "Imogen Heap", ["Heap, Imogen"], "ARTIST"),
+            (_HIDE, "Hide and Seek", [], "WORK"),
+        ]:
+            session.add(
+                ResolvedEntityModel(
+                    entity_id=eid,
+                    entity_type=etype,
+                    canonical_name=name,
+                    alternative_names=json.dumps(alternatives),
+                    identifiers=json.dumps({}),
+                    source_records=json.dumps([]),
+                    resolution_method="test",
+                    resolution_confidence=0.9,
+                    resolution_details=json.dumps({}),
+                    assurance_level="LEVEL_1",
+                    conflicts=json.dumps([]),
+                    needs_review=False,
+                    resolved_at=datetime.now(UTC),
+                ),
+            )
+        await session.commit()
+
+    async with factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+class TestNameIndex:
+    """Tests for NameIndex lookup, updates and persistence."""
+
+    def test_query_finds_reordered_name(self, index) -> None:
+        """Test that 'Beatles, The' finds the indexed 'The Beatles'."""
+        hits = index.query("Beatles, The")
+        assert [h.entity_id for h in hits] == [_BEATLES]
+        assert hits[0].name == "The Beatles"
+        assert hits[0].score == 1.0
+
+    def test_query_matches_alternative_name(self, index) -> None:
+        """Test that alternative names are indexed."""
+        hits = index.query("Fab Four")
+        assert hits[0].entity_id == _BEATLES
+
+    def test_query_tolerates_typo(self, index) -> None:
+        """Test that a single-character typo still matches."""
+        hits = index.query("Imogen Heep")
+        assert [h.entity_id for h in hits] == [_HEAP]
+
+    def test_unrelated_name_returns_nothing(self, index) -> None:
+        """Test that dissimilar names produce no hits."""
+        assert index.query("Johann Sebastian Bach") == []
+
+    def test_entity_type_filter(self, index) -> None:
+        """Test that lookups can be restricted to one entity type."""
+        assert index.query("Hide and Seek", entity_type="ARTIST") == []
+        assert index.query("Hide and Seek", entity_type="WORK")[0].entity_id == _HIDE
+
+    def test_remove_and_readd(self, index) -> None:
+        """Test that removal hides an entity and re-adding replaces names."""
+        assert index.remove(_HEAP)
+        assert index.query("Imogen Heap") == []
+        assert not index.remove(_HEAP)
+
+        index.add(_BEATLES, ["Frou Frou"], entity_type="ARTIST")
+        assert index.query("The Beatles") == []
+        assert index.query("Frou Frou")[0].entity_id == _BEATLES
+        assert len(index) == 2
+
+    def test_save_load_round_trip(self, index, tmp_path) -> None:
+        """Test that a saved index answers the same queries after loading."""
+        path = tmp_path / "names.json"
+        index.remove(_HIDE)
+        index.save(path)
+
+        loaded = NameIndex.load(path)
+        assert len(loaded) == 2
+        assert _HIDE not in loaded
+        assert loaded.query("Beatles, The") == index.query("Beatles, The")
+
+    def test_load_rejects_unknown_version(self, tmp_path) -> None:
+        """Test that an incompatible file format is rejected."""
+        path = tmp_path / "names.json"
+        path.write_text(json.dumps({"version": 99, "ngram_size": 3, "entities": []}), encoding="utf-8")
+        with pytest.raises(ValueError, match="format version"):
+            NameIndex.load(path)
+
+    async def test_load_from_db(self, async_session) -> None:
+        """Test that resolved_entities rows are indexed with alternative names."""
+        idx = NameIndex()
+        count = await idx.load_from_db(session=async_session, entity_type="ARTIST")
+        assert count == 1
+        hits = idx.query("Heap, Imogen")
+        assert hits[0].entity_id == _HEAP
+        assert hits[0].score == 1.0
@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 
 import pytest
 
+from music_attribution.resolution.name_index import NameIndex
 from music_attribution.resolution.orchestrator import ResolutionOrchestrator
 from music_attribution.schemas.enums import (
     AssuranceLevelEnum,
@@ -122,3 +123,37 @@ class TestResolutionOrchestrator:
         assert len(entities) == 1
         details = entities[0].resolution_details
         assert isinstance(details.matched_identifiers, list)
+
+    async def test_each_name_normalized_once_per_resolve(self, orchestrator, monkeypatch) -> None:
+        """Test that resolve() normalizes every record name exactly once."""
+        calls: list[str] = []
+        original = orchestrator._string_matcher.normalize
+
+        def counting_normalize(name: str) -> str:
+            calls.append(name)
+            return original(name)
+
+        monkeypatch.setattr(orchestrator._string_matcher, "normalize", counting_normalize)
+        records = [
+            _make_record("The Beatles", source=SourceEnum.ARTIST_INPUT),
+            _make_record("Beatles, The", source=SourceEnum.FILE_METADATA),
+            _make_record("Mozart", source=SourceEnum.ARTIST_INPUT),
+        ]
+        entities = await orchestrator.resolve(records)
+        assert len(entities) == 2
+        assert sorted(calls) == sorted(r.canonical_name for r in records)
+
+    def test_find_existing_matches_uses_name_index(self) -> None:
+        """Test that records are matched against indexed resolved entities."""
+        existing = uuid.uuid4()
+        index = NameIndex()
+        index.add(existing, ["The Beatles"], entity_type=str(EntityTypeEnum.ARTIST))
+        orchestrator = ResolutionOrchestrator(name_index=index)
+
+        records = [
+            _make_record("Beatles, The", source=SourceEnum.ARTIST_INPUT),
+            _make_record("Mozart", source=SourceEnum.ARTIST_INPUT),
+        ]
+        matches = orchestrator.find_existing_matches(records)
+        assert [h.entity_id for h in matches[0]] == [existing]
+        assert matches[1] == []
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import logging
+
 import pytest
 
 from music_attribution.resolution.splink_linkage import SplinkMatcher
@@ -105,3 +107,264 @@ class TestSplinkMatcher:
         # Should not raise
         predictions = matcher.predict(records)
         assert isinstance(predictions, pd.DataFrame)
+
+    def test_cluster_includes_unpaired_ids(self, matcher) -> None:
+        """Test that unique_ids adds records without predictions as singletons."""
+        import pandas as pd
+
+        predictions = pd.DataFrame({"unique_id_l": [1], "unique_id_r": [2], "match_probability": [0.95]})
+        assert matcher.cluster(predictions, unique_ids=[1, 2, 3, 4]) == [[1, 2], [3], [4]]
+
+
+class TestFallbackPredict:
+    """Tests for the vectorized exact-match fallback."""
+
+    @staticmethod
+    def _reference(columns: list[str], records) -> list[tuple[int, int, float]]:
+        """Naive pairwise agreement fraction, keeping pairs that agree at all."""
+        rows = records.to_dict("records")
+        pairs = []
+        for i, left in enumerate(rows):
+            for right in rows[i + 1 :]:
+                agree = sum(
+                    left.get(c) is not None and right.get(c) is not None and left.get(c) == right.get(c)
+                    for c in columns
+                )
+                if agree:
+                    pairs.append((left["unique_id"], right["unique_id"], agree / len(columns)))
+        return pairs
+
+    def test_blocks_on_comparison_columns(self, matcher) -> None:
+        """Test that only pairs sharing a column value are emitted, with agreement fractions."""
+        import pandas as pd
+
+        records = pd.DataFrame(
+            {
+                "unique_id": [10, 11, 12, 13],
+                "canonical_name": ["Beatles", "Beatles", "Stones", "Beatles"],
+                "isrc": ["GB1", "GB1", None, None],
+            }
+        )
+        matcher.configure_model(["canonical_name", "isrc"])
+        predictions = matcher._fallback_predict(records)
+        assert list(predictions.itertuples(index=False, name=None)) == [
+            (10, 11, 1.0),
+            (10, 13, 0.5),
+            (11, 13, 0.5),
+        ]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_pairwise_reference(self, matcher, seed) -> None:
+        """Test that the self-join agrees with naive pairwise comparison."""
+        import random
+
+        import pandas as pd
+
+        rng = random.Random(seed)
+        size = rng.randint(0, 60)
+        records = pd.DataFrame(
+            {
+                "unique_id": range(100, 100 + size),
+                "canonical_name": [rng.choice(["A", "B", "C", None]) for _ in range(size)],
+                "isrc": [rng.choice(["X", "Y", None]) for _ in range(size)],
+            }
+        )
+        columns = ["canonical_name", "isrc", "absent"]
+        matcher.configure_model(columns)
+        predictions = matcher._fallback_predict(records)
+        assert list(predictions.columns) == ["unique_id_l", "unique_id_r", "match_probability"]
+        assert list(predictions.itertuples(index=False, name=None)) == pytest.approx(self._reference(columns, records))
+
+
+class TestModelPersistence:
+    """Tests for saving, reloading and drift-gated re-training."""
+
+    @staticmethod
+    def _records(names: list[str]):
+        """Records with a unique_id and canonical_name/isrc columns."""
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                "unique_id": range(len(names)),
+                "canonical_name": names,
+                "isrc": [f"GB{i % 3}" for i in range(len(names))],
+            }
+        )
+
+    @pytest.fixture
+    def trained(self, matcher):
+        """A matcher with recorded training data (fallback mode, no Splink run)."""
+        matcher.configure_model(["canonical_name", "isrc"])
+        matcher._record_training_data(self._records(["A", "B", "C", "A"]))
+        return matcher
+
+    def test_training_hash_ignores_row_order(self) -> None:
+        """Test that the content hash is order-independent but value-sensitive."""
+        from music_attribution.resolution.splink_linkage import training_data_hash
+
+        columns = ["canonical_name", "isrc"]
+        records = self._records(["A", "B", "C"])
+        shuffled = records.iloc[::-1].reset_index(drop=True)
+        assert training_data_hash(records, columns) == training_data_hash(shuffled, columns)
+        assert training_data_hash(records, columns) != training_data_hash(self._records(["A", "B", "D"]), columns)
+        assert training_data_hash(records, columns) != training_data_hash(records, ["canonical_name"])
+
+    def test_profile_drift(self) -> None:
+        """Test that drift is the largest change of any profile statistic."""
+        from music_attribution.resolution.splink_linkage import data_profile, profile_drift
+
+        columns = ["canonical_name", "isrc"]
+        base = data_profile(self._records(["A", "B", "C", "D"]), columns)
+        assert profile_drift(base, base) == 0.0
+        skewed = data_profile(self._records(["A", "A", "A", "A"]), columns)
+        assert profile_drift(base, skewed) == pytest.approx(0.75)
+        assert profile_drift(base, data_profile(self._records(["A"]), ["isrc"])) == 1.0
+
+    def test_save_requires_training(self, matcher, tmp_path) -> None:
+        """Test that saving an untrained matcher is rejected."""
+        matcher.configure_model(["canonical_name"])
+        with pytest.raises(RuntimeError, match="No trained parameters"):
+            matcher.save_model(tmp_path / "model.json")
+
+    def test_round_trip(self, trained, tmp_path) -> None:
+        """Test that load_model restores columns, hash and profile."""
+        path = tmp_path / "model.json"
+        trained.save_model(path)
+
+        loaded = SplinkMatcher()
+        loaded.load_model(path)
+        assert loaded._model_configured
+        assert loaded._comparison_columns == ["canonical_name", "isrc"]
+        assert loaded._training_hash == trained._training_hash
+        assert loaded._training_profile == trained._training_profile
+
+    def test_unsupported_version_rejected(self, trained, tmp_path) -> None:
+        """Test that files from another format version are refused."""
+        import json
+
+        path = tmp_path / "model.json"
+        trained.save_model(path)
+        payload = json.loads(path.read_text())
+        payload["version"] = 99
+        path.write_text(json.dumps(payload))
+        with pytest.raises(ValueError, match="format version"):
+            SplinkMatcher().load_model(path)
+
+    def test_fit_or_load_reuses_model_until_drift(self, trained, tmp_path, monkeypatch) -> None:
+        """Test that re-estimation only runs for new columns or drifted data."""
+        path = tmp_path / "model.json"
+        trained.save_model(path)
+
+        matcher = SplinkMatcher()
+        calls: list[int] = []
+        monkeypatch.setattr(matcher, "estimate_parameters", lambda records: calls.append(len(records)))
+        monkeypatch.setattr(matcher, "save_model", lambda _: None)
+        matcher.configure_model(["canonical_name", "isrc"])
+
+        # Same data, reordered: hash matches
+        assert not matcher.fit_or_load(self._records(["A", "C", "B", "A"]), path)
+        # Different values, similar profile: within threshold
+        assert not matcher.fit_or_load(self._records(["A", "B", "D", "A"]), path)
+        # Collapsed name distribution: drift past threshold
+        assert matcher.fit_or_load(self._records(["A", "A", "A", "A"]), path)
+        # Changed comparison columns always re-train
+        matcher.configure_model(["canonical_name"])
+        assert matcher.fit_or_load(self._records(["A", "B", "C", "A"]), path)
+        assert calls == [4, 4]
+
+    def test_loaded_fallback_model_predicts_new_batch(self, trained, tmp_path) -> None:
+        """Test that a loaded model without Splink settings predicts via the fallback."""
+        path = tmp_path / "model.json"
+        trained.save_model(path)
+        loaded = SplinkMatcher()
+        loaded.load_model(path)
+        predictions = loaded.predict(self._records(["X", "X", "Y"]), warm_start=True)
+        assert set(zip(predictions["unique_id_l"], predictions["unique_id_r"], strict=True)) == {(0, 1)}
+
+
+class TestStreamingPrediction:
+    """Tests for chunked prediction and incremental clustering."""
+
+    @staticmethod
+    def _records(size: int):
+        """Records forming entities of three with a shared name and ISRC."""
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                "unique_id": range(size),
+                "canonical_name": [f"Artist {i // 3}" for i in range(size)],
+                "isrc": [f"GB{i // 3:05d}" if i % 3 else None for i in range(size)],
+            }
+        )
+
+    @staticmethod
+    def _splink_settings(records) -> dict:
+        """Untrained Splink settings (default m/u) for warm-starting."""
+        import splink.comparison_library as cl
+        from splink import DuckDBAPI, Linker, SettingsCreator, block_on
+
+        settings = SettingsCreator(
+            link_type="dedupe_only",
+            comparisons=[cl.ExactMatch(col) for col in ("canonical_name", "isrc")],
+            blocking_rules_to_generate_predictions=[block_on(col) for col in ("canonical_name", "isrc")],
+        )
+        return Linker(records, settings, db_api=DuckDBAPI()).misc.save_model_to_json()
+
+    @staticmethod
+    def _pairs(batches) -> set[tuple[int, int]]:
+        """Flatten streamed chunks into a set of ID pairs."""
+        return {
+            (int(left), int(right))
+            for batch in batches
+            for left, right in zip(batch.unique_id_l, batch.unique_id_r, strict=True)
+        }
+
+    def test_fallback_batches_are_bounded_and_filtered(self, matcher) -> None:
+        """Test that fallback streaming slices the above-threshold pairs."""
+        records = self._records(30)
+        matcher.configure_model(["canonical_name", "isrc"])
+        batches = list(matcher.predict_batches(records, threshold=0.75, batch_size=4))
+
+        assert all(len(b.unique_id_l) <= 4 for b in batches)
+        streamed = self._pairs(batches)
+        expected = matcher._fallback_predict(records)
+        expected = expected[expected["match_probability"] >= 0.75]
+        assert streamed == set(zip(expected["unique_id_l"], expected["unique_id_r"], strict=True))
+
+    def test_splink_stream_matches_materialized_predict(self, matcher, caplog) -> None:
+        """Test that the Arrow stream returns the thresholded Splink pairs."""
+        records = self._records(60)
+        matcher.configure_model(["canonical_name", "isrc"])
+        matcher._settings = self._splink_settings(records)
+
+        with caplog.at_level(logging.WARNING, logger="music_attribution.resolution.splink_linkage"):
+            batches = list(matcher.predict_batches(records, threshold=0.5, batch_size=16))
+        assert "fallback" not in caplog.text
+        full = matcher.predict(records)
+        full = full[full["match_probability"] >= 0.5]
+
+        assert len(batches) > 1
+        assert all(len(b.unique_id_l) <= 16 for b in batches)
+        streamed = self._pairs(batches)
+        assert streamed == set(zip(full["unique_id_l"], full["unique_id_r"], strict=True))
+
+    def test_predict_clusters_matches_cluster(self, matcher) -> None:
+        """Test that streamed clustering equals clustering the full frame."""
+        records = self._records(31)
+        matcher.configure_model(["canonical_name", "isrc"])
+        streamed = matcher.predict_clusters(records, threshold=0.5, batch_size=3)
+        full = matcher.cluster(matcher.predict(records), 0.5, unique_ids=records["unique_id"])
+        assert streamed == full
+        assert streamed[-1] == [30]
+
+    def test_cluster_batches_rejects_unknown_ids(self, matcher) -> None:
+        """Test that pairs referencing unknown records are rejected."""
+        import numpy as np
+
+        from music_attribution.resolution.splink_linkage import PairBatch
+
+        batch = PairBatch(np.array([1]), np.array([99]), np.array([0.9]))
+        with pytest.raises(ValueError, match="missing from unique_ids"):
+            matcher.cluster_batches([batch], [1, 2, 3])
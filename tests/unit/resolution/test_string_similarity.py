@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import re
+import unicodedata
+
 import pytest
 
-from music_attribution.resolution.string_similarity import StringSimilarityMatcher
+from music_attribution.resolution.string_similarity import (
+    _ABBREVIATIONS,
+    StringSimilarityMatcher,
+    _normalize_name,
+)
 
 
 @pytest.fixture
@@ -51,3 +58,110 @@ class TestStringSimilarityMatcher:
         lenient_candidates = lenient.find_candidates("Beatles", ["The Beatles"])
 
         assert len(lenient_candidates) >= len(strict_candidates)
+
+
+class TestNormalization:
+    """Tests for the cached, single-pass name normalization."""
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "Jay-Z feat. Kanye West",
+            "Jay-Z ft Kanye West",
+            "Prod. by Someone & Co",
+            "Vienna Phil. Orch. vs. Berlin Symph.",
+            "Beatles, The",
+        ],
+    )
+    def test_single_pass_matches_sequential_expansion(self, raw) -> None:
+        """Test that the precompiled alternation equals one re.sub per abbreviation."""
+        expected = unicodedata.normalize("NFD", raw)
+        expected = "".join(c for c in expected if unicodedata.category(c) != "Mn").lower().strip()
+        if expected.endswith(", the"):
+            expected = "the " + expected[:-5]
+        for abbrev, expansion in _ABBREVIATIONS.items():
+            expected = re.sub(r"\b" + re.escape(abbrev) + r"\b", expansion, expected, flags=re.IGNORECASE)
+        expected = re.sub(r"\s+", " ", expected).strip()
+        assert _normalize_name(raw) == expected
+
+    def test_normalized_names_are_memoized(self) -> None:
+        """Test that repeated normalization of a name hits the LRU cache."""
+        _normalize_name.cache_clear()
+        _normalize_name("Imogen Heap")
+        _normalize_name("Imogen Heap")
+        info = _normalize_name.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_prenormalized_score_matches_raw(self, matcher) -> None:
+        """Test that the pre-normalized fast path yields identical scores."""
+        a, b = "Björk feat. Thom Yorke", "Bjork featuring Thom Yorke"
+        fast = matcher.score(matcher.normalize(a), matcher.normalize(b), normalized=True)
+        assert fast == matcher.score(a, b)
+
+    def test_prenormalized_find_candidates(self, matcher) -> None:
+        """Test that find_candidates accepts a pre-normalized corpus."""
+        corpus = [matcher.normalize(n) for n in ["Beatles, The", "Mozart"]]
+        candidates = matcher.find_candidates(matcher.normalize("The Beatles"), corpus, normalized=True)
+        assert [name for name, _ in candidates] == ["the beatles"]
+
+
+_BATCH_NAMES = [
+    "The Beatles",
+    "Beatles, The",
+    "Björk",
+    "Bjork",
+    "Elton John",
+    "John Elton",
+    "Jay-Z feat. Kanye West",
+    "Jay-Z ft Kanye West",
+    "Mozart",
+    "",
+]
+
+
+class TestBatchScoring:
+    """Tests for the vectorized score_matrix / score_pairs / top_k API."""
+
+    def test_score_matrix_matches_pairwise_score(self, matcher) -> None:
+        """Test that every matrix cell equals the scalar score()."""
+        matrix = matcher.score_matrix(_BATCH_NAMES, _BATCH_NAMES)
+        assert matrix.shape == (len(_BATCH_NAMES), len(_BATCH_NAMES))
+        for i, a in enumerate(_BATCH_NAMES):
+            for j, b in enumerate(_BATCH_NAMES):
+                assert matrix[i, j] == pytest.approx(matcher.score(a, b), abs=1e-12)
+
+    def test_score_pairs_matches_pairwise_score(self, matcher) -> None:
+        """Test that aligned pair scoring equals the scalar score()."""
+        left, right = _BATCH_NAMES[::2], _BATCH_NAMES[1::2]
+        scores = matcher.score_pairs(left, right)
+        assert scores.tolist() == pytest.approx([matcher.score(a, b) for a, b in zip(left, right, strict=True)])
+
+    def test_score_pairs_length_mismatch_raises(self, matcher) -> None:
+        """Test that misaligned pair inputs are rejected."""
+        with pytest.raises(ValueError, match="equal-length"):
+            matcher.score_pairs(["a", "b"], ["a"])
+
+    def test_empty_inputs_return_empty_arrays(self, matcher) -> None:
+        """Test that empty batches return correctly shaped arrays."""
+        assert matcher.score_matrix(["a"], []).shape == (1, 0)
+        assert matcher.score_pairs([], []).shape == (0,)
+
+    def test_top_k_returns_best_matches_in_order(self, matcher) -> None:
+        """Test that top_k returns corpus indices sorted by score."""
+        corpus = ["Mozart", "Beatles, The", "Bach", "The Beatles"]
+        indices, scores = matcher.top_k("The Beatles", corpus, k=2)
+        assert sorted(indices.tolist()) == [1, 3]
+        assert scores.tolist() == [1.0, 1.0]
+
+    def test_top_k_applies_threshold(self, matcher) -> None:
+        """Test that top_k drops results below the threshold."""
+        indices, scores = matcher.top_k("The Beatles", ["Mozart", "Beatles, The"], k=5, threshold=0.85)
+        assert indices.tolist() == [1]
+        assert scores[0] >= 0.85
+
+    def test_workers_do_not_change_scores(self) -> None:
+        """Test that multi-threaded scoring matches single-threaded scoring."""
+        single = StringSimilarityMatcher(workers=1).score_matrix(_BATCH_NAMES, _BATCH_NAMES)
+        multi = StringSimilarityMatcher(workers=-1).score_matrix(_BATCH_NAMES, _BATCH_NAMES)
+        assert (single == multi).all()
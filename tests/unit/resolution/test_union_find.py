@@ -0,0 +1,83 @@
+"""Tests for the array-backed disjoint-set."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from music_attribution.resolution.union_find import DisjointSet
+
+
+def _reference_groups(size: int, edges: list[tuple[int, int]]) -> list[list[int]]:
+    """Naive transitive closure for cross-checking."""
+    label = list(range(size))
+    changed = True
+    while changed:
+        changed = False
+        for a, b in edges:
+            low = min(label[a], label[b])
+            if label[a] != low or label[b] != low:
+                label[a] = label[b] = low
+                changed = True
+    groups: dict[int, list[int]] = {}
+    for i in range(size):
+        groups.setdefault(label[i], []).append(i)
+    return sorted(groups.values())
+
+
+class TestDisjointSet:
+    """Tests for scalar/bulk union and component extraction."""
+
+    def test_union_and_find(self) -> None:
+        """Test that scalar unions merge sets and report new merges only."""
+        forest = DisjointSet(4)
+        assert forest.union(0, 1)
+        assert forest.union(2, 1)
+        assert not forest.union(0, 2)
+        assert forest.find(0) == forest.find(2)
+        assert forest.find(3) == 3
+
+    def test_union_pairs_counts_merges(self) -> None:
+        """Test that bulk union returns the number of merges performed."""
+        forest = DisjointSet(6)
+        merges = forest.union_pairs(np.array([0, 1, 3, 0]), np.array([1, 2, 4, 2]))
+        assert merges == 3
+        assert forest.groups() == [[0, 1, 2], [3, 4], [5]]
+
+    def test_groups_min_size_and_order(self) -> None:
+        """Test that groups are ordered by smallest member and filtered by size."""
+        forest = DisjointSet(6)
+        forest.union_pairs(np.array([5, 4]), np.array([1, 2]))
+        assert forest.groups(min_size=2) == [[1, 5], [2, 4]]
+
+    def test_mismatched_lengths_raise(self) -> None:
+        """Test that misaligned edge arrays are rejected."""
+        with pytest.raises(ValueError, match="equal-length"):
+            DisjointSet(3).union_pairs(np.array([0, 1]), np.array([2]))
+
+    def test_empty_forest(self) -> None:
+        """Test that an empty forest has no groups."""
+        forest = DisjointSet(0)
+        assert forest.union_pairs(np.array([], dtype=np.int64), np.array([], dtype=np.int64)) == 0
+        assert forest.groups() == []
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_mixed_scalar_and_bulk_match_reference(self, seed) -> None:
+        """Test that scalar and bulk unions agree with a naive closure."""
+        rng = random.Random(seed)
+        size = rng.randint(1, 80)
+        edges = [(rng.randrange(size), rng.randrange(size)) for _ in range(rng.randint(0, 100))]
+        half = len(edges) // 2
+
+        forest = DisjointSet(size)
+        for a, b in edges[:half]:
+            forest.union(a, b)
+        rest = np.array(edges[half:], dtype=np.int64).reshape(-1, 2)
+        forest.union_pairs(rest[:, 0], rest[:, 1])
+
+        assert forest.groups() == _reference_groups(size, edges)
+        labels = forest.component_labels()
+        for a, b in edges:
+            assert labels[a] == labels[b]
@@ -0,0 +1,141 @@
+"""Tests for the in-memory matrix vector index."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from music_attribution.resolution.embedding_match import EmbeddingMatcher
+from music_attribution.resolution.vector_index import VectorIndex
+
+
+def _reference_top_k(ids, vectors, query, k) -> list[tuple[str, float]]:
+    """Brute-force cosine ranking with the legacy scalar implementation."""
+    scored = [(i, EmbeddingMatcher.cosine_similarity(list(query), list(v))) for i, v in zip(ids, vectors, strict=True)]
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored[:k]
+
+
+class TestVectorIndex:
+    """Tests for insert, delete and exact top-k search."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_search_matches_brute_force(self, seed) -> None:
+        """Test that top-k equals a scalar cosine ranking."""
+        rng = np.random.default_rng(seed)
+        ids = [f"e{i}" for i in range(300)]
+        vectors = rng.normal(size=(300, 16))
+        index = VectorIndex()
+        index.add_many(ids, vectors)
+
+        query = rng.normal(size=16)
+        expected = _reference_top_k(ids, vectors, query, 7)
+        results = index.search(query, k=7)
+        assert [entity_id for entity_id, _ in results] == [entity_id for entity_id, _ in expected]
+        assert [score for _, score in results] == pytest.approx([score for _, score in expected], abs=1e-5)
+
+    def test_search_many_matches_single_queries(self) -> None:
+        """Test that batched search returns the per-query results."""
+        rng = np.random.default_rng(7)
+        index = VectorIndex()
+        index.add_many([f"e{i}" for i in range(50)], rng.normal(size=(50, 8)))
+        queries = rng.normal(size=(6, 8))
+
+        batched = index.search_many(queries, k=3)
+        for results, query in zip(batched, queries, strict=True):
+            single = index.search(query, k=3)
+            assert [entity_id for entity_id, _ in results] == [entity_id for entity_id, _ in single]
+            assert [score for _, score in results] == pytest.approx([score for _, score in single], abs=1e-6)
+
+    def test_replace_updates_in_place(self) -> None:
+        """Test that re-adding an ID overwrites its vector."""
+        index = VectorIndex()
+        index.add("a", [1.0, 0.0])
+        index.add("b", [0.0, 1.0])
+        index.add("a", [0.0, 2.0])
+
+        assert len(index) == 2
+        assert index.search([0.0, 1.0], k=2) == [("a", pytest.approx(1.0)), ("b", pytest.approx(1.0))]
+
+    def test_removed_entries_are_excluded_and_compacted(self) -> None:
+        """Test tombstones are skipped and reclaimed by compaction."""
+        index = VectorIndex()
+        index.add_many([f"e{i}" for i in range(2000)], np.eye(2000, 4, dtype=np.float32) + 0.01)
+        for i in range(1, 1500):
+            assert index.remove(f"e{i}")
+        assert not index.remove("e1")
+
+        assert len(index) == 501
+        assert index._size < 2000  # automatic compaction ran
+        assert "e0" in index
+        assert "e1" not in index
+        assert all(entity_id != "e1" for entity_id, _ in index.search([0.0, 1.0, 0.0, 0.0], k=10))
+        index.compact()
+        assert index._size == len(index)
+        assert index.ids() == ["e0", *(f"e{i}" for i in range(1500, 2000))]
+
+    def test_compaction_reports_renumbered_rows(self) -> None:
+        """Test that on_compact receives the old row of each kept row."""
+        calls: list[list[int]] = []
+        index = VectorIndex(on_compact=lambda kept: calls.append(kept.tolist()))
+        rows = index.add_many(["a", "b", "c"], np.eye(3, dtype=np.float32))
+        assert rows.tolist() == [0, 1, 2]
+        index.remove("b")
+        index.compact()
+
+        assert calls == [[0, 2]]
+        assert index.row("c") == 1
+        assert index.top_k_rows(np.array([0.0, 0.0, 1.0], dtype=np.float32), np.arange(2), k=1) == [
+            ("c", pytest.approx(1.0)),
+        ]
+
+    def test_grows_past_initial_capacity(self) -> None:
+        """Test that appends beyond the initial capacity keep all rows."""
+        rng = np.random.default_rng(11)
+        vectors = rng.normal(size=(2500, 8))
+        index = VectorIndex()
+        for i, vector in enumerate(vectors):
+            index.add(f"e{i}", vector)
+        assert len(index) == 2500
+        assert index.ids()[:2] == ["e0", "e1"]
+        assert index.search(vectors[0], k=1)[0][0] == "e0"
+        assert index.search(vectors[2499], k=1)[0][0] == "e2499"
+
+    def test_float16_storage(self) -> None:
+        """Test that half-precision storage ranks like float32."""
+        rng = np.random.default_rng(3)
+        vectors = rng.normal(size=(100, 32))
+        full, half = VectorIndex(), VectorIndex(dtype=np.float16)
+        ids = [f"e{i}" for i in range(100)]
+        full.add_many(ids, vectors)
+        half.add_many(ids, vectors)
+
+        query = vectors[5]
+        assert half.search(query, k=1)[0][0] == "e5"
+        assert half.search(query, k=5)[0][1] == pytest.approx(full.search(query, k=5)[0][1], abs=1e-3)
+
+    def test_edge_cases(self) -> None:
+        """Test empty index, zero vectors and dimension checks."""
+        index = VectorIndex()
+        assert index.search([1.0, 0.0]) == []
+        index.add("zero", [0.0, 0.0])
+        assert index.search([1.0, 0.0]) == [("zero", 0.0)]
+        with pytest.raises(ValueError, match="dimension"):
+            index.add("bad", [1.0, 0.0, 0.0])
+        with pytest.raises(ValueError, match="dimension"):
+            index.search([1.0])
+
+
+class TestMatcherIndex:
+    """Tests for the EmbeddingMatcher index API."""
+
+    async def test_find_similar_many_and_remove(self) -> None:
+        """Test batched lookup and removal through the matcher."""
+        matcher = EmbeddingMatcher()
+        await matcher.store_embeddings(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+
+        results = await matcher.find_similar_many([[1.0, 0.1], [0.1, 1.0]], top_k=1)
+        assert [r[0][0] for r in results] == ["a", "b"]
+
+        assert await matcher.remove_embedding("a")
+        assert (await matcher.find_similar([1.0, 0.0], top_k=2))[0][0] == "b"
@@ -0,0 +1,229 @@
+"""Tests for the local IVF-flat ANN index."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import UTC, datetime
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from music_attribution.search.ann_index import ANNConfig, IVFFlatIndex, recall_at_k
+
+_DIM = 16
+
+
+def _clustered(size: int, *, seed: int = 0, spread: float = 0.3) -> np.ndarray:
+    """Generate well-separated clustered vectors."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(20, _DIM))
+    return (centres[rng.integers(0, 20, size)] + spread * rng.normal(size=(size, _DIM))).astype(np.float32)
+
+
+def _ids(size: int) -> list[str]:
+    return [str(uuid.uuid5(uuid.NAMESPACE_DNS, f"entity-{i}")) for i in range(size)]
+
+
+@pytest.fixture
+async def session_factory():
+    """In-memory SQLite with resolved entities and 300 stored embeddings."""
+    from music_attribution.db.models import EntityEmbeddingModel, ResolvedEntityModel
+
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(ResolvedEntityModel.__table__.create)
+        await conn.run_sync(EntityEmbeddingModel.__table__.create)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    vectors = _clustered(300)
+    async with factory() as session:
+        for i, (entity_id, vector) in enumerate(zip(_ids(300), vectors, strict=True)):
+            session.add(
+                ResolvedEntityModel(
+                    entity_id=uuid.UUID(entity_id),
+                    entity_type="ARTIST" if i % 2 == 0 else "WORK",
+                    canonical_name=f"Entity {i}",
+                    alternative_names=json.dumps([]),
+                    identifiers=json.dumps({}),
+                    source_records=json.dumps([]),
+                    resolution_method="test",
+                    resolution_confidence=0.9,
+                    resolution_details=json.dumps({}),
+                    assurance_level="LEVEL_2",
+                    conflicts=json.dumps([]),
+                    needs_review=False,
+                    resolved_at=datetime.now(UTC),
+                ),
+            )
+            session.add(
+                EntityEmbeddingModel(
+                    entity_id=uuid.UUID(entity_id),
+                    model_name="all-MiniLM-L6-v2",
+                    model_version="1.0.0",
+                    embedding=json.dumps(vector.tolist()),
+                    created_at=datetime.now(UTC),
+                ),
+            )
+        await session.commit()
+
+    yield factory
+    await engine.dispose()
+
+
+class TestIVFFlatIndex:
+    """Tests for training, search, updates and persistence."""
+
+    def test_untrained_index_searches_exactly(self) -> None:
+        """Below min_train_size the index is a brute-force scan."""
+        vectors = _clustered(100)
+        index = IVFFlatIndex()
+        index.add_many(_ids(100), vectors)
+
+        assert not index.is_trained
+        assert index.search(vectors[3], k=5) == index.search_exact(vectors[3], k=5)
+        assert index.search(vectors[3], k=1)[0][0] == _ids(100)[3]
+
+    def test_trains_at_threshold_with_high_recall(self) -> None:
+        """The index trains itself and keeps recall high on clustered data."""
+        vectors = _clustered(2000)
+        index = IVFFlatIndex(ANNConfig(min_train_size=1000, n_probe=4))
+        index.add_many(_ids(2000), vectors)
+
+        assert index.is_trained
+        assert index.n_lists == round(np.sqrt(2000))
+        queries = vectors[:50] + 0.05
+        assert recall_at_k(index, queries, k=10) >= 0.9
+        assert recall_at_k(index, queries, k=10, n_probe=index.n_lists) == 1.0
+
+    def test_incremental_add_replace_and_remove(self) -> None:
+        """Updates after training are searchable without retraining."""
+        vectors = _clustered(1200)
+        index = IVFFlatIndex(ANNConfig(min_train_size=1000))
+        index.add_many(_ids(1200)[:1000], vectors[:1000])
+        n_lists = index.n_lists
+
+        new_id = _ids(1200)[1100]
+        index.add(new_id, vectors[1100])
+        assert index.search(vectors[1100], k=1)[0][0] == new_id
+        assert index.n_lists == n_lists
+
+        index.add(new_id, vectors[0])
+        assert len(index) == 1001
+        assert new_id in {entity_id for entity_id, _ in index.search(vectors[0], k=2)}
+
+        assert index.remove(new_id)
+        assert not index.remove(new_id)
+        assert new_id not in {entity_id for entity_id, _ in index.search(vectors[0], k=10)}
+
+    def test_lists_follow_compaction(self) -> None:
+        """Removing most rows compacts the store and renumbers the lists."""
+        vectors = _clustered(3000)
+        index = IVFFlatIndex(ANNConfig(min_train_size=1000))
+        index.add_many(_ids(3000), vectors)
+        for entity_id in _ids(3000)[:2000]:
+            assert index.remove(entity_id)
+
+        assert index._store.size < 3000  # the row store compacted itself
+        assert sum(len(rows) for rows in index._lists) == 1000
+        assert recall_at_k(index, vectors[2000:2050], k=5, n_probe=index.n_lists) == 1.0
+        assert index.search(vectors[2500], k=1)[0][0] == _ids(3000)[2500]
+
+    def test_retrains_after_growth(self) -> None:
+        """Growing past retrain_growth x the trained size retrains."""
+        vectors = _clustered(2100)
+        index = IVFFlatIndex(ANNConfig(min_train_size=500, retrain_growth=4.0))
+        index.add_many(_ids(2100)[:500], vectors[:500])
+        assert index.n_lists == round(np.sqrt(500))
+        index.add_many(_ids(2100)[500:], vectors[500:])
+        assert index.n_lists == round(np.sqrt(2100))
+
+    def test_save_and_load_round_trip(self, tmp_path) -> None:
+        """A loaded index returns the same results without retraining."""
+        vectors = _clustered(1500)
+        index = IVFFlatIndex(ANNConfig(min_train_size=1000), model_name="all-MiniLM-L6-v2")
+        index.add_many(_ids(1500), vectors)
+        index.remove(_ids(1500)[0])
+        path = tmp_path / "ann.npz"
+        index.save(path)
+
+        loaded = IVFFlatIndex.load(path, model_name="all-MiniLM-L6-v2")
+        assert len(loaded) == 1499
+        assert loaded.n_lists == index.n_lists
+        for query in vectors[1:6]:
+            assert loaded.search(query, k=5) == index.search(query, k=5)
+        with pytest.raises(ValueError, match="built for model"):
+            IVFFlatIndex.load(path, model_name="other-model")
+
+    def test_dimension_mismatch_raises(self) -> None:
+        """Vectors and queries must match the index dimension."""
+        index = IVFFlatIndex()
+        assert index.search([1.0, 0.0]) == []
+        index.add("a", [1.0, 0.0])
+        with pytest.raises(ValueError, match="dimension"):
+            index.add("b", [1.0, 0.0, 0.0])
+        with pytest.raises(ValueError, match="dimension"):
+            index.search([1.0])
+
+
+class TestDatabaseIntegration:
+    """Tests for building from and searching over entity_embeddings."""
+
+    async def test_from_database_and_vector_search(self, session_factory) -> None:
+        """ANN-backed find_similar agrees with the exact table scan."""
+        from music_attribution.search.vector_search import VectorSearchService
+
+        async with session_factory() as session:
+            index = await IVFFlatIndex.from_database(session, config=ANNConfig(min_train_size=100, n_probe=32))
+            assert len(index) == 300
+            assert index.is_trained
+
+            query_id = uuid.UUID(_ids(300)[0])
+            exact = await VectorSearchService().find_similar(query_id, limit=5, session=session)
+            approx = await VectorSearchService(ann_index=index).find_similar(query_id, limit=5, session=session)
+            assert [entity_id for entity_id, _ in approx] == [entity_id for entity_id, _ in exact]
+            assert [score for _, score in approx] == pytest.approx([score for _, score in exact], abs=1e-4)
+
+            typed = await VectorSearchService(ann_index=index).find_similar(
+                query_id,
+                limit=5,
+                entity_type="WORK",
+                session=session,
+            )
+            work_ids = {uuid.UUID(entity_id) for i, entity_id in enumerate(_ids(300)) if i % 2 == 1}
+            assert typed
+            assert all(entity_id in work_ids for entity_id, _ in typed)
+
+    async def test_embedding_service_updates_index(self, session_factory) -> None:
+        """Stored embeddings are added to the ANN index incrementally."""
+        from music_attribution.resolution.embedding_service import EmbeddingService
+
+        async with session_factory() as session:
+            index = await IVFFlatIndex.from_database(session)
+            service = EmbeddingService(ann_index=index)
+            new_id = uuid.uuid4()
+            vector = [1.0] * _DIM
+            await service.store_embeddings([(new_id, vector), (uuid.UUID(_ids(300)[0]), [0.0] * _DIM)], session=session)
+
+            assert len(index) == 301
+            assert index.search(vector, k=1)[0][0] == str(new_id)
+            assert index.vector(_ids(300)[0]) is not None
+            assert not np.allclose(index.vector(_ids(300)[0]), 0.0)
+
+    async def test_embedding_service_skips_conflicting_rows(self, session_factory) -> None:
+        """Rows the insert skipped on conflict never reach the index."""
+        from music_attribution.resolution.embedding_service import EmbeddingService
+
+        async with session_factory() as session:
+            index = IVFFlatIndex()
+            service = EmbeddingService(ann_index=index)
+            new_id = uuid.uuid4()
+            stored = await service.store_embeddings(
+                [(new_id, [1.0] * _DIM), (uuid.UUID(_ids(300)[0]), [0.0] * _DIM)],
+                session=session,
+            )
+
+            assert stored == 1
+            assert len(index) == 1
+            assert _ids(300)[0] not in index
@@ -12,7 +12,7 @@ async def seeded_app():
     from sqlalchemy.ext.asyncio import async_sessionmaker
 
     from music_attribution.api.app import create_app
-    from music_attribution.db.models import AttributionRecordModel
+    from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel
     from music_attribution.seed.imogen_heap import seed_imogen_heap
 
     engine = create_async_engine("sqlite+aiosqlite://", echo=False)
@@ -20,6 +20,7 @@ async def seeded_app():
     # Create tables
     async with engine.begin() as conn:
         await conn.run_sync(AttributionRecordModel.__table__.create)
+        await conn.run_sync(AttributionEntityModel.__table__.create)
 
     factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
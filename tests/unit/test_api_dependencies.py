@@ -77,3 +77,22 @@ class TestAppLifespan:
             assert isinstance(engine, AsyncEngine)
 
         # After lifespan exits, engine.dispose() was called without error
+
+    async def test_app_lifespan_installs_search_result_cache(self, monkeypatch) -> None:
+        """The search result cache is process-wide during lifespan only."""
+        import os
+
+        os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+        os.environ.setdefault("MUSICBRAINZ_USER_AGENT", "test/1.0")
+        monkeypatch.setenv("SEARCH_CACHE_BACKEND", "memory")
+
+        from music_attribution.api.app import create_app, lifespan
+        from music_attribution.search.result_cache import SearchResultCache, get_search_result_cache
+
+        app = create_app()
+
+        async with lifespan(app):
+            assert isinstance(app.state.search_result_cache, SearchResultCache)
+            assert get_search_result_cache() is app.state.search_result_cache
+
+        assert get_search_result_cache() is None
@@ -7,7 +7,7 @@ import uuid
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
-from music_attribution.db.models import AttributionRecordModel
+from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel
 from music_attribution.schemas.attribution import AttributionRecord
 from music_attribution.schemas.enums import ProvenanceEventTypeEnum
 from tests.factories import make_attribution
@@ -39,6 +39,7 @@ async def async_session():
     engine = create_async_engine("sqlite+aiosqlite://", echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(AttributionRecordModel.__table__.create)
+        await conn.run_sync(AttributionEntityModel.__table__.create)
 
     session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     async with session_factory() as session:
@@ -168,3 +169,42 @@ class TestAsyncAttributionRepository:
         repo = AsyncAttributionRepository()
         result = await repo.find_by_id(uuid.uuid4(), async_session)
         assert result is None
+
+    async def test_store_and_update_maintain_attribution_entities(self, async_session: AsyncSession) -> None:
+        """The junction table holds the work entity and every credited entity."""
+        from sqlalchemy import select
+
+        from music_attribution.attribution.persistence import WORK_ENTITY_ROLE, AsyncAttributionRepository
+        from music_attribution.schemas.enums import CreditRoleEnum
+        from tests.factories import make_credit
+
+        repo = AsyncAttributionRepository()
+        artist_id = uuid.uuid4()
+        record = make_attribution(
+            credits=[
+                make_credit(entity_id=artist_id, role=CreditRoleEnum.PERFORMER),
+                make_credit(entity_id=artist_id, role=CreditRoleEnum.PRODUCER),
+            ],
+        )
+        await repo.store(record, async_session)
+
+        async def _rows() -> set[tuple[uuid.UUID, str]]:
+            result = await async_session.execute(
+                select(AttributionEntityModel.entity_id, AttributionEntityModel.role).where(
+                    AttributionEntityModel.attribution_id == record.attribution_id,
+                ),
+            )
+            return {(entity_id, role) for entity_id, role in result.all()}
+
+        assert await _rows() == {
+            (record.work_entity_id, WORK_ENTITY_ROLE),
+            (artist_id, "PERFORMER"),
+            (artist_id, "PRODUCER"),
+        }
+
+        replacement_id = uuid.uuid4()
+        await repo.update(record.model_copy(update={"credits": [make_credit(entity_id=replacement_id)]}), async_session)
+        rows = await _rows()
+        assert (record.work_entity_id, WORK_ENTITY_ROLE) in rows
+        assert replacement_id in {entity_id for entity_id, _ in rows}
+        assert artist_id not in {entity_id for entity_id, _ in rows}
@@ -9,11 +9,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 @pytest.fixture
 async def db_engine():
     """Create an in-memory SQLite database with attribution table."""
-    from music_attribution.db.models import AttributionRecordModel
+    from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel
 
     engine = create_async_engine("sqlite+aiosqlite://", echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(AttributionRecordModel.__table__.create)
+        await conn.run_sync(AttributionEntityModel.__table__.create)
 
     yield engine
     await engine.dispose()
@@ -54,7 +55,7 @@ class TestCliDb:
 
     async def test_cli_reset_clears_data(self, db_engine) -> None:
         """reset command clears all data."""
-        from sqlalchemy import func, select
+        from sqlalchemy import func, select, text
         from sqlalchemy.ext.asyncio import async_sessionmaker
 
         from music_attribution.cli.db import run_reset, run_seed
@@ -69,3 +70,5 @@ class TestCliDb:
             result = await session.execute(select(func.count()).select_from(AttributionRecordModel))
             count = result.scalar()
             assert count == 0
+            fts_count = await session.execute(text("SELECT count(*) FROM attribution_records_fts"))
+            assert fts_count.scalar() == 0
@@ -0,0 +1,34 @@
+"""Tests for the LLM cache CLI commands."""
+
+from __future__ import annotations
+
+import time
+
+from music_attribution.cli.llm_cache import run_purge, run_stats, run_warm
+from music_attribution.resolution.llm_cache import CacheEntry, SQLiteLLMCacheStore
+
+
+async def test_warm_copies_recent_decisions() -> None:
+    """Test that warm copies only decisions within max_age."""
+    source = SQLiteLLMCacheStore(":memory:")
+    target = SQLiteLLMCacheStore(":memory:")
+    now = time.time()
+    await source.put(CacheEntry("old", "o", now - 1000))
+    await source.put(CacheEntry("new", "n", now - 10))
+
+    assert await run_warm(source, target, max_age=100) == 1
+    assert await target.get("new") is not None
+    assert await target.get("old") is None
+
+
+async def test_purge_and_stats() -> None:
+    """Test that purge drops expired decisions and stats reports the rest."""
+    store = SQLiteLLMCacheStore(":memory:")
+    now = time.time()
+    await store.put(CacheEntry("old", "o", now - 1000))
+    await store.put(CacheEntry("new", "n", now - 10))
+
+    assert await run_purge(store, ttl_seconds=100) == 1
+    stats = await run_stats(store)
+    assert stats["entries"] == 1
+    assert stats["newest_age_seconds"] >= 10
@@ -0,0 +1,109 @@
+"""Tests for the NumPy-decoded embedding column type."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import UTC, datetime
+
+import numpy as np
+import pytest
+from pgvector import HalfVector
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from music_attribution.db.embedding_type import (
+    HalfVectorType,
+    decode_embedding,
+    encode_embedding,
+    stack_embeddings,
+)
+
+
+class TestDecodeEmbedding:
+    """Tests for decoding every stored embedding form."""
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            [0.5, -1.0, 2.0],
+            (0.5, -1.0, 2.0),
+            np.array([0.5, -1.0, 2.0]),
+            "[0.5,-1.0,2.0]",
+            json.dumps([0.5, -1.0, 2.0]),
+            HalfVector([0.5, -1.0, 2.0]),
+            encode_embedding([0.5, -1.0, 2.0]),
+            memoryview(encode_embedding([0.5, -1.0, 2.0])),
+        ],
+    )
+    def test_all_forms_decode_to_float16(self, raw) -> None:
+        """Lists, arrays, text, HalfVector and BLOBs decode identically."""
+        decoded = decode_embedding(raw)
+        assert decoded.dtype == np.float16
+        assert decoded.tolist() == [0.5, -1.0, 2.0]
+
+    def test_blob_is_two_bytes_per_dimension(self) -> None:
+        """The BLOB encoding is raw little-endian float16."""
+        assert len(encode_embedding([0.0] * 768)) == 1536
+
+    def test_unknown_type_raises(self) -> None:
+        """Unsupported values raise TypeError."""
+        with pytest.raises(TypeError, match="Unexpected embedding type"):
+            decode_embedding(42)
+
+    def test_stack_embeddings(self) -> None:
+        """Mixed stored forms stack into one float32 matrix."""
+        matrix = stack_embeddings([encode_embedding([1.0, 2.0]), "[3,4]", HalfVector([5.0, 6.0])])
+        assert matrix.dtype == np.float32
+        assert matrix.tolist() == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        assert stack_embeddings([]).shape == (0, 0)
+        with pytest.raises(ValueError, match="dimension"):
+            stack_embeddings(["[1,2]", "[1,2,3]"])
+
+
+class TestHalfVectorType:
+    """Tests for the column type on each backend."""
+
+    def test_postgres_uses_halfvec_and_numpy_results(self) -> None:
+        """PostgreSQL keeps HALFVEC(dim) and decodes results to arrays."""
+        from sqlalchemy.dialects import postgresql
+
+        dialect = postgresql.dialect()
+        column_type = HalfVectorType(768)
+        impl = column_type.load_dialect_impl(dialect)
+        assert impl.compile(dialect=dialect) == "HALFVEC(768)"
+
+        process = column_type.result_processor(dialect, None)
+        assert process is not None
+        assert process("[1,2]").tolist() == [1.0, 2.0]
+        assert isinstance(process(HalfVector([1.0, 2.0])), np.ndarray)
+
+    async def test_sqlite_round_trip_stores_blob(self) -> None:
+        """SQLite stores a float16 BLOB and loads a NumPy array."""
+        from music_attribution.db.models import EntityEmbeddingModel, ResolvedEntityModel
+
+        engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(ResolvedEntityModel.__table__.create)
+            await conn.run_sync(EntityEmbeddingModel.__table__.create)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with factory() as session:
+            session.add(
+                EntityEmbeddingModel(
+                    entity_id=uuid.uuid4(),
+                    model_name="m",
+                    model_version="1",
+                    embedding=[0.25, 0.5, 1.0],
+                    created_at=datetime.now(UTC),
+                ),
+            )
+            await session.commit()
+
+            stored = (await session.execute(text("SELECT typeof(embedding) FROM entity_embeddings"))).scalar()
+            loaded = (await session.execute(select(EntityEmbeddingModel.embedding))).scalar_one()
+
+        assert stored == "blob"
+        assert isinstance(loaded, np.ndarray)
+        assert loaded.tolist() == [0.25, 0.5, 1.0]
+        await engine.dispose()
@@ -164,3 +164,97 @@ class TestEmbeddingService:
             )
         )
         assert result.scalar() == 1
+
+
+def _fake_service():
+    """EmbeddingService whose model returns deterministic 4-d vectors."""
+    from unittest.mock import MagicMock
+
+    import numpy as np
+
+    from music_attribution.resolution.embedding_service import EmbeddingService
+
+    service = EmbeddingService()
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **_: np.arange(len(texts) * 4, dtype=float).reshape(-1, 4)
+    service._matcher._model = model
+    return service, model
+
+
+async def _count_embeddings(session: AsyncSession) -> int:
+    """Count rows in entity_embeddings."""
+    from sqlalchemy import func, select
+
+    from music_attribution.db.models import EntityEmbeddingModel
+
+    result = await session.execute(select(func.count()).select_from(EntityEmbeddingModel))
+    return result.scalar()
+
+
+class TestEmbeddingBackfill:
+    """Tests for batched generation, bulk insert and resumable backfill."""
+
+    async def test_store_embeddings_skips_conflicts(self, async_session: AsyncSession) -> None:
+        """Multi-row insert ignores rows that already exist."""
+        service, _ = _fake_service()
+        ids = [uuid.uuid4() for _ in range(3)]
+        for i, entity_id in enumerate(ids):
+            _seed_entity(async_session, entity_id, f"Artist {i}")
+        await async_session.flush()
+
+        assert await service.store_embeddings([(ids[0], [0.1] * 4)], session=async_session) == 1
+        inserted = await service.store_embeddings([(e, [0.2] * 4) for e in ids], session=async_session)
+        assert inserted == 2
+        assert await _count_embeddings(async_session) == 3
+
+    async def test_backfill_pages_and_batches(self, async_session: AsyncSession) -> None:
+        """Backfill embeds every entity once per page with one encode call."""
+        service, model = _fake_service()
+        for i in range(5):
+            _seed_entity(async_session, uuid.uuid4(), f"Artist {i}")
+        await async_session.commit()
+
+        report = await service.backfill_embeddings(session=async_session, page_size=2, batch_size=8)
+
+        assert (report.entities_seen, report.embedded, report.pages) == (5, 5, 3)
+        assert model.encode.call_count == 3
+        assert model.encode.call_args.kwargs["batch_size"] == 8
+        assert report.entities_per_second > 0
+        assert await _count_embeddings(async_session) == 5
+
+    async def test_backfill_skips_already_embedded(self, async_session: AsyncSession) -> None:
+        """Entities with an embedding for the model are never re-encoded."""
+        service, model = _fake_service()
+        embedded_id = uuid.uuid4()
+        _seed_entity(async_session, embedded_id, "Done")
+        _seed_entity(async_session, uuid.uuid4(), "Pending")
+        await async_session.flush()
+        await service.store_embeddings([(embedded_id, [0.0] * 4)], session=async_session)
+        await async_session.commit()
+
+        report = await service.backfill_embeddings(session=async_session)
+
+        assert report.entities_seen == 1
+        texts = model.encode.call_args.args[0]
+        assert texts == ["ARTIST: Pending"]
+
+    async def test_backfill_resumes_from_checkpoint(self, async_session: AsyncSession, tmp_path) -> None:
+        """An interrupted backfill continues after the last committed page."""
+        from music_attribution.resolution.embedding_service import BackfillReport
+
+        service, model = _fake_service()
+        for i in range(5):
+            _seed_entity(async_session, uuid.uuid4(), f"Artist {i}")
+        await async_session.commit()
+        checkpoint = tmp_path / "backfill.json"
+
+        first = await service.backfill_embeddings(
+            session=async_session, page_size=2, checkpoint_path=checkpoint, max_pages=1
+        )
+        assert first.entities_seen == 2
+        assert BackfillReport.load(checkpoint).last_entity_id == first.last_entity_id
+
+        second = await service.backfill_embeddings(session=async_session, page_size=2, checkpoint_path=checkpoint)
+        assert (second.entities_seen, second.entities_this_run, second.pages) == (5, 3, 3)
+        assert sum(len(call.args[0]) for call in model.encode.call_args_list) == 5
+        assert await _count_embeddings(async_session) == 5
@@ -13,6 +13,7 @@ async def _create_hybrid_db() -> tuple:
     from datetime import UTC, datetime
 
     from music_attribution.db.models import (
+        AttributionEntityModel,
         AttributionRecordModel,
         EdgeModel,
         EntityEmbeddingModel,
@@ -24,6 +25,7 @@ async def _create_hybrid_db() -> tuple:
     engine = create_async_engine("sqlite+aiosqlite://", echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(AttributionRecordModel.__table__.create)
+        await conn.run_sync(AttributionEntityModel.__table__.create)
         await conn.run_sync(ResolvedEntityModel.__table__.create)
         await conn.run_sync(EntityEmbeddingModel.__table__.create)
         await conn.run_sync(EdgeModel.__table__.create)
@@ -97,6 +99,71 @@ async def hybrid_session():
     await engine.dispose()
 
 
+@pytest.fixture
+async def records_session():
+    """In-memory database with only the seeded attribution records."""
+    from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel
+    from music_attribution.seed.imogen_heap import seed_imogen_heap
+
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(AttributionRecordModel.__table__.create)
+        await conn.run_sync(AttributionEntityModel.__table__.create)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        await seed_imogen_heap(session)
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+class TestEntitiesToAttributions:
+    """Tests for the junction-table entity to attribution mapping."""
+
+    async def test_maps_credited_and_work_entities(self, records_session: AsyncSession) -> None:
+        """Credited contributors and work entities map to their records."""
+        from sqlalchemy import select
+
+        from music_attribution.db.models import AttributionRecordModel
+        from music_attribution.search.hybrid_search import HybridSearchService
+        from music_attribution.seed.imogen_heap import deterministic_uuid
+
+        service = HybridSearchService()
+        ih_id = deterministic_uuid("artist-imogen-heap")
+        mapped = await service._entities_to_attributions([ih_id], session=records_session)
+        assert len(mapped) == 8
+
+        rows = (
+            await records_session.execute(
+                select(AttributionRecordModel.attribution_id, AttributionRecordModel.work_entity_id),
+            )
+        ).all()
+        attribution_id, work_id = rows[0]
+        assert await service._entities_to_attributions([work_id], session=records_session) == [attribution_id]
+        assert await service._entities_to_attributions([], session=records_session) == []
+
+    async def test_orders_by_confidence_without_duplicates(self, records_session: AsyncSession) -> None:
+        """Results are distinct and sorted by confidence score descending."""
+        from sqlalchemy import select
+
+        from music_attribution.db.models import AttributionRecordModel
+        from music_attribution.search.hybrid_search import HybridSearchService
+        from music_attribution.seed.imogen_heap import deterministic_uuid
+
+        ih_id = deterministic_uuid("artist-imogen-heap")
+        mapped = await HybridSearchService()._entities_to_attributions([ih_id, ih_id], session=records_session)
+        confidence = dict(
+            (
+                await records_session.execute(
+                    select(AttributionRecordModel.attribution_id, AttributionRecordModel.confidence_score),
+                )
+            ).all(),
+        )
+        assert len(mapped) == len(set(mapped))
+        scores = [confidence[attribution_id] for attribution_id in mapped]
+        assert scores == sorted(scores, reverse=True)
+
+
 class TestHybridSearch:
     """Tests for HybridSearchService."""
 
@@ -176,3 +243,269 @@ class TestHybridSearch:
                 assert "rrf_score" in data[0]
         finally:
             await engine.dispose()
+
+
+@pytest.fixture
+async def records_factory(tmp_path):
+    """File-backed SQLite session factory (separate pooled connections)."""
+    from music_attribution.db.models import (
+        AttributionEntityModel,
+        AttributionRecordModel,
+        EdgeModel,
+        ResolvedEntityModel,
+    )
+    from music_attribution.seed.imogen_heap import seed_imogen_heap
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'hybrid.db'}", echo=False)
+    async with engine.begin() as conn:
+        for model in (AttributionRecordModel, AttributionEntityModel, ResolvedEntityModel, EdgeModel):
+            await conn.run_sync(model.__table__.create)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        await seed_imogen_heap(session)
+        await session.commit()
+    yield factory
+    await engine.dispose()
+
+
+class TestConcurrentModalities:
+    """Tests for concurrent modality execution, budgets and metrics."""
+
+    @staticmethod
+    def _service(factory=None, **timeouts):
+        from prometheus_client import CollectorRegistry
+
+        from music_attribution.observability.search_metrics import create_search_metrics
+        from music_attribution.search.hybrid_search import HybridSearchService, ModalityTimeouts
+
+        return HybridSearchService(
+            session_factory=factory,
+            timeouts=ModalityTimeouts(**timeouts),
+            metrics=create_search_metrics(CollectorRegistry()),
+        )
+
+    @staticmethod
+    def _slow_vector(delay: float):
+        """Vector search stand-in returning Imogen Heap after ``delay`` seconds."""
+        import asyncio
+
+        from music_attribution.seed.imogen_heap import deterministic_uuid
+
+        async def _search(query, *, limit, session):  # noqa: ARG001
+            await asyncio.sleep(delay)
+            return [(deterministic_uuid("artist-imogen-heap"), 0.9)]
+
+        return _search
+
+    async def test_slow_vector_modality_is_dropped(self, records_factory) -> None:
+        """A modality past its budget is dropped; text results still return."""
+        service = self._service(records_factory, vector=0.05)
+        service._vector_search_by_query = self._slow_vector(1.0)
+
+        async with records_factory() as session:
+            results = await service.search("vocoder arrangement", limit=10, session=session)
+
+        assert [r.record.work_title for r in results] == ["Hide and Seek"]
+        metrics = service._metrics
+        assert metrics.modality_dropped_total.labels(modality="vector")._value.get() == 1.0
+        assert metrics.modality_latency_seconds.labels(modality="text", outcome="ok")._sum.get() > 0
+        assert metrics.modality_latency_seconds.labels(modality="vector", outcome="timeout")._sum.get() >= 0.05
+        assert metrics.modality_latency_seconds.labels(modality="graph", outcome="ok")._sum.get() == 0
+
+    async def test_modalities_overlap(self, records_factory) -> None:
+        """Text and vector retrieval run concurrently on separate sessions."""
+        import asyncio
+        import time
+
+        service = self._service(records_factory)
+        service._vector_search_by_query = self._slow_vector(0.3)
+        text_search = service._text_search.search
+        sessions = []
+
+        async def _slow_text(query, *, limit, session):
+            sessions.append(session)
+            await asyncio.sleep(0.3)
+            return await text_search(query, limit=limit, session=session)
+
+        service._text_search.search = _slow_text
+
+        async with records_factory() as session:
+            start = time.perf_counter()
+            results = await service.search("vocoder arrangement", limit=10, session=session)
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.55
+        assert sessions[0] is not session
+        assert len(results) == 8
+        assert results[0].record.work_title == "Hide and Seek"
+
+    async def test_sequential_mode_ignores_budgets(self, records_factory) -> None:
+        """Without a session factory every modality runs to completion."""
+        service = self._service(vector=0.01)
+        service._vector_search_by_query = self._slow_vector(0.05)
+
+        async with records_factory() as session:
+            results = await service.search("vocoder arrangement", limit=10, session=session)
+
+        assert len(results) == 8
+        assert service._metrics.modality_dropped_total.labels(modality="vector")._value.get() == 0.0
+
+    async def test_modality_errors_propagate(self, records_factory) -> None:
+        """A failing modality raises its own exception and cancels the other."""
+
+        async def _broken(query, *, limit, session):  # noqa: ARG001
+            raise RuntimeError("vector backend down")
+
+        service = self._service(records_factory)
+        service._vector_search_by_query = _broken
+
+        async with records_factory() as session:
+            with pytest.raises(RuntimeError, match="vector backend down"):
+                await service.search("vocoder", session=session)
+        assert service._metrics.modality_latency_seconds.labels(modality="vector", outcome="error")._sum.get() > 0
+
+
+class TestResultCache:
+    """Tests for result caching and write-through invalidation."""
+
+    @pytest.fixture
+    def result_cache(self):
+        """Process-wide in-process result cache, removed after the test."""
+        from prometheus_client import CollectorRegistry
+
+        from music_attribution.observability.search_metrics import create_search_metrics
+        from music_attribution.search.result_cache import (
+            InProcessSearchCacheBackend,
+            SearchResultCache,
+            set_search_result_cache,
+        )
+
+        cache = SearchResultCache(InProcessSearchCacheBackend(), metrics=create_search_metrics(CollectorRegistry()))
+        set_search_result_cache(cache)
+        yield cache
+        set_search_result_cache(None)
+
+    @staticmethod
+    def _service(factory=None, **timeouts):
+        service = TestConcurrentModalities._service(factory, **timeouts)
+        service._vector_search_by_query = TestConcurrentModalities._slow_vector(0.0)
+        fused = service._fused_search
+        service.fused_calls = 0
+
+        async def _counting(query, *, limit, session):
+            service.fused_calls += 1
+            return await fused(query, limit=limit, session=session)
+
+        service._fused_search = _counting
+        return service
+
+    async def test_repeated_search_served_from_cache(self, records_factory, result_cache) -> None:
+        """A second identical search skips the modalities."""
+        service = self._service()
+
+        async with records_factory() as session:
+            first = await service.search("vocoder arrangement", limit=10, session=session)
+            second = await service.search("Vocoder  arrangement", limit=10, session=session)
+
+        assert service.fused_calls == 1
+        assert second == first
+        assert result_cache.hits == 1
+
+    def test_use_result_cache_false_bypasses_installed_cache(self, result_cache) -> None:
+        """``use_result_cache=False`` disables caching despite a process-wide cache."""
+        from music_attribution.search.hybrid_search import HybridSearchService
+
+        assert HybridSearchService()._result_cache is result_cache
+        assert HybridSearchService(use_result_cache=False)._result_cache is None
+
+    async def test_repository_update_invalidates(self, records_factory, result_cache) -> None:
+        """``AsyncAttributionRepository.update`` bumps the catalogue generation."""
+        from music_attribution.attribution.persistence import AsyncAttributionRepository
+
+        service = self._service()
+
+        async with records_factory() as session:
+            results = await service.search("vocoder arrangement", limit=10, session=session)
+            await AsyncAttributionRepository().update(results[0].record, session)
+            await session.commit()
+            refreshed = await service.search("vocoder arrangement", limit=10, session=session)
+
+        assert service.fused_calls == 2
+        assert (result_cache.hits, result_cache.misses) == (0, 2)
+        hide_and_seek = next(r.record for r in refreshed if r.record.work_title == "Hide and Seek")
+        assert hide_and_seek.version == results[0].record.version + 1
+
+    async def test_edge_write_invalidates_on_commit(self, records_factory, result_cache) -> None:
+        """An ``add_edge`` write invalidates when committed, not when flushed."""
+        from music_attribution.resolution.edge_repository import AsyncEdgeRepository
+        from music_attribution.seed.imogen_heap import deterministic_uuid
+
+        service = self._service()
+
+        async with records_factory() as writer, records_factory() as reader:
+            await service.search("vocoder", limit=10, session=reader)
+            await AsyncEdgeRepository().add_edge(
+                deterministic_uuid("artist-imogen-heap"),
+                deterministic_uuid("artist-guy-sigsworth"),
+                "COLLABORATED_WITH",
+                0.9,
+                session=writer,
+            )
+            # Uncommitted: nothing else can see the edge yet
+            await service.search("vocoder", limit=10, session=reader)
+            assert (result_cache.hits, service.fused_calls) == (1, 1)
+
+            await writer.commit()
+            await service.search("vocoder", limit=10, session=reader)
+
+        assert service.fused_calls == 2
+        assert result_cache.misses == 2
+
+    async def test_search_during_uncommitted_write_is_not_served_after_commit(
+        self, records_factory, result_cache
+    ) -> None:
+        """Results computed before a commit are never served after it."""
+        from music_attribution.attribution.persistence import AsyncAttributionRepository
+
+        service = self._service()
+
+        async with records_factory() as writer, records_factory() as reader:
+            original = await service.search("vocoder arrangement", limit=10, session=reader)
+            await AsyncAttributionRepository().update(original[0].record, writer)
+            during = await service.search("vocoder arrangement", limit=5, session=reader)
+            await writer.commit()
+            after = await service.search("vocoder arrangement", limit=5, session=reader)
+
+        assert service.fused_calls == 3
+        assert result_cache.hits == 0
+        assert during[0].record.version == original[0].record.version
+        assert after[0].record.attribution_id == original[0].record.attribution_id
+        assert after[0].record.version == original[0].record.version + 1
+
+    async def test_rolled_back_write_does_not_invalidate(self, records_factory, result_cache) -> None:
+        """A rolled-back write leaves cached results in place."""
+        from music_attribution.attribution.persistence import AsyncAttributionRepository
+
+        service = self._service()
+
+        async with records_factory() as session:
+            results = await service.search("vocoder arrangement", limit=10, session=session)
+            await AsyncAttributionRepository().update(results[0].record, session)
+            await session.rollback()
+            await session.commit()
+            await service.search("vocoder arrangement", limit=10, session=session)
+
+        assert service.fused_calls == 1
+        assert result_cache.hits == 1
+
+    async def test_degraded_results_not_cached(self, records_factory, result_cache) -> None:
+        """Results missing a dropped modality are recomputed next time."""
+        service = self._service(records_factory, vector=0.05)
+        service._vector_search_by_query = TestConcurrentModalities._slow_vector(1.0)
+
+        async with records_factory() as session:
+            await service.search("vocoder arrangement", limit=10, session=session)
+            await service.search("vocoder arrangement", limit=10, session=session)
+
+        assert service.fused_calls == 2
+        assert result_cache.hits == 0
@@ -0,0 +1,37 @@
+"""Structural tests for migration 005 — verifiable without a database."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+_MIGRATION_PATH = Path("alembic/versions/005_entity_embeddings_hnsw.py")
+
+
+def _load_migration():
+    """Load migration 005 as a module from file path."""
+    spec = importlib.util.spec_from_file_location("m005", _MIGRATION_PATH)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigration005Structure:
+    """Verify migration 005 revision chain and HNSW index definition."""
+
+    def test_migration_005_revision_chain(self) -> None:
+        """Migration 005 depends on 004."""
+        m005 = _load_migration()
+        assert m005.revision == "005"
+        assert m005.down_revision == "004"
+        assert callable(m005.upgrade)
+        assert callable(m005.downgrade)
+
+    def test_migration_005_creates_hnsw_cosine_index(self) -> None:
+        """The index uses HNSW with the cosine operator class for halfvec."""
+        source = _MIGRATION_PATH.read_text(encoding="utf-8")
+        assert "USING hnsw (embedding halfvec_cosine_ops)" in source
+        assert "ix_entity_embeddings_embedding_hnsw" in source
+        assert "DROP INDEX IF EXISTS ix_entity_embeddings_embedding_hnsw" in source
@@ -0,0 +1,62 @@
+"""Tests for migration 006 (float16 BLOB embeddings on SQLite)."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+
+import numpy as np
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+_MIGRATION_PATH = Path("alembic/versions/006_entity_embeddings_binary.py")
+
+
+def _load_migration():
+    """Load migration 006 as a module from file path."""
+    spec = importlib.util.spec_from_file_location("m006", _MIGRATION_PATH)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigration006:
+    """Verify the revision chain and the SQLite data conversion."""
+
+    def test_migration_006_revision_chain(self) -> None:
+        """Migration 006 depends on 005."""
+        m006 = _load_migration()
+        assert m006.revision == "006"
+        assert m006.down_revision == "005"
+
+    def test_sqlite_upgrade_and_downgrade_convert_vectors(self) -> None:
+        """JSON text vectors become float16 BLOBs and back."""
+        m006 = _load_migration()
+        engine = sa.create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(
+                sa.text(
+                    "CREATE TABLE entity_embeddings (embedding_id CHAR(32) PRIMARY KEY, embedding TEXT NOT NULL)",
+                ),
+            )
+            conn.execute(
+                sa.text("INSERT INTO entity_embeddings VALUES ('a1', :v)"),
+                {"v": json.dumps([0.5, 1.0, -2.0])},
+            )
+            context = MigrationContext.configure(conn)
+
+            with Operations.context(context):
+                m006.upgrade()
+            kind, value = conn.execute(sa.text("SELECT typeof(embedding), embedding FROM entity_embeddings")).one()
+            assert kind == "blob"
+            assert np.frombuffer(value, dtype="<f2").tolist() == [0.5, 1.0, -2.0]
+
+            with Operations.context(context):
+                m006.downgrade()
+            kind, value = conn.execute(sa.text("SELECT typeof(embedding), embedding FROM entity_embeddings")).one()
+            assert kind == "text"
+            assert json.loads(value) == [0.5, 1.0, -2.0]
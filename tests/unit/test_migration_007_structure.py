@@ -0,0 +1,70 @@
+"""Tests for migration 007 (full-text index on attribution_records)."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+_MIGRATION_PATH = Path("alembic/versions/007_attribution_records_fulltext.py")
+
+_FTS_ROWS = "SELECT * FROM attribution_records_fts ORDER BY attribution_id"
+
+
+def _load_migration():
+    """Load migration 007 as a module from file path."""
+    spec = importlib.util.spec_from_file_location("m007", _MIGRATION_PATH)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigration007:
+    """Verify the revision chain, the PostgreSQL DDL and the SQLite backfill."""
+
+    def test_migration_007_revision_chain(self) -> None:
+        """Migration 007 depends on 006."""
+        m007 = _load_migration()
+        assert m007.revision == "007"
+        assert m007.down_revision == "006"
+
+    def test_postgres_generated_column_covers_document(self) -> None:
+        """The generated tsvector covers titles, names, roles and agents."""
+        m007 = _load_migration()
+        for field in ("work_title", "artist_name", "$[*].entity_name", "$[*].role", "$[*].role_detail", "$[*].agent"):
+            assert field in m007._SEARCH_VECTOR
+
+    async def test_sqlite_backfill_matches_repository_sync(self, tmp_path) -> None:
+        """Backfilled FTS rows equal the rows the repository writes."""
+        from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel
+        from music_attribution.seed.imogen_heap import seed_imogen_heap
+
+        db_path = tmp_path / "fts.db"
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        async with engine.begin() as conn:
+            await conn.run_sync(AttributionRecordModel.__table__.create)
+            await conn.run_sync(AttributionEntityModel.__table__.create)
+        async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+            await seed_imogen_heap(session)
+            await session.commit()
+        await engine.dispose()
+
+        m007 = _load_migration()
+        sync_engine = sa.create_engine(f"sqlite:///{db_path}")
+        with sync_engine.begin() as conn:
+            synced = conn.execute(sa.text(_FTS_ROWS)).all()
+            context = MigrationContext.configure(conn)
+            with Operations.context(context):
+                m007.downgrade()
+                m007.upgrade()
+            backfilled = conn.execute(sa.text(_FTS_ROWS)).all()
+        sync_engine.dispose()
+
+        assert len(synced) == 8
+        assert backfilled == synced
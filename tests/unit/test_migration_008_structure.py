@@ -0,0 +1,67 @@
+"""Tests for migration 008 (attribution_entities junction table)."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+_MIGRATION_PATH = Path("alembic/versions/008_attribution_entities.py")
+
+_JUNCTION_ROWS = "SELECT attribution_id, entity_id, role FROM attribution_entities ORDER BY 1, 2, 3"
+
+
+def _load_migration():
+    """Load migration 008 as a module from file path."""
+    spec = importlib.util.spec_from_file_location("m008", _MIGRATION_PATH)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestMigration008:
+    """Verify the revision chain and the backfill."""
+
+    def test_migration_008_revision_chain(self) -> None:
+        """Migration 008 depends on 007."""
+        m008 = _load_migration()
+        assert m008.revision == "008"
+        assert m008.down_revision == "007"
+
+    async def test_backfill_matches_repository_rows(self, tmp_path) -> None:
+        """Backfilled junction rows equal the rows the repository writes."""
+        from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel
+        from music_attribution.seed.imogen_heap import seed_imogen_heap
+
+        db_path = tmp_path / "junction.db"
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        async with engine.begin() as conn:
+            await conn.run_sync(AttributionRecordModel.__table__.create)
+            await conn.run_sync(AttributionEntityModel.__table__.create)
+        async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+            await seed_imogen_heap(session)
+            await session.commit()
+        await engine.dispose()
+
+        m008 = _load_migration()
+        sync_engine = sa.create_engine(f"sqlite:///{db_path}")
+        with sync_engine.begin() as conn:
+            stored = conn.execute(sa.text(_JUNCTION_ROWS)).all()
+            context = MigrationContext.configure(conn)
+            with Operations.context(context):
+                m008.downgrade()
+                assert not sa.inspect(conn).has_table("attribution_entities")
+                m008.upgrade()
+            backfilled = conn.execute(sa.text(_JUNCTION_ROWS)).all()
+            indexes = {index["name"] for index in sa.inspect(conn).get_indexes("attribution_entities")}
+        sync_engine.dispose()
+
+        assert len(stored) > 8
+        assert backfilled == stored
+        assert "ix_attribution_entities_entity_id" in indexes
@@ -13,12 +13,13 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 async def _create_seeded_app() -> tuple[FastAPI, object]:
     """Create a FastAPI app with seeded database."""
     from music_attribution.api.routes.attribution import router
-    from music_attribution.db.models import AttributionRecordModel
+    from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel
     from music_attribution.seed.imogen_heap import seed_imogen_heap
 
     engine = create_async_engine("sqlite+aiosqlite://", echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(AttributionRecordModel.__table__.create)
+        await conn.run_sync(AttributionEntityModel.__table__.create)
 
     factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -0,0 +1,121 @@
+"""Tests for the async query-embedding LRU."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from music_attribution.search.query_embedding import QueryEmbeddingService, normalize_query
+
+
+class _FakeMatcher:
+    """``EmbeddingMatcher`` stand-in recording encoded texts and threads."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.calls: list[list[str]] = []
+        self.threads: list[int] = []
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(texts)
+        self.threads.append(threading.get_ident())
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return np.array([[float(len(t)), 1.0, 0.0] for t in texts], dtype=np.float32)
+
+
+class TestNormalizeQuery:
+    """Tests for the cache key."""
+
+    def test_case_whitespace_and_compatibility_forms(self) -> None:
+        """Case, surrounding/inner whitespace and NFKC variants share a key."""
+        assert normalize_query("  Imogen\tHEAP ") == "imogen heap"
+        assert normalize_query("ＨＩＤＥ and seek") == normalize_query("hide AND seek")
+
+
+class TestQueryEmbeddingService:
+    """Tests for QueryEmbeddingService."""
+
+    async def test_repeated_query_hits_cache(self) -> None:
+        """Equivalent queries are encoded once, as normalized text."""
+        matcher = _FakeMatcher()
+        service = QueryEmbeddingService(matcher)
+
+        first = await service.embed("Imogen Heap")
+        second = await service.embed("  imogen   heap")
+
+        assert matcher.calls == [["imogen heap"]]
+        assert second is first
+        assert first.dtype == np.float32
+        assert not first.flags.writeable
+        assert (service.hits, service.misses) == (1, 1)
+
+    async def test_encode_runs_off_event_loop(self) -> None:
+        """The forward pass runs in an executor thread."""
+        matcher = _FakeMatcher()
+        await QueryEmbeddingService(matcher).embed("vocoder")
+        assert matcher.threads[0] != threading.get_ident()
+
+    async def test_lru_evicts_least_recently_used(self) -> None:
+        """Beyond ``maxsize``, the least recently used query is dropped."""
+        matcher = _FakeMatcher()
+        service = QueryEmbeddingService(matcher, maxsize=2)
+
+        await service.embed("a")
+        await service.embed("b")
+        await service.embed("a")
+        await service.embed("c")
+        await service.embed("a")
+        await service.embed("b")
+
+        assert len(service) == 2
+        assert [c[0] for c in matcher.calls] == ["a", "b", "c", "b"]
+
+    async def test_concurrent_identical_queries_share_one_encode(self) -> None:
+        """Concurrent requests for one query join the in-flight encode."""
+        matcher = _FakeMatcher(delay=0.05)
+        service = QueryEmbeddingService(matcher)
+
+        vectors = await asyncio.gather(*(service.embed("Hide and Seek") for _ in range(5)))
+
+        assert len(matcher.calls) == 1
+        assert all(v is vectors[0] for v in vectors)
+        assert (service.misses, service.coalesced) == (1, 4)
+        assert service._inflight == {}
+
+    async def test_cancelled_caller_does_not_cancel_shared_encode(self) -> None:
+        """A caller timing out leaves the encode running for other waiters."""
+        matcher = _FakeMatcher(delay=0.1)
+        service = QueryEmbeddingService(matcher)
+
+        waiter = asyncio.ensure_future(service.embed("frou frou"))
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(service.embed("frou frou"), 0.01)
+
+        await waiter
+        assert len(matcher.calls) == 1
+        assert len(service) == 1
+
+    async def test_failed_encode_is_not_cached(self) -> None:
+        """Errors reach every waiter and the next call retries."""
+        matcher = _FakeMatcher(delay=0.02, fail=True)
+        service = QueryEmbeddingService(matcher)
+
+        results = await asyncio.gather(service.embed("q"), service.embed("q"), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(service) == 0
+
+        matcher.fail = False
+        await service.embed("q")
+        assert len(matcher.calls) == 2
+
+    def test_rejects_non_positive_maxsize(self) -> None:
+        """``maxsize`` must allow at least one entry."""
+        with pytest.raises(ValueError, match="maxsize"):
+            QueryEmbeddingService(_FakeMatcher(), maxsize=0)  # type: ignore[arg-type]
@@ -0,0 +1,36 @@
+"""Tests for hybrid search Prometheus metrics."""
+
+from __future__ import annotations
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from music_attribution.observability.search_metrics import SearchMetrics, create_search_metrics
+
+
+@pytest.fixture()
+def search_metrics() -> SearchMetrics:
+    """Create isolated search metrics for testing."""
+    return create_search_metrics(CollectorRegistry())
+
+
+class TestSearchMetrics:
+    """Tests for observability.search_metrics module."""
+
+    def test_modality_latency_histogram_observes(self, search_metrics: SearchMetrics) -> None:
+        """Latency histogram records observations with modality+outcome labels."""
+        search_metrics.modality_latency_seconds.labels(modality="text", outcome="ok").observe(0.012)
+        child = search_metrics.modality_latency_seconds.labels(modality="text", outcome="ok")
+        assert child._sum.get() == pytest.approx(0.012)
+
+    def test_modality_dropped_counter_increments(self, search_metrics: SearchMetrics) -> None:
+        """Dropped counter increments with modality label."""
+        search_metrics.modality_dropped_total.labels(modality="vector").inc()
+        assert search_metrics.modality_dropped_total.labels(modality="vector")._value.get() == 1.0
+
+    def test_isolated_registries_do_not_conflict(self) -> None:
+        """Two SearchMetrics instances with separate registries are independent."""
+        sm1 = create_search_metrics(CollectorRegistry())
+        sm2 = create_search_metrics(CollectorRegistry())
+        sm1.modality_dropped_total.labels(modality="graph").inc()
+        assert sm2.modality_dropped_total.labels(modality="graph")._value.get() == 0.0
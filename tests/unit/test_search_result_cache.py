@@ -0,0 +1,275 @@
+"""Tests for the hybrid search result cache and its invalidation."""
+
+from __future__ import annotations
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from music_attribution.observability.search_metrics import create_search_metrics
+from music_attribution.search.result_cache import (
+    InProcessSearchCacheBackend,
+    SearchResultCache,
+    ValkeySearchCacheBackend,
+    bump_catalogue_generation,
+    create_search_result_cache,
+    get_search_result_cache,
+    set_search_result_cache,
+)
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeValkey:
+    """In-memory stand-in for the subset of the async Valkey client used."""
+
+    def __init__(self) -> None:
+        self.strings: dict[str, str] = {}
+        self.expiry: dict[str, int] = {}
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.strings[key] = value
+        self.expiry[key] = ex
+
+    async def incr(self, key):
+        self.strings[key] = str(int(self.strings.get(key, "0")) + 1)
+        return int(self.strings[key])
+
+    async def aclose(self):
+        pass
+
+
+class _BrokenBackend:
+    """Backend whose every call fails, like an unreachable Valkey."""
+
+    async def generation(self):
+        raise ConnectionError("valkey down")
+
+    async def bump_generation(self):
+        raise ConnectionError("valkey down")
+
+    async def get(self, _key):
+        raise ConnectionError("valkey down")
+
+    async def put(self, _key, _payload):
+        raise ConnectionError("valkey down")
+
+    async def close(self):
+        pass
+
+
+def _record():
+    """Return one seeded attribution record."""
+    from music_attribution.seed.imogen_heap import build_imogen_heap_records
+
+    return build_imogen_heap_records()[0]
+
+
+@pytest.fixture
+def result_cache() -> SearchResultCache:
+    """In-process result cache with isolated metrics."""
+    return SearchResultCache(InProcessSearchCacheBackend(), metrics=create_search_metrics(CollectorRegistry()))
+
+
+class TestInProcessBackend:
+    """Tests for InProcessSearchCacheBackend."""
+
+    async def test_entries_expire_after_ttl(self) -> None:
+        """Entries older than the TTL are misses."""
+        clock = _Clock()
+        backend = InProcessSearchCacheBackend(ttl_seconds=10, clock=clock)
+        await backend.put("k", "payload")
+        clock.now += 5
+        assert await backend.get("k") == "payload"
+        clock.now += 6
+        assert await backend.get("k") is None
+        assert len(backend) == 0
+
+    async def test_lru_evicts_least_recently_used(self) -> None:
+        """Beyond ``max_entries``, the least recently used entry is dropped."""
+        backend = InProcessSearchCacheBackend(max_entries=2)
+        await backend.put("a", "1")
+        await backend.put("b", "2")
+        await backend.get("a")
+        await backend.put("c", "3")
+        assert await backend.get("b") is None
+        assert await backend.get("a") == "1"
+
+    async def test_bump_advances_generation_and_drops_entries(self) -> None:
+        """A generation bump makes every stored entry unreachable."""
+        backend = InProcessSearchCacheBackend()
+        await backend.put("k", "payload")
+        assert await backend.bump_generation() == 1
+        assert await backend.generation() == 1
+        assert len(backend) == 0
+
+
+class TestValkeyBackend:
+    """Tests for ValkeySearchCacheBackend with a fake client."""
+
+    async def test_generation_counter_and_expiring_entries(self) -> None:
+        """Generation is an INCR counter; entries carry the TTL."""
+        client = _FakeValkey()
+        backend = ValkeySearchCacheBackend("redis://unused", ttl_seconds=60, client=client)
+
+        assert await backend.generation() == 0
+        assert await backend.bump_generation() == 1
+        assert await backend.generation() == 1
+
+        await backend.put("1:abc", "payload")
+        assert await backend.get("1:abc") == "payload"
+        assert client.expiry["search-cache:1:abc"] == 60
+
+    def test_requires_valkey_package_without_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without a client and without ``valkey`` the backend refuses to start."""
+        from music_attribution.search import result_cache
+
+        monkeypatch.setattr(result_cache, "VALKEY_AVAILABLE", False)
+        with pytest.raises(ImportError, match="valkey"):
+            ValkeySearchCacheBackend("redis://localhost:6379")
+
+
+class TestSearchResultCache:
+    """Tests for keying, serialization, invalidation and metrics."""
+
+    async def test_round_trip_with_normalized_query(self, result_cache: SearchResultCache) -> None:
+        """Stored results come back for an equivalent query and the same limit."""
+        record = _record()
+        generation, cached = await result_cache.get("Hide and Seek", 10)
+        assert cached is None
+        await result_cache.put("Hide and Seek", 10, generation, [(record, 0.03)])
+
+        _, cached = await result_cache.get("  hide AND seek ", 10)
+        assert cached is not None
+        assert cached[0][0] == record
+        assert cached[0][1] == pytest.approx(0.03)
+
+        _, other_limit = await result_cache.get("Hide and Seek", 20)
+        assert other_limit is None
+
+    async def test_generation_bump_invalidates(self, result_cache: SearchResultCache) -> None:
+        """Results stored before a bump are not served after it."""
+        generation, _ = await result_cache.get("vocoder", 10)
+        await result_cache.put("vocoder", 10, generation, [(_record(), 0.01)])
+        await result_cache.bump_generation()
+        _, cached = await result_cache.get("vocoder", 10)
+        assert cached is None
+
+    async def test_results_of_a_superseded_generation_are_unreachable(self, result_cache: SearchResultCache) -> None:
+        """A search that raced a write stores under the old generation."""
+        generation, _ = await result_cache.get("vocoder", 10)
+        await result_cache.bump_generation()
+        await result_cache.put("vocoder", 10, generation, [(_record(), 0.01)])
+        _, cached = await result_cache.get("vocoder", 10)
+        assert cached is None
+
+    async def test_hit_ratio_metrics(self, result_cache: SearchResultCache) -> None:
+        """Lookups are counted by result and the gauge tracks the ratio."""
+        generation, _ = await result_cache.get("q", 5)
+        await result_cache.put("q", 5, generation, [])
+        await result_cache.get("q", 5)
+        await result_cache.get("q", 5)
+
+        metrics = result_cache._metrics
+        assert metrics.result_cache_requests_total.labels(result="hit")._value.get() == 2.0
+        assert metrics.result_cache_requests_total.labels(result="miss")._value.get() == 1.0
+        assert result_cache.hit_ratio == pytest.approx(2 / 3)
+        assert metrics.result_cache_hit_ratio._value.get() == pytest.approx(2 / 3)
+
+    async def test_backend_errors_degrade_to_misses(self) -> None:
+        """An unavailable backend never fails the search."""
+        cache = SearchResultCache(_BrokenBackend(), metrics=create_search_metrics(CollectorRegistry()))
+        generation, cached = await cache.get("q", 5)
+        assert (generation, cached) == (None, None)
+        await cache.put("q", 5, generation, [(_record(), 0.1)])
+        await cache.bump_generation()
+
+
+class TestEmbeddingWrites:
+    """Tests for invalidation by ``entity_embeddings`` writes."""
+
+    async def test_committed_embedding_write_bumps_generation(self, result_cache: SearchResultCache) -> None:
+        """Embeddings feed the vector and graph modalities, so writing one invalidates."""
+        import uuid
+
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+        from music_attribution.db.models import EntityEmbeddingModel
+        from music_attribution.resolution.embedding_service import EmbeddingService
+
+        engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(EntityEmbeddingModel.__table__.create)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        service = EmbeddingService()
+        entity_id = uuid.uuid4()
+
+        set_search_result_cache(result_cache)
+        try:
+            async with factory() as session:
+                assert await service.store_embeddings([(entity_id, [0.1] * 4)], session=session) == 1
+                await session.commit()
+            await result_cache.wait_for_pending()
+            assert await result_cache._backend.generation() == 1
+
+            async with factory() as session:
+                # Conflicts write nothing and leave the generation alone
+                assert await service.store_embeddings([(entity_id, [0.2] * 4)], session=session) == 0
+                await session.commit()
+                await service.store_embedding(uuid.uuid4(), [0.3] * 4, session=session)
+                await session.commit()
+            await result_cache.wait_for_pending()
+            assert await result_cache._backend.generation() == 2
+        finally:
+            set_search_result_cache(None)
+            await engine.dispose()
+
+
+class TestFactoryAndDefault:
+    """Tests for settings-driven construction and the process-wide cache."""
+
+    @staticmethod
+    def _settings(backend: str):
+        from music_attribution.config import Settings
+
+        return Settings(database_url="sqlite+aiosqlite://", search_cache_backend=backend)  # type: ignore[call-arg]
+
+    def test_create_from_settings(self) -> None:
+        """``memory`` builds an in-process cache, ``none`` disables caching."""
+        cache = create_search_result_cache(self._settings("memory"))
+        assert isinstance(cache, SearchResultCache)
+        assert isinstance(cache._backend, InProcessSearchCacheBackend)
+        assert create_search_result_cache(self._settings("none")) is None
+
+    def test_caching_is_off_by_default(self) -> None:
+        """A per-process cache blind to pipeline writes is never the default."""
+        from music_attribution.config import Settings
+
+        settings = Settings(database_url="sqlite+aiosqlite://")  # type: ignore[call-arg]
+        assert create_search_result_cache(settings) is None
+
+    def test_unknown_backend_rejected(self) -> None:
+        """Misspelled backends fail at startup."""
+        with pytest.raises(ValueError, match="memcached"):
+            create_search_result_cache(self._settings("memcached"))
+
+    async def test_bump_catalogue_generation_uses_default(self, result_cache: SearchResultCache) -> None:
+        """The module-level bump reaches the installed cache, and no-ops without one."""
+        await bump_catalogue_generation()
+        set_search_result_cache(result_cache)
+        try:
+            await bump_catalogue_generation()
+            assert await result_cache._backend.generation() == 1
+        finally:
+            set_search_result_cache(None)
+        assert get_search_result_cache() is None
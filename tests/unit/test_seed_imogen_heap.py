@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
-from music_attribution.db.models import AttributionRecordModel
+from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel
 
 
 @pytest.fixture
@@ -16,6 +16,7 @@ async def async_session():
     engine = create_async_engine("sqlite+aiosqlite://", echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(AttributionRecordModel.__table__.create)
+        await conn.run_sync(AttributionEntityModel.__table__.create)
 
     session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     async with session_factory() as session:
@@ -11,12 +11,13 @@ async def seeded_session():
     """Create a seeded in-memory database."""
     from sqlalchemy.ext.asyncio import async_sessionmaker
 
-    from music_attribution.db.models import AttributionRecordModel
+    from music_attribution.db.models import AttributionEntityModel, AttributionRecordModel
     from music_attribution.seed.imogen_heap import seed_imogen_heap
 
     engine = create_async_engine("sqlite+aiosqlite://", echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(AttributionRecordModel.__table__.create)
+        await conn.run_sync(AttributionEntityModel.__table__.create)
 
     factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -75,3 +76,118 @@ class TestTextSearch:
         results = await service.search("", limit=1, session=seeded_session)
         assert len(results) == 1
         assert isinstance(results[0], AttributionRecord)
+
+
+class TestFullTextIndex:
+    """Tests for the FTS5 backend, its synchronization and the PostgreSQL query."""
+
+    async def test_fts_table_mirrors_records(self, seeded_session: AsyncSession) -> None:
+        """The FTS5 table is created with attribution_records and filled on store."""
+        from sqlalchemy import text
+
+        result = await seeded_session.execute(text("SELECT count(*) FROM attribution_records_fts"))
+        assert result.scalar() == 8
+
+    async def test_search_by_title_and_credit_name(self, seeded_session: AsyncSession) -> None:
+        """Title words and credited names are indexed; terms are ANDed."""
+        from music_attribution.search.text_search import TextSearchService
+
+        service = TextSearchService()
+        results = await service.search("hide seek", session=seeded_session)
+        assert [r.work_title for r in results] == ["Hide and Seek"]
+
+        names = {c.entity_name for c in results[0].credits if c.entity_name}
+        assert names
+        by_name = await service.search(next(iter(names)), session=seeded_session)
+        assert any(r.work_title == "Hide and Seek" for r in by_name)
+
+    async def test_query_syntax_is_not_passed_to_fts5(self, seeded_session: AsyncSession) -> None:
+        """FTS5 operators and quotes in user input are treated as words."""
+        from music_attribution.search.text_search import TextSearchService, _fts5_match
+
+        assert _fts5_match('vocoder" OR NEAR(') == '"vocoder" "OR" "NEAR"'
+        assert _fts5_match("!!!") is None
+        assert await TextSearchService().search('"*:(', session=seeded_session) == []
+
+    async def test_update_refreshes_fts_row(self, seeded_session: AsyncSession) -> None:
+        """Repository updates re-index the record's credits."""
+        from music_attribution.attribution.persistence import AsyncAttributionRepository
+        from music_attribution.search.text_search import TextSearchService
+
+        service = TextSearchService()
+        record = (await service.search("hide seek", session=seeded_session))[0]
+        renamed = record.model_copy(
+            update={"credits": [c.model_copy(update={"entity_name": "Zanzibarius"}) for c in record.credits]},
+        )
+        await AsyncAttributionRepository().update(renamed, seeded_session)
+
+        results = await service.search("zanzibarius", session=seeded_session)
+        assert [r.attribution_id for r in results] == [record.attribution_id]
+
+    async def test_like_fallback_without_fts_table(self, seeded_session: AsyncSession) -> None:
+        """Without the FTS5 table the service falls back to LIKE matching."""
+        from sqlalchemy import text
+
+        from music_attribution.db.fts import forget_fts_backend
+        from music_attribution.search.text_search import TextSearchService
+
+        await seeded_session.execute(text("DROP TABLE attribution_records_fts"))
+        forget_fts_backend(seeded_session.get_bind())
+        results = await TextSearchService().search("vocoder arrangement", session=seeded_session)
+        assert any(r.confidence_score == 0.95 for r in results)
+
+    async def test_backend_is_detected_once_per_engine(self, seeded_session: AsyncSession) -> None:
+        """Searches and repository writes do not re-query sqlite_master."""
+        from sqlalchemy import event
+
+        from music_attribution.attribution.persistence import AsyncAttributionRepository
+        from music_attribution.search.text_search import TextSearchService
+
+        statements: list[str] = []
+        engine = seeded_session.get_bind()
+        event.listen(engine, "before_cursor_execute", lambda _c, _cur, statement, *_a: statements.append(statement))
+
+        service = TextSearchService()
+        record = (await service.search("vocoder arrangement", session=seeded_session))[0]
+        renamed = record.model_copy(
+            update={"credits": [c.model_copy(update={"entity_name": "Zanzibarius"}) for c in record.credits]},
+        )
+        await AsyncAttributionRepository().update(renamed, seeded_session)
+        assert await service.search("zanzibarius", session=seeded_session)
+        assert statements
+        assert not [statement for statement in statements if "sqlite_master" in statement]
+
+    async def test_postgres_without_search_vector_uses_like(self) -> None:
+        """A PostgreSQL database before migration 007 falls back to LIKE, checked once."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from music_attribution.db.fts import FTSBackend, fts_backend
+
+        class _Bind:
+            dialect = MagicMock()
+
+            @property
+            def engine(self) -> _Bind:
+                return self
+
+        _Bind.dialect.name = "postgresql"
+        bind = _Bind()
+        session = MagicMock()
+        session.get_bind.return_value = bind
+        session.execute = AsyncMock(return_value=MagicMock(first=MagicMock(return_value=None)))
+
+        assert await fts_backend(session) is FTSBackend.LIKE
+        assert await fts_backend(session) is FTSBackend.LIKE
+        session.execute.assert_awaited_once()
+        assert "information_schema.columns" in str(session.execute.await_args.args[0])
+
+    def test_postgres_statement_uses_tsvector_index(self) -> None:
+        """PostgreSQL queries match search_vector and order by ts_rank."""
+        from sqlalchemy.dialects import postgresql
+
+        from music_attribution.search.text_search import _tsvector_statement
+
+        sql = str(_tsvector_statement("vocoder", limit=5, offset=0).compile(dialect=postgresql.dialect()))
+        assert "attribution_records.search_vector @@ websearch_to_tsquery(" in sql
+        assert "ORDER BY ts_rank(attribution_records.search_vector" in sql
+        assert "LIKE" not in sql
@@ -134,3 +134,83 @@ class TestVectorSearch:
         # Should only contain ARTIST-type entities, not WORK
         for eid, _ in results:
             assert eid != uuid.uuid5(uuid.NAMESPACE_DNS, "entity-c")
+
+
+class _FakeResult:
+    """Minimal result object returning fixed rows."""
+
+    def __init__(self, rows: list[tuple[object, ...]]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[tuple[object, ...]]:
+        return self._rows
+
+
+class _FakePostgresSession:
+    """Session stand-in bound to a PostgreSQL dialect that records statements."""
+
+    def __init__(self, rows: list[tuple[object, ...]]) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        self.dialect = postgresql.dialect()
+        self.statements: list[str] = []
+        self._rows = rows
+
+    def get_bind(self):
+        return self
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=self.dialect)))
+        return _FakeResult(self._rows)
+
+
+class TestPgvectorPushDown:
+    """Tests for ranking pushed into pgvector on PostgreSQL."""
+
+    def test_statement_orders_by_cosine_distance(self) -> None:
+        """The ranking query uses <=> with filters and LIMIT in SQL."""
+        from sqlalchemy.dialects import postgresql
+
+        from music_attribution.search.vector_search import _pgvector_statement
+
+        stmt = _pgvector_statement(
+            [0.1, 0.2],
+            limit=7,
+            threshold=0.6,
+            entity_type="ARTIST",
+            exclude_entity_id=uuid.uuid4(),
+        )
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "<=>" in sql
+        assert "ORDER BY entity_embeddings.embedding <=>" in sql
+        assert "LIMIT" in sql
+        assert "JOIN resolved_entities" in sql
+        assert "resolved_entities.entity_type =" in sql
+        assert "entity_embeddings.entity_id !=" in sql
+        assert sql.count("<=>") == 3  # select, threshold, order by
+
+    def test_statement_without_filters(self) -> None:
+        """Threshold 0 and no type filter add no WHERE clause or join."""
+        from sqlalchemy.dialects import postgresql
+
+        from music_attribution.search.vector_search import _pgvector_statement
+
+        sql = str(_pgvector_statement([0.1, 0.2], limit=3).compile(dialect=postgresql.dialect()))
+        assert "WHERE" not in sql
+        assert "JOIN" not in sql
+
+    async def test_postgres_session_uses_pushdown(self) -> None:
+        """On PostgreSQL only the ranked rows are fetched and distances become similarities."""
+        from music_attribution.search.vector_search import VectorSearchService
+
+        near, far = uuid.uuid4(), uuid.uuid4()
+        session = _FakePostgresSession([(near, 0.1), (far, 1.4)])
+        results = await VectorSearchService(ef_search=100).search_by_vector(
+            [0.1, 0.2],
+            limit=2,
+            session=session,  # type: ignore[arg-type]
+        )
+
+        assert results == [(near, pytest.approx(0.9)), (far, 0.0)]
+        assert session.statements[0] == "SET LOCAL hnsw.ef_search = 100"
+        assert "<=>" in session.statements[1]